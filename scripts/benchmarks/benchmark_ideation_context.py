@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Benchmark ideation chat context size over a long session.
+
+Runs a synthetic multi-turn ideation session through IdeationServiceImpl
+with in-memory repositories and a fake LLM, once with the previous
+behaviour (the whole history loaded, the last 10 messages sent) and once
+with the rolling-summary context manager, and reports prompt tokens,
+summary overhead, prompt prefix reuse between consecutive turns, and
+messages read from the repository.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_ideation_context.py [--turns 100]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+# Ensure the repository root is importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from src.core.models.ideation import ChatMessage, IdeationSession
+from src.infrastructure.llm.base_client import LLMResponse
+from src.orchestrator.routes.ideation_api import IdeationChatRequest
+from src.orchestrator.services.ideation_context import (
+    SUMMARY_SYSTEM_PROMPT,
+    ConversationContextManager,
+    estimate_tokens,
+)
+from src.orchestrator.services.ideation_service import IdeationServiceImpl
+
+# Vocabulary for synthetic user and assistant messages
+_WORDS = (
+    "users upload invoices export reports dashboard latency audit roles "
+    "approval workflow mobile offline sync retention compliance budget "
+    "integration billing search notifications onboarding analytics"
+).split()
+
+
+class InMemoryMessageRepository:
+    """Message repository over a shared dict, counting rows read."""
+
+    def __init__(self, store: dict[str, list[ChatMessage]], stats: dict[str, int]) -> None:
+        self._store = store
+        self._stats = stats
+
+    async def create(self, message: ChatMessage) -> ChatMessage:
+        self._store.setdefault(message.session_id, []).append(message)
+        return message
+
+    async def get_by_session(
+        self, session_id: str, limit: int = 100, offset: int = 0
+    ) -> list[ChatMessage]:
+        rows = self._store.get(session_id, [])[offset : offset + limit]
+        self._stats["rows_read"] += len(rows)
+        return rows
+
+    async def get_latest(self, session_id: str, limit: int = 100) -> list[ChatMessage]:
+        rows = self._store.get(session_id, [])[-limit:] if limit > 0 else []
+        self._stats["rows_read"] += len(rows)
+        return rows
+
+    async def count_by_session(self, session_id: str) -> int:
+        return len(self._store.get(session_id, []))
+
+    async def delete_by_session(self, session_id: str) -> None:
+        self._store.pop(session_id, None)
+
+
+class InMemorySessionRepository:
+    """Session repository over a shared dict."""
+
+    def __init__(self, store: dict[str, IdeationSession]) -> None:
+        self._store = store
+
+    async def create(self, session: IdeationSession) -> IdeationSession:
+        self._store[session.id] = session
+        return session
+
+    async def get_by_id(self, session_id: str) -> IdeationSession | None:
+        return self._store.get(session_id)
+
+    async def update(self, session: IdeationSession) -> None:
+        self._store[session.id] = session
+
+
+class InMemoryMaturityRepository:
+    """Maturity repository over a shared dict."""
+
+    def __init__(self, store: dict[str, Any]) -> None:
+        self._store = store
+
+    async def save(self, maturity: Any) -> None:
+        self._store[maturity.session_id] = maturity
+
+    async def get_by_session(self, session_id: str) -> Any:
+        return self._store.get(session_id)
+
+
+class InMemoryRepositoryFactory:
+    """Repository factory handing out in-memory repositories."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, IdeationSession] = {}
+        self.messages: dict[str, list[ChatMessage]] = {}
+        self.maturity: dict[str, Any] = {}
+        self.stats = {"rows_read": 0}
+
+    def get_session_repository(self, db_session: Any = None) -> InMemorySessionRepository:
+        return InMemorySessionRepository(self.sessions)
+
+    def get_message_repository(self, db_session: Any = None) -> InMemoryMessageRepository:
+        return InMemoryMessageRepository(self.messages, self.stats)
+
+    def get_maturity_repository(self, db_session: Any = None) -> InMemoryMaturityRepository:
+        return InMemoryMaturityRepository(self.maturity)
+
+
+class FakeLLMClient:
+    """LLM client returning canned ideation replies and summaries."""
+
+    model = "fake-model"
+    max_tokens = 1024
+    temperature = 0.0
+
+    def __init__(self, seed: int = 7) -> None:
+        self._rng = random.Random(seed)
+        self.prompts: list[str] = []
+        self.summary_prompts: list[str] = []
+
+    async def generate(
+        self, prompt: str = "", system: str | None = None, **kwargs: Any
+    ) -> LLMResponse:
+        if system == SUMMARY_SYSTEM_PROMPT:
+            self.summary_prompts.append(prompt)
+            return LLMResponse(content=_sentence(self._rng, 120), model=self.model)
+
+        self.prompts.append(prompt)
+        reply = {
+            "response": _sentence(self._rng, 80),
+            "extracted_requirements": [],
+            "maturity_updates": {"functional": min(100, len(self.prompts))},
+            "follow_up_questions": [],
+            "current_phase": "functional",
+        }
+        return LLMResponse(content=json.dumps(reply), model=self.model)
+
+
+class FakeLLMFactory:
+    """LLM client factory returning one shared fake client."""
+
+    def __init__(self, client: FakeLLMClient) -> None:
+        self._client = client
+
+    async def get_client(self, role: Any) -> FakeLLMClient:
+        return self._client
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+@asynccontextmanager
+async def _no_db_session():
+    yield None
+
+
+def make_service(
+    context_manager: ConversationContextManager,
+) -> tuple[IdeationServiceImpl, FakeLLMClient, InMemoryRepositoryFactory]:
+    """Create a service wired to in-memory repositories and a fake LLM."""
+    client = FakeLLMClient()
+    repos = InMemoryRepositoryFactory()
+    service = IdeationServiceImpl(
+        llm_factory=FakeLLMFactory(client),
+        repository_factory=repos,
+        context_manager=context_manager,
+    )
+    service._db_session = _no_db_session
+    return service, client, repos
+
+
+def _shared_prefix(a: str, b: str) -> int:
+    return len(os.path.commonprefix([a, b]))
+
+
+async def run_session(
+    context_manager: ConversationContextManager, turns: int
+) -> dict[str, float]:
+    """Run a synthetic session and collect context metrics."""
+    service, client, repos = make_service(context_manager)
+    rng = random.Random(11)
+    for _ in range(turns):
+        await service.process_chat(
+            IdeationChatRequest(
+                sessionId="bench-session",
+                message=_sentence(rng, 60),
+                currentMaturity=0,
+            )
+        )
+        await service.wait_for_summary_refreshes()
+
+    prompt_tokens = [estimate_tokens(p) for p in client.prompts]
+    reuse = [
+        _shared_prefix(prev, cur) / len(cur)
+        for prev, cur in zip(client.prompts, client.prompts[1:], strict=False)
+    ]
+    return {
+        "total_prompt_tokens": sum(prompt_tokens),
+        "last_prompt_tokens": prompt_tokens[-1],
+        "summary_calls": len(client.summary_prompts),
+        "summary_tokens": sum(estimate_tokens(p) for p in client.summary_prompts),
+        "prefix_reuse": sum(reuse) / len(reuse) if reuse else 0.0,
+        "rows_read": repos.stats["rows_read"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ideation context benchmark")
+    parser.add_argument("--turns", type=int, default=100)
+    args = parser.parse_args()
+
+    # Previous behaviour: never summarise, load everything, send the last
+    # 10 messages (IdeationAgent's max_history_messages default)
+    last10 = ConversationContextManager(
+        token_budget=10**9,
+        summary_every_turns=10**6,
+        keep_recent_messages=0,
+        history_messages=10,
+    )
+    results = {
+        "last10": asyncio.run(run_session(last10, args.turns)),
+        "rolling": asyncio.run(run_session(ConversationContextManager(), args.turns)),
+    }
+
+    print(f"{args.turns}-turn session")
+    print(
+        f"{'mode':<8} {'prompt tok':>11} {'last turn':>10} {'summary tok':>12} "
+        f"{'total tok':>10} {'prefix reuse':>13} {'rows read':>10}"
+    )
+    for name, r in results.items():
+        total = r["total_prompt_tokens"] + r["summary_tokens"]
+        print(
+            f"{name:<8} {r['total_prompt_tokens']:>11.0f} {r['last_prompt_tokens']:>10.0f} "
+            f"{r['summary_tokens']:>12.0f} {total:>10.0f} "
+            f"{r['prefix_reuse']:>12.0%} {r['rows_read']:>10.0f}"
+        )
+    base_total = results["last10"]["total_prompt_tokens"]
+    rolling_total = (
+        results["rolling"]["total_prompt_tokens"] + results["rolling"]["summary_tokens"]
+    )
+    print(f"rolling vs last10 total tokens: {rolling_total / base_total - 1:+.0%}")
+
+
+if __name__ == "__main__":
+    main()
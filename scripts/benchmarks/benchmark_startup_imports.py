@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark cold-start import time of the service entry points.
+
+Runs each entry point module in a fresh interpreter with `-X importtime`
+and reports the median cumulative import time over several runs, along
+with the heaviest top-level dependencies. For the orchestrator it also
+times `create_app()` plus the first /health request under each
+ORCHESTRATOR_ROUTER_LOADING mode, which is what a readiness probe waits
+for.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_startup_imports.py [--runs 5] [--top 8]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Entry point modules started by the service containers
+ENTRY_POINTS = {
+    "orchestrator": "src.orchestrator.main",
+    "worker": "src.workers.main",
+    "swarm": "src.workers.swarm.main",
+}
+
+# Router loading modes compared for the orchestrator
+ROUTER_LOADING_MODES = ("eager", "lazy")
+
+# Creates the app and serves /health, printing the elapsed seconds as JSON
+_READY_SCRIPT = """
+import json, logging, time
+started = time.perf_counter()
+from fastapi.testclient import TestClient
+from src.orchestrator.main import create_app
+logging.disable(logging.CRITICAL)
+app = create_app()
+status = TestClient(app).get("/health").status_code
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "status": status,
+    "pending_routers": len(app.state.router_loader.pending),
+}))
+"""
+
+
+def _env(**extra: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    env.setdefault("LOG_LEVEL", "ERROR")
+    env.update(extra)
+    return env
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """Parse `-X importtime` output into (self_us, cumulative_us, name) rows.
+
+    The module name keeps its indentation, which encodes import depth.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def measure_imports(module: str) -> list[tuple[int, int, str]]:
+    """Import a module in a fresh interpreter and return importtime rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def total_seconds(rows: list[tuple[int, int, str]], module: str) -> float:
+    """Cumulative import time of the module itself, in seconds."""
+    return next(c for _, c, name in rows if name.strip() == module) / 1e6
+
+
+def top_dependencies(
+    rows: list[tuple[int, int, str]], count: int
+) -> list[tuple[str, float]]:
+    """Heaviest top-level packages by cumulative time, in seconds."""
+    packages: dict[str, float] = {}
+    for _, cumulative, name in rows:
+        # Direct children of the entry point, grouped by top-level package
+        if name.startswith("   ") and not name.startswith("    "):
+            package = name.strip().split(".")[0]
+            if package == "src":
+                package = ".".join(name.strip().split(".")[:3])
+            packages[package] = packages.get(package, 0.0) + cumulative / 1e6
+    return sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:count]
+
+
+def measure_ready(mode: str) -> dict[str, float]:
+    """Time orchestrator create_app() and the first /health in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", _READY_SCRIPT],
+        cwd=REPO_ROOT,
+        env=_env(ORCHESTRATOR_ROUTER_LOADING=mode),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{mode} startup failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Entry point import-time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Dependencies to list per entry point")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    for name, module in ENTRY_POINTS.items():
+        runs = [measure_imports(module) for _ in range(args.runs)]
+        results[name] = {
+            "module": module,
+            "import_seconds": statistics.median(total_seconds(r, module) for r in runs),
+            "top": top_dependencies(runs[-1], args.top),
+        }
+    ready = {
+        mode: statistics.median(measure_ready(mode)["seconds"] for _ in range(args.runs))
+        for mode in ROUTER_LOADING_MODES
+    }
+
+    if args.json:
+        print(json.dumps({"entry_points": results, "orchestrator_ready": ready}, indent=2))
+        return
+
+    print(f"Cold-start import time (median of {args.runs} runs)")
+    for name, r in results.items():
+        print(f"\n{name:<13} {r['module']:<28} {r['import_seconds']:>7.3f}s")
+        for package, seconds in r["top"]:
+            print(f"  {package:<40} {seconds:>7.3f}s")
+
+    print("\nOrchestrator create_app() + first /health")
+    for mode, seconds in ready.items():
+        print(f"  ORCHESTRATOR_ROUTER_LOADING={mode:<11} {seconds:>7.3f}s")
+    print(f"  speedup: {ready['eager'] / ready['lazy']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
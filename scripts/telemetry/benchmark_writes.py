@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark hook-side write latency for the SQLite telemetry store.
+
+Compares immediate commits against the write-behind buffer (inline and
+background writer thread) and reports per-call latency and events/sec.
+Each mode writes to its own temporary database.
+
+Usage:
+    python3 scripts/telemetry/benchmark_writes.py [--events 2000] [--max-rows 200]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure the scripts directory is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sqlite_store
+
+
+def _run_mode(
+    name: str,
+    db_path: Path,
+    events: int,
+    buffer_kwargs: dict | None,
+) -> dict:
+    sqlite_store.init_db(db_path)
+    if buffer_kwargs is not None:
+        sqlite_store.enable_write_buffer(**buffer_kwargs)
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for i in range(events):
+        t0 = time.perf_counter()
+        sqlite_store.record_event(
+            hook_name="benchmark",
+            hook_event_type="PreToolUse",
+            duration_seconds=0.01,
+            session_id="bench-session",
+            tool_name="Read",
+            payload={"i": i},
+            db_path=db_path,
+        )
+        latencies.append(time.perf_counter() - t0)
+    sqlite_store.disable_write_buffer()
+    elapsed = time.perf_counter() - start
+
+    stored = sqlite_store.get_stats(db_path=db_path)["total_events"]
+    latencies.sort()
+    return {
+        "mode": name,
+        "events_per_sec": events / elapsed if elapsed else 0.0,
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+        "stored": stored,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Telemetry write benchmark")
+    parser.add_argument("--events", type=int, default=2000, help="Events per mode")
+    parser.add_argument("--max-rows", type=int, default=200, help="Buffer size threshold")
+    parser.add_argument(
+        "--max-delay", type=float, default=1.0, help="Buffer time threshold (seconds)",
+    )
+    args = parser.parse_args()
+
+    modes = [
+        ("immediate", None),
+        ("buffered", {"max_rows": args.max_rows, "max_delay_seconds": args.max_delay}),
+        (
+            "background",
+            {
+                "max_rows": args.max_rows,
+                "max_delay_seconds": args.max_delay,
+                "background": True,
+            },
+        ),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            _run_mode(name, Path(tmp) / f"{name}.db", args.events, kwargs)
+            for name, kwargs in modes
+        ]
+
+    print(f"{'mode':<12} {'events/sec':>12} {'p50 (us)':>10} {'p99 (us)':>10} {'stored':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<12} {r['events_per_sec']:>12.0f} {r['p50_us']:>10.1f}"
+            f" {r['p99_us']:>10.1f} {r['stored']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,13 @@ Endpoints:
     GET /api/events   -> Paginated hook events (query params: since, session, type, limit)
     GET /api/sessions -> Active and recent sessions
     GET /api/stats    -> Aggregate statistics
-    GET /stream       -> SSE endpoint, polls SQLite every 2s for new events
+    GET /stream       -> SSE endpoint, pushes new events from the shared change feed
+
+A single ChangeFeed thread tails hook_events by autoincrement id and fans
+batches out to every connected SSE client, so the database is polled once
+regardless of how many dashboards are open. Each SSE message carries the
+id of its newest event; a client that reconnects with Last-Event-ID is
+backfilled from the database, so no events are dropped.
 
 Usage:
     python3 scripts/telemetry/dashboard_server.py [--port 9191] [--db ~/.asdlc/telemetry.db]
@@ -17,11 +23,13 @@ Usage:
 import argparse
 import json
 import os
+import queue
 import sys
-import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from threading import Event
+from typing import Optional
 from urllib.parse import urlparse, parse_qs
 
 # Ensure the scripts directory is importable
@@ -29,11 +37,109 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 import sqlite_store
 
 
+class Subscription:
+    """A single SSE client's view of the change feed.
+
+    Batches are queued up to max_batches. If the client falls that far
+    behind, the subscription is marked overflowed instead of dropping
+    events; the handler then closes the stream and the browser reconnects
+    with Last-Event-ID, resuming from the database.
+    """
+
+    def __init__(self, max_batches: int) -> None:
+        self.queue: "queue.Queue[list[dict]]" = queue.Queue(maxsize=max_batches)
+        self.overflowed = False
+
+    def get(self, timeout: float) -> list[dict] | None:
+        """Return the next batch (oldest first), or None on timeout."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class ChangeFeed:
+    """Tails hook_events by id and fans new rows out to all subscribers."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        poll_interval: float = 1.0,
+        batch_size: int = 500,
+        max_queued_batches: int = 256,
+    ) -> None:
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_queued_batches = max_queued_batches
+        self.last_id = 0
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._stop = Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def start(self) -> None:
+        """Start tailing from the current end of the table."""
+        self.last_id = sqlite_store.get_latest_event_id(db_path=self.db_path)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="change-feed", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def subscribe(self) -> Subscription:
+        sub = Subscription(self.max_queued_batches)
+        with self._lock:
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def poll_once(self) -> int:
+        """Fetch one batch of new rows and publish it. Returns the row count."""
+        rows = sqlite_store.get_events_after(
+            self.last_id, limit=self.batch_size, db_path=self.db_path,
+        )
+        if rows:
+            self.last_id = rows[-1]["id"]
+            self._publish(rows)
+        return len(rows)
+
+    def _publish(self, rows: list[dict]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.queue.put_nowait(rows)
+            except queue.Full:
+                sub.overflowed = True
+                self.unsubscribe(sub)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # Drain without sleeping while full batches keep coming
+            if self.poll_once() < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+
 class DashboardHandler(BaseHTTPRequestHandler):
     """Routes requests to the appropriate handler."""
 
     # Assigned at server startup
     db_path: Path = sqlite_store.DEFAULT_DB_PATH
+    change_feed: Optional[ChangeFeed] = None
+    sse_heartbeat_seconds: float = 15.0
 
     def do_GET(self) -> None:
         parsed = urlparse(self.path)
@@ -96,32 +202,56 @@ class DashboardHandler(BaseHTTPRequestHandler):
     # -- SSE -------------------------------------------------------------------
 
     def _sse_stream(self, _params: dict) -> None:
-        self.send_response(200)
-        self.send_header("Content-Type", "text/event-stream")
-        self.send_header("Cache-Control", "no-cache")
-        self.send_header("Connection", "keep-alive")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
+        feed = self.change_feed
+        if feed is None:
+            self._send_json({"error": "stream unavailable"}, status=503)
+            return
 
-        last_ts = time.time()
+        # Subscribe before responding or backfilling so nothing falls between
+        sub = feed.subscribe()
+        sent_id = _parse_event_id(self.headers.get("Last-Event-ID"))
         try:
-            while True:
-                events = sqlite_store.get_events(
-                    since=last_ts, limit=50, db_path=self.db_path,
-                )
-                if events:
-                    # Events come back newest-first; update watermark to newest
-                    last_ts = max(e["timestamp"] for e in events)
-                    payload = json.dumps({"events": events})
-                    self.wfile.write(f"data: {payload}\n\n".encode())
-                    self.wfile.flush()
-                else:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "keep-alive")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+
+            if sent_id is not None:
+                while True:
+                    rows = sqlite_store.get_events_after(
+                        sent_id, limit=feed.batch_size, db_path=self.db_path,
+                    )
+                    if not rows:
+                        break
+                    sent_id = self._send_events(rows)
+            else:
+                sent_id = feed.last_id
+
+            while not sub.overflowed:
+                batch = sub.get(timeout=self.sse_heartbeat_seconds)
+                if batch is None:
                     # Send heartbeat to keep connection alive
                     self.wfile.write(": heartbeat\n\n".encode())
                     self.wfile.flush()
-                time.sleep(2)
+                    continue
+                fresh = [e for e in batch if e["id"] > sent_id]
+                if fresh:
+                    sent_id = self._send_events(fresh)
         except (BrokenPipeError, ConnectionResetError, OSError):
             pass
+        finally:
+            feed.unsubscribe(sub)
+
+    def _send_events(self, rows: list[dict]) -> int:
+        """Write one SSE message for rows (oldest first). Returns newest id."""
+        newest_id = rows[-1]["id"]
+        # The dashboard expects newest-first within a message
+        payload = json.dumps({"events": rows[::-1]}, default=str)
+        self.wfile.write(f"id: {newest_id}\ndata: {payload}\n\n".encode())
+        self.wfile.flush()
+        return newest_id
 
     # -- Helpers ---------------------------------------------------------------
 
@@ -149,6 +279,15 @@ class DashboardHandler(BaseHTTPRequestHandler):
 
 # -- Parameter helpers ---------------------------------------------------------
 
+def _parse_event_id(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
 def _first_str(params: dict, key: str) -> str | None:
     vals = params.get(key, [])
     return vals[0] if vals else None
@@ -191,7 +330,12 @@ def main() -> None:
     # Ensure DB and tables exist
     sqlite_store.init_db(db_path)
 
-    server = HTTPServer(("127.0.0.1", args.port), DashboardHandler)
+    feed = ChangeFeed(db_path)
+    feed.start()
+    DashboardHandler.change_feed = feed
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), DashboardHandler)
+    server.daemon_threads = True
     print(f"aSDLC Telemetry Dashboard: http://localhost:{args.port}")
     print(f"Database: {db_path}")
     print("Press Ctrl+C to stop.")
@@ -199,6 +343,7 @@ def main() -> None:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nShutting down dashboard server.")
+        feed.stop()
         server.shutdown()
 
 
@@ -6,9 +6,16 @@ hook execution events and session metadata. Designed to be imported by
 hook-wrapper.py and queried by dashboard_server.py.
 
 All write operations fail silently to avoid breaking hooks.
+
+Writes are committed immediately by default. Long-lived writers can call
+enable_write_buffer() to group record_event/record_cost inserts into
+batched transactions committed on a size or time threshold.
 """
 
+import atexit
 import json
+import logging
+import math
 import sqlite3
 import threading
 import time
@@ -18,6 +25,8 @@ from typing import Any, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from src.core.costs.models import CostFilter, CostRecord
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DB_PATH = Path.home() / ".asdlc" / "telemetry.db"
 
 _SCHEMA_SQL = """
@@ -69,6 +78,80 @@ CREATE INDEX IF NOT EXISTS idx_cost_records_agent_id ON cost_records(agent_id);
 CREATE INDEX IF NOT EXISTS idx_cost_records_model ON cost_records(model);
 """
 
+# Cost rollups: pre-aggregated per (bucket, agent, model, session, tool) so
+# summary queries never scan cost_records. NULL dimensions are stored as ''
+# so they take part in the primary key; readers map them back with NULLIF.
+# A trigger keeps both tables in step with every insert into cost_records.
+_ROLLUP_TABLES = {"cost_rollup_hourly": 3600, "cost_rollup_daily": 86400}
+
+_ROLLUP_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    bucket_start INTEGER NOT NULL,
+    agent_id TEXT NOT NULL DEFAULT '',
+    model TEXT NOT NULL DEFAULT '',
+    session_id TEXT NOT NULL DEFAULT '',
+    tool_name TEXT NOT NULL DEFAULT '',
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    estimated_cost_usd REAL NOT NULL DEFAULT 0.0,
+    record_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket_start, agent_id, model, session_id, tool_name)
+);
+CREATE INDEX IF NOT EXISTS idx_{table}_session_id ON {table}(session_id);
+"""
+
+_ROLLUP_UPSERT_SQL = """
+    INSERT INTO {table} (bucket_start, agent_id, model, session_id, tool_name,
+                         input_tokens, output_tokens, estimated_cost_usd, record_count)
+    VALUES (CAST(NEW.timestamp / {seconds} AS INTEGER) * {seconds},
+            COALESCE(NEW.agent_id, ''), COALESCE(NEW.model, ''),
+            COALESCE(NEW.session_id, ''), COALESCE(NEW.tool_name, ''),
+            COALESCE(NEW.input_tokens, 0), COALESCE(NEW.output_tokens, 0),
+            COALESCE(NEW.estimated_cost_usd, 0.0), 1)
+    ON CONFLICT(bucket_start, agent_id, model, session_id, tool_name) DO UPDATE SET
+        input_tokens = input_tokens + excluded.input_tokens,
+        output_tokens = output_tokens + excluded.output_tokens,
+        estimated_cost_usd = estimated_cost_usd + excluded.estimated_cost_usd,
+        record_count = record_count + 1;
+"""
+
+_ROLLUP_REBUILD_SQL = """
+DELETE FROM {table};
+INSERT INTO {table} (bucket_start, agent_id, model, session_id, tool_name,
+                     input_tokens, output_tokens, estimated_cost_usd, record_count)
+SELECT CAST(timestamp / {seconds} AS INTEGER) * {seconds},
+       COALESCE(agent_id, ''), COALESCE(model, ''),
+       COALESCE(session_id, ''), COALESCE(tool_name, ''),
+       SUM(COALESCE(input_tokens, 0)), SUM(COALESCE(output_tokens, 0)),
+       SUM(COALESCE(estimated_cost_usd, 0.0)), COUNT(*)
+FROM cost_records
+GROUP BY 1, 2, 3, 4, 5;
+"""
+
+_ROLLUP_SCHEMA_SQL = "".join(
+    _ROLLUP_TABLE_SQL.format(table=table) for table in _ROLLUP_TABLES
+) + (
+    "CREATE TRIGGER IF NOT EXISTS trg_cost_records_rollup"
+    " AFTER INSERT ON cost_records BEGIN"
+    + "".join(
+        _ROLLUP_UPSERT_SQL.format(table=table, seconds=seconds)
+        for table, seconds in _ROLLUP_TABLES.items()
+    )
+    + "END;\n"
+)
+
+_INSERT_EVENT_SQL = """INSERT INTO hook_events
+   (timestamp, session_id, hook_event_type, hook_name,
+    exit_code, duration_seconds, tool_name, agent_id,
+    blocked, error, payload_json)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_INSERT_COST_SQL = """INSERT INTO cost_records
+   (timestamp, session_id, agent_id, model,
+    input_tokens, output_tokens, estimated_cost_usd,
+    tool_name, hook_event_id, payload_json)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
 
 _thread_local = threading.local()
 
@@ -99,11 +182,216 @@ def _get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     return conn
 
 
+class WriteBuffer:
+    """Write-behind buffer that groups inserts into batched transactions.
+
+    Rows are queued per (database, statement) and written with executemany
+    in a single transaction per database, so a burst of hook events costs one
+    WAL commit instead of one per event. A flush happens when max_rows rows
+    are pending or the oldest pending row is older than max_delay_seconds;
+    at most that window of writes is lost if the process is killed.
+
+    With background=True a daemon writer thread performs the flushes and
+    add() never touches the database. Otherwise flushes run inline in the
+    calling thread when a threshold is crossed.
+
+    If a batch fails because the database is locked or busy, its rows are
+    put back ahead of newer rows and retried on the next flush. At most
+    max_pending rows are kept; the oldest are dropped beyond that. Batches
+    failing for any other reason are dropped and logged.
+    """
+
+    def __init__(
+        self,
+        max_rows: int = 200,
+        max_delay_seconds: float = 1.0,
+        background: bool = False,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        self.max_rows = max_rows
+        self.max_delay_seconds = max_delay_seconds
+        self.max_pending = max_pending or max_rows * 10
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, list[tuple]]] = {}
+        self._pending_count = 0
+        self._oldest: Optional[float] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name="telemetry-writer", daemon=True,
+            )
+            self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be written."""
+        return self._pending_count
+
+    def add(self, sql: str, row: tuple, db_path: Optional[Path] = None) -> None:
+        """Queue one row for insertion, flushing if a threshold is crossed."""
+        path_str = str(db_path or DEFAULT_DB_PATH)
+        now = time.monotonic()
+        with self._lock:
+            self._pending.setdefault(path_str, {}).setdefault(sql, []).append(row)
+            self._pending_count += 1
+            if self._oldest is None:
+                self._oldest = now
+            due = (
+                self._pending_count >= self.max_rows
+                or now - self._oldest >= self.max_delay_seconds
+            )
+        if not due:
+            return
+        if self._thread is not None:
+            self._wake.set()
+        else:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all pending rows. Returns the number of rows written."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._pending_count = 0
+            self._oldest = None
+
+        written = 0
+        for path_str, statements in pending.items():
+            try:
+                conn = _get_connection(Path(path_str))
+                with conn:
+                    for sql, rows in statements.items():
+                        conn.executemany(sql, rows)
+                written += sum(len(rows) for rows in statements.values())
+            except Exception as e:
+                count = sum(len(rows) for rows in statements.values())
+                if _is_transient(e):
+                    logger.warning(
+                        "Telemetry flush to %s failed, retrying %d rows: %s",
+                        path_str, count, e,
+                    )
+                    self._requeue(path_str, statements)
+                else:
+                    logger.warning(
+                        "Telemetry flush to %s failed, dropping %d rows: %s",
+                        path_str, count, e,
+                    )
+        return written
+
+    def _requeue(self, path_str: str, statements: dict[str, list[tuple]]) -> None:
+        """Put failed rows back ahead of rows queued since the flush began."""
+        with self._lock:
+            merged = {sql: list(rows) for sql, rows in statements.items()}
+            for sql, rows in self._pending.get(path_str, {}).items():
+                merged.setdefault(sql, []).extend(rows)
+            self._pending[path_str] = merged
+            self._pending_count += sum(len(rows) for rows in statements.values())
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+
+            excess = self._pending_count - self.max_pending
+            if excess <= 0:
+                return
+            logger.warning("Telemetry buffer full, dropping %d oldest rows", excess)
+            for rows in merged.values():
+                dropped = min(excess, len(rows))
+                del rows[:dropped]
+                self._pending_count -= dropped
+                excess -= dropped
+                if excess <= 0:
+                    break
+
+    def close(self) -> None:
+        """Stop the writer thread (if any) and flush remaining rows."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.max_delay_seconds)
+            self._wake.clear()
+            self.flush()
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed write is worth retrying (database locked or busy)."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+_write_buffer: Optional[WriteBuffer] = None
+
+
+def enable_write_buffer(
+    max_rows: int = 200,
+    max_delay_seconds: float = 1.0,
+    background: bool = False,
+) -> WriteBuffer:
+    """Route record_event/record_cost through a write-behind buffer.
+
+    Replaces any buffer already enabled (flushing it first). The buffer is
+    flushed automatically at interpreter exit.
+    """
+    global _write_buffer
+    disable_write_buffer()
+    _write_buffer = WriteBuffer(
+        max_rows=max_rows,
+        max_delay_seconds=max_delay_seconds,
+        background=background,
+    )
+    return _write_buffer
+
+
+def disable_write_buffer() -> None:
+    """Flush and remove the write buffer, restoring immediate commits."""
+    global _write_buffer
+    buffer, _write_buffer = _write_buffer, None
+    if buffer is not None:
+        buffer.close()
+
+
+def flush_writes() -> int:
+    """Flush buffered writes now. Returns the number of rows written."""
+    if _write_buffer is None:
+        return 0
+    return _write_buffer.flush()
+
+
+atexit.register(disable_write_buffer)
+
+
+def _insert(sql: str, row: tuple, db_path: Optional[Path]) -> None:
+    """Insert a row, via the write buffer when one is enabled."""
+    if _write_buffer is not None:
+        _write_buffer.add(sql, row, db_path)
+        return
+    conn = _get_connection(db_path)
+    conn.execute(sql, row)
+    conn.commit()
+
+
 def init_db(db_path: Optional[Path] = None) -> None:
-    """Initialize the database schema. Safe to call repeatedly."""
+    """Initialize the database schema. Safe to call repeatedly.
+
+    Databases created before cost rollups existed get their rollup tables
+    backfilled from cost_records the first time this runs.
+    """
     try:
         conn = _get_connection(db_path)
-        conn.executescript(_SCHEMA_SQL)
+        had_rollups = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='cost_rollup_daily'"
+        ).fetchone() is not None
+        conn.executescript(_SCHEMA_SQL + _ROLLUP_SCHEMA_SQL)
+        if not had_rollups:
+            rebuild_cost_rollups(db_path)
     except Exception:
         pass
 
@@ -124,13 +412,8 @@ def record_event(
 ) -> None:
     """Record a hook execution event. Fails silently on any error."""
     try:
-        conn = _get_connection(db_path)
-        conn.execute(
-            """INSERT INTO hook_events
-               (timestamp, session_id, hook_event_type, hook_name,
-                exit_code, duration_seconds, tool_name, agent_id,
-                blocked, error, payload_json)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _insert(
+            _INSERT_EVENT_SQL,
             (
                 timestamp or time.time(),
                 session_id,
@@ -144,8 +427,8 @@ def record_event(
                 error,
                 json.dumps(payload) if payload else None,
             ),
+            db_path,
         )
-        conn.commit()
     except Exception:
         pass
 
@@ -223,6 +506,37 @@ def get_events(
         return []
 
 
+def get_events_after(
+    after_id: int = 0,
+    limit: int = 500,
+    db_path: Optional[Path] = None,
+) -> list[dict[str, Any]]:
+    """Return hook events with id > after_id, oldest first.
+
+    Uses the autoincrement primary key as a change-feed cursor, so no rows
+    are skipped when several share a timestamp or arrive out of order.
+    """
+    try:
+        conn = _get_connection(db_path)
+        rows = conn.execute(
+            "SELECT * FROM hook_events WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit),
+        ).fetchall()
+        return [dict(row) for row in rows]
+    except Exception:
+        return []
+
+
+def get_latest_event_id(db_path: Optional[Path] = None) -> int:
+    """Return the highest hook event id, or 0 if there are none."""
+    try:
+        conn = _get_connection(db_path)
+        row = conn.execute("SELECT MAX(id) as m FROM hook_events").fetchone()
+        return row["m"] or 0
+    except Exception:
+        return 0
+
+
 def get_sessions(
     active_only: bool = False,
     db_path: Optional[Path] = None,
@@ -309,13 +623,8 @@ def record_cost(
 ) -> None:
     """Insert a cost record into the cost_records table. Fails silently."""
     try:
-        conn = _get_connection(db_path)
-        conn.execute(
-            """INSERT INTO cost_records
-               (timestamp, session_id, agent_id, model,
-                input_tokens, output_tokens, estimated_cost_usd,
-                tool_name, hook_event_id, payload_json)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _insert(
+            _INSERT_COST_SQL,
             (
                 cost_record.timestamp,
                 cost_record.session_id,
@@ -328,8 +637,8 @@ def record_cost(
                 cost_record.hook_event_id,
                 None,
             ),
+            db_path,
         )
-        conn.commit()
     except Exception:
         pass
 
@@ -384,6 +693,101 @@ def get_costs(
         return [], 0
 
 
+def rebuild_cost_rollups(db_path: Optional[Path] = None) -> None:
+    """Recompute the rollup tables from cost_records.
+
+    Only needed for backfill or repair: the insert trigger keeps rollups
+    current. Rollup history for raw rows already removed by
+    prune_cost_records() is lost by a rebuild.
+    """
+    try:
+        conn = _get_connection(db_path)
+        conn.executescript(
+            "BEGIN;"
+            + "".join(
+                _ROLLUP_REBUILD_SQL.format(table=table, seconds=seconds)
+                for table, seconds in _ROLLUP_TABLES.items()
+            )
+            + "COMMIT;"
+        )
+    except Exception:
+        pass
+
+
+def prune_cost_records(
+    retention_days: float = 30,
+    db_path: Optional[Path] = None,
+) -> int:
+    """Delete raw cost records older than the retention window.
+
+    Rollups are kept, so summaries still cover the pruned period; only
+    per-call drill-down via get_costs() is lost. Fails silently.
+
+    Returns:
+        Number of raw rows deleted.
+    """
+    try:
+        conn = _get_connection(db_path)
+        cutoff = time.time() - retention_days * 86400
+        cursor = conn.execute("DELETE FROM cost_records WHERE timestamp < ?", (cutoff,))
+        conn.commit()
+        return cursor.rowcount
+    except Exception:
+        return 0
+
+
+def _plan_cost_ranges(
+    date_from: Optional[float],
+    date_to: Optional[float],
+) -> list[tuple[str, Optional[float], Optional[float]]]:
+    """Split a time range into the cheapest sources that cover it exactly.
+
+    Whole UTC days come from the daily rollup, whole hours at the edges from
+    the hourly rollup, and sub-hour remainders from raw cost_records.
+
+    Returns:
+        List of (table, lower, upper) with lower inclusive and upper
+        exclusive; None means unbounded.
+    """
+    lo = date_from
+    # date_to is inclusive; convert to an exclusive bound
+    hi = math.nextafter(date_to, math.inf) if date_to is not None else None
+
+    def _split(
+        start: Optional[float],
+        end: Optional[float],
+        seconds: int,
+        table: str,
+        remainder,
+    ) -> list[tuple[str, Optional[float], Optional[float]]]:
+        aligned_lo = None if start is None else math.ceil(start / seconds) * seconds
+        aligned_hi = None if end is None else math.floor(end / seconds) * seconds
+        if aligned_lo is not None and aligned_hi is not None and aligned_lo >= aligned_hi:
+            return remainder(start, end)
+        plan = [(table, aligned_lo, aligned_hi)]
+        if start is not None and start < aligned_lo:
+            plan += remainder(start, aligned_lo)
+        if end is not None and aligned_hi < end:
+            plan += remainder(aligned_hi, end)
+        return plan
+
+    def _hours(start, end):
+        return _split(
+            start, end, 3600, "cost_rollup_hourly",
+            lambda a, b: [("cost_records", a, b)],
+        )
+
+    return _split(lo, hi, 86400, "cost_rollup_daily", _hours)
+
+
+_SUMMARY_GROUP_COLUMNS = {
+    "agent": "agent_id",
+    "model": "model",
+    "session": "session_id",
+    "tool": "tool_name",
+}
+
+
 def get_cost_summary(
     group_by: str = "agent",
     filters: Optional["CostFilter"] = None,
@@ -391,8 +795,12 @@ def get_cost_summary(
 ) -> list[dict[str, Any]]:
     """Aggregate costs grouped by a dimension.
 
+    Reads the rollup tables, falling back to raw rows only for the parts
+    of a date range that do not align to whole hours.
+
     Args:
-        group_by: Grouping dimension -- "agent", "model", or "day".
+        group_by: Grouping dimension -- "agent", "model", "session",
+            "tool", or "day".
         filters: Optional CostFilter for pre-filtering.
         db_path: Database path override.
 
@@ -415,33 +823,51 @@ def get_cost_summary(
             if filters.model is not None:
                 clauses.append("model = ?")
                 params.append(filters.model)
-            if filters.date_from is not None:
-                clauses.append("timestamp >= ?")
-                params.append(filters.date_from)
-            if filters.date_to is not None:
-                clauses.append("timestamp <= ?")
-                params.append(filters.date_to)
 
-        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
-
-        if group_by == "model":
-            group_col = "model"
-        elif group_by == "day":
-            group_col = "date(timestamp, 'unixepoch')"
-        else:
-            group_col = "agent_id"
+        date_from = filters.date_from if filters is not None else None
+        date_to = filters.date_to if filters is not None else None
+
+        parts: list[str] = []
+        part_params: list[Any] = []
+        for table, lower, upper in _plan_cost_ranges(date_from, date_to):
+            raw = table == "cost_records"
+            time_col = "timestamp" if raw else "bucket_start"
+            if group_by == "day":
+                group_col = f"date({time_col}, 'unixepoch')"
+            else:
+                group_col = _SUMMARY_GROUP_COLUMNS.get(group_by, "agent_id")
+                if not raw:
+                    group_col = f"NULLIF({group_col}, '')"
+
+            part_clauses = list(clauses)
+            part_values = list(params)
+            if lower is not None:
+                part_clauses.append(f"{time_col} >= ?")
+                part_values.append(lower)
+            if upper is not None:
+                part_clauses.append(f"{time_col} < ?")
+                part_values.append(upper)
+            where = (" WHERE " + " AND ".join(part_clauses)) if part_clauses else ""
+
+            count_col = "1" if raw else "record_count"
+            parts.append(
+                f"SELECT {group_col} as group_key, estimated_cost_usd as cost,"
+                f" input_tokens as input_tokens, output_tokens as output_tokens,"
+                f" {count_col} as record_count FROM {table}{where}"
+            )
+            part_params.extend(part_values)
 
         query = (
-            f"SELECT {group_col} as group_key,"
-            f" SUM(estimated_cost_usd) as total_cost_usd,"
-            f" SUM(input_tokens) as total_input_tokens,"
-            f" SUM(output_tokens) as total_output_tokens,"
-            f" COUNT(*) as record_count"
-            f" FROM cost_records{where}"
-            f" GROUP BY {group_col}"
-            f" ORDER BY total_cost_usd DESC"
+            "SELECT group_key,"
+            " SUM(cost) as total_cost_usd,"
+            " SUM(input_tokens) as total_input_tokens,"
+            " SUM(output_tokens) as total_output_tokens,"
+            " SUM(record_count) as record_count"
+            f" FROM ({' UNION ALL '.join(parts)})"
+            " GROUP BY group_key"
+            " ORDER BY total_cost_usd DESC"
         )
-        rows = conn.execute(query, params).fetchall()
+        rows = conn.execute(query, part_params).fetchall()
         return [dict(row) for row in rows]
     except Exception:
         return []
@@ -453,6 +879,9 @@ def get_session_costs(
 ) -> dict[str, Any]:
     """Get per-session cost breakdown by model and tool.
 
+    Served from the daily rollup, which holds the same totals as the raw
+    rows for the session.
+
     Returns:
         Dict with model_breakdown, tool_breakdown, and total_cost_usd.
     """
@@ -465,11 +894,11 @@ def get_session_costs(
         conn = _get_connection(db_path)
 
         model_rows = conn.execute(
-            """SELECT model,
+            """SELECT NULLIF(model, '') as model,
                       SUM(input_tokens) as input_tokens,
                       SUM(output_tokens) as output_tokens,
                       SUM(estimated_cost_usd) as cost_usd
-               FROM cost_records
+               FROM cost_rollup_daily
                WHERE session_id = ?
                GROUP BY model
                ORDER BY cost_usd DESC""",
@@ -477,10 +906,10 @@ def get_session_costs(
         ).fetchall()
 
         tool_rows = conn.execute(
-            """SELECT tool_name,
-                      COUNT(*) as call_count,
+            """SELECT NULLIF(tool_name, '') as tool_name,
+                      SUM(record_count) as call_count,
                       SUM(estimated_cost_usd) as total_cost_usd
-               FROM cost_records
+               FROM cost_rollup_daily
                WHERE session_id = ?
                GROUP BY tool_name
                ORDER BY total_cost_usd DESC""",
@@ -488,7 +917,7 @@ def get_session_costs(
         ).fetchall()
 
         total_row = conn.execute(
-            "SELECT SUM(estimated_cost_usd) as total FROM cost_records WHERE session_id = ?",
+            "SELECT SUM(estimated_cost_usd) as total FROM cost_rollup_daily WHERE session_id = ?",
             (session_id,),
         ).fetchone()
 
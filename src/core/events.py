@@ -43,6 +43,17 @@ class EventType(str, Enum):
     PATCH_REJECTED = "patch_rejected"
 
 
+class EventPriority(str, Enum):
+    """Dispatch lane for AGENT_STARTED events.
+
+    Urgent events (e.g. retries that unblock a HITL gate) are published to
+    a separate stream that workers drain before the bulk stream.
+    """
+
+    URGENT = "urgent"
+    BULK = "bulk"
+
+
 @dataclass
 class ASDLCEvent:
     """Base event model for aSDLC event stream.
@@ -63,6 +74,7 @@ class ASDLCEvent:
     tenant_id: str | None = None
     idempotency_key: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    priority: EventPriority = EventPriority.BULK
 
     def __post_init__(self) -> None:
         """Validate event after initialization."""
@@ -72,6 +84,8 @@ class ASDLCEvent:
         # Convert string event_type to enum if needed
         if isinstance(self.event_type, str):
             self.event_type = EventType(self.event_type)
+        if isinstance(self.priority, str):
+            self.priority = EventPriority(self.priority)
 
         # Ensure timestamp is timezone-aware
         if self.timestamp.tzinfo is None:
@@ -101,6 +115,8 @@ class ASDLCEvent:
             data["tenant_id"] = self.tenant_id
         if self.idempotency_key:
             data["idempotency_key"] = self.idempotency_key
+        if self.priority != EventPriority.BULK:
+            data["priority"] = self.priority.value
         if self.metadata:
             # Store metadata as JSON string
             import json
@@ -161,6 +177,7 @@ class ASDLCEvent:
             timestamp=timestamp,
             idempotency_key=data.get("idempotency_key"),
             metadata=metadata,
+            priority=EventPriority(data.get("priority", EventPriority.BULK.value)),
         )
 
 
@@ -17,6 +17,7 @@ from src.core.models.ideation import (
     RequirementPriority,
     IdeationSession,
     ChatMessage,
+    MessageCursor,
     ExtractedRequirement,
     MaturityCategory,
     MaturityState,
@@ -36,6 +37,7 @@ __all__ = [
     "RequirementPriority",
     "IdeationSession",
     "ChatMessage",
+    "MessageCursor",
     "ExtractedRequirement",
     "MaturityCategory",
     "MaturityState",
@@ -7,6 +7,8 @@ messages, requirements, maturity tracking, PRD drafts, and user stories.
 
 from __future__ import annotations
 
+import base64
+import binascii
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -73,6 +75,9 @@ class IdeationSession:
         version: Version number for optimistic locking.
         created_at: When the session was created.
         updated_at: When the session was last updated.
+        context_summary: Rolling summary of the conversation's older messages.
+        summarized_message_count: Number of messages (oldest first) folded
+            into context_summary.
     """
 
     id: str
@@ -83,6 +88,8 @@ class IdeationSession:
     version: int = 1
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    context_summary: str = ""
+    summarized_message_count: int = 0
 
 
 @dataclass
@@ -110,6 +117,65 @@ class ChatMessage:
     metadata: Optional[dict] = None
 
 
+@dataclass(frozen=True)
+class MessageCursor:
+    """Keyset pagination position within a session's messages.
+
+    Messages are ordered by (timestamp, id); a cursor names the last
+    message of a page so the next page starts strictly after (or, when
+    paging backwards, strictly before) it.
+
+    Attributes:
+        timestamp: Timestamp of the message the cursor points at.
+        id: ID of the message the cursor points at.
+    """
+
+    timestamp: datetime
+    id: str
+
+    @classmethod
+    def of(cls, message: ChatMessage) -> MessageCursor:
+        """Create a cursor pointing at a message.
+
+        Args:
+            message: The message.
+
+        Returns:
+            MessageCursor: Cursor at the message's position.
+        """
+        return cls(timestamp=message.timestamp, id=message.id)
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token.
+
+        Returns:
+            str: The token.
+        """
+        raw = f"{self.timestamp.isoformat()}|{self.id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> MessageCursor:
+        """Decode a token produced by encode().
+
+        Args:
+            token: The token.
+
+        Returns:
+            MessageCursor: The decoded cursor.
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            timestamp, message_id = raw.split("|", 1)
+            return cls(timestamp=datetime.fromisoformat(timestamp), id=message_id)
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise ValueError(f"Invalid message cursor: {token!r}") from e
+
+
 @dataclass
 class ExtractedRequirement:
     """A requirement extracted from the ideation conversation.
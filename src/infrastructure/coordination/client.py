@@ -89,6 +89,8 @@ class CoordinationClient:
         self._instance_id = instance_id
         self._is_connected = False
         self._correlation_id: str | None = None
+        self._pending_heartbeats: set[str] = set()
+        self._heartbeat_task: asyncio.Task[None] | None = None
 
         logger.debug(
             f"CoordinationClient initialized with prefix={self._config.key_prefix}"
@@ -162,13 +164,15 @@ class CoordinationClient:
     ) -> None:
         """Exit async context manager.
 
-        Performs cleanup and logs any exceptions.
+        Stops the background heartbeat task, flushes queued heartbeats,
+        and logs any exceptions.
 
         Args:
             exc_type: Exception type if an exception was raised
             exc_val: Exception value if an exception was raised
             exc_tb: Exception traceback if an exception was raised
         """
+        await self.stop_heartbeat()
         self._is_connected = False
         self._correlation_id = None
 
@@ -817,7 +821,8 @@ class CoordinationClient:
     ) -> None:
         """Register an instance as active.
 
-        Adds the instance to the presence hash with current timestamp.
+        Adds the instance to the presence hash with current timestamp and
+        records it in the last-seen sorted set, in a single round trip.
 
         Args:
             instance_id: Instance ID to register
@@ -826,7 +831,6 @@ class CoordinationClient:
         Raises:
             PresenceError: If registration fails
         """
-        presence_key = self._config.presence_key()
         now = datetime.now(UTC)
 
         presence_data = {
@@ -843,7 +847,13 @@ class CoordinationClient:
         )
 
         try:
-            await self._redis.hset(presence_key, mapping=presence_data)
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(self._config.presence_key(), mapping=presence_data)
+                pipe.zadd(
+                    self._config.presence_seen_key(),
+                    {instance_id: now.timestamp()},
+                )
+                await pipe.execute()
             logger.info(f"Registered instance: {instance_id}")
         except redis.RedisError as e:
             logger.error(f"Failed to register instance {instance_id}: {e}")
@@ -861,27 +871,155 @@ class CoordinationClient:
         Raises:
             PresenceError: If heartbeat fails
         """
-        presence_key = self._config.presence_key()
+        await self.heartbeat_many([instance_id])
+
+    async def heartbeat_many(self, instance_ids: list[str]) -> None:
+        """Update heartbeat timestamps for several instances at once.
+
+        All timestamps are written with one HSET and one ZADD in a single
+        pipelined round trip, regardless of the number of instances.
+
+        Args:
+            instance_ids: Instance IDs to heartbeat
+
+        Raises:
+            PresenceError: If the heartbeat write fails
+        """
+        if not instance_ids:
+            return
+
         now = datetime.now(UTC)
+        timestamp = now.strftime("%Y-%m-%dT%H:%M:%SZ")
 
         try:
-            await self._redis.hset(
-                presence_key,
-                f"{instance_id}.last_heartbeat",
-                now.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            )
-            logger.debug(f"Heartbeat for instance: {instance_id}")
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    self._config.presence_key(),
+                    mapping={f"{iid}.last_heartbeat": timestamp for iid in instance_ids},
+                )
+                pipe.zadd(
+                    self._config.presence_seen_key(),
+                    {iid: now.timestamp() for iid in instance_ids},
+                )
+                await pipe.execute()
+            logger.debug(f"Heartbeat for instances: {', '.join(instance_ids)}")
         except redis.RedisError as e:
-            logger.error(f"Failed to heartbeat for {instance_id}: {e}")
+            logger.error(f"Failed to heartbeat for {instance_ids}: {e}")
             raise PresenceError(
                 f"Failed to update heartbeat: {e}",
-                details={"instance_id": instance_id, "error": str(e)},
+                details={"instance_ids": list(instance_ids), "error": str(e)},
             ) from e
 
+    def queue_heartbeat(self, instance_id: str) -> None:
+        """Queue a heartbeat to be written on the next flush.
+
+        Repeated heartbeats for the same instance between flushes are
+        coalesced into a single write.
+
+        Args:
+            instance_id: Instance ID to heartbeat
+        """
+        self._pending_heartbeats.add(instance_id)
+
+    async def flush_heartbeats(self) -> int:
+        """Write all queued heartbeats in one batch.
+
+        Returns:
+            Number of instances whose heartbeat was written
+
+        Raises:
+            PresenceError: If the heartbeat write fails. The queued
+                heartbeats are kept for the next flush.
+        """
+        if not self._pending_heartbeats:
+            return 0
+
+        instance_ids = sorted(self._pending_heartbeats)
+        self._pending_heartbeats.clear()
+        try:
+            await self.heartbeat_many(instance_ids)
+        except PresenceError:
+            self._pending_heartbeats.update(instance_ids)
+            raise
+        return len(instance_ids)
+
+    def start_heartbeat(
+        self,
+        instance_ids: list[str] | None = None,
+        interval_seconds: float | None = None,
+    ) -> asyncio.Task[None]:
+        """Start a background task that heartbeats on a fixed interval.
+
+        On each tick the given instances (or this client's instance_id) are
+        queued and flushed together with any heartbeats queued via
+        queue_heartbeat(), so all sessions sharing this client share one
+        connection and one write per interval.
+
+        Args:
+            instance_ids: Instances to keep alive. Defaults to this
+                client's instance_id.
+            interval_seconds: Seconds between flushes. Uses config default
+                if not provided.
+
+        Returns:
+            The running heartbeat task
+
+        Raises:
+            CoordinationError: If no instance IDs are given and the client
+                has no instance_id
+        """
+        if self._heartbeat_task is not None and not self._heartbeat_task.done():
+            return self._heartbeat_task
+
+        if instance_ids is None:
+            if self._instance_id is None:
+                raise CoordinationError(
+                    "No instance IDs to heartbeat",
+                    details={"reason": "client has no instance_id"},
+                )
+            instance_ids = [self._instance_id]
+
+        interval = interval_seconds or self._config.heartbeat_interval_seconds
+        keep_alive = list(instance_ids)
+
+        async def _heartbeat_loop() -> None:
+            while True:
+                for instance_id in keep_alive:
+                    self.queue_heartbeat(instance_id)
+                try:
+                    await self.flush_heartbeats()
+                except PresenceError as e:
+                    logger.warning(f"Background heartbeat failed: {e}")
+                await asyncio.sleep(interval)
+
+        self._log_operation(
+            "start_heartbeat",
+            instance_ids=keep_alive,
+            interval_seconds=interval,
+        )
+        self._heartbeat_task = asyncio.create_task(_heartbeat_loop())
+        return self._heartbeat_task
+
+    async def stop_heartbeat(self) -> None:
+        """Stop the background heartbeat task and flush queued heartbeats."""
+        task = self._heartbeat_task
+        self._heartbeat_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        try:
+            await self.flush_heartbeats()
+        except PresenceError as e:
+            logger.warning(f"Final heartbeat flush failed: {e}")
+
     async def unregister_instance(self, instance_id: str) -> None:
         """Unregister an instance.
 
-        Removes the instance from the presence hash.
+        Removes the instance from the presence hash and last-seen set.
 
         Args:
             instance_id: Instance ID to unregister
@@ -889,18 +1027,21 @@ class CoordinationClient:
         Raises:
             PresenceError: If unregistration fails
         """
-        presence_key = self._config.presence_key()
+        self._pending_heartbeats.discard(instance_id)
 
         self._log_operation("unregister_instance", instance_id=instance_id)
 
         try:
-            # Remove all fields for this instance
-            await self._redis.hdel(
-                presence_key,
-                f"{instance_id}.active",
-                f"{instance_id}.last_heartbeat",
-                f"{instance_id}.session_id",
-            )
+            async with self._redis.pipeline(transaction=True) as pipe:
+                # Remove all fields for this instance
+                pipe.hdel(
+                    self._config.presence_key(),
+                    f"{instance_id}.active",
+                    f"{instance_id}.last_heartbeat",
+                    f"{instance_id}.session_id",
+                )
+                pipe.zrem(self._config.presence_seen_key(), instance_id)
+                await pipe.execute()
             logger.info(f"Unregistered instance: {instance_id}")
         except redis.RedisError as e:
             logger.error(f"Failed to unregister instance {instance_id}: {e}")
@@ -909,6 +1050,43 @@ class CoordinationClient:
                 details={"instance_id": instance_id, "error": str(e)},
             ) from e
 
+    async def get_stale_instances(
+        self,
+        timeout_minutes: int | None = None,
+    ) -> list[str]:
+        """Get instances whose last heartbeat is older than the timeout.
+
+        Answered from the last-seen sorted set with a single ZRANGEBYSCORE,
+        without reading the presence hash.
+
+        Args:
+            timeout_minutes: Minutes before instance is considered stale.
+                           Uses config default if not provided.
+
+        Returns:
+            List of stale instance IDs, oldest first
+
+        Raises:
+            PresenceError: If query fails
+        """
+        timeout = timeout_minutes or self._config.presence_timeout_minutes
+        cutoff = datetime.now(UTC).timestamp() - timeout * 60
+
+        self._log_operation("get_stale_instances", timeout_minutes=timeout)
+
+        try:
+            return list(
+                await self._redis.zrangebyscore(
+                    self._config.presence_seen_key(), "-inf", cutoff
+                )
+            )
+        except redis.RedisError as e:
+            logger.error(f"Failed to get stale instances: {e}")
+            raise PresenceError(
+                f"Failed to get stale instances: {e}",
+                details={"error": str(e)},
+            ) from e
+
     async def get_presence(
         self,
         timeout_minutes: int | None = None,
@@ -19,6 +19,7 @@ class CoordinationConfig:
         message_ttl_days: Message TTL in days
         presence_timeout_minutes: Timeout for presence staleness
         timeline_max_size: Maximum messages in timeline
+        heartbeat_interval_seconds: Interval for the background heartbeat task
     """
 
     redis_host: str = "localhost"
@@ -28,6 +29,7 @@ class CoordinationConfig:
     message_ttl_days: int = 30
     presence_timeout_minutes: int = 5
     timeline_max_size: int = 1000
+    heartbeat_interval_seconds: int = 30
 
     # Redis key patterns (class variables)
     KEY_MESSAGE: ClassVar[str] = "{prefix}:msg:{id}"
@@ -35,6 +37,7 @@ class CoordinationConfig:
     KEY_INBOX: ClassVar[str] = "{prefix}:inbox:{instance}"
     KEY_PENDING: ClassVar[str] = "{prefix}:pending"
     KEY_PRESENCE: ClassVar[str] = "{prefix}:presence"
+    KEY_PRESENCE_SEEN: ClassVar[str] = "{prefix}:presence:seen"
 
     # Pub/sub channel patterns
     CHANNEL_INSTANCE: ClassVar[str] = "{prefix}:notify:{instance}"
@@ -55,6 +58,7 @@ class CoordinationConfig:
             COORD_MESSAGE_TTL_DAYS: Message TTL (default: 30)
             COORD_PRESENCE_TIMEOUT_MINUTES: Presence timeout (default: 5)
             COORD_TIMELINE_MAX_SIZE: Max timeline size (default: 1000)
+            COORD_HEARTBEAT_INTERVAL_SECONDS: Heartbeat task interval (default: 30)
 
         Returns:
             CoordinationConfig instance
@@ -67,6 +71,9 @@ class CoordinationConfig:
             message_ttl_days=int(os.getenv("COORD_MESSAGE_TTL_DAYS", "30")),
             presence_timeout_minutes=int(os.getenv("COORD_PRESENCE_TIMEOUT_MINUTES", "5")),
             timeline_max_size=int(os.getenv("COORD_TIMELINE_MAX_SIZE", "1000")),
+            heartbeat_interval_seconds=int(
+                os.getenv("COORD_HEARTBEAT_INTERVAL_SECONDS", "30")
+            ),
         )
 
     @property
@@ -120,6 +127,17 @@ class CoordinationConfig:
         """
         return self.KEY_PRESENCE.format(prefix=self.key_prefix)
 
+    def presence_seen_key(self) -> str:
+        """Get Redis key for the last-seen sorted set.
+
+        Members are instance IDs scored by last heartbeat (epoch seconds),
+        so stale instances can be found with a single ZRANGEBYSCORE.
+
+        Returns:
+            Redis key string
+        """
+        return self.KEY_PRESENCE_SEEN.format(prefix=self.key_prefix)
+
     def instance_channel(self, instance_id: str) -> str:
         """Get pub/sub channel for instance notifications.
 
@@ -4,8 +4,10 @@
 DEPRECATED: This exporter targets Docker-hosted VictoriaMetrics. For workstation
 use, see scripts/telemetry/ (SQLite + dashboard).
 
-Reads JSONL telemetry records written by hook-wrapper.py and exposes
-Prometheus metrics on port 9191.
+Tails JSONL telemetry records written by hook-wrapper.py in a background
+thread (rotation- and truncation-aware) and exposes Prometheus metrics on
+port 9191. Distinct hook_name/event_type values are capped; further values
+are reported under the "__overflow__" label.
 
 Metrics:
     asdlc_hook_executions_total{hook_name, event_type, exit_code} - Counter
@@ -16,13 +18,15 @@ Usage:
     python3 -m src.infrastructure.hook_telemetry.prometheus_exporter
 """
 
+import bisect
 import json
 import os
 import time
 from collections import defaultdict
+from collections.abc import Iterator
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock, Thread
 
 TELEMETRY_FILE = Path("/tmp/hook-telemetry.jsonl")
 PORT = int(os.environ.get("HOOK_TELEMETRY_PORT", "9191"))
@@ -30,111 +34,220 @@ PORT = int(os.environ.get("HOOK_TELEMETRY_PORT", "9191"))
 # Histogram bucket boundaries (seconds)
 DURATION_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
 
+# Distinct values kept per label before new values collapse into OVERFLOW_LABEL
+MAX_LABEL_VALUES = int(os.environ.get("HOOK_TELEMETRY_MAX_LABEL_VALUES", "200"))
+OVERFLOW_LABEL = "__overflow__"
+
+# Seconds between background tail passes
+TAIL_INTERVAL = float(os.environ.get("HOOK_TELEMETRY_TAIL_INTERVAL", "1.0"))
+
+
+class JsonlTailer:
+    """Incrementally reads JSONL records appended to a file.
+
+    Tracks the file's inode and read offset. A new inode (rotation) or a
+    size below the offset (truncation) restarts reading from the beginning.
+    A trailing line without a newline is left for the next pass so records
+    being written are never parsed half-way.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._inode: int | None = None
+        self.position: int = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path or TELEMETRY_FILE
+
+    def read(self) -> Iterator[dict]:
+        """Yield records appended since the last call."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return
+        if stat.st_ino != self._inode or stat.st_size < self.position:
+            self._inode = stat.st_ino
+            self.position = 0
+        if stat.st_size == self.position:
+            return
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.position)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    self.position += len(raw)
+                    line = raw.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except OSError:
+            return
+
 
 class MetricsCollector:
-    """Collects and aggregates hook telemetry metrics."""
+    """Collects and aggregates hook telemetry metrics.
 
-    def __init__(self) -> None:
+    Records are folded into counters as they are read, so memory depends on
+    the number of label combinations, not on the number of new records.
+    With start() a background thread tails the file; otherwise each scrape
+    collects inline. The rendered exposition text is cached until new
+    records change the metrics.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_label_values: int = MAX_LABEL_VALUES,
+    ) -> None:
         self._lock = Lock()
-        self._last_position: int = 0
+        self._tailer = JsonlTailer(path)
+        self._max_label_values = max_label_values
+        self._label_values: dict[str, set[str]] = defaultdict(set)
         self._executions: dict[tuple[str, str, int], int] = defaultdict(int)
         self._errors: dict[tuple[str, str], int] = defaultdict(int)
         self._duration_sum: dict[tuple[str, str], float] = defaultdict(float)
         self._duration_count: dict[tuple[str, str], int] = defaultdict(int)
-        self._duration_buckets: dict[tuple[str, str, float], int] = defaultdict(int)
+        # Per-bucket (non-cumulative) counts; index len(DURATION_BUCKETS) is +Inf
+        self._duration_buckets: dict[tuple[str, str], list[int]] = {}
+        self._version = 0
+        self._rendered_version = -1
+        self._rendered = ""
+        self._stop = Event()
+        self._thread: Thread | None = None
 
-    def _read_new_records(self) -> list[dict]:
-        """Read new JSONL records since last position."""
-        records = []
-        try:
-            if not TELEMETRY_FILE.exists():
-                return records
-            with open(TELEMETRY_FILE, "r") as f:
-                f.seek(self._last_position)
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            records.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
-                self._last_position = f.tell()
-        except OSError:
-            pass
-        return records
+    def _label(self, name: str, value: object) -> str:
+        """Return value, or OVERFLOW_LABEL once the label is at its cap."""
+        value = str(value)
+        seen = self._label_values[name]
+        if value in seen:
+            return value
+        if len(seen) >= self._max_label_values:
+            return OVERFLOW_LABEL
+        seen.add(value)
+        return value
+
+    def _observe(self, record: dict) -> None:
+        hook_name = self._label("hook_name", record.get("hook_name", "unknown"))
+        event_type = self._label("event_type", record.get("event_type", "unknown"))
+        exit_code = record.get("exit_code", 0)
+        duration = record.get("duration_seconds", 0.0)
+        error = record.get("error")
 
-    def collect(self) -> None:
-        """Read new telemetry records and update metrics."""
-        records = self._read_new_records()
+        # Execution counter
+        self._executions[(hook_name, event_type, exit_code)] += 1
+
+        # Error counter
+        if exit_code != 0 and error:
+            error_type = "timeout" if exit_code == 124 else "command_not_found" if exit_code == 127 else "execution_error"
+            self._errors[(hook_name, error_type)] += 1
+
+        # Duration histogram
+        key = (hook_name, event_type)
+        self._duration_sum[key] += duration
+        self._duration_count[key] += 1
+        buckets = self._duration_buckets.get(key)
+        if buckets is None:
+            buckets = self._duration_buckets[key] = [0] * (len(DURATION_BUCKETS) + 1)
+        buckets[bisect.bisect_left(DURATION_BUCKETS, duration)] += 1
+
+    def collect(self) -> int:
+        """Read new telemetry records and update metrics.
+
+        Returns:
+            Number of records processed.
+        """
+        count = 0
         with self._lock:
-            for record in records:
-                hook_name = record.get("hook_name", "unknown")
-                event_type = record.get("event_type", "unknown")
-                exit_code = record.get("exit_code", 0)
-                duration = record.get("duration_seconds", 0.0)
-                error = record.get("error")
-
-                # Execution counter
-                self._executions[(hook_name, event_type, exit_code)] += 1
-
-                # Error counter
-                if exit_code != 0 and error:
-                    error_type = "timeout" if exit_code == 124 else "command_not_found" if exit_code == 127 else "execution_error"
-                    self._errors[(hook_name, error_type)] += 1
-
-                # Duration histogram
-                key = (hook_name, event_type)
-                self._duration_sum[key] += duration
-                self._duration_count[key] += 1
-                for bucket in DURATION_BUCKETS:
-                    if duration <= bucket:
-                        self._duration_buckets[(*key, bucket)] += 1
+            for record in self._tailer.read():
+                self._observe(record)
+                count += 1
+            if count:
+                self._version += 1
+        return count
+
+    def start(self, interval: float = TAIL_INTERVAL) -> None:
+        """Tail the telemetry file in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            self.collect()
+            self._stop.wait(interval)
 
     def format_metrics(self) -> str:
         """Format metrics in Prometheus exposition format."""
-        self.collect()
-        lines = []
+        if self._thread is None:
+            self.collect()
 
         with self._lock:
-            # Execution counter
-            if self._executions:
-                lines.append("# HELP asdlc_hook_executions_total Total number of hook executions")
-                lines.append("# TYPE asdlc_hook_executions_total counter")
-                for (hook_name, event_type, exit_code), count in sorted(self._executions.items()):
-                    lines.append(
-                        f'asdlc_hook_executions_total{{hook_name="{hook_name}",event_type="{event_type}",exit_code="{exit_code}"}} {count}'
-                    )
-
-            # Error counter
-            if self._errors:
-                lines.append("# HELP asdlc_hook_errors_total Total number of hook errors")
-                lines.append("# TYPE asdlc_hook_errors_total counter")
-                for (hook_name, error_type), count in sorted(self._errors.items()):
-                    lines.append(
-                        f'asdlc_hook_errors_total{{hook_name="{hook_name}",error_type="{error_type}"}} {count}'
-                    )
-
-            # Duration histogram
-            if self._duration_count:
-                lines.append("# HELP asdlc_hook_duration_seconds Hook execution duration in seconds")
-                lines.append("# TYPE asdlc_hook_duration_seconds histogram")
-                for key in sorted(self._duration_count.keys()):
-                    hook_name, event_type = key
-                    base_labels = f'hook_name="{hook_name}",event_type="{event_type}"'
-
-                    # Buckets
-                    cumulative = 0
-                    for bucket in DURATION_BUCKETS:
-                        cumulative += self._duration_buckets.get((*key, bucket), 0)
-                        lines.append(f'asdlc_hook_duration_seconds_bucket{{{base_labels},le="{bucket}"}} {cumulative}')
-                    lines.append(f'asdlc_hook_duration_seconds_bucket{{{base_labels},le="+Inf"}} {self._duration_count[key]}')
-                    lines.append(f'asdlc_hook_duration_seconds_sum{{{base_labels}}} {self._duration_sum[key]:.4f}')
-                    lines.append(f'asdlc_hook_duration_seconds_count{{{base_labels}}} {self._duration_count[key]}')
+            if self._rendered_version != self._version:
+                self._rendered = self._render()
+                self._rendered_version = self._version
+            return self._rendered
+
+    def _render(self) -> str:
+        lines = []
+
+        # Execution counter
+        if self._executions:
+            lines.append("# HELP asdlc_hook_executions_total Total number of hook executions")
+            lines.append("# TYPE asdlc_hook_executions_total counter")
+            for (hook_name, event_type, exit_code), count in sorted(self._executions.items()):
+                lines.append(
+                    f'asdlc_hook_executions_total{{hook_name="{_escape(hook_name)}",event_type="{_escape(event_type)}",exit_code="{exit_code}"}} {count}'
+                )
+
+        # Error counter
+        if self._errors:
+            lines.append("# HELP asdlc_hook_errors_total Total number of hook errors")
+            lines.append("# TYPE asdlc_hook_errors_total counter")
+            for (hook_name, error_type), count in sorted(self._errors.items()):
+                lines.append(
+                    f'asdlc_hook_errors_total{{hook_name="{_escape(hook_name)}",error_type="{error_type}"}} {count}'
+                )
+
+        # Duration histogram
+        if self._duration_count:
+            lines.append("# HELP asdlc_hook_duration_seconds Hook execution duration in seconds")
+            lines.append("# TYPE asdlc_hook_duration_seconds histogram")
+            for key in sorted(self._duration_count.keys()):
+                hook_name, event_type = key
+                base_labels = f'hook_name="{_escape(hook_name)}",event_type="{_escape(event_type)}"'
+                buckets = self._duration_buckets[key]
+
+                # Buckets
+                cumulative = 0
+                for bucket, count in zip(DURATION_BUCKETS, buckets, strict=False):
+                    cumulative += count
+                    lines.append(f'asdlc_hook_duration_seconds_bucket{{{base_labels},le="{bucket}"}} {cumulative}')
+                lines.append(f'asdlc_hook_duration_seconds_bucket{{{base_labels},le="+Inf"}} {self._duration_count[key]}')
+                lines.append(f'asdlc_hook_duration_seconds_sum{{{base_labels}}} {self._duration_sum[key]:.4f}')
+                lines.append(f'asdlc_hook_duration_seconds_count{{{base_labels}}} {self._duration_count[key]}')
 
         lines.append("")
         return "\n".join(lines)
 
 
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
 collector = MetricsCollector()
 
 
@@ -164,12 +277,14 @@ class MetricsHandler(BaseHTTPRequestHandler):
 
 
 def main() -> None:
+    collector.start()
     server = HTTPServer(("0.0.0.0", PORT), MetricsHandler)
     print(f"Hook telemetry exporter listening on :{PORT}/metrics")
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nShutting down hook telemetry exporter")
+        collector.stop()
         server.shutdown()
 
 
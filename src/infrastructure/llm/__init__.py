@@ -4,6 +4,7 @@ This package provides infrastructure for LLM integration including:
 - Model discovery for vendor APIs
 - Base client interface and implementations
 - Client factory for role-based configuration
+- Shared HTTP connection pools for provider SDKs
 """
 
 from src.infrastructure.llm.model_discovery import ModelDiscoveryService
@@ -13,6 +14,7 @@ from src.infrastructure.llm.factory import (
     LLMClientError,
     get_llm_client_factory,
 )
+from src.infrastructure.llm.http_pool import HTTPClientPool, get_http_client_pool
 
 __all__ = [
     "ModelDiscoveryService",
@@ -22,4 +24,6 @@ __all__ = [
     "LLMClientFactory",
     "LLMClientError",
     "get_llm_client_factory",
+    "HTTPClientPool",
+    "get_http_client_pool",
 ]
@@ -40,6 +40,7 @@ class AnthropicClient(BaseLLMClient):
         max_tokens: int = 16384,
         top_p: float | None = None,
         top_k: int | None = None,
+        http_client: Any | None = None,
     ) -> None:
         """Initialize the Anthropic client.
 
@@ -50,6 +51,7 @@ class AnthropicClient(BaseLLMClient):
             max_tokens: Maximum tokens in response.
             top_p: Nucleus sampling parameter.
             top_k: Top-k sampling parameter.
+            http_client: Optional shared httpx.AsyncClient for connection pooling.
         """
         super().__init__(
             api_key=api_key,
@@ -59,6 +61,7 @@ class AnthropicClient(BaseLLMClient):
             top_p=top_p,
             top_k=top_k,
         )
+        self._http_client = http_client
         self._client = None
 
     def _get_client(self) -> Any:
@@ -70,7 +73,10 @@ class AnthropicClient(BaseLLMClient):
         if self._client is None:
             import anthropic
 
-            self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
+            kwargs: dict[str, Any] = {"api_key": self._api_key}
+            if self._http_client is not None:
+                kwargs["http_client"] = self._http_client
+            self._client = anthropic.AsyncAnthropic(**kwargs)
         return self._client
 
     @property
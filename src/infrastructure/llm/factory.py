@@ -6,11 +6,15 @@ based on agent role and admin configuration.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, TYPE_CHECKING
+import os
+import time
+from typing import TYPE_CHECKING
 
 from src.core.exceptions import ASDLCError
 from src.infrastructure.llm.base_client import BaseLLMClient
+from src.infrastructure.llm.http_pool import HTTPClientPool, get_http_client_pool
 from src.orchestrator.api.models.llm_config import (
     AgentLLMConfig,
     AgentRole,
@@ -24,18 +28,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Default interval between checks of the shared config version (seconds)
+DEFAULT_VERSION_CHECK_SECONDS = 5.0
+
+
 class LLMClientError(ASDLCError):
     """Raised when LLM client operations fail."""
 
     pass
 
 
+# (provider, model, api_key_id, settings fingerprint, config version)
+ClientCacheKey = tuple[str, str, str, str, int]
+
+
 class LLMClientFactory:
     """Factory for creating LLM clients based on agent configuration.
 
     Reads configuration from LLMConfigService and creates appropriate
-    client instances for each agent role. Caches clients per role to
-    avoid recreating them.
+    client instances for each agent role. Clients are cached by
+    (provider, model, api_key_id, settings, config version), so roles with
+    identical configuration share a client and any config change produces
+    a fresh one. The factory listens for changes made through its config
+    service and also polls the shared config version (at most every
+    LLM_CONFIG_VERSION_CHECK_SECONDS) to pick up changes made by other
+    processes.
+
+    Anthropic and OpenAI clients built for the same API key share one
+    pooled HTTP transport from the HTTPClientPool.
 
     Usage:
         factory = LLMClientFactory()
@@ -49,15 +69,35 @@ class LLMClientFactory:
     def __init__(
         self,
         config_service: LLMConfigService | None = None,
+        http_pool: HTTPClientPool | None = None,
+        version_check_seconds: float | None = None,
     ) -> None:
         """Initialize the factory.
 
         Args:
             config_service: Optional LLMConfigService instance. If not provided,
                 will use the global singleton.
+            http_pool: Optional HTTP client pool. Defaults to the global pool.
+            version_check_seconds: Interval between config version checks.
+                Defaults to LLM_CONFIG_VERSION_CHECK_SECONDS or 5.
         """
         self._config_service = config_service
-        self._client_cache: dict[AgentRole, BaseLLMClient] = {}
+        self._http_pool = (
+            http_pool if http_pool is not None else get_http_client_pool()
+        )
+        if version_check_seconds is None:
+            version_check_seconds = float(
+                os.environ.get(
+                    "LLM_CONFIG_VERSION_CHECK_SECONDS", DEFAULT_VERSION_CHECK_SECONDS
+                )
+            )
+        self._version_check_seconds = version_check_seconds
+        self._config_version = 0
+        self._version_checked_at: float | None = None
+        self._client_cache: dict[ClientCacheKey, BaseLLMClient] = {}
+        self._role_clients: dict[AgentRole, tuple[int, BaseLLMClient]] = {}
+        if config_service is not None:
+            self._register_listener(config_service)
 
     def _get_config_service(self) -> LLMConfigService:
         """Get the config service, creating if needed.
@@ -71,15 +111,70 @@ class LLMClientFactory:
             )
 
             self._config_service = get_llm_config_service()
+            self._register_listener(self._config_service)
         return self._config_service
 
+    def _register_listener(self, config_service: LLMConfigService) -> None:
+        """Subscribe to config change notifications.
+
+        Args:
+            config_service: The config service to listen to.
+        """
+        add_listener = getattr(config_service, "add_change_listener", None)
+        if callable(add_listener):
+            add_listener(self._on_config_changed)
+
+    def _on_config_changed(self) -> None:
+        """Force a config version check on the next lookup."""
+        self._version_checked_at = None
+        self._role_clients.clear()
+
+    async def _current_version(self) -> int:
+        """Return the config version, re-reading it when the check is due.
+
+        Falls back to the last known version if the read fails, so a
+        Redis outage does not break requests served from cache.
+
+        Returns:
+            int: The config version.
+        """
+        now = time.monotonic()
+        if (
+            self._version_checked_at is not None
+            and now - self._version_checked_at < self._version_check_seconds
+        ):
+            return self._config_version
+
+        try:
+            version = int(await self._get_config_service().get_config_version())
+        except Exception as e:
+            logger.debug(f"Could not read LLM config version: {e}")
+            version = self._config_version
+        self._version_checked_at = now
+
+        if version != self._config_version:
+            logger.info(
+                f"LLM config version changed ({self._config_version} -> {version}), "
+                "dropping cached clients"
+            )
+            self._config_version = version
+            self._role_clients.clear()
+            self._client_cache = {
+                key: client
+                for key, client in self._client_cache.items()
+                if key[4] == version
+            }
+        return version
+
     async def get_client(
         self,
         role: AgentRole | str,
     ) -> BaseLLMClient:
         """Get a configured LLM client for the given agent role.
 
-        Creates a new client if not cached, or returns the cached instance.
+        Returns the cached client while the config version is unchanged;
+        otherwise re-reads the role's config and reuses or creates the
+        client for it.
 
         Args:
             role: The agent role (AgentRole enum or string).
@@ -98,8 +193,10 @@ class LLMClientFactory:
                 raise LLMClientError(f"Invalid agent role: {role}") from e
 
         # Check cache first
-        if role in self._client_cache:
-            return self._client_cache[role]
+        version = await self._current_version()
+        cached = self._role_clients.get(role)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
         # Get config from service
         config_service = self._get_config_service()
@@ -112,19 +209,59 @@ class LLMClientFactory:
         if not config.api_key_id:
             raise LLMClientError(f"No API key configured for agent {role.value}")
 
-        # Get decrypted API key
-        api_key = await config_service.get_decrypted_key(config.api_key_id)
-        if not api_key:
-            raise LLMClientError(f"API key not found: {config.api_key_id}")
+        key: ClientCacheKey = (
+            config.provider.value,
+            config.model,
+            config.api_key_id,
+            config.settings.model_dump_json(),
+            version,
+        )
+        client = self._client_cache.get(key)
+        if client is None:
+            # Get decrypted API key
+            api_key = await config_service.get_decrypted_key(config.api_key_id)
+            if not api_key:
+                raise LLMClientError(f"API key not found: {config.api_key_id}")
+
+            # Create the appropriate client
+            client = self._create_client(config, api_key)
+            self._client_cache[key] = client
+            logger.info(
+                f"Created LLM client for {role.value}: "
+                f"{config.provider.value}/{config.model}"
+            )
 
-        # Create the appropriate client
-        client = self._create_client(config, api_key)
+        self._role_clients[role] = (version, client)
+        return client
 
-        # Cache and return
-        self._client_cache[role] = client
-        logger.info(f"Created LLM client for {role.value}: {config.provider.value}/{config.model}")
+    async def warmup(self, roles: list[AgentRole] | None = None) -> int:
+        """Create clients and open provider connections ahead of first use.
 
-        return client
+        Roles that are disabled or not configured are skipped.
+
+        Args:
+            roles: Roles to warm up. Defaults to all roles.
+
+        Returns:
+            int: Number of roles with a ready client.
+        """
+        roles = list(AgentRole) if roles is None else roles
+
+        async def _resolve(role: AgentRole) -> bool:
+            try:
+                await self.get_client(role)
+                return True
+            except Exception as e:
+                logger.debug(f"Skipping warmup for {role.value}: {e}")
+                return False
+
+        ready = sum(await asyncio.gather(*(_resolve(role) for role in roles)))
+        connected = await self._http_pool.warmup()
+        logger.info(
+            f"Warmed up LLM clients for {ready} roles "
+            f"({connected} provider connections)"
+        )
+        return ready
 
     def _create_client(
         self,
@@ -153,6 +290,7 @@ class LLMClientFactory:
                 max_tokens=config.settings.max_tokens,
                 top_p=config.settings.top_p,
                 top_k=config.settings.top_k,
+                http_client=self._http_pool.get("anthropic", api_key),
             )
         elif config.provider == LLMProvider.OPENAI:
             from src.infrastructure.llm.clients.openai_client import OpenAIClient
@@ -163,6 +301,7 @@ class LLMClientFactory:
                 temperature=config.settings.temperature,
                 max_tokens=config.settings.max_tokens,
                 top_p=config.settings.top_p,
+                http_client=self._http_pool.get("openai", api_key),
             )
         elif config.provider == LLMProvider.GOOGLE:
             from src.infrastructure.llm.clients.google_client import GoogleClient
@@ -181,9 +320,10 @@ class LLMClientFactory:
     def clear_cache(self) -> None:
         """Clear the client cache.
 
-        Useful when configuration has changed and clients need to be recreated.
+        Pooled HTTP connections are kept; only client instances are dropped.
         """
         self._client_cache.clear()
+        self._role_clients.clear()
         logger.info("Cleared LLM client cache")
 
     def remove_from_cache(self, role: AgentRole) -> bool:
@@ -195,11 +335,16 @@ class LLMClientFactory:
         Returns:
             bool: True if removed, False if not in cache.
         """
-        if role in self._client_cache:
-            del self._client_cache[role]
-            logger.info(f"Removed {role.value} from LLM client cache")
-            return True
-        return False
+        cached = self._role_clients.pop(role, None)
+        if cached is None:
+            return False
+        _, client = cached
+        if not any(c is client for _, c in self._role_clients.values()):
+            self._client_cache = {
+                key: c for key, c in self._client_cache.items() if c is not client
+            }
+        logger.info(f"Removed {role.value} from LLM client cache")
+        return True
 
 
 # Global factory instance
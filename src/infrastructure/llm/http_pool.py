@@ -0,0 +1,182 @@
+"""Shared HTTP connection pools for LLM provider SDKs.
+
+The Anthropic and OpenAI SDKs each create their own httpx client (and
+connection pool) per SDK instance. This module keeps one pooled
+``httpx.AsyncClient`` per (provider, API key) pair so every LLM client
+using the same credentials shares keep-alive connections, and HTTP/2
+where the ``h2`` package is installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+# Providers whose SDKs accept an injected httpx.AsyncClient
+PROVIDER_BASE_URLS = {
+    "anthropic": "https://api.anthropic.com",
+    "openai": "https://api.openai.com",
+}
+
+# Timeout used for warmup requests (seconds)
+WARMUP_TIMEOUT_SECONDS = 5.0
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2.
+
+    Returns:
+        bool: True if the optional h2 package is installed.
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientPool:
+    """Pool of shared httpx clients keyed by provider and API key.
+
+    API keys are hashed before being used as keys so plaintext keys are
+    not retained in the pool's index.
+
+    Environment variables:
+        LLM_HTTP_MAX_CONNECTIONS: Max connections per client (default: 100)
+        LLM_HTTP_MAX_KEEPALIVE: Max idle keep-alive connections (default: 20)
+        LLM_HTTP_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds
+            (default: 60)
+
+    Usage:
+        pool = get_http_client_pool()
+        http_client = pool.get("anthropic", api_key)
+        sdk = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_connections: Max connections per client.
+            max_keepalive_connections: Max idle keep-alive connections.
+            keepalive_expiry: Idle connection lifetime in seconds.
+        """
+        self._limits = httpx.Limits(
+            max_connections=max_connections
+            or int(os.environ.get("LLM_HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=max_keepalive_connections
+            or int(os.environ.get("LLM_HTTP_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=keepalive_expiry
+            or float(os.environ.get("LLM_HTTP_KEEPALIVE_EXPIRY", "60")),
+        )
+        self._http2 = _http2_available()
+        self._clients: dict[tuple[str, str], httpx.AsyncClient] = {}
+
+    @property
+    def http2(self) -> bool:
+        """Whether pooled clients negotiate HTTP/2."""
+        return self._http2
+
+    def __len__(self) -> int:
+        """Return the number of pooled clients."""
+        return len(self._clients)
+
+    @staticmethod
+    def supports(provider: str) -> bool:
+        """Check whether a provider's SDK can use a pooled client.
+
+        Args:
+            provider: Provider name (e.g. "anthropic").
+
+        Returns:
+            bool: True if the provider accepts an injected httpx client.
+        """
+        return provider in PROVIDER_BASE_URLS
+
+    def get(self, provider: str, api_key: str) -> httpx.AsyncClient:
+        """Get the shared client for a provider and API key.
+
+        Args:
+            provider: Provider name (e.g. "anthropic").
+            api_key: The plaintext API key.
+
+        Returns:
+            httpx.AsyncClient: The pooled client.
+        """
+        key = (provider, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self._limits,
+                http2=self._http2,
+                follow_redirects=True,
+            )
+            self._clients[key] = client
+            logger.debug(
+                f"Created pooled HTTP client for {provider} (http2={self._http2})"
+            )
+        return client
+
+    async def warmup(self) -> int:
+        """Open a connection on every pooled client.
+
+        Sends a HEAD request to each provider's API host so TCP and TLS
+        setup happen before the first real request. Failures are ignored.
+
+        Returns:
+            int: Number of clients that connected.
+        """
+
+        async def _warm(provider: str, client: httpx.AsyncClient) -> bool:
+            try:
+                await client.head(
+                    PROVIDER_BASE_URLS[provider], timeout=WARMUP_TIMEOUT_SECONDS
+                )
+                return True
+            except httpx.HTTPError as e:
+                logger.debug(f"Warmup for {provider} failed: {e}")
+                return False
+
+        results = await asyncio.gather(
+            *(
+                _warm(provider, client)
+                for (provider, _), client in self._clients.items()
+            )
+        )
+        return sum(results)
+
+    async def aclose(self) -> None:
+        """Close all pooled clients."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+
+
+# Global pool instance
+_http_client_pool: HTTPClientPool | None = None
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Get the global HTTP client pool.
+
+    Returns:
+        HTTPClientPool: The pool instance.
+    """
+    global _http_client_pool
+    if _http_client_pool is None:
+        _http_client_pool = HTTPClientPool()
+    return _http_client_pool
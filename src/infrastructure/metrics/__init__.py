@@ -36,13 +36,26 @@ from src.infrastructure.metrics.collectors import (
 from src.infrastructure.metrics.definitions import (
     ACTIVE_TASKS,
     ACTIVE_WORKERS,
+    AGENTS_WS_CONNECTIONS,
+    AGENTS_WS_SEND_OVERFLOWS,
+    CLASSIFICATION_BATCH_DURATION,
+    CLASSIFICATION_BATCH_THROUGHPUT,
+    CLASSIFICATION_IDEA_LATENCY,
+    CLASSIFICATION_IDEAS_PROCESSED,
     EVENTS_PROCESSED,
+    K8S_INFORMER_CACHE_AGE,
+    K8S_INFORMER_EVENTS,
+    K8S_INFORMER_RELISTS,
+    METRICS_PROXY_CACHE_REQUESTS,
+    METRICS_PROXY_UPSTREAM_LATENCY,
     PROCESS_CPU_PERCENT,
     PROCESS_MEMORY_BYTES,
     REDIS_CONNECTION_UP,
     REDIS_LATENCY,
     REQUEST_COUNT,
     REQUEST_LATENCY,
+    SECRETS_CACHE_LOOKUPS,
+    SECRETS_CACHE_WRITEBACKS,
     SERVICE_INFO,
 )
 
@@ -68,6 +81,19 @@ __all__ = [
     "EVENTS_PROCESSED",
     "ACTIVE_TASKS",
     "ACTIVE_WORKERS",
+    "CLASSIFICATION_IDEAS_PROCESSED",
+    "CLASSIFICATION_IDEA_LATENCY",
+    "CLASSIFICATION_BATCH_DURATION",
+    "CLASSIFICATION_BATCH_THROUGHPUT",
+    "SECRETS_CACHE_LOOKUPS",
+    "SECRETS_CACHE_WRITEBACKS",
+    "METRICS_PROXY_CACHE_REQUESTS",
+    "METRICS_PROXY_UPSTREAM_LATENCY",
+    "AGENTS_WS_CONNECTIONS",
+    "AGENTS_WS_SEND_OVERFLOWS",
+    "K8S_INFORMER_CACHE_AGE",
+    "K8S_INFORMER_EVENTS",
+    "K8S_INFORMER_RELISTS",
     "REDIS_CONNECTION_UP",
     "REDIS_LATENCY",
     "PROCESS_MEMORY_BYTES",
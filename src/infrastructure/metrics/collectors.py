@@ -137,7 +137,8 @@ class WorkerPoolCollector(Collector):
         """Collect worker pool metrics.
 
         Yields:
-            GaugeMetricFamily: Active workers and events processed metrics.
+            GaugeMetricFamily: Active workers, events processed, and per-lane
+                queue depth and lag metrics.
         """
         try:
             stats = self.worker_pool.get_stats()
@@ -173,6 +174,29 @@ class WorkerPoolCollector(Collector):
         )
         yield events_processed
 
+        # Per-lane queue depth and lag, for autoscaling the worker Deployment
+        lanes = stats.get("lanes") or {}
+        if lanes:
+            queue_depth = GaugeMetricFamily(
+                "asdlc_worker_queue_depth",
+                "Events waiting for or held by the worker consumer group",
+                labels=["service", "lane"],
+            )
+            queue_lag = GaugeMetricFamily(
+                "asdlc_worker_queue_lag_seconds",
+                "Age of the oldest event not yet delivered to the worker consumer group",
+                labels=["service", "lane"],
+            )
+            for lane, lane_stats in sorted(lanes.items()):
+                queue_depth.add_metric(
+                    [self.service_name, lane], lane_stats.get("depth", 0)
+                )
+                queue_lag.add_metric(
+                    [self.service_name, lane], lane_stats.get("lag_seconds", 0.0)
+                )
+            yield queue_depth
+            yield queue_lag
+
 
 class ProcessMetricsCollector(Collector):
     """Collector for process resource metrics.
@@ -64,6 +64,103 @@ ACTIVE_WORKERS = Gauge(
     ["service"],
 )
 
+# =============================================================================
+# Classification Worker Metrics
+# =============================================================================
+
+CLASSIFICATION_IDEAS_PROCESSED = Counter(
+    "asdlc_classification_ideas_processed_total",
+    "Total number of ideas processed by the classification worker",
+    ["status"],
+)
+
+CLASSIFICATION_IDEA_LATENCY = Histogram(
+    "asdlc_classification_idea_latency_seconds",
+    "Time from enqueue to classification result per idea in seconds",
+    buckets=[0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0],
+)
+
+CLASSIFICATION_BATCH_DURATION = Histogram(
+    "asdlc_classification_batch_duration_seconds",
+    "Time from enqueue to completion of a batch classification job in seconds",
+    buckets=[1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0],
+)
+
+CLASSIFICATION_BATCH_THROUGHPUT = Gauge(
+    "asdlc_classification_batch_throughput_ideas_per_second",
+    "Ideas per second of the most recently completed batch classification job",
+)
+
+# =============================================================================
+# Secrets Cache Metrics
+# =============================================================================
+
+SECRETS_CACHE_LOOKUPS = Counter(
+    "asdlc_secrets_cache_lookups_total",
+    "Secret lookups served by the in-process cache, by result",
+    ["result"],
+)
+
+SECRETS_CACHE_WRITEBACKS = Counter(
+    "asdlc_secrets_cache_writebacks_total",
+    "Write-backs of primary secret values to the fallback store, by result",
+    ["result"],
+)
+
+# =============================================================================
+# VictoriaMetrics Proxy Metrics
+# =============================================================================
+
+METRICS_PROXY_CACHE_REQUESTS = Counter(
+    "asdlc_metrics_proxy_cache_requests_total",
+    "VictoriaMetrics proxy queries by cache result (hit, miss, coalesced)",
+    ["query_type", "result"],
+)
+
+METRICS_PROXY_UPSTREAM_LATENCY = Histogram(
+    "asdlc_metrics_proxy_upstream_duration_seconds",
+    "Latency of VictoriaMetrics requests made by the metrics proxy in seconds",
+    ["query_type"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+# =============================================================================
+# Agents WebSocket Metrics
+# =============================================================================
+
+AGENTS_WS_CONNECTIONS = Gauge(
+    "asdlc_agents_ws_connections",
+    "Open agents dashboard WebSocket connections",
+)
+
+AGENTS_WS_SEND_OVERFLOWS = Counter(
+    "asdlc_agents_ws_send_overflows_total",
+    "Agents WebSocket messages not delivered because a client fell behind",
+    ["action"],
+)
+
+# =============================================================================
+# K8s Informer Metrics
+# =============================================================================
+
+K8S_INFORMER_CACHE_AGE = Gauge(
+    "asdlc_k8s_informer_cache_age_seconds",
+    "Seconds since the K8s informer store last heard from the API server",
+    ["resource"],
+)
+
+K8S_INFORMER_EVENTS = Counter(
+    "asdlc_k8s_informer_events_total",
+    "K8s watch events applied to the informer store",
+    ["resource", "type"],
+)
+
+K8S_INFORMER_RELISTS = Counter(
+    "asdlc_k8s_informer_relists_total",
+    "Full K8s lists made by the informer (initial sync and expired watches)",
+    ["resource"],
+)
+
 # =============================================================================
 # Redis Metrics
 # =============================================================================
@@ -108,6 +205,19 @@ __all__ = [
     "EVENTS_PROCESSED",
     "ACTIVE_TASKS",
     "ACTIVE_WORKERS",
+    "CLASSIFICATION_IDEAS_PROCESSED",
+    "CLASSIFICATION_IDEA_LATENCY",
+    "CLASSIFICATION_BATCH_DURATION",
+    "CLASSIFICATION_BATCH_THROUGHPUT",
+    "SECRETS_CACHE_LOOKUPS",
+    "SECRETS_CACHE_WRITEBACKS",
+    "METRICS_PROXY_CACHE_REQUESTS",
+    "METRICS_PROXY_UPSTREAM_LATENCY",
+    "AGENTS_WS_CONNECTIONS",
+    "AGENTS_WS_SEND_OVERFLOWS",
+    "K8S_INFORMER_CACHE_AGE",
+    "K8S_INFORMER_EVENTS",
+    "K8S_INFORMER_RELISTS",
     "REDIS_CONNECTION_UP",
     "REDIS_LATENCY",
     "PROCESS_MEMORY_BYTES",
@@ -14,7 +14,12 @@ from typing import Any
 import redis.asyncio as redis
 
 from src.core.config import RedisConfig, get_redis_config, get_tenant_config
-from src.core.events import ASDLCEvent, EventType, generate_idempotency_key
+from src.core.events import (
+    ASDLCEvent,
+    EventPriority,
+    EventType,
+    generate_idempotency_key,
+)
 from src.core.exceptions import ConsumerGroupError, StreamError
 from src.core.redis_client import get_redis_client
 from src.core.tenant import TenantContext
@@ -25,6 +30,9 @@ logger = logging.getLogger(__name__)
 # Default TTL for idempotency keys (7 days)
 DEFAULT_IDEMPOTENCY_TTL = 86400 * 7
 
+# Suffix of the stream carrying urgent AGENT_STARTED events
+URGENT_STREAM_SUFFIX = ":urgent"
+
 
 @dataclass
 class StreamEvent:
@@ -347,6 +355,24 @@ def get_stream_name(base_name: str | None = None) -> str:
     return base_name
 
 
+def get_lane_stream_name(stream_name: str, priority: EventPriority) -> str:
+    """Get the stream for a dispatch lane.
+
+    Bulk events use the base stream; urgent events use a sibling stream
+    so workers can drain them ahead of any bulk backlog.
+
+    Args:
+        stream_name: The base (possibly tenant-prefixed) stream name.
+        priority: The event's dispatch lane.
+
+    Returns:
+        str: The lane's stream name.
+    """
+    if priority == EventPriority.URGENT:
+        return f"{stream_name}{URGENT_STREAM_SUFFIX}"
+    return stream_name
+
+
 async def publish_event_model(
     event: ASDLCEvent,
     client: redis.Redis | None = None,
@@ -357,6 +383,7 @@ async def publish_event_model(
 
     This is the preferred method for publishing events, as it ensures
     proper validation, tenant context injection, and idempotency key generation.
+    Urgent events go to the urgent lane of the stream.
 
     Args:
         event: The validated event model to publish.
@@ -376,6 +403,29 @@ async def publish_event_model(
     if stream_name is None:
         stream_name = get_stream_name()
 
+    event_data = _prepare_event_model(event)
+    stream_name = get_lane_stream_name(stream_name, event.priority)
+
+    try:
+        event_id = await client.xadd(stream_name, event_data, maxlen=maxlen)
+        logger.debug(f"Published event {event_id}: {event.event_type.value}")
+        return event_id
+    except redis.RedisError as e:
+        raise StreamError(
+            f"Failed to publish event: {e}",
+            details={"event_type": event.event_type.value, "stream": stream_name},
+        ) from e
+
+
+def _prepare_event_model(event: ASDLCEvent) -> dict[str, str]:
+    """Inject tenant and idempotency key, then serialize for the stream.
+
+    Args:
+        event: The event to prepare. Modified in place.
+
+    Returns:
+        dict[str, str]: Stream-format event fields.
+    """
     # Inject tenant context if not already set
     tenant_config = get_tenant_config()
     if tenant_config.enabled and not event.tenant_id:
@@ -394,16 +444,56 @@ async def publish_event_model(
         )
 
     # Serialize to stream format
-    event_data = event.to_stream_dict()
+    return event.to_stream_dict()
+
+
+async def publish_event_models(
+    events: list[ASDLCEvent],
+    client: redis.Redis | None = None,
+    stream_name: str | None = None,
+    maxlen: int = 10000,
+) -> list[str]:
+    """Publish several validated events in a single pipelined round trip.
+
+    Events are prepared exactly as in publish_event_model and appended
+    to the stream in order.
+
+    Args:
+        events: The event models to publish.
+        client: Redis client. Creates one if not provided.
+        stream_name: Stream name. Uses tenant-aware default if not provided.
+        maxlen: Maximum stream length for trimming.
+
+    Returns:
+        list[str]: The event IDs assigned by Redis, in input order.
+
+    Raises:
+        StreamError: If publishing fails.
+    """
+    if not events:
+        return []
+
+    if client is None:
+        client = await get_redis_client()
+
+    if stream_name is None:
+        stream_name = get_stream_name()
 
     try:
-        event_id = await client.xadd(stream_name, event_data, maxlen=maxlen)
-        logger.debug(f"Published event {event_id}: {event.event_type.value}")
-        return event_id
+        async with client.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(
+                    get_lane_stream_name(stream_name, event.priority),
+                    _prepare_event_model(event),
+                    maxlen=maxlen,
+                )
+            event_ids = await pipe.execute()
+        logger.debug(f"Published {len(event_ids)} events to {stream_name}")
+        return list(event_ids)
     except redis.RedisError as e:
         raise StreamError(
-            f"Failed to publish event: {e}",
-            details={"event_type": event.event_type.value, "stream": stream_name},
+            f"Failed to publish event batch: {e}",
+            details={"count": len(events), "stream": stream_name},
         ) from e
 
 
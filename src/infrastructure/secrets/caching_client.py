@@ -1,42 +1,106 @@
 """Caching secrets client with GCP primary and Infisical fallback."""
 
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Any
-
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src.infrastructure.metrics.definitions import (
+    SECRETS_CACHE_LOOKUPS,
+    SECRETS_CACHE_WRITEBACKS,
+)
 from src.infrastructure.secrets.client import SecretsClient
 
 logger = logging.getLogger(__name__)
 
+# Default lifetime of a locally cached value before it is revalidated
+DEFAULT_SECRETS_CACHE_TTL_SECONDS = 300.0
+
+# Default window after expiry during which a stale value is still served
+# while a background refresh runs
+DEFAULT_SECRETS_CACHE_STALE_SECONDS = 3600.0
+
+
+@dataclass
+class _CacheEntry:
+    """A locally cached secret value."""
+
+    value: str
+    fresh_until: float
+    stale_until: float
+
 
 class CachingSecretsClient(SecretsClient):
     """GCP-primary with Infisical cache fallback.
 
     This client implements a caching pattern where:
     - GCP Secret Manager is the source of truth
-    - Infisical serves as a local cache for resilience
-    - On successful GCP reads, values are cached to Infisical
+    - Values read from GCP are kept in a process-local TTL cache
+    - Expired values are served while a background refresh runs
+      (stale-while-revalidate)
+    - Concurrent lookups of the same secret share a single GCP call
+    - Infisical serves as a local cache for resilience; values are written
+      back in the background, and only when they change
     - On GCP failure, cached values from Infisical are used (read-only mode)
     - Writes always require GCP connectivity
 
     Environment variables:
+    - SECRETS_CACHE_TTL_SECONDS: Local cache freshness (default: 300, 0 disables)
+    - SECRETS_CACHE_STALE_SECONDS: Stale-while-revalidate window (default: 3600)
     - Inherits from GCPSecretsClient and InfisicalSecretsClient
     """
 
     def __init__(
-        self, gcp_client: SecretsClient, infisical_client: SecretsClient
+        self,
+        gcp_client: SecretsClient,
+        infisical_client: SecretsClient,
+        ttl_seconds: float | None = None,
+        stale_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize with GCP primary and Infisical cache clients.
 
         Args:
             gcp_client: Primary GCP Secret Manager client
             infisical_client: Infisical client for caching
+            ttl_seconds: Local cache freshness. Defaults to
+                SECRETS_CACHE_TTL_SECONDS or 300.
+            stale_seconds: How long an expired value may still be served
+                while it is refreshed. Defaults to
+                SECRETS_CACHE_STALE_SECONDS or 3600.
+            clock: Monotonic time source (injectable for tests)
         """
         self.primary = gcp_client
         self.cache = infisical_client
         self._using_cache = False
         self._cache_warning_shown = False
 
+        if ttl_seconds is None:
+            ttl_seconds = float(
+                os.environ.get(
+                    "SECRETS_CACHE_TTL_SECONDS", DEFAULT_SECRETS_CACHE_TTL_SECONDS
+                )
+            )
+        if stale_seconds is None:
+            stale_seconds = float(
+                os.environ.get(
+                    "SECRETS_CACHE_STALE_SECONDS", DEFAULT_SECRETS_CACHE_STALE_SECONDS
+                )
+            )
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._clock = clock
+
+        self._entries: dict[tuple[str, str], _CacheEntry] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+        # Last value known to be in Infisical, to skip redundant write-backs
+        self._written: dict[tuple[str, str], str] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+        self._stats = {"hit": 0, "stale": 0, "miss": 0, "coalesced": 0}
+
     @property
     def backend_type(self) -> str:
         """Return the backend type identifier.
@@ -49,8 +113,11 @@ class CachingSecretsClient(SecretsClient):
     async def get_secret(self, name: str, environment: str = "dev") -> str | None:
         """Get a secret value, with automatic fallback to cache.
 
-        Attempts to get from GCP first. On success, updates the local cache.
-        On failure, falls back to the cached value in Infisical.
+        Serves fresh values from the in-process cache. Expired values are
+        served for up to ``stale_seconds`` while a background refresh runs.
+        Otherwise the value is fetched from GCP, with concurrent callers for
+        the same secret sharing one request. On GCP failure, falls back to
+        the cached value in Infisical.
 
         Args:
             name: Secret name (e.g., "SLACK_BOT_TOKEN")
@@ -59,19 +126,130 @@ class CachingSecretsClient(SecretsClient):
         Returns:
             Secret value or None if not found in either backend
         """
+        key = (environment, name)
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = self._clock()
+            if now < entry.fresh_until:
+                self._record_lookup("hit")
+                return entry.value
+            if now < entry.stale_until:
+                self._record_lookup("stale")
+                self._get_or_start_fetch(key)
+                return entry.value
+
+        if key in self._inflight:
+            self._record_lookup("coalesced")
+        else:
+            self._record_lookup("miss")
+        # Shield so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(self._get_or_start_fetch(key))
+
+    def _get_or_start_fetch(
+        self, key: tuple[str, str]
+    ) -> asyncio.Task[str | None]:
+        """Return the in-flight fetch for a secret, starting one if needed.
+
+        Args:
+            key: (environment, name) tuple
+
+        Returns:
+            The task resolving to the secret value
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return task
+
+    async def _fetch(self, key: tuple[str, str]) -> str | None:
+        """Fetch a secret from GCP, falling back to Infisical on failure.
+
+        Args:
+            key: (environment, name) tuple
+
+        Returns:
+            Secret value or None if not found
+        """
+        environment, name = key
         try:
             value = await self.primary.get_secret(name, environment)
-            if value is not None:
-                await self._update_cache(name, value, environment)
-                self._using_cache = False
-                return value
-            return None
         except Exception as e:
             logger.warning(f"GCP unavailable ({e}), using Infisical cache")
             self._using_cache = True
             self._show_cache_warning()
             return await self.cache.get_secret(name, environment)
 
+        self._using_cache = False
+        self._cache_warning_shown = False
+        if value is None:
+            self._entries.pop(key, None)
+            return None
+
+        self._store(key, value)
+        if self._written.get(key) == value:
+            SECRETS_CACHE_WRITEBACKS.labels(result="skipped").inc()
+        else:
+            self._written[key] = value
+            self._run_in_background(self._update_cache(name, value, environment))
+        return value
+
+    def _store(self, key: tuple[str, str], value: str) -> None:
+        """Store a value in the in-process cache.
+
+        Args:
+            key: (environment, name) tuple
+            value: Secret value
+        """
+        if self.ttl_seconds <= 0:
+            return
+        now = self._clock()
+        fresh_until = now + self.ttl_seconds
+        self._entries[key] = _CacheEntry(
+            value=value,
+            fresh_until=fresh_until,
+            stale_until=fresh_until + self.stale_seconds,
+        )
+
+    def _record_lookup(self, result: str) -> None:
+        """Count a lookup outcome.
+
+        Args:
+            result: One of hit, stale, miss, coalesced
+        """
+        self._stats[result] += 1
+        SECRETS_CACHE_LOOKUPS.labels(result=result).inc()
+
+    def _run_in_background(self, coro: Any) -> None:
+        """Run a coroutine without awaiting it, keeping a reference.
+
+        Args:
+            coro: Coroutine to schedule
+        """
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def drain(self) -> None:
+        """Wait for pending background refreshes and write-backs."""
+        while self._background or self._inflight:
+            await asyncio.gather(
+                *self._background, *self._inflight.values(), return_exceptions=True
+            )
+
+    def invalidate(self, name: str | None = None, environment: str = "dev") -> None:
+        """Drop locally cached values.
+
+        Args:
+            name: Secret to drop, or None to clear the whole cache
+            environment: Environment scope when ``name`` is given
+        """
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop((environment, name), None)
+
     async def _update_cache(
         self, name: str, value: str, environment: str
     ) -> None:
@@ -84,7 +262,12 @@ class CachingSecretsClient(SecretsClient):
         """
         try:
             await self.cache.set_secret(name, value, environment)
+            SECRETS_CACHE_WRITEBACKS.labels(result="written").inc()
         except Exception as e:
+            # Forget the value so the next read retries the write-back
+            if self._written.get((environment, name)) == value:
+                del self._written[(environment, name)]
+            SECRETS_CACHE_WRITEBACKS.labels(result="failed").inc()
             logger.debug(f"Failed to update cache for {name}: {e}")
 
     def _show_cache_warning(self) -> None:
@@ -114,10 +297,13 @@ class CachingSecretsClient(SecretsClient):
         try:
             result = await self.primary.set_secret(name, value, environment)
             if result:
+                key = (environment, name)
+                self._store(key, value)
                 try:
                     await self.cache.set_secret(name, value, environment)
+                    self._written[key] = value
                 except Exception:
-                    pass  # Cache update is best-effort
+                    self._written.pop(key, None)  # Cache update is best-effort
             return result
         except Exception as e:
             logger.error(
@@ -159,6 +345,8 @@ class CachingSecretsClient(SecretsClient):
         try:
             result = await self.primary.delete_secret(name, environment)
             if result:
+                self._entries.pop((environment, name), None)
+                self._written.pop((environment, name), None)
                 try:
                     await self.cache.delete_secret(name, environment)
                 except Exception:
@@ -206,6 +394,7 @@ class CachingSecretsClient(SecretsClient):
             "using_cache": self._using_cache,
             "primary": {},
             "cache": {},
+            "local_cache": {"entries": len(self._entries), **self._stats},
         }
         try:
             primary_health = await self.primary.health_check()
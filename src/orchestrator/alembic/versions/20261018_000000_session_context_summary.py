@@ -0,0 +1,44 @@
+"""Add rolling context summary to ideation sessions
+
+Revision ID: 002_session_context_summary
+Revises: 001_initial
+Create Date: 2026-10-18 00:00:00.000000
+
+Adds the columns the ideation chat uses to keep a rolling summary of
+older conversation messages with the session:
+- context_summary: The summary text
+- summarized_message_count: Number of messages folded into the summary
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "002_session_context_summary"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add context summary columns to ideation_sessions."""
+    op.add_column(
+        "ideation_sessions",
+        sa.Column("context_summary", sa.Text(), nullable=False, server_default=""),
+    )
+    op.add_column(
+        "ideation_sessions",
+        sa.Column(
+            "summarized_message_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop context summary columns from ideation_sessions."""
+    op.drop_column("ideation_sessions", "summarized_message_count")
+    op.drop_column("ideation_sessions", "context_summary")
@@ -0,0 +1,33 @@
+"""Add composite index for message keyset pagination
+
+Revision ID: 003_message_keyset_index
+Revises: 002_session_context_summary
+Create Date: 2026-10-18 00:01:00.000000
+
+Adds a (session_id, timestamp, id) index on ideation_messages so keyset
+pages and "last N messages" queries for a session are index range scans
+in either direction, instead of filtering on session_id and sorting.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_message_keyset_index"
+down_revision: Union[str, None] = "002_session_context_summary"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the composite message index."""
+    op.create_index(
+        "idx_messages_session_timestamp_id",
+        "ideation_messages",
+        ["session_id", "timestamp", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the composite message index."""
+    op.drop_index("idx_messages_session_timestamp_id", table_name="ideation_messages")
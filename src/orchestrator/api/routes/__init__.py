@@ -1,7 +1,24 @@
 """Orchestrator API routes package."""
 
-from src.orchestrator.api.routes.devops import router as devops_router
-from src.orchestrator.api.routes.k8s import router as k8s_router
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public name -> (defining module, attribute)
+_EXPORTS = {
+    "devops_router": ("src.orchestrator.api.routes.devops", "router"),
+    "k8s_router": ("src.orchestrator.api.routes.k8s", "router"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for routers, so importing one does not load the other."""
+    if name in _EXPORTS:
+        module, attr = _EXPORTS[name]
+        return getattr(importlib.import_module(module), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "devops_router",
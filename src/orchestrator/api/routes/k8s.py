@@ -34,12 +34,19 @@ _k8s_service: Optional[K8sClusterService] = None
 def get_k8s_service() -> K8sClusterService:
     """Get or create the K8sClusterService singleton.
 
+    Creating the service starts its informer without waiting for it to
+    sync; reads use the direct K8s API until it has.
+
     Returns:
         K8sClusterService instance.
     """
     global _k8s_service
     if _k8s_service is None:
         _k8s_service = K8sClusterService()
+        try:
+            _k8s_service.start_informer(sync_timeout=0)
+        except Exception as e:
+            logger.warning(f"K8s informer start failed, using direct API reads: {e}")
     return _k8s_service
 
 
@@ -5,6 +5,7 @@ Manages human-in-the-loop gate requests, decisions, and audit logging.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from dataclasses import dataclass, field
@@ -23,6 +24,41 @@ from src.orchestrator.evidence_bundle import (
 
 logger = logging.getLogger(__name__)
 
+# Atomically flips a batch of expired IDs, read beforehand with
+# ZRANGEBYSCORE, to expired. Every key it touches is declared in KEYS. IDs
+# no longer in the pending set with an expired score are skipped. Returns
+# {hgetall, ...} for the requests that were still pending.
+#   KEYS[1]: pending set
+#   KEYS[2..n+1]: request hashes, one per ID
+#   KEYS[n+2..]: per-gate-type pending sets
+#   ARGV: now, pending status, expired status, n, n IDs, then the gate
+#         type of each per-gate-type set in KEYS order
+_EXPIRE_SWEEP_SCRIPT = """
+local n = tonumber(ARGV[4])
+local gate_sets = {}
+for i = n + 2, #KEYS do
+    gate_sets[ARGV[i + 3]] = KEYS[i]
+end
+local expired = {}
+for i = 1, n do
+    local id = ARGV[4 + i]
+    local score = redis.call('ZSCORE', KEYS[1], id)
+    if score and tonumber(score) <= tonumber(ARGV[1]) then
+        redis.call('ZREM', KEYS[1], id)
+        local key = KEYS[1 + i]
+        if redis.call('HGET', key, 'status') == ARGV[2] then
+            redis.call('HSET', key, 'status', ARGV[3])
+            local gate_set = gate_sets[redis.call('HGET', key, 'gate_type')]
+            if gate_set then
+                redis.call('ZREM', gate_set, id)
+            end
+            expired[#expired + 1] = redis.call('HGETALL', key)
+        end
+    end
+end
+return expired
+"""
+
 
 @dataclass
 class GateDecision:
@@ -262,6 +298,8 @@ class HITLDispatcher:
         redis_client: redis.Redis,
         event_publisher: Callable[[ASDLCEvent], Awaitable[str]],
         decision_logger: DecisionLogger,
+        batch_event_publisher: Callable[[list[ASDLCEvent]], Awaitable[list[str]]]
+        | None = None,
     ):
         """Initialize the HITL dispatcher.
 
@@ -269,10 +307,15 @@ class HITLDispatcher:
             redis_client: Redis client for storage.
             event_publisher: Function to publish events.
             decision_logger: Logger for audit trail.
+            batch_event_publisher: Optional function publishing a list of
+                events in one call (e.g. publish_event_models). Falls back
+                to concurrent event_publisher calls.
         """
         self.client = redis_client
         self.event_publisher = event_publisher
         self.decision_logger = decision_logger
+        self.batch_event_publisher = batch_event_publisher
+        self._expire_script = None
 
     def _get_request_key(self, request_id: str) -> str:
         """Get tenant-prefixed request key."""
@@ -314,6 +357,19 @@ class HITLDispatcher:
 
         return self.PENDING_SET
 
+    def _get_gate_type_set(self, gate_type: GateType) -> str:
+        """Get tenant-prefixed pending set key for one gate type."""
+        return f"{self._get_pending_set()}:{gate_type.value}"
+
+    async def _publish_batch(self, events: list[ASDLCEvent]) -> None:
+        """Publish events through the batch publisher when available."""
+        if not events:
+            return
+        if self.batch_event_publisher is not None:
+            await self.batch_event_publisher(events)
+        else:
+            await asyncio.gather(*(self.event_publisher(e) for e in events))
+
     async def request_gate(
         self,
         task_id: str,
@@ -357,18 +413,19 @@ class HITLDispatcher:
             expires_at=expires_at,
         )
 
-        # Store request
+        # Store the request and evidence bundle and add the request to the
+        # pending set and its gate type index (score = expires_at or max
+        # timestamp) in one transaction, so the indexes never disagree
+        # with the hashes
         request_key = self._get_request_key(request.request_id)
-        await self.client.hset(request_key, mapping=request.to_dict())
-
-        # Store evidence bundle
         bundle_key = self._get_bundle_key(evidence_bundle.bundle_id)
-        await self.client.hset(bundle_key, mapping=evidence_bundle.to_dict())
-
-        # Add to pending set (score = expires_at or max timestamp)
         score = expires_at.timestamp() if expires_at else float("inf")
-        pending_set = self._get_pending_set()
-        await self.client.zadd(pending_set, {request.request_id: score})
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(request_key, mapping=request.to_dict())
+            pipe.hset(bundle_key, mapping=evidence_bundle.to_dict())
+            pipe.zadd(self._get_pending_set(), {request.request_id: score})
+            pipe.zadd(self._get_gate_type_set(gate_type), {request.request_id: score})
+            await pipe.execute()
 
         # Log the request
         await self.decision_logger.log_request(request)
@@ -443,13 +500,14 @@ class HITLDispatcher:
             conditions=conditions or [],
         )
 
-        # Update request status
+        # Update request status and remove it from the pending indexes in
+        # one transaction
         new_status = GateStatus.APPROVED if approved else GateStatus.REJECTED
-        await self.client.hset(request_key, "status", new_status.value)
-
-        # Remove from pending set
-        pending_set = self._get_pending_set()
-        await self.client.zrem(pending_set, request_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(request_key, "status", new_status.value)
+            pipe.zrem(self._get_pending_set(), request_id)
+            pipe.zrem(self._get_gate_type_set(request.gate_type), request_id)
+            await pipe.execute()
 
         # Log decision
         request.status = new_status
@@ -481,23 +539,38 @@ class HITLDispatcher:
     async def get_pending_requests(
         self,
         gate_type: GateType | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> list[GateRequest]:
-        """Get all pending gate requests.
+        """Get pending gate requests, soonest to expire first.
+
+        Reads one page of IDs from the pending set (or the per-gate-type
+        index) and fetches the request hashes in a single pipeline.
 
         Args:
             gate_type: Optional filter by gate type.
+            offset: Number of requests to skip.
+            limit: Maximum number of requests to return (None for all).
 
         Returns:
             List of pending requests.
         """
-        pending_set = self._get_pending_set()
-        request_ids = await self.client.zrange(pending_set, 0, -1)
+        if gate_type is None:
+            key = self._get_pending_set()
+        else:
+            key = self._get_gate_type_set(gate_type)
+        end = -1 if limit is None else offset + limit - 1
+        request_ids = await self.client.zrange(key, offset, end)
+        if not request_ids:
+            return []
 
-        requests = []
-        for request_id in request_ids:
-            request_key = self._get_request_key(request_id)
-            data = await self.client.hgetall(request_key)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for request_id in request_ids:
+                pipe.hgetall(self._get_request_key(request_id))
+            results = await pipe.execute()
 
+        requests = []
+        for data in results:
             if data:
                 request = GateRequest.from_dict(data)
                 if gate_type is None or request.gate_type == gate_type:
@@ -505,6 +578,30 @@ class HITLDispatcher:
 
         return requests
 
+    async def count_pending(self, gate_type: GateType | None = None) -> int:
+        """Count pending gate requests.
+
+        Args:
+            gate_type: Optional filter by gate type.
+
+        Returns:
+            Number of pending requests.
+        """
+        if gate_type is None:
+            return await self.client.zcard(self._get_pending_set())
+        return await self.client.zcard(self._get_gate_type_set(gate_type))
+
+    async def rebuild_gate_type_index(self) -> int:
+        """Rebuild the per-gate-type pending indexes from the pending set.
+
+        Needed once for requests created before the indexes existed. See
+        rebuild_gate_type_indexes for every tenant at once.
+
+        Returns:
+            Number of pending requests indexed.
+        """
+        return await _rebuild_pending_set_index(self.client, self._get_pending_set())
+
     async def get_request_by_id(self, request_id: str) -> GateRequest | None:
         """Get a gate request by ID."""
         request_key = self._get_request_key(request_id)
@@ -515,44 +612,127 @@ class HITLDispatcher:
 
         return GateRequest.from_dict(data)
 
-    async def check_expired(self) -> list[GateRequest]:
+    async def check_expired(self, batch_size: int = 100) -> list[GateRequest]:
         """Find and mark expired requests.
 
+        Each batch of up to batch_size expired IDs is read with
+        ZRANGEBYSCORE and then swept by a single Lua script that removes
+        them from the pending indexes and flips the still-pending ones to
+        expired. Expiry events for a batch are published together.
+
+        Args:
+            batch_size: Maximum number of IDs handled per script call.
+
         Returns:
             List of expired requests.
         """
         now = datetime.now(timezone.utc)
         pending_set = self._get_pending_set()
+        gate_types = list(GateType)
 
-        # Get requests with expiry <= now
-        expired_ids = await self.client.zrangebyscore(
-            pending_set, 0, now.timestamp()
-        )
-
-        expired = []
-        for request_id in expired_ids:
-            request_key = self._get_request_key(request_id)
-            data = await self.client.hgetall(request_key)
+        if self._expire_script is None:
+            self._expire_script = self.client.register_script(_EXPIRE_SWEEP_SCRIPT)
 
-            if data and data.get("status") == GateStatus.PENDING.value:
-                # Mark as expired
-                await self.client.hset(request_key, "status", GateStatus.EXPIRED.value)
-                await self.client.zrem(pending_set, request_id)
+        expired: list[GateRequest] = []
+        while True:
+            request_ids = await self.client.zrangebyscore(
+                pending_set, 0, now.timestamp(), start=0, num=batch_size
+            )
+            if not request_ids:
+                break
+
+            rows = await self._expire_script(
+                keys=[
+                    pending_set,
+                    *(self._get_request_key(request_id) for request_id in request_ids),
+                    *(self._get_gate_type_set(gate_type) for gate_type in gate_types),
+                ],
+                args=[
+                    now.timestamp(),
+                    GateStatus.PENDING.value,
+                    GateStatus.EXPIRED.value,
+                    len(request_ids),
+                    *request_ids,
+                    *(gate_type.value for gate_type in gate_types),
+                ],
+            )
 
-                request = GateRequest.from_dict(data)
-                request.status = GateStatus.EXPIRED
+            events = []
+            for row in rows:
+                request = GateRequest.from_dict(dict(zip(row[::2], row[1::2], strict=True)))
                 expired.append(request)
-
-                # Publish expired event
-                event = ASDLCEvent(
-                    event_type=EventType.GATE_EXPIRED,
-                    session_id=request.session_id,
-                    task_id=request.task_id,
-                    timestamp=now,
-                    metadata={"request_id": request_id},
+                events.append(
+                    ASDLCEvent(
+                        event_type=EventType.GATE_EXPIRED,
+                        session_id=request.session_id,
+                        task_id=request.task_id,
+                        timestamp=now,
+                        metadata={"request_id": request.request_id},
+                    )
                 )
-                await self.event_publisher(event)
+                logger.warning(f"Gate request expired: {request.request_id}")
 
-                logger.warning(f"Gate request expired: {request_id}")
+            await self._publish_batch(events)
+
+            if len(request_ids) < batch_size:
+                break
 
         return expired
+
+
+async def _rebuild_pending_set_index(client: redis.Redis, pending_set: str) -> int:
+    """Index one pending set's requests by gate type.
+
+    Args:
+        client: Redis client.
+        pending_set: Pending set key, with any tenant prefix.
+
+    Returns:
+        Number of pending requests indexed.
+    """
+    entries = await client.zrange(pending_set, 0, -1, withscores=True)
+    if not entries:
+        return 0
+
+    # Request hashes share the pending set's tenant prefix
+    key_prefix = pending_set[: -len(HITLDispatcher.PENDING_SET)]
+    async with client.pipeline(transaction=False) as pipe:
+        for request_id, _ in entries:
+            pipe.hget(
+                f"{key_prefix}{HITLDispatcher.REQUEST_KEY_PREFIX}{request_id}",
+                "gate_type",
+            )
+        gate_types = await pipe.execute()
+
+    async with client.pipeline(transaction=False) as pipe:
+        for (request_id, score), gate_type in zip(entries, gate_types, strict=True):
+            if gate_type:
+                pipe.zadd(f"{pending_set}:{gate_type}", {request_id: score})
+        await pipe.execute()
+
+    logger.info(f"Rebuilt gate type index for {len(entries)} pending requests in {pending_set}")
+    return len(entries)
+
+
+async def rebuild_gate_type_indexes(client: redis.Redis) -> int:
+    """Rebuild the per-gate-type pending indexes for every tenant.
+
+    Covers the untenanted pending set and every tenant's, so pending
+    requests created before the indexes existed show up in gate type
+    filtered lists. Safe to run repeatedly; the orchestrator runs it at
+    startup.
+
+    Args:
+        client: Redis client.
+
+    Returns:
+        Number of pending requests indexed.
+    """
+    pending_sets = [HITLDispatcher.PENDING_SET]
+    async for key in client.scan_iter(match=f"tenant:*:{HITLDispatcher.PENDING_SET}"):
+        pending_sets.append(key.decode() if isinstance(key, bytes) else key)
+
+    total = 0
+    for pending_set in pending_sets:
+        total += await _rebuild_pending_set_index(client, pending_set)
+    return total
@@ -2,6 +2,10 @@
 
 Runs the orchestrator/governance service with health and KnowledgeStore API endpoints.
 Uses FastAPI for async HTTP handling.
+
+API routers are registered through RouterLoader. Set
+ORCHESTRATOR_ROUTER_LOADING=lazy or background to defer importing them
+(and their heavy dependencies) until first use or until after startup.
 """
 
 from __future__ import annotations
@@ -10,6 +14,7 @@ import asyncio
 import logging
 import os
 import signal
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -28,25 +33,13 @@ from src.infrastructure.metrics import (
     initialize_service_info,
 )
 from src.infrastructure.redis_streams import initialize_consumer_groups
-from src.orchestrator.api.routes.devops import router as devops_api_router
-from src.orchestrator.api.routes.k8s import router as k8s_api_router
-from src.orchestrator.knowledge_store_api import create_knowledge_store_router
-from src.orchestrator.routes.metrics_api import router as metrics_api_router
-from src.orchestrator.routes.ideation_api import router as ideation_api_router
-from src.orchestrator.routes.agents_api import router as agents_api_router, ws_router as agents_ws_router
-from src.orchestrator.routes.llm_config_api import router as llm_config_router
-from src.orchestrator.routes.llm_streaming_api import router as llm_streaming_router
-from src.orchestrator.routes.integrations_api import router as integrations_router
-from src.orchestrator.routes.ideas_api import router as ideas_api_router
-from src.orchestrator.routes.correlation_api import router as correlation_api_router
-from src.orchestrator.routes.classification_api import (
-    router as classification_api_router,
-    admin_router as classification_admin_router,
+from src.orchestrator.router_loader import (
+    ROUTER_LOADING_BACKGROUND,
+    ROUTER_LOADING_EAGER,
+    LazyRouterMiddleware,
+    RouterLoader,
+    get_router_loading_mode,
 )
-from src.orchestrator.routes.architect_api import router as architect_api_router
-from src.orchestrator.routes.swarm import router as swarm_api_router
-from src.orchestrator.routes.guardrails_api import router as guardrails_api_router
-from src.orchestrator.routes.cost_api import router as cost_api_router
 
 # Configure logging
 logging.basicConfig(
@@ -59,6 +52,12 @@ logger = logging.getLogger(__name__)
 # Global health checker instance
 _health_checker: HealthChecker | None = None
 
+# Background LLM client warmup started at startup
+_llm_warmup_task: asyncio.Task | None = None
+
+# Background router loading started after startup (background mode)
+_router_load_task: asyncio.Task | None = None
+
 
 async def initialize_infrastructure() -> None:
     """Initialize Redis streams and consumer groups."""
@@ -73,13 +72,23 @@ async def initialize_infrastructure() -> None:
         raise
 
 
+async def warmup_llm_clients() -> None:
+    """Create LLM clients and open provider connections ahead of first use."""
+    try:
+        from src.infrastructure.llm.factory import get_llm_client_factory
+
+        await get_llm_client_factory().warmup()
+    except Exception as e:
+        logger.warning(f"LLM client warmup failed (non-fatal): {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifecycle.
 
     Initializes infrastructure on startup and cleans up on shutdown.
     """
-    global _health_checker
+    global _health_checker, _llm_warmup_task, _router_load_task
 
     # Startup
     logger.info("Starting aSDLC Orchestrator Service")
@@ -111,6 +120,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Infrastructure init failed (non-fatal): {e}")
 
+    # Index pending HITL gates created before the per-gate-type indexes
+    try:
+        from src.core.redis_client import get_redis_client
+        from src.orchestrator.hitl_dispatcher import rebuild_gate_type_indexes
+
+        indexed = await rebuild_gate_type_indexes(await get_redis_client())
+        logger.info(f"HITL gate type indexes rebuilt ({indexed} pending requests)")
+    except Exception as e:
+        logger.warning(f"HITL gate index rebuild failed (non-fatal): {e}")
+
     # Initialize PostgreSQL database for ideation persistence
     try:
         backend = os.getenv("IDEATION_PERSISTENCE_BACKEND", "postgres")
@@ -122,6 +141,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Database connection failed (non-fatal): {e}")
 
+    # Warm up LLM clients in the background so startup is not delayed
+    if os.getenv("LLM_WARMUP_ON_STARTUP", "true").lower() == "true":
+        _llm_warmup_task = asyncio.create_task(warmup_llm_clients())
+
+    # Create the K8s service so its informer syncs before the first request.
+    # With deferred router loading it starts with the k8s router instead.
+    router_loader: RouterLoader = app.state.router_loader
+    if router_loader.is_loaded("k8s"):
+        from src.orchestrator.api.routes.k8s import get_k8s_service
+        get_k8s_service()
+
+    # Load the remaining routers once the app is serving
+    if app.state.router_loading == ROUTER_LOADING_BACKGROUND:
+        _router_load_task = asyncio.create_task(router_loader.load_all_async())
+
     logger.info("Orchestrator service ready")
     yield
 
@@ -139,12 +173,69 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Database disconnect failed: {e}")
 
-    # Close guardrails ES client
+    # Stop background router loading
+    if _router_load_task is not None and not _router_load_task.done():
+        _router_load_task.cancel()
+
+    # Stop LLM warmup and close pooled provider connections
+    if _llm_warmup_task is not None and not _llm_warmup_task.done():
+        _llm_warmup_task.cancel()
     try:
-        from src.orchestrator.routes.guardrails_api import shutdown_guardrails_store
-        await shutdown_guardrails_store()
+        from src.infrastructure.llm.http_pool import get_http_client_pool
+        await get_http_client_pool().aclose()
     except Exception as e:
-        logger.warning(f"Guardrails store shutdown failed: {e}")
+        logger.warning(f"LLM HTTP pool shutdown failed: {e}")
+
+    # Modules below may never have been imported with deferred router
+    # loading; those have nothing to shut down.
+
+    # Stop the agents WebSocket status feed and writer tasks
+    if "src.orchestrator.routes.agents_api" in sys.modules:
+        try:
+            from src.orchestrator.routes.agents_api import manager as agents_ws_manager
+            await agents_ws_manager.shutdown()
+        except Exception as e:
+            logger.warning(f"Agents WebSocket shutdown failed: {e}")
+
+    # Close pooled VictoriaMetrics clients
+    if "src.orchestrator.services.service_health" in sys.modules:
+        try:
+            from src.orchestrator.services.service_health import (
+                shutdown_service_health_service,
+            )
+            await shutdown_service_health_service()
+        except Exception as e:
+            logger.warning(f"Service health client shutdown failed: {e}")
+    if "src.orchestrator.routes.metrics_api" in sys.modules:
+        try:
+            from src.orchestrator.routes.metrics_api import close_vm_client
+            await close_vm_client()
+        except Exception as e:
+            logger.warning(f"Metrics proxy client shutdown failed: {e}")
+
+    # Stop the K8s informer watch threads
+    if "src.orchestrator.api.routes.k8s" in sys.modules:
+        try:
+            from src.orchestrator.api.routes.k8s import get_k8s_service
+            get_k8s_service().stop_informer()
+        except Exception as e:
+            logger.warning(f"K8s informer shutdown failed: {e}")
+
+    # Close the swarm review executor's GitHub HTTP client
+    if "src.orchestrator.routes.swarm" in sys.modules:
+        try:
+            from src.orchestrator.routes.swarm import shutdown_swarm_components
+            await shutdown_swarm_components()
+        except Exception as e:
+            logger.warning(f"Swarm components shutdown failed: {e}")
+
+    # Close guardrails ES client
+    if "src.orchestrator.routes.guardrails_api" in sys.modules:
+        try:
+            from src.orchestrator.routes.guardrails_api import shutdown_guardrails_store
+            await shutdown_guardrails_store()
+        except Exception as e:
+            logger.warning(f"Guardrails store shutdown failed: {e}")
 
 
 def create_app() -> FastAPI:
@@ -210,59 +301,18 @@ def create_app() -> FastAPI:
             media_type=CONTENT_TYPE_LATEST,
         )
 
-    # KnowledgeStore API endpoints
-    knowledge_store_router = create_knowledge_store_router()
-    app.include_router(
-        knowledge_store_router,
-        prefix="/api/knowledge-store",
-    )
-
-    # VictoriaMetrics proxy API endpoints (for metrics dashboard)
-    app.include_router(metrics_api_router)
-
-    # DevOps activity API endpoints (for DevOps monitoring dashboard)
-    app.include_router(devops_api_router)
-
-    # K8s cluster API endpoints (for K8s visibility dashboard)
-    app.include_router(k8s_api_router)
-
-    # Ideation Studio API endpoints (for PRD Ideation Studio)
-    app.include_router(ideation_api_router)
-
-    # Agent Telemetry API endpoints (for agent activity monitoring)
-    app.include_router(agents_api_router)
-    app.include_router(agents_ws_router)  # WebSocket at /ws/agents
-
-    # LLM Configuration API endpoints (for LLM Admin settings)
-    app.include_router(llm_config_router)
-
-    # LLM Streaming API endpoints (for SSE streaming in Ideation Studio)
-    app.include_router(llm_streaming_router)
-
-    # Integration Credentials API endpoints (for Slack, Teams, GitHub)
-    app.include_router(integrations_router, prefix="/api")
-
-    # Ideas API endpoints (for Brainflare Hub)
-    app.include_router(ideas_api_router)
-
-    # Correlation API endpoints (for Brainflare Hub graph/linking)
-    app.include_router(correlation_api_router)
-
-    # Classification API endpoints (for idea classification and labels)
-    app.include_router(classification_api_router)
-    app.include_router(classification_admin_router)
-
-    # Architect Board API endpoints (for diagram translation)
-    app.include_router(architect_api_router)
-
-    # Swarm Review API endpoints (for parallel code review)
-    app.include_router(swarm_api_router)
-
-    # Guardrails Configuration API endpoints (for guardrails management)
-    app.include_router(guardrails_api_router)
-
-    # Agent Cost Tracking API endpoints (P13-F01)
-    app.include_router(cost_api_router)
+    # API routers (KnowledgeStore, metrics, DevOps, K8s, Ideation Studio,
+    # agents, LLM admin, integrations, Brainflare, classification,
+    # architect, swarm, guardrails, costs); see router_loader
+    router_loading = get_router_loading_mode()
+    router_loader = RouterLoader(app)
+    app.state.router_loading = router_loading
+    app.state.router_loader = router_loader
+    if router_loading == ROUTER_LOADING_EAGER:
+        router_loader.load_all()
+    else:
+        app.add_middleware(LazyRouterMiddleware, loader=router_loader)
+        logger.info(f"Router loading: {router_loading}")
 
     return app
 
@@ -11,7 +11,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Callable, Awaitable
 
-from src.core.events import ASDLCEvent, EventType, HandlerResult
+from src.core.events import ASDLCEvent, EventPriority, EventType, HandlerResult
 from src.orchestrator.git_gateway import GitGateway
 from src.orchestrator.state_machine import TaskState
 from src.orchestrator.task_manager import Task, TaskManager, SessionManager
@@ -344,13 +344,15 @@ class ManagerAgent:
         # Get rejection feedback
         feedback = event.metadata.get("feedback", "Gate rejected")
 
-        # Dispatch back to agent with feedback
+        # Dispatch back to agent with feedback. A reviewer is waiting on
+        # this rework, so it goes to the urgent lane.
         retry_event = ASDLCEvent(
             event_type=EventType.AGENT_STARTED,
             session_id=event.session_id,
             task_id=event.task_id,
             epic_id=task.epic_id,
             mode="rlm" if fail_count > RLM_FAIL_THRESHOLD else "normal",
+            priority=EventPriority.URGENT,
             timestamp=datetime.now(timezone.utc),
             metadata={
                 "agent_type": task.current_agent or "coding-agent",
@@ -53,6 +53,8 @@ class SessionMapper:
             version=domain.version,
             created_at=domain.created_at,
             updated_at=domain.updated_at,
+            context_summary=domain.context_summary,
+            summarized_message_count=domain.summarized_message_count,
         )
 
     @staticmethod
@@ -74,6 +76,8 @@ class SessionMapper:
             version=orm.version,
             created_at=orm.created_at,
             updated_at=orm.updated_at,
+            context_summary=orm.context_summary or "",
+            summarized_message_count=orm.summarized_message_count or 0,
         )
 
 
@@ -7,7 +7,7 @@ These models use SQLAlchemy 2.0+ style with Mapped type hints.
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -31,6 +31,8 @@ class SessionORM(Base):
         version: Version number for optimistic locking.
         created_at: Timestamp when session was created.
         updated_at: Timestamp when session was last updated.
+        context_summary: Rolling summary of older conversation messages.
+        summarized_message_count: Number of messages folded into the summary.
         messages: Related chat messages.
         requirements: Related extracted requirements.
         maturity: Related maturity state (one-to-one).
@@ -52,6 +54,8 @@ class SessionORM(Base):
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    context_summary: Mapped[str] = mapped_column(Text, default="")
+    summarized_message_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Relationships
     messages: Mapped[list["MessageORM"]] = relationship(
@@ -88,6 +92,12 @@ class MessageORM(Base):
     """
 
     __tablename__ = "ideation_messages"
+    __table_args__ = (
+        # Keyset pagination over a session's messages by (timestamp, id)
+        Index(
+            "idx_messages_session_timestamp_id", "session_id", "timestamp", "id"
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     session_id: Mapped[str] = mapped_column(
@@ -7,11 +7,14 @@ Implementations can use PostgreSQL, Redis, or other backends.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator
 from typing import Optional, List
 
 from src.core.models.ideation import (
     IdeationSession,
     ChatMessage,
+    MessageCursor,
     ExtractedRequirement,
     MaturityState,
     PRDDraft,
@@ -120,6 +123,118 @@ class IMessageRepository(ABC):
         """
         pass
 
+    async def get_page(
+        self,
+        session_id: str,
+        limit: int = 100,
+        after: Optional[MessageCursor] = None,
+    ) -> List[ChatMessage]:
+        """Get a page of messages using keyset pagination.
+
+        The default implementation filters stream_by_session(); backends
+        should override it with an indexed range query.
+
+        Args:
+            session_id: The session ID to filter by.
+            limit: Maximum number of messages to return.
+            after: Return messages strictly after this position, or from
+                the start of the session if None.
+
+        Returns:
+            Messages ordered by (timestamp, id) asc.
+        """
+        page: List[ChatMessage] = []
+        if limit <= 0:
+            return page
+        async for message in self.stream_by_session(session_id, after=after):
+            page.append(message)
+            if len(page) >= limit:
+                break
+        return page
+
+    async def get_latest(
+        self,
+        session_id: str,
+        limit: int = 100,
+        before: Optional[MessageCursor] = None,
+    ) -> List[ChatMessage]:
+        """Get the last N messages, optionally before a position.
+
+        The default implementation scans stream_by_session(); backends
+        should override it with a reverse indexed range query.
+
+        Args:
+            session_id: The session ID to filter by.
+            limit: Maximum number of messages to return.
+            before: Return messages strictly before this position, or the
+                newest messages if None.
+
+        Returns:
+            Messages ordered by (timestamp, id) asc.
+        """
+        if limit <= 0:
+            return []
+        latest: deque[ChatMessage] = deque(maxlen=limit)
+        async for message in self.stream_by_session(session_id):
+            if before is not None and (message.timestamp, message.id) >= (
+                before.timestamp,
+                before.id,
+            ):
+                break
+            latest.append(message)
+        return list(latest)
+
+    async def stream_by_session(
+        self,
+        session_id: str,
+        after: Optional[MessageCursor] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[ChatMessage]:
+        """Stream all messages for a session without materialising them.
+
+        The default implementation pages through get_by_session().
+
+        Args:
+            session_id: The session ID to filter by.
+            after: Start strictly after this position, or from the start
+                of the session if None.
+            batch_size: Number of rows fetched per round trip.
+
+        Yields:
+            Messages ordered by (timestamp, id) asc.
+        """
+        offset = 0
+        while True:
+            batch = await self.get_by_session(
+                session_id, limit=batch_size, offset=offset
+            )
+            for message in batch:
+                if after is None or (message.timestamp, message.id) > (
+                    after.timestamp,
+                    after.id,
+                ):
+                    yield message
+            if len(batch) < batch_size:
+                return
+            offset += len(batch)
+
+    async def count_by_session(self, session_id: str) -> int:
+        """Count the messages in a session.
+
+        The default implementation counts stream_by_session(); backends
+        should override it.
+
+        Args:
+            session_id: The session ID to filter by.
+
+        Returns:
+            Number of messages.
+        """
+        count = 0
+        async for _ in self.stream_by_session(session_id):
+            count += 1
+        return count
+
     @abstractmethod
     async def delete_by_session(self, session_id: str) -> None:
         """Delete all messages for a session.
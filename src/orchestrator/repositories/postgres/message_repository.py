@@ -2,13 +2,18 @@
 
 This module provides the PostgreSQL-backed implementation for message
 persistence operations using SQLAlchemy async ORM.
+
+Pages are selected by (timestamp, id) keyset conditions rather than
+offsets, backed by the composite (session_id, timestamp, id) index, so
+the cost of a page does not grow with its position in the conversation.
 """
 
+from collections.abc import AsyncIterator
 
-from sqlalchemy import delete, select
+from sqlalchemy import Select, delete, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.models.ideation import ChatMessage
+from src.core.models.ideation import ChatMessage, MessageCursor
 from src.orchestrator.persistence.mappers import MessageMapper
 from src.orchestrator.persistence.orm_models import MessageORM
 from src.orchestrator.repositories.interfaces import IMessageRepository
@@ -74,13 +79,155 @@ class PostgresMessageRepository(IMessageRepository):
         stmt = (
             select(MessageORM)
             .where(MessageORM.session_id == session_id)
-            .order_by(MessageORM.timestamp.asc())
+            .order_by(MessageORM.timestamp.asc(), MessageORM.id.asc())
             .limit(limit)
             .offset(offset)
         )
         result = await self._session.execute(stmt)
         return [MessageMapper.from_orm(orm) for orm in result.scalars().all()]
 
+    async def get_page(
+        self,
+        session_id: str,
+        limit: int = 100,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """Get a page of messages using keyset pagination.
+
+        Args:
+            session_id: The session ID to filter by.
+            limit: Maximum number of messages to return (default 100).
+            after: Return messages strictly after this position, or from
+                the start of the session if None.
+
+        Returns:
+            Messages ordered by (timestamp, id) asc.
+
+        Raises:
+            ValueError: If session_id is empty or too long.
+            TypeError: If session_id is not a string.
+        """
+        validate_id(session_id, "session_id")
+        stmt = self._select_after(session_id, after).limit(limit)
+        result = await self._session.execute(stmt)
+        return [MessageMapper.from_orm(orm) for orm in result.scalars().all()]
+
+    async def get_latest(
+        self,
+        session_id: str,
+        limit: int = 100,
+        before: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """Get the last N messages, optionally before a position.
+
+        Reads the index backwards and reverses the page, so only `limit`
+        rows are fetched however long the conversation is.
+
+        Args:
+            session_id: The session ID to filter by.
+            limit: Maximum number of messages to return (default 100).
+            before: Return messages strictly before this position, or the
+                newest messages if None.
+
+        Returns:
+            Messages ordered by (timestamp, id) asc.
+
+        Raises:
+            ValueError: If session_id is empty or too long.
+            TypeError: If session_id is not a string.
+        """
+        validate_id(session_id, "session_id")
+        stmt = select(MessageORM).where(MessageORM.session_id == session_id)
+        if before is not None:
+            stmt = stmt.where(
+                tuple_(MessageORM.timestamp, MessageORM.id)
+                < tuple_(before.timestamp, before.id)
+            )
+        stmt = stmt.order_by(
+            MessageORM.timestamp.desc(), MessageORM.id.desc()
+        ).limit(limit)
+        result = await self._session.execute(stmt)
+        messages = [MessageMapper.from_orm(orm) for orm in result.scalars().all()]
+        messages.reverse()
+        return messages
+
+    async def stream_by_session(
+        self,
+        session_id: str,
+        after: MessageCursor | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[ChatMessage]:
+        """Stream all messages for a session without materialising them.
+
+        Uses a server-side cursor that fetches batch_size rows at a time.
+
+        Args:
+            session_id: The session ID to filter by.
+            after: Start strictly after this position, or from the start
+                of the session if None.
+            batch_size: Number of rows fetched per round trip (default 500).
+
+        Yields:
+            Messages ordered by (timestamp, id) asc.
+
+        Raises:
+            ValueError: If session_id is empty or too long.
+            TypeError: If session_id is not a string.
+        """
+        validate_id(session_id, "session_id")
+        stmt = self._select_after(session_id, after).execution_options(
+            yield_per=batch_size
+        )
+        result = await self._session.stream_scalars(stmt)
+        try:
+            async for orm in result:
+                yield MessageMapper.from_orm(orm)
+        finally:
+            await result.close()
+
+    async def count_by_session(self, session_id: str) -> int:
+        """Count the messages in a session.
+
+        Args:
+            session_id: The session ID to filter by.
+
+        Returns:
+            Number of messages.
+
+        Raises:
+            ValueError: If session_id is empty or too long.
+            TypeError: If session_id is not a string.
+        """
+        validate_id(session_id, "session_id")
+        stmt = (
+            select(func.count())
+            .select_from(MessageORM)
+            .where(MessageORM.session_id == session_id)
+        )
+        result = await self._session.execute(stmt)
+        return int(result.scalar_one())
+
+    @staticmethod
+    def _select_after(
+        session_id: str, after: MessageCursor | None
+    ) -> Select[tuple[MessageORM]]:
+        """Build the ascending keyset query for a session's messages.
+
+        Args:
+            session_id: The session ID to filter by.
+            after: Start strictly after this position, or None.
+
+        Returns:
+            The select statement, ordered by (timestamp, id) asc.
+        """
+        stmt = select(MessageORM).where(MessageORM.session_id == session_id)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(MessageORM.timestamp, MessageORM.id)
+                > tuple_(after.timestamp, after.id)
+            )
+        return stmt.order_by(MessageORM.timestamp.asc(), MessageORM.id.asc())
+
     async def delete_by_session(self, session_id: str) -> None:
         """Delete all messages for a session.
 
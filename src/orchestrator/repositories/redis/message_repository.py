@@ -7,11 +7,13 @@ persistence operations using JSON serialization.
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from src.core.models.ideation import (
     ChatMessage,
+    MessageCursor,
     MessageRole,
 )
 from src.orchestrator.repositories.interfaces import IMessageRepository
@@ -20,9 +22,15 @@ if TYPE_CHECKING:
     import redis.asyncio as redis
 
 
-# Redis key prefix
+# Redis key prefix for the legacy list of message JSONs (migrated on access)
 MESSAGES_KEY_PREFIX = "ideation:messages:"
 
+# Redis key prefix for the sorted set of message IDs scored by timestamp
+MESSAGE_INDEX_KEY_PREFIX = "ideation:message_index:"
+
+# Redis key prefix for the hash of message ID -> message JSON
+MESSAGE_DATA_KEY_PREFIX = "ideation:message_data:"
+
 
 def _message_to_dict(message: ChatMessage) -> dict[str, Any]:
     """Convert ChatMessage to JSON-serializable dict."""
@@ -50,11 +58,29 @@ def _dict_to_message(data: dict[str, Any]) -> ChatMessage:
     )
 
 
+def _text(value: bytes | str) -> str:
+    """Decode a Redis reply that may be bytes."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _score(timestamp: datetime) -> float:
+    """Sorted set score for a message timestamp."""
+    return timestamp.timestamp()
+
+
 class RedisMessageRepository(IMessageRepository):
     """Redis implementation of message repository.
 
-    Stores messages as a JSON list in Redis with the key pattern:
-    - `ideation:messages:{session_id}` - List of message JSONs
+    Stores messages with the key patterns:
+    - `ideation:message_index:{session_id}` - Sorted set of message IDs
+      scored by timestamp. Redis orders equal scores by member, so the
+      set is ordered by (timestamp, id), matching the PostgreSQL keyset.
+    - `ideation:message_data:{session_id}` - Hash of message ID to JSON
+
+    Ranges are read from the index and only the selected messages are
+    fetched. Sessions stored in the older `ideation:messages:{session_id}`
+    list format are moved to the sorted set the first time they are
+    written to, or read from and found empty.
 
     Args:
         redis_client: Async Redis client instance.
@@ -69,7 +95,7 @@ class RedisMessageRepository(IMessageRepository):
         self._redis = redis_client
 
     async def create(self, message: ChatMessage) -> ChatMessage:
-        """Create a new message in Redis list.
+        """Create a new message.
 
         Args:
             message: The message to create.
@@ -77,9 +103,22 @@ class RedisMessageRepository(IMessageRepository):
         Returns:
             The created message.
         """
-        key = f"{MESSAGES_KEY_PREFIX}{message.session_id}"
-        data = _message_to_dict(message)
-        await self._redis.rpush(key, json.dumps(data))
+        session_id = message.session_id
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                f"{MESSAGE_DATA_KEY_PREFIX}{session_id}",
+                message.id,
+                json.dumps(_message_to_dict(message)),
+            )
+            pipe.zadd(
+                f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}",
+                {message.id: _score(message.timestamp)},
+            )
+            pipe.exists(f"{MESSAGES_KEY_PREFIX}{session_id}")
+            results = await pipe.execute()
+
+        if results[-1]:
+            await self._migrate_legacy(session_id)
         return message
 
     async def get_by_session(
@@ -95,21 +134,140 @@ class RedisMessageRepository(IMessageRepository):
         Returns:
             List of messages for the session, ordered by timestamp asc.
         """
-        key = f"{MESSAGES_KEY_PREFIX}{session_id}"
-
-        # Get all messages (Redis LRANGE is 0-indexed, -1 means all)
-        start = offset
         end = offset + limit - 1 if limit > 0 else -1
 
-        raw_messages = await self._redis.lrange(key, start, end)
+        async def read() -> list[str]:
+            return await self._ids_by_rank(session_id, offset, end)
 
-        messages = []
-        for raw in raw_messages:
-            data = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
-            messages.append(_dict_to_message(data))
+        return await self._fetch(session_id, await self._read(session_id, read))
+
+    async def get_page(
+        self,
+        session_id: str,
+        limit: int = 100,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """Get a page of messages using keyset pagination.
+
+        Args:
+            session_id: The session ID to filter by.
+            limit: Maximum number of messages to return.
+            after: Return messages strictly after this position, or from
+                the start of the session if None.
+
+        Returns:
+            Messages ordered by (timestamp, id) asc.
+        """
+
+        async def read() -> list[str]:
+            start = await self._rank_after(session_id, after)
+            ids: list[str] = []
+            while len(ids) < limit:
+                batch = await self._redis.zrange(
+                    f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}",
+                    start,
+                    start + limit - 1,
+                    withscores=True,
+                )
+                if not batch:
+                    break
+                start += len(batch)
+                ids.extend(
+                    message_id
+                    for message_id, score in self._decode(batch)
+                    if after is None or (score, message_id) > (
+                        _score(after.timestamp),
+                        after.id,
+                    )
+                )
+            return ids[:limit]
+
+        return await self._fetch(session_id, await self._read(session_id, read))
+
+    async def get_latest(
+        self,
+        session_id: str,
+        limit: int = 100,
+        before: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """Get the last N messages, optionally before a position.
+
+        Args:
+            session_id: The session ID to filter by.
+            limit: Maximum number of messages to return.
+            before: Return messages strictly before this position, or the
+                newest messages if None.
+
+        Returns:
+            Messages ordered by (timestamp, id) asc.
+        """
+        index_key = f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}"
+
+        async def read() -> list[str]:
+            if limit <= 0:
+                return []
+            if before is None:
+                return [_text(m) for m in await self._redis.zrange(index_key, -limit, -1)]
+
+            # Walk backwards from the last member scored at or below the cursor
+            before_score = _score(before.timestamp)
+            end = await self._redis.zcount(index_key, "-inf", before_score)
+            ids: list[str] = []
+            while len(ids) < limit and end > 0:
+                start = max(0, end - limit)
+                batch = await self._redis.zrange(
+                    index_key, start, end - 1, withscores=True
+                )
+                end = start
+                ids[:0] = [
+                    message_id
+                    for message_id, score in self._decode(batch)
+                    if (score, message_id) < (before_score, before.id)
+                ]
+            return ids[-limit:]
+
+        return await self._fetch(session_id, await self._read(session_id, read))
+
+    async def stream_by_session(
+        self,
+        session_id: str,
+        after: MessageCursor | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[ChatMessage]:
+        """Stream all messages for a session in batches.
+
+        Args:
+            session_id: The session ID to filter by.
+            after: Start strictly after this position, or from the start
+                of the session if None.
+            batch_size: Number of messages fetched per round trip.
+
+        Yields:
+            Messages ordered by (timestamp, id) asc.
+        """
+        cursor = after
+        while True:
+            page = await self.get_page(session_id, limit=batch_size, after=cursor)
+            for message in page:
+                yield message
+            if len(page) < batch_size:
+                return
+            cursor = MessageCursor.of(page[-1])
+
+    async def count_by_session(self, session_id: str) -> int:
+        """Count the messages in a session.
+
+        Args:
+            session_id: The session ID to filter by.
+
+        Returns:
+            Number of messages.
+        """
+
+        async def read() -> int:
+            return await self._redis.zcard(f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}")
 
-        # Messages are already in order (appended chronologically)
-        return messages
+        return await self._read(session_id, read)
 
     async def delete_by_session(self, session_id: str) -> None:
         """Delete all messages for a session.
@@ -117,5 +275,117 @@ class RedisMessageRepository(IMessageRepository):
         Args:
             session_id: The session ID whose messages to delete.
         """
-        key = f"{MESSAGES_KEY_PREFIX}{session_id}"
-        await self._redis.delete(key)
+        await self._redis.delete(
+            f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}",
+            f"{MESSAGE_DATA_KEY_PREFIX}{session_id}",
+            f"{MESSAGES_KEY_PREFIX}{session_id}",
+        )
+
+    async def _read(self, session_id: str, read: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a read, retrying once after migrating a legacy list.
+
+        Args:
+            session_id: The session ID being read.
+            read: The read to run; returns an empty result if nothing matched.
+
+        Returns:
+            The read's result.
+        """
+        result = await read()
+        if not result and await self._migrate_legacy(session_id):
+            result = await read()
+        return result
+
+    async def _ids_by_rank(self, session_id: str, start: int, end: int) -> list[str]:
+        """Get message IDs by position in the index.
+
+        Args:
+            session_id: The session ID.
+            start: First rank (inclusive).
+            end: Last rank (inclusive, -1 for the end).
+
+        Returns:
+            Message IDs in (timestamp, id) order.
+        """
+        members = await self._redis.zrange(
+            f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}", start, end
+        )
+        return [_text(m) for m in members]
+
+    async def _rank_after(self, session_id: str, after: MessageCursor | None) -> int:
+        """Get the first rank that can follow a cursor.
+
+        Members scored below the cursor's timestamp all precede it; members
+        with an equal score are filtered by ID by the caller.
+
+        Args:
+            session_id: The session ID.
+            after: The cursor, or None for the start of the session.
+
+        Returns:
+            int: The rank to start reading from.
+        """
+        if after is None:
+            return 0
+        return await self._redis.zcount(
+            f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}",
+            "-inf",
+            f"({_score(after.timestamp)!r}",
+        )
+
+    @staticmethod
+    def _decode(batch: list[tuple[bytes | str, float]]) -> list[tuple[str, float]]:
+        """Decode (member, score) pairs into (message ID, score) pairs."""
+        return [(_text(member), float(score)) for member, score in batch]
+
+    async def _fetch(self, session_id: str, ids: list[str]) -> list[ChatMessage]:
+        """Load messages by ID, preserving order.
+
+        Args:
+            session_id: The session ID.
+            ids: Message IDs to load.
+
+        Returns:
+            The messages; IDs without data are skipped.
+        """
+        if not ids:
+            return []
+        raw_messages = await self._redis.hmget(
+            f"{MESSAGE_DATA_KEY_PREFIX}{session_id}", ids
+        )
+        return [
+            _dict_to_message(json.loads(_text(raw)))
+            for raw in raw_messages
+            if raw is not None
+        ]
+
+    async def _migrate_legacy(self, session_id: str) -> bool:
+        """Move a session's messages from the legacy list to the sorted set.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            bool: True if any messages were migrated.
+        """
+        legacy_key = f"{MESSAGES_KEY_PREFIX}{session_id}"
+        raw_messages = await self._redis.lrange(legacy_key, 0, -1)
+        if not raw_messages:
+            return False
+
+        data: dict[str, str] = {}
+        scores: dict[str, float] = {}
+        for raw in raw_messages:
+            text = _text(raw)
+            message = json.loads(text)
+            data[message["id"]] = text
+            scores[message["id"]] = _score(
+                datetime.fromisoformat(message["timestamp"])
+            )
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(f"{MESSAGE_DATA_KEY_PREFIX}{session_id}", mapping=data)
+            pipe.zadd(f"{MESSAGE_INDEX_KEY_PREFIX}{session_id}", scores)
+            pipe.delete(legacy_key)
+            await pipe.execute()
+        return True
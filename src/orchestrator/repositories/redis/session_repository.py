@@ -37,6 +37,8 @@ def _session_to_dict(session: IdeationSession) -> dict[str, Any]:
         "version": session.version,
         "created_at": session.created_at.isoformat(),
         "updated_at": session.updated_at.isoformat(),
+        "context_summary": session.context_summary,
+        "summarized_message_count": session.summarized_message_count,
     }
 
 
@@ -51,6 +53,8 @@ def _dict_to_session(data: dict[str, Any]) -> IdeationSession:
         version=data["version"],
         created_at=datetime.fromisoformat(data["created_at"]),
         updated_at=datetime.fromisoformat(data["updated_at"]),
+        context_summary=data.get("context_summary", ""),
+        summarized_message_count=data.get("summarized_message_count", 0),
     )
 
 
@@ -0,0 +1,231 @@
+"""Deferred router loading for the orchestrator app.
+
+Importing every router pulls in the Kubernetes client, Elasticsearch,
+sentence-transformers, three LLM SDKs and more, so an eagerly loaded app
+spends most of its cold start on imports it does not need to serve
+/health. RouterLoader registers routers from a table of specs instead, in
+one of three modes (ORCHESTRATOR_ROUTER_LOADING):
+
+- eager: import and include every router in create_app (default).
+- lazy: include a router the first time a request hits one of its paths.
+- background: as lazy, and also load every router in a background task
+  once the app is ready, so later first requests do not pay the import.
+
+Lazy imports run in a worker thread so the event loop keeps serving
+health checks and already-loaded routes while a heavy module imports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Router loading modes
+ROUTER_LOADING_EAGER = "eager"
+ROUTER_LOADING_LAZY = "lazy"
+ROUTER_LOADING_BACKGROUND = "background"
+
+# Paths that list every route, so they need all routers loaded
+_ALL_ROUTES_PATHS = ("/openapi.json", "/docs", "/redoc")
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """How to import and mount one router.
+
+    Attributes:
+        name: Short name used in logs and `is_loaded`.
+        module: Module that defines the router.
+        attribute: Router attribute, or factory function if `factory`.
+        paths: URL prefixes the router serves, for lazy matching.
+        prefix: Prefix passed to `include_router`.
+        factory: Whether `attribute` is a function returning the router.
+    """
+
+    name: str
+    module: str
+    attribute: str
+    paths: tuple[str, ...]
+    prefix: str = ""
+    factory: bool = False
+
+    def serves(self, path: str) -> bool:
+        """Check whether a request path falls under this router's prefixes."""
+        return any(path == p or path.startswith(p.rstrip("/") + "/") for p in self.paths)
+
+
+# Orchestrator routers, in registration order
+ORCHESTRATOR_ROUTERS: tuple[RouterSpec, ...] = (
+    RouterSpec(
+        "knowledge_store",
+        "src.orchestrator.knowledge_store_api",
+        "create_knowledge_store_router",
+        paths=("/api/knowledge-store",),
+        prefix="/api/knowledge-store",
+        factory=True,
+    ),
+    RouterSpec("metrics", "src.orchestrator.routes.metrics_api", "router", ("/api/metrics",)),
+    RouterSpec("devops", "src.orchestrator.api.routes.devops", "router", ("/api/devops",)),
+    RouterSpec("k8s", "src.orchestrator.api.routes.k8s", "router", ("/api/k8s",)),
+    RouterSpec(
+        "ideation", "src.orchestrator.routes.ideation_api", "router", ("/api/studio/ideation",)
+    ),
+    RouterSpec("agents", "src.orchestrator.routes.agents_api", "router", ("/api/agents",)),
+    RouterSpec("agents_ws", "src.orchestrator.routes.agents_api", "ws_router", ("/ws/agents",)),
+    RouterSpec("llm_config", "src.orchestrator.routes.llm_config_api", "router", ("/api/llm",)),
+    RouterSpec(
+        "llm_streaming", "src.orchestrator.routes.llm_streaming_api", "router", ("/api/llm",)
+    ),
+    RouterSpec(
+        "integrations",
+        "src.orchestrator.routes.integrations_api",
+        "router",
+        ("/api/integrations",),
+        prefix="/api",
+    ),
+    RouterSpec("ideas", "src.orchestrator.routes.ideas_api", "router", ("/api/brainflare/ideas",)),
+    RouterSpec(
+        "correlation", "src.orchestrator.routes.correlation_api", "router", ("/api/brainflare",)
+    ),
+    RouterSpec(
+        "classification", "src.orchestrator.routes.classification_api", "router", ("/api/ideas",)
+    ),
+    RouterSpec(
+        "classification_admin",
+        "src.orchestrator.routes.classification_api",
+        "admin_router",
+        ("/api/admin/labels",),
+    ),
+    RouterSpec("architect", "src.orchestrator.routes.architect_api", "router", ("/api/architect",)),
+    RouterSpec("swarm", "src.orchestrator.routes.swarm", "router", ("/api/swarm",)),
+    RouterSpec(
+        "guardrails", "src.orchestrator.routes.guardrails_api", "router", ("/api/guardrails",)
+    ),
+    RouterSpec("cost", "src.orchestrator.routes.cost_api", "router", ("/api/costs",)),
+)
+
+
+def get_router_loading_mode() -> str:
+    """Get the router loading mode from ORCHESTRATOR_ROUTER_LOADING.
+
+    Returns:
+        str: One of eager, lazy or background; unknown values mean eager.
+    """
+    mode = os.getenv("ORCHESTRATOR_ROUTER_LOADING", ROUTER_LOADING_EAGER).lower()
+    if mode not in (ROUTER_LOADING_EAGER, ROUTER_LOADING_LAZY, ROUTER_LOADING_BACKGROUND):
+        logger.warning(f"Unknown ORCHESTRATOR_ROUTER_LOADING '{mode}', using eager")
+        return ROUTER_LOADING_EAGER
+    return mode
+
+
+class RouterLoader:
+    """Imports and includes routers into an app on demand.
+
+    Args:
+        app: The FastAPI app to include routers into.
+        specs: Routers to manage, in registration order.
+    """
+
+    def __init__(self, app: FastAPI, specs: tuple[RouterSpec, ...] = ORCHESTRATOR_ROUTERS) -> None:
+        """Initialize the loader with nothing loaded."""
+        self._app = app
+        self._specs = specs
+        self._loaded: set[str] = set()
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def pending(self) -> list[RouterSpec]:
+        """Routers not loaded yet, in registration order."""
+        return [s for s in self._specs if s.name not in self._loaded]
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a router has been included."""
+        return name in self._loaded
+
+    def load_all(self) -> None:
+        """Import and include every pending router on the calling thread."""
+        for spec in self.pending:
+            self._include(spec, _import_router(spec))
+
+    async def load_for_path(self, path: str) -> None:
+        """Load the pending routers serving a request path.
+
+        Args:
+            path: The request path; documentation paths load everything.
+        """
+        if path in _ALL_ROUTES_PATHS:
+            await self._load([s.name for s in self.pending])
+        else:
+            await self._load([s.name for s in self.pending if s.serves(path)])
+
+    async def load_all_async(self) -> None:
+        """Load every pending router, importing in a worker thread."""
+        started = time.perf_counter()
+        count = len(self.pending)
+        await self._load([s.name for s in self.pending])
+        if count:
+            logger.info(
+                f"Loaded {count} routers in the background in "
+                f"{time.perf_counter() - started:.2f}s"
+            )
+
+    async def _load(self, names: list[str]) -> None:
+        """Import and include routers, one loader-wide load at a time."""
+        if not names:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            for spec in self._specs:
+                if spec.name not in names or spec.name in self._loaded:
+                    continue
+                try:
+                    router = await asyncio.to_thread(_import_router, spec)
+                except Exception as e:
+                    # Leave it pending so a later request can retry
+                    logger.error(f"Failed to load router {spec.name}: {e}")
+                    continue
+                self._include(spec, router)
+
+    def _include(self, spec: RouterSpec, router: Any) -> None:
+        """Include a router and invalidate the cached OpenAPI schema."""
+        self._app.include_router(router, prefix=spec.prefix)
+        self._app.openapi_schema = None
+        self._loaded.add(spec.name)
+        logger.debug(f"Router loaded: {spec.name}")
+
+
+def _import_router(spec: RouterSpec) -> Any:
+    """Import a spec's module and return its router."""
+    router = getattr(importlib.import_module(spec.module), spec.attribute)
+    return router() if spec.factory else router
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that loads routers before their first request.
+
+    Args:
+        app: The wrapped ASGI app.
+        loader: The loader holding the pending routers.
+    """
+
+    def __init__(self, app: ASGIApp, loader: RouterLoader) -> None:
+        """Initialize the middleware."""
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Load matching routers, then pass the request on."""
+        if scope["type"] in ("http", "websocket") and self.loader.pending:
+            await self.loader.load_for_path(scope["path"])
+        await self.app(scope, receive, send)
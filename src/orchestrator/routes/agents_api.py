@@ -10,12 +10,18 @@ Endpoints:
 - GET /api/agents/timeline - Execution timeline for Gantt view
 - GET /api/agents/{id}/detail - Detailed status for a specific agent
 - WS /ws/agents - Real-time updates via WebSocket
+
+Clients that subscribe to the "status" channel receive a full
+"status_update" snapshot, then "status_delta" messages carrying only the
+agents that changed. Deltas come from a single fan-out task reading the
+agent status Pub/Sub channel, shared by all viewers.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -24,6 +30,7 @@ import re
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, WebSocket, WebSocketDisconnect
 from pydantic import Field
 
+from src.infrastructure.metrics import AGENTS_WS_CONNECTIONS, AGENTS_WS_SEND_OVERFLOWS
 from src.orchestrator.api.models.agent_telemetry import (
     AgentLog,
     AgentLogLevel,
@@ -55,15 +62,110 @@ def get_telemetry_service() -> AgentTelemetryService:
     return get_agent_telemetry_service()
 
 
+# Overflow policies for a client whose send queue is full
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DISCONNECT = "disconnect"
+
+# WebSocket close code sent to clients evicted for falling behind
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+# Window over which status changes are coalesced into one delta (seconds)
+STATUS_FEED_BATCH_SECONDS = 0.1
+
+# Max delay between status feed reconnect attempts (seconds)
+STATUS_FEED_MAX_BACKOFF_SECONDS = 30.0
+
+
+def _serialize_agent(agent: AgentStatus) -> dict[str, Any]:
+    """Convert an agent status to its WebSocket representation.
+
+    Args:
+        agent: The agent status.
+
+    Returns:
+        dict: JSON-serializable agent fields.
+    """
+    return {
+        "agent_id": agent.agent_id,
+        "agent_type": agent.agent_type,
+        "status": agent.status,
+        "current_task": agent.current_task,
+        "progress": agent.progress,
+    }
+
+
+class _ClientSender:
+    """Bounded send queue and writer task for one WebSocket."""
+
+    def __init__(self, websocket: WebSocket, max_queue_size: int) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue_size)
+        self.channels: set[str] = set()
+        self.task: Optional[asyncio.Task] = None
+
+    def close(self) -> None:
+        """Discard queued messages and stop the writer task."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+        if self.task is not None and self.task is not asyncio.current_task():
+            self.task.cancel()
+
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates.
 
     Handles connection lifecycle, broadcasting, and heartbeat management.
+    Each connection gets a bounded send queue drained by its own writer
+    task, so broadcasting never waits on a slow client. When a queue is
+    full the oldest message is dropped, or the client is disconnected,
+    depending on the overflow policy. A client whose send stalls past the
+    send timeout is disconnected.
+
+    Environment variables:
+        AGENTS_WS_SEND_QUEUE_SIZE: Max queued messages per client
+            (default: 100)
+        AGENTS_WS_SEND_TIMEOUT_SECONDS: Max time for a single send
+            (default: 5)
+        AGENTS_WS_OVERFLOW_POLICY: "drop_oldest" or "disconnect"
+            (default: drop_oldest)
     """
 
-    def __init__(self) -> None:
-        """Initialize the connection manager."""
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = None,
+        send_timeout: Optional[float] = None,
+        overflow_policy: Optional[str] = None,
+    ) -> None:
+        """Initialize the connection manager.
+
+        Args:
+            max_queue_size: Max queued messages per client.
+            send_timeout: Max seconds for a single send before the client
+                is disconnected.
+            overflow_policy: OVERFLOW_DROP_OLDEST or OVERFLOW_DISCONNECT.
+        """
         self.active_connections: list[WebSocket] = []
+        self.max_queue_size = max_queue_size or int(
+            os.environ.get("AGENTS_WS_SEND_QUEUE_SIZE", "100")
+        )
+        self.send_timeout = send_timeout or float(
+            os.environ.get("AGENTS_WS_SEND_TIMEOUT_SECONDS", "5")
+        )
+        policy = overflow_policy or os.environ.get(
+            "AGENTS_WS_OVERFLOW_POLICY", OVERFLOW_DROP_OLDEST
+        )
+        if policy not in (OVERFLOW_DROP_OLDEST, OVERFLOW_DISCONNECT):
+            logger.warning(
+                f"Unknown WebSocket overflow policy '{policy}', "
+                f"using {OVERFLOW_DROP_OLDEST}"
+            )
+            policy = OVERFLOW_DROP_OLDEST
+        self.overflow_policy = policy
+
+        self._senders: dict[WebSocket, _ClientSender] = {}
+        self._status_feed: Optional[asyncio.Task] = None
+        self._background: set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection.
@@ -73,50 +175,248 @@ class ConnectionManager:
         """
         await websocket.accept()
         self.active_connections.append(websocket)
+        self._get_sender(websocket)
+        AGENTS_WS_CONNECTIONS.set(len(self.active_connections))
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection.
 
+        Stops the connection's writer task, and the status feed if no
+        status subscribers remain.
+
         Args:
             websocket: The WebSocket to disconnect.
         """
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+            AGENTS_WS_CONNECTIONS.set(len(self.active_connections))
             logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Send a message to all connected clients.
+        sender = self._senders.pop(websocket, None)
+        if sender is not None:
+            sender.close()
+
+        if not any("status" in s.channels for s in self._senders.values()):
+            self._stop_status_feed()
+
+    def _get_sender(self, websocket: WebSocket) -> _ClientSender:
+        """Get or start the writer for a connection.
 
         Args:
-            message: The message to broadcast.
+            websocket: The WebSocket.
+
+        Returns:
+            _ClientSender: The connection's sender.
         """
-        disconnected = []
-        for connection in self.active_connections:
+        sender = self._senders.get(websocket)
+        if sender is None:
+            sender = _ClientSender(websocket, self.max_queue_size)
+            sender.task = asyncio.create_task(self._run_sender(sender))
+            self._senders[websocket] = sender
+        return sender
+
+    async def _run_sender(self, sender: _ClientSender) -> None:
+        """Write queued messages to a WebSocket until it fails.
+
+        Args:
+            sender: The connection's sender.
+        """
+        while True:
+            message = await sender.queue.get()
             try:
-                await connection.send_json(message)
+                await asyncio.wait_for(
+                    sender.websocket.send_json(message), timeout=self.send_timeout
+                )
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
-                disconnected.append(connection)
+                logger.warning(f"Failed to send to WebSocket: {e!r}")
+                self._evict(sender)
+                return
+            finally:
+                sender.queue.task_done()
 
-        # Remove disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+    def _enqueue(self, sender: _ClientSender, message: dict[str, Any]) -> None:
+        """Queue a message for a connection, applying the overflow policy.
+
+        Args:
+            sender: The connection's sender.
+            message: The message to queue.
+        """
+        try:
+            sender.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == OVERFLOW_DISCONNECT:
+            AGENTS_WS_SEND_OVERFLOWS.labels(action="disconnected").inc()
+            logger.warning("WebSocket client fell behind, disconnecting")
+            self._evict(sender)
+            return
+
+        sender.queue.get_nowait()
+        sender.queue.task_done()
+        sender.queue.put_nowait(message)
+        AGENTS_WS_SEND_OVERFLOWS.labels(action="dropped").inc()
+
+    def _evict(self, sender: _ClientSender) -> None:
+        """Disconnect a failed or lagging client and close its socket.
+
+        Args:
+            sender: The connection's sender.
+        """
+        websocket = sender.websocket
+        self.disconnect(websocket)
+
+        async def _close() -> None:
+            try:
+                await asyncio.wait_for(
+                    websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER),
+                    timeout=self.send_timeout,
+                )
+            except Exception as e:
+                logger.debug(f"Error closing evicted WebSocket: {e!r}")
+
+        task = asyncio.create_task(_close())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def broadcast(
+        self, message: dict[str, Any], channel: Optional[str] = None
+    ) -> None:
+        """Queue a message for all connected clients.
+
+        Returns without waiting for delivery; use flush() to wait.
+
+        Args:
+            message: The message to broadcast.
+            channel: If given, only clients subscribed to this channel
+                receive the message.
+        """
+        for connection in list(self.active_connections):
+            sender = self._get_sender(connection)
+            if channel is None or channel in sender.channels:
+                self._enqueue(sender, message)
 
     async def send_personal_message(
         self, message: dict[str, Any], websocket: WebSocket
     ) -> None:
         """Send a message to a specific client.
 
+        Registered connections go through their send queue, so personal
+        messages stay ordered with broadcasts.
+
         Args:
             message: The message to send.
             websocket: The target WebSocket.
         """
+        sender = self._senders.get(websocket)
+        if sender is not None:
+            self._enqueue(sender, message)
+            return
         try:
             await websocket.send_json(message)
         except Exception as e:
             logger.warning(f"Failed to send personal message: {e}")
 
+    async def flush(self) -> None:
+        """Wait until every queued message has been sent or discarded."""
+        await asyncio.gather(*(s.queue.join() for s in list(self._senders.values())))
+
+    def subscribe(
+        self,
+        websocket: WebSocket,
+        channel: str,
+        service: AgentTelemetryService,
+    ) -> None:
+        """Subscribe a connection to a channel.
+
+        Subscribing to "status" starts the shared status feed if it is not
+        already running.
+
+        Args:
+            websocket: The WebSocket.
+            channel: The channel name.
+            service: The telemetry service that supplies status changes.
+        """
+        self._get_sender(websocket).channels.add(channel)
+        if channel == "status":
+            self._start_status_feed(service)
+
+    def _start_status_feed(self, service: AgentTelemetryService) -> None:
+        """Start the status fan-out task unless it is running.
+
+        Args:
+            service: The telemetry service that supplies status changes.
+        """
+        feed = self._status_feed
+        if (
+            feed is not None
+            and not feed.done()
+            and feed.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._status_feed = asyncio.create_task(self._run_status_feed(service))
+
+    def _stop_status_feed(self) -> None:
+        """Cancel the status fan-out task."""
+        if self._status_feed is not None and not self._status_feed.done():
+            self._status_feed.cancel()
+        self._status_feed = None
+
+    async def _run_status_feed(self, service: AgentTelemetryService) -> None:
+        """Read status changes and broadcast them to status subscribers.
+
+        Changes are coalesced per agent over STATUS_FEED_BATCH_SECONDS, so
+        an agent reporting rapid progress costs viewers one message per
+        window. The subscription is re-established with backoff on error.
+
+        Args:
+            service: The telemetry service that supplies status changes.
+        """
+        pending: dict[str, AgentStatus] = {}
+
+        async def _flush_pending() -> None:
+            while True:
+                await asyncio.sleep(STATUS_FEED_BATCH_SECONDS)
+                if not pending:
+                    continue
+                agents = [_serialize_agent(a) for a in pending.values()]
+                pending.clear()
+                await self.broadcast(
+                    {
+                        "type": "status_delta",
+                        "data": {"agents": agents},
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
+                    channel="status",
+                )
+
+        flusher = asyncio.create_task(_flush_pending())
+        backoff = 1.0
+        try:
+            while True:
+                try:
+                    async for status in service.subscribe_status_updates():
+                        pending[status.agent_id] = status
+                        backoff = 1.0
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Agent status feed failed, retrying in {backoff}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, STATUS_FEED_MAX_BACKOFF_SECONDS)
+        finally:
+            flusher.cancel()
+
+    async def shutdown(self) -> None:
+        """Stop the status feed and all writer tasks."""
+        self._stop_status_feed()
+        for websocket in list(self._senders):
+            self.disconnect(websocket)
+
 
 # Global connection manager instance
 manager = ConnectionManager()
@@ -302,7 +602,7 @@ async def websocket_agents(
     Supports the following message types:
     - ping/pong: Connection health check
     - heartbeat: Periodic heartbeat with timestamp
-    - subscribe: Subscribe to status updates
+    - subscribe: Subscribe to status updates (snapshot, then deltas)
 
     Args:
         websocket: The WebSocket connection.
@@ -330,23 +630,16 @@ async def websocket_agents(
             elif message_type == "subscribe":
                 channel = data.get("channel", "")
                 if channel == "status":
-                    # Send current status immediately
+                    # Register first so no change published during the
+                    # snapshot read is missed
+                    manager.subscribe(websocket, "status", service)
                     try:
                         agents = await service.get_all_agent_status()
                         await manager.send_personal_message(
                             {
                                 "type": "status_update",
                                 "data": {
-                                    "agents": [
-                                        {
-                                            "agent_id": a.agent_id,
-                                            "agent_type": a.agent_type,
-                                            "status": a.status,
-                                            "current_task": a.current_task,
-                                            "progress": a.progress,
-                                        }
-                                        for a in agents
-                                    ]
+                                    "agents": [_serialize_agent(a) for a in agents]
                                 },
                                 "timestamp": datetime.now(timezone.utc).isoformat(),
                             },
@@ -33,7 +33,7 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/costs", tags=["costs"])
 
-VALID_GROUP_BY = {"agent", "model", "session", "tool"}
+VALID_GROUP_BY = {"agent", "model", "session", "tool", "day"}
 _SESSION_ID_RE = re.compile(r"^[a-zA-Z0-9_.-]+$")
 
 
@@ -7,6 +7,7 @@ This module provides API endpoints for the PRD Ideation Studio (P05-F11):
 - POST /api/studio/ideation/{sessionId}/draft - Save session draft
 - GET /api/studio/ideation/sessions - List all sessions for a user
 - GET /api/studio/ideation/sessions/{session_id} - Load a specific session
+- GET /api/studio/ideation/sessions/{session_id}/messages - Page through messages
 - PATCH /api/studio/ideation/sessions/{session_id} - Update session details
 """
 
@@ -19,6 +20,8 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from pydantic import BaseModel, Field
 
+from src.core.models.ideation import ChatMessage, MessageCursor
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/studio/ideation", tags=["ideation"])
@@ -223,6 +226,19 @@ class SessionDetailResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class MessagePageResponse(BaseModel):
+    """Response for a page of session messages.
+
+    prevCursor is set when older messages may exist; pass it as `before`
+    to load them. nextCursor points at the newest message returned; pass
+    it as `after` to poll for new messages.
+    """
+
+    messages: list[IdeationMessage]
+    prevCursor: str | None = None
+    nextCursor: str | None = None
+
+
 class UpdateSessionRequest(BaseModel):
     """Request to update session details."""
 
@@ -373,17 +389,44 @@ class IdeationService:
         impl = self._get_impl()
         return await impl.list_sessions(user_id, limit, offset)
 
-    async def get_session(self, session_id: str) -> dict | None:
+    async def get_session(
+        self,
+        session_id: str,
+        message_limit: int | None = None,
+    ) -> dict | None:
         """Get full session details.
 
         Args:
             session_id: Session identifier.
+            message_limit: Return only the last N messages (the last 1000
+                if None).
 
         Returns:
             dict | None: Session details or None if not found.
         """
         impl = self._get_impl()
-        return await impl.get_session(session_id)
+        return await impl.get_session(session_id, message_limit)
+
+    async def get_messages(
+        self,
+        session_id: str,
+        limit: int = 50,
+        after: MessageCursor | None = None,
+        before: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """Get a page of a session's messages.
+
+        Args:
+            session_id: Session identifier.
+            limit: Maximum number of messages to return.
+            after: Return messages strictly after this position.
+            before: Return messages strictly before this position.
+
+        Returns:
+            list[ChatMessage]: Messages ordered oldest first.
+        """
+        impl = self._get_impl()
+        return await impl.get_messages(session_id, limit, after, before)
 
     async def update_session(
         self,
@@ -471,14 +514,43 @@ async def list_sessions(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def _to_api_message(message: ChatMessage) -> IdeationMessage:
+    """Convert a domain chat message to the API model.
+
+    Args:
+        message: The domain message.
+
+    Returns:
+        IdeationMessage: The API message.
+    """
+    return IdeationMessage(
+        id=message.id,
+        role=message.role.value,
+        content=message.content,
+        timestamp=message.timestamp.isoformat(),
+        maturityDelta=float(message.maturity_delta) if message.maturity_delta else None,
+        extractedRequirements=[],
+        suggestedFollowups=[],
+    )
+
+
 @router.get("/sessions/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
     session_id: str = Path(..., description="Session ID"),
+    message_limit: int | None = Query(
+        None,
+        alias="messageLimit",
+        ge=1,
+        le=1000,
+        description="Return only the last N messages",
+    ),
 ) -> SessionDetailResponse:
     """Get details of a specific session.
 
     Args:
         session_id: Session identifier.
+        message_limit: Return only the last N messages (the last 1000 if
+            omitted).
 
     Returns:
         SessionDetailResponse: Full session details with messages and maturity.
@@ -488,23 +560,12 @@ async def get_session(
         HTTPException: 500 on service error.
     """
     try:
-        session = await _get_service().get_session(session_id)
+        session = await _get_service().get_session(session_id, message_limit)
         if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Convert domain models to API models
-        messages = [
-            IdeationMessage(
-                id=m.id,
-                role=m.role.value,
-                content=m.content,
-                timestamp=m.timestamp.isoformat(),
-                maturityDelta=float(m.maturity_delta) if m.maturity_delta else None,
-                extractedRequirements=[],
-                suggestedFollowups=[],
-            )
-            for m in session["messages"]
-        ]
+        messages = [_to_api_message(m) for m in session["messages"]]
 
         maturity_state = None
         if session["maturity"]:
@@ -557,6 +618,60 @@ async def get_session(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/sessions/{session_id}/messages", response_model=MessagePageResponse)
+async def get_session_messages(
+    session_id: str = Path(..., description="Session ID"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum messages to return"),
+    after: str | None = Query(None, description="Return messages after this cursor"),
+    before: str | None = Query(None, description="Return messages before this cursor"),
+) -> MessagePageResponse:
+    """Get a page of a session's messages.
+
+    Without a cursor, returns the newest messages.
+
+    Args:
+        session_id: Session identifier.
+        limit: Maximum number of messages to return.
+        after: Cursor from a previous page's nextCursor.
+        before: Cursor from a previous page's prevCursor.
+
+    Returns:
+        MessagePageResponse: Messages (oldest first) and paging cursors.
+
+    Raises:
+        HTTPException: 400 on an invalid cursor.
+        HTTPException: 500 on service error.
+    """
+    try:
+        after_cursor = MessageCursor.decode(after) if after else None
+        before_cursor = MessageCursor.decode(before) if before else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    try:
+        messages = await _get_service().get_messages(
+            session_id, limit, after_cursor, before_cursor
+        )
+    except NotImplementedError:
+        return MessagePageResponse(messages=[])
+    except Exception as e:
+        logger.error(f"Failed to get session messages: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    prev_cursor = None
+    if messages and after_cursor is None and len(messages) == limit:
+        prev_cursor = MessageCursor.of(messages[0]).encode()
+    if messages:
+        next_cursor = MessageCursor.of(messages[-1]).encode()
+    else:
+        next_cursor = after
+    return MessagePageResponse(
+        messages=[_to_api_message(m) for m in messages],
+        prevCursor=prev_cursor,
+        nextCursor=next_cursor,
+    )
+
+
 @router.patch("/sessions/{session_id}")
 async def update_session(
     session_id: str = Path(..., description="Session ID"),
@@ -13,12 +13,20 @@ Endpoints:
 - GET /api/metrics/requests - Request rate time series
 - GET /api/metrics/latency - Latency percentiles (p50, p95, p99)
 - GET /api/metrics/tasks - Active tasks and workers count
+
+All handlers share one pooled HTTP client. Queries go through a small
+response cache: range queries are aligned to their step so concurrent
+panels issue identical requests, and identical in-flight requests are
+coalesced into a single upstream call.
 """
 
 from __future__ import annotations
 
+import asyncio
+import math
 import os
 import re
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -26,10 +34,15 @@ import httpx
 from fastapi import APIRouter, HTTPException, Path, Query
 from pydantic import BaseModel
 
+from src.infrastructure.metrics.definitions import (
+    METRICS_PROXY_CACHE_REQUESTS,
+    METRICS_PROXY_UPSTREAM_LATENCY,
+)
 from src.orchestrator.api.models.service_health import (
     ServicesHealthResponse,
     ServiceSparklineResponse,
 )
+from src.orchestrator.services.query_cache import QueryCache
 from src.orchestrator.services.service_health import (
     VALID_SERVICES,
     get_service_health_service,
@@ -44,6 +57,10 @@ VICTORIAMETRICS_URL = os.environ.get(
 QUERY_TIMEOUT = float(os.environ.get("VICTORIAMETRICS_QUERY_TIMEOUT", "30.0"))
 HEALTH_TIMEOUT = float(os.environ.get("VICTORIAMETRICS_HEALTH_TIMEOUT", "5.0"))
 
+# Query response cache configuration
+QUERY_CACHE_TTL = float(os.environ.get("METRICS_QUERY_CACHE_TTL", "10.0"))
+QUERY_CACHE_MAX_ENTRIES = int(os.environ.get("METRICS_QUERY_CACHE_MAX_ENTRIES", "256"))
+
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 
 
@@ -144,47 +161,139 @@ def parse_vm_response(data: dict, metric_name: str, service: str) -> VMMetricsTi
     )
 
 
-async def query_victoriametrics(query: str, start: str, end: str, step: str) -> dict:
-    """Execute a PromQL range query against VictoriaMetrics."""
-    async with httpx.AsyncClient() as client:
+# =============================================================================
+# Shared Client and Query Cache
+# =============================================================================
+
+_vm_client: httpx.AsyncClient | None = None
+_query_cache: QueryCache[dict] = QueryCache(QUERY_CACHE_TTL, QUERY_CACHE_MAX_ENTRIES)
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w)")
+
+
+def get_vm_client() -> httpx.AsyncClient:
+    """Get the app-lifetime VictoriaMetrics client, creating it on first use."""
+    global _vm_client
+    if _vm_client is None:
+        _vm_client = httpx.AsyncClient(
+            timeout=QUERY_TIMEOUT,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _vm_client
+
+
+async def close_vm_client() -> None:
+    """Close the shared client and drop cached responses."""
+    global _vm_client
+    client, _vm_client = _vm_client, None
+    _query_cache.clear()
+    if client is not None:
+        await client.aclose()
+
+
+def _parse_step_seconds(step: str) -> float | None:
+    """Parse a PromQL step ("15s", "1m30s" or plain seconds) into seconds."""
+    try:
+        return float(step)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(step)
+    if not parts or "".join(n + u for n, u in parts) != step:
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def _parse_timestamp(value: str) -> float | None:
+    """Parse an RFC3339 or Unix timestamp into epoch seconds."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def align_time_range(start: str, end: str, step: str) -> tuple[str, str]:
+    """Align a range query's start down and its end up to its step.
+
+    Requests for the same window made within one step then produce
+    identical, cacheable queries, and rounding the end up keeps the
+    partial last bucket so the newest samples are not cut off. Inputs
+    that cannot be parsed are returned unchanged.
+    """
+    step_seconds = _parse_step_seconds(step)
+    start_ts = _parse_timestamp(start)
+    end_ts = _parse_timestamp(end)
+    if not step_seconds or start_ts is None or end_ts is None:
+        return start, end
+    aligned_start = int(start_ts // step_seconds * step_seconds)
+    aligned_end = int(math.ceil(end_ts / step_seconds) * step_seconds)
+    return str(aligned_start), str(max(aligned_end, aligned_start))
+
+
+async def _cached_get(
+    query_type: str,
+    path: str,
+    params: dict[str, str],
+    timeout: float = QUERY_TIMEOUT,
+) -> dict:
+    """GET a VictoriaMetrics API path through the response cache.
+
+    Successful responses are cached for QUERY_CACHE_TTL seconds and
+    concurrent identical requests share one upstream call. Errors are
+    propagated to every waiter and never cached.
+    """
+    key = (path, *sorted(f"{k}={v}" for k, v in params.items()))
+
+    async def _fetch() -> dict:
+        started = time.perf_counter()
         try:
-            response = await client.get(
-                f"{VICTORIAMETRICS_URL}/api/v1/query_range",
-                params={
-                    "query": query,
-                    "start": start,
-                    "end": end,
-                    "step": step,
-                },
-                timeout=QUERY_TIMEOUT,
+            response = await get_vm_client().get(
+                f"{VICTORIAMETRICS_URL}{path}", params=params, timeout=timeout,
             )
             response.raise_for_status()
             return response.json()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"VictoriaMetrics error: {e}",
-            ) from e
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"VictoriaMetrics unavailable: {e}",
-            ) from e
+        finally:
+            METRICS_PROXY_UPSTREAM_LATENCY.labels(query_type=query_type).observe(
+                time.perf_counter() - started
+            )
+
+    def _record(result: str) -> None:
+        METRICS_PROXY_CACHE_REQUESTS.labels(query_type=query_type, result=result).inc()
+
+    return await _query_cache.get(key, _fetch, on_lookup=_record)
+
+
+async def query_victoriametrics(query: str, start: str, end: str, step: str) -> dict:
+    """Execute a PromQL range query against VictoriaMetrics."""
+    start, end = align_time_range(start, end, step)
+    try:
+        return await _cached_get(
+            "range",
+            "/api/v1/query_range",
+            {"query": query, "start": start, "end": end, "step": step},
+        )
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"VictoriaMetrics error: {e}",
+        ) from e
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"VictoriaMetrics unavailable: {e}",
+        ) from e
 
 
 async def query_victoriametrics_instant(query: str) -> dict:
     """Execute an instant PromQL query against VictoriaMetrics."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{VICTORIAMETRICS_URL}/api/v1/query",
-                params={"query": query},
-                timeout=QUERY_TIMEOUT,
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return {"data": {"result": []}}
+    try:
+        return await _cached_get("instant", "/api/v1/query", {"query": query})
+    except Exception:
+        return {"data": {"result": []}}
 
 
 # =============================================================================
@@ -194,18 +303,17 @@ async def query_victoriametrics_instant(query: str) -> dict:
 @router.get("/health", response_model=HealthResponse)
 async def metrics_health() -> HealthResponse:
     """Check VictoriaMetrics connectivity."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{VICTORIAMETRICS_URL}/health",
-                timeout=HEALTH_TIMEOUT,
-            )
-            if response.status_code == 200:
-                return HealthResponse(status="healthy")
-            else:
-                return HealthResponse(status="unhealthy")
-        except Exception as e:
-            return HealthResponse(status="unhealthy", error=str(e))
+    try:
+        response = await get_vm_client().get(
+            f"{VICTORIAMETRICS_URL}/health",
+            timeout=HEALTH_TIMEOUT,
+        )
+        if response.status_code == 200:
+            return HealthResponse(status="healthy")
+        else:
+            return HealthResponse(status="unhealthy")
+    except Exception as e:
+        return HealthResponse(status="unhealthy", error=str(e))
 
 
 @router.get("/services", response_model=ServicesResponse)
@@ -223,45 +331,40 @@ async def list_services() -> ServicesResponse:
     # Query for services that have metrics
     query = "group by (service) (up)"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{VICTORIAMETRICS_URL}/api/v1/query",
-                params={"query": query},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            services = []
-            results = data.get("data", {}).get("result", [])
-
-            for result in results:
-                name = result.get("metric", {}).get("service", "unknown")
-                value = result.get("value", [0, "0"])[1]
-                healthy = value == "1"
-
-                services.append(ServiceInfo(
-                    name=name,
-                    displayName=known_services.get(name, name.title()),
-                    healthy=healthy,
-                ))
-
-            # If no results, return known services as fallback
-            if not services:
-                services = [
-                    ServiceInfo(name=k, displayName=v, healthy=True)
-                    for k, v in known_services.items()
-                ]
-
-            return ServicesResponse(services=sorted(services, key=lambda s: s.name))
-
-        except Exception:
-            # Fallback to known services
-            return ServicesResponse(services=[
+    try:
+        data = await _cached_get(
+            "instant", "/api/v1/query", {"query": query}, timeout=10.0
+        )
+
+        services = []
+        results = data.get("data", {}).get("result", [])
+
+        for result in results:
+            name = result.get("metric", {}).get("service", "unknown")
+            value = result.get("value", [0, "0"])[1]
+            healthy = value == "1"
+
+            services.append(ServiceInfo(
+                name=name,
+                displayName=known_services.get(name, name.title()),
+                healthy=healthy,
+            ))
+
+        # If no results, return known services as fallback
+        if not services:
+            services = [
                 ServiceInfo(name=k, displayName=v, healthy=True)
                 for k, v in known_services.items()
-            ])
+            ]
+
+        return ServicesResponse(services=sorted(services, key=lambda s: s.name))
+
+    except Exception:
+        # Fallback to known services
+        return ServicesResponse(services=[
+            ServiceInfo(name=k, displayName=v, healthy=True)
+            for k, v in known_services.items()
+        ])
 
 
 # =============================================================================
@@ -393,14 +496,17 @@ async def get_latency_metrics(
         "p99": f'histogram_quantile(0.99, rate(asdlc_http_request_duration_seconds_bucket{{{service_filter}}}[5m]))',
     }
 
-    results = {}
-    for percentile, query in queries.items():
-        data = await query_victoriametrics(query, start, end, step)
-        results[percentile] = parse_vm_response(
+    responses = await asyncio.gather(
+        *(query_victoriametrics(query, start, end, step) for query in queries.values())
+    )
+    results = {
+        percentile: parse_vm_response(
             data,
             f"asdlc_http_request_duration_seconds_{percentile}",
             service
         )
+        for percentile, data in zip(queries, responses, strict=True)
+    }
 
     return LatencyMetrics(
         p50=results["p50"],
@@ -417,9 +523,11 @@ async def get_active_tasks() -> ActiveTasksMetrics:
     workers_query = "asdlc_active_workers"
     max_tasks_query = "asdlc_max_tasks"
 
-    tasks_data = await query_victoriametrics_instant(tasks_query)
-    workers_data = await query_victoriametrics_instant(workers_query)
-    max_tasks_data = await query_victoriametrics_instant(max_tasks_query)
+    tasks_data, workers_data, max_tasks_data = await asyncio.gather(
+        query_victoriametrics_instant(tasks_query),
+        query_victoriametrics_instant(workers_query),
+        query_victoriametrics_instant(max_tasks_query),
+    )
 
     # Extract values with defaults
     def get_value(data: dict, default: int = 0) -> int:
@@ -23,6 +23,7 @@ from src.workers.swarm.reviewers import ReviewerRegistry, default_registry
 
 if TYPE_CHECKING:
     from src.workers.swarm.dispatcher import SwarmDispatcher
+    from src.workers.swarm.executor import ReviewExecutor
     from src.workers.swarm.redis_store import SwarmRedisStore
     from src.workers.swarm.session import SwarmSessionManager
 
@@ -150,6 +151,7 @@ def get_reviewer_registry() -> ReviewerRegistry:
 _cached_redis_store: SwarmRedisStore | None = None
 _cached_session_manager: SwarmSessionManager | None = None
 _cached_dispatcher: SwarmDispatcher | None = None
+_cached_review_executor: ReviewExecutor | None = None
 _init_lock: asyncio.Lock | None = None
 
 
@@ -175,6 +177,7 @@ async def _ensure_swarm_components() -> (
         is unavailable.
     """
     global _cached_redis_store, _cached_session_manager, _cached_dispatcher
+    global _cached_review_executor
 
     if _cached_dispatcher is not None:
         return _cached_redis_store, _cached_session_manager, _cached_dispatcher
@@ -202,14 +205,14 @@ async def _ensure_swarm_components() -> (
             # Wire up real LLM executor for code reviews
             llm_config_service = LLMConfigService(redis_client=redis_client)
             llm_factory = LLMClientFactory(config_service=llm_config_service)
-            review_executor = ReviewExecutor(factory=llm_factory)
+            _cached_review_executor = ReviewExecutor(factory=llm_factory)
 
             _cached_dispatcher = _Dispatcher(
                 session_manager=_cached_session_manager,
                 redis_store=_cached_redis_store,
                 registry=default_registry,
                 config=config,
-                review_executor=review_executor.execute_review,
+                review_executor=_cached_review_executor.execute_review,
             )
             return _cached_redis_store, _cached_session_manager, _cached_dispatcher
         except Exception as exc:
@@ -247,6 +250,21 @@ async def get_swarm_dispatcher() -> SwarmDispatcher | None:
     return result[2] if result else None
 
 
+async def shutdown_swarm_components() -> None:
+    """Close the review executor and drop the cached swarm components.
+
+    Safe to call even if the components were never created.
+    """
+    global _cached_redis_store, _cached_session_manager, _cached_dispatcher
+    global _cached_review_executor
+    if _cached_review_executor is not None:
+        await _cached_review_executor.aclose()
+    _cached_redis_store = None
+    _cached_session_manager = None
+    _cached_dispatcher = None
+    _cached_review_executor = None
+
+
 # =============================================================================
 # Validation Functions
 # =============================================================================
@@ -1,16 +1,33 @@
-"""Orchestrator services package."""
-
-from src.orchestrator.services.agent_telemetry import AgentTelemetryService
-from src.orchestrator.services.devops_activity import DevOpsActivityService
-from src.orchestrator.services.k8s_cluster import K8sClusterService
-from src.orchestrator.services.label_taxonomy_service import (
-    LabelTaxonomyService,
-    get_label_taxonomy_service,
-)
-from src.orchestrator.services.llm_config_service import (
-    LLMConfigService,
-    get_llm_config_service,
-)
+"""Orchestrator services package.
+
+Services are imported on first attribute access, so importing one service
+module does not load the dependencies of all the others (the Kubernetes
+client for K8sClusterService, for example).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public name -> defining module
+_EXPORTS = {
+    "AgentTelemetryService": "src.orchestrator.services.agent_telemetry",
+    "DevOpsActivityService": "src.orchestrator.services.devops_activity",
+    "K8sClusterService": "src.orchestrator.services.k8s_cluster",
+    "LabelTaxonomyService": "src.orchestrator.services.label_taxonomy_service",
+    "get_label_taxonomy_service": "src.orchestrator.services.label_taxonomy_service",
+    "LLMConfigService": "src.orchestrator.services.llm_config_service",
+    "get_llm_config_service": "src.orchestrator.services.llm_config_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for service classes and getters."""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AgentTelemetryService",
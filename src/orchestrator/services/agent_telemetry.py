@@ -8,12 +8,21 @@ Redis Keys:
 - agent:logs:{id} - List of log entries (capped at 1000)
 - agent:metrics:{type} - Metrics JSON by agent type
 - agent:active - Set of active agent IDs
+
+Pub/Sub Channels:
+- agent:status:updates - Status JSON published whenever an agent's status
+  changes, so WebSocket viewers are pushed changes instead of polling
+
+Status writers must go through publish_agent_status for changes to reach
+the channel. No agent runtime writes agent:status:{id} yet; until one is
+wired to publish_agent_status the WebSocket feed stays silent.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -36,9 +45,13 @@ AGENT_LOGS_KEY_PREFIX = "agent:logs:"
 AGENT_METRICS_KEY_PREFIX = "agent:metrics:"
 AGENT_ACTIVE_SET_KEY = "agent:active"
 
+# Pub/Sub channel carrying status changes
+AGENT_STATUS_CHANNEL = "agent:status:updates"
+
 # Default values
 DEFAULT_LOG_LIMIT = 100
 MAX_LOG_LIMIT = 1000
+DEFAULT_STATUS_TTL_SECONDS = 300
 
 
 class AgentTelemetryService:
@@ -74,7 +87,7 @@ class AgentTelemetryService:
         """Get status for all active agents.
 
         Retrieves the list of active agent IDs from the agent:active set,
-        then fetches status details for each agent.
+        then fetches all status documents with a single MGET.
 
         Returns:
             list[AgentStatus]: List of agent statuses, sorted by agent_id.
@@ -83,15 +96,15 @@ class AgentTelemetryService:
             client = await self._get_client()
 
             # Get all active agent IDs
-            active_ids = await client.smembers(AGENT_ACTIVE_SET_KEY)
+            active_ids = list(await client.smembers(AGENT_ACTIVE_SET_KEY))
             if not active_ids:
                 return []
 
-            statuses = []
-            for agent_id in active_ids:
-                status_key = f"{AGENT_STATUS_KEY_PREFIX}{agent_id}"
-                status_json = await client.get(status_key)
+            status_keys = [f"{AGENT_STATUS_KEY_PREFIX}{agent_id}" for agent_id in active_ids]
+            status_values = await client.mget(status_keys)
 
+            statuses = []
+            for agent_id, status_json in zip(active_ids, status_values, strict=True):
                 if status_json:
                     try:
                         status_data = json.loads(status_json)
@@ -108,6 +121,68 @@ class AgentTelemetryService:
             logger.error(f"Error getting agent statuses: {e}")
             return []
 
+    async def publish_agent_status(
+        self,
+        status_data: dict[str, Any],
+        ttl_seconds: int = DEFAULT_STATUS_TTL_SECONDS,
+    ) -> None:
+        """Store an agent's status and publish the change.
+
+        Writes agent:status:{id}, adds the agent to agent:active and
+        publishes the status on AGENT_STATUS_CHANNEL in one transaction,
+        so readers and WebSocket subscribers never disagree. This is the
+        only write path that pushes to WebSocket viewers; a plain SET of
+        agent:status:{id} is served by polling reads but never broadcast.
+
+        Args:
+            status_data: Status fields as stored in agent:status:{id}.
+                Must include "agent_id".
+            ttl_seconds: Expiry for the status key.
+
+        Raises:
+            KeyError: If status_data has no agent_id.
+        """
+        agent_id = status_data["agent_id"]
+        payload = json.dumps(status_data)
+
+        client = await self._get_client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.set(f"{AGENT_STATUS_KEY_PREFIX}{agent_id}", payload, ex=ttl_seconds)
+            pipe.sadd(AGENT_ACTIVE_SET_KEY, agent_id)
+            pipe.publish(AGENT_STATUS_CHANNEL, payload)
+            await pipe.execute()
+
+    async def subscribe_status_updates(self) -> AsyncIterator[AgentStatus]:
+        """Yield agent status changes as they are published.
+
+        Subscribes to AGENT_STATUS_CHANNEL. Messages that cannot be parsed
+        are skipped. The subscription is closed when the iterator is closed
+        or cancelled.
+
+        Yields:
+            AgentStatus: Each published status change.
+        """
+        client = await self._get_client()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(AGENT_STATUS_CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    status = self._parse_agent_status(json.loads(message["data"]))
+                except (json.JSONDecodeError, TypeError, ValueError) as e:
+                    logger.warning(f"Failed to parse published status: {e}")
+                    continue
+                if status:
+                    yield status
+        finally:
+            try:
+                await pubsub.unsubscribe(AGENT_STATUS_CHANNEL)
+                await pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing status subscription: {e}")
+
     def _parse_agent_status(self, data: dict[str, Any]) -> Optional[AgentStatus]:
         """Parse agent status data from JSON.
 
@@ -209,7 +284,7 @@ class AgentTelemetryService:
     async def get_agent_metrics(self) -> list[AgentMetrics]:
         """Get aggregated metrics for all agent types.
 
-        Retrieves metrics from agent:metrics:{type} keys for each agent type.
+        Retrieves metrics from agent:metrics:{type} keys with a single MGET.
 
         Returns:
             list[AgentMetrics]: List of metrics by agent type.
@@ -222,10 +297,11 @@ class AgentTelemetryService:
             if not metrics_keys:
                 return []
 
-            metrics_list = []
-            for key in metrics_keys:
-                metrics_json = await client.get(key)
+            metrics_keys = list(metrics_keys)
+            metrics_values = await client.mget(metrics_keys)
 
+            metrics_list = []
+            for key, metrics_json in zip(metrics_keys, metrics_values, strict=True):
                 if metrics_json:
                     try:
                         metrics_data = json.loads(metrics_json)
@@ -0,0 +1,239 @@
+"""Classification result cache.
+
+Caches LLM classification outcomes in Redis, keyed by the normalised
+idea content, the label taxonomy, the prompt version and the model, so
+re-classifying unchanged ideas does not call the LLM again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.orchestrator.api.models.classification import (
+    ClassificationResult,
+    ClassificationType,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Redis key prefix for cached classification outcomes
+REDIS_CLASSIFICATION_CACHE_PREFIX = "classification:cache:"
+
+# Default cache entry lifetime (7 days)
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+def normalize_content(content: str) -> str:
+    """Normalise idea content for hashing.
+
+    Collapses whitespace and case so trivially different copies of an
+    idea (e.g. re-imported from Slack) share a cache entry.
+
+    Args:
+        content: The raw idea content.
+
+    Returns:
+        str: The normalised content.
+    """
+    return " ".join(content.split()).casefold()
+
+
+def content_hash(content: str) -> str:
+    """Hash normalised idea content.
+
+    Args:
+        content: The raw idea content.
+
+    Returns:
+        str: Hex SHA-256 of the normalised content.
+    """
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()
+
+
+def taxonomy_fingerprint(taxonomy_version: str, taxonomy_text: str) -> str:
+    """Fingerprint a taxonomy as seen by the classification prompt.
+
+    The taxonomy version string is not bumped on label edits, so the
+    prompt text is included to make any label change produce a new key.
+
+    Args:
+        taxonomy_version: The taxonomy's version string.
+        taxonomy_text: The taxonomy formatted for the prompt.
+
+    Returns:
+        str: Short hex fingerprint.
+    """
+    digest = hashlib.sha256(
+        f"{taxonomy_version}\n{taxonomy_text}".encode("utf-8")
+    ).hexdigest()
+    return digest[:16]
+
+
+class ClassificationCache:
+    """Redis-backed cache of classification outcomes.
+
+    Entries hold the classification, confidence, labels, reasoning and
+    model version, but not the idea ID, so identical content shares one
+    entry.
+
+    Usage:
+        cache = ClassificationCache()
+        key = cache.make_key(content, fingerprint, prompt_version, model)
+        cached = await cache.get(redis_client, key, idea_id)
+        if cached is None:
+            ...
+            await cache.set(redis_client, key, result)
+    """
+
+    def __init__(self, ttl_seconds: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Entry lifetime. Defaults to the
+                CLASSIFICATION_CACHE_TTL_SECONDS env var or 7 days.
+        """
+        if ttl_seconds is None:
+            ttl_seconds = int(
+                os.environ.get(
+                    "CLASSIFICATION_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS
+                )
+            )
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled (a TTL of 0 disables it)."""
+        return self.ttl_seconds > 0
+
+    def make_key(
+        self,
+        content: str,
+        taxonomy_fp: str,
+        prompt_version: str,
+        model: str,
+    ) -> str:
+        """Build the cache key for an idea's content.
+
+        Args:
+            content: The raw idea content.
+            taxonomy_fp: Fingerprint from taxonomy_fingerprint().
+            prompt_version: The classification prompt version.
+            model: The LLM model name.
+
+        Returns:
+            str: The Redis key.
+        """
+        return (
+            f"{REDIS_CLASSIFICATION_CACHE_PREFIX}"
+            f"{taxonomy_fp}:{prompt_version}:{model}:{content_hash(content)}"
+        )
+
+    async def get(
+        self,
+        redis_client: redis.Redis,
+        key: str,
+        idea_id: str,
+    ) -> ClassificationResult | None:
+        """Look up a cached outcome.
+
+        Args:
+            redis_client: The Redis client.
+            key: Key from make_key().
+            idea_id: The idea the result is returned for.
+
+        Returns:
+            ClassificationResult | None: The cached result, or None on a
+                miss or an unreadable entry.
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            data = await redis_client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Classification cache lookup failed: {e}")
+            data = None
+
+        if data is None:
+            self.misses += 1
+            return None
+
+        try:
+            cached: dict[str, Any] = json.loads(data)
+            result = ClassificationResult(
+                idea_id=idea_id,
+                classification=ClassificationType(cached["classification"]),
+                confidence=cached["confidence"],
+                labels=cached.get("labels", []),
+                reasoning=cached.get("reasoning"),
+                model_version=cached.get("model_version"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable classification cache entry: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    async def set(
+        self,
+        redis_client: redis.Redis,
+        key: str,
+        result: ClassificationResult,
+    ) -> None:
+        """Store an outcome with the configured TTL.
+
+        Args:
+            redis_client: The Redis client.
+            key: Key from make_key().
+            result: The classification result to cache.
+        """
+        if not self.enabled:
+            return
+
+        value = {
+            "classification": result.classification.value,
+            "confidence": result.confidence,
+            "labels": result.labels,
+            "reasoning": result.reasoning,
+            "model_version": result.model_version,
+        }
+        try:
+            await redis_client.set(key, json.dumps(value), ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            logger.warning(f"Classification cache store failed: {e}")
+
+    async def invalidate(self, redis_client: redis.Redis) -> int:
+        """Delete all cached outcomes.
+
+        Args:
+            redis_client: The Redis client.
+
+        Returns:
+            int: Number of keys deleted.
+        """
+        deleted = 0
+        batch: list[str] = []
+        async for key in redis_client.scan_iter(
+            match=f"{REDIS_CLASSIFICATION_CACHE_PREFIX}*", count=500
+        ):
+            batch.append(key)
+            if len(batch) >= 500:
+                deleted += await redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await redis_client.unlink(*batch)
+
+        logger.info(f"Invalidated {deleted} cached classification results")
+        return deleted
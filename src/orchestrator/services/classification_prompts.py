@@ -94,6 +94,47 @@ Response:
 Now classify the idea provided above."""
 
 
+# Multi-idea prompt used to classify several short ideas in one LLM call
+BATCH_CLASSIFICATION_PROMPT = """You are an expert product analyst tasked with classifying product ideas.
+
+Classify EACH of the numbered ideas below independently.
+
+## IDEAS TO CLASSIFY
+
+{ideas_text}
+
+## CLASSIFICATION GUIDELINES
+
+- "functional": describes WHAT the system should do (features, user actions).
+- "non_functional": describes HOW the system should perform (performance,
+  security, scalability, usability constraints).
+- "undetermined": too vague, or functional and non-functional aspects equally.
+
+## LABEL TAXONOMY
+
+{taxonomy_text}
+
+## RESPONSE FORMAT
+
+Respond with ONLY a JSON object with one entry per idea, using the idea
+numbers given above as "id":
+
+{{
+    "results": [
+        {{
+            "id": "1",
+            "classification": "functional" | "non_functional" | "undetermined",
+            "confidence": 0.0-1.0,
+            "reasoning": "Brief explanation",
+            "labels": ["label1"],
+            "label_scores": {{"label1": 0.9}}
+        }}
+    ]
+}}
+
+Now classify the ideas provided above."""
+
+
 # Few-shot examples for functional classification
 FUNCTIONAL_EXAMPLES = [
     {
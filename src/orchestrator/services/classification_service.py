@@ -6,6 +6,7 @@ as functional or non-functional requirements and assigning labels.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -22,6 +23,10 @@ from src.orchestrator.api.models.classification import (
 )
 from src.orchestrator.api.models.idea import IdeaClassification
 from src.orchestrator.api.models.llm_config import AgentRole
+from src.orchestrator.services.classification_cache import (
+    ClassificationCache,
+    taxonomy_fingerprint,
+)
 from src.orchestrator.services.classification_prompts import (
     build_classification_prompt,
     get_prompt_version,
@@ -48,6 +53,12 @@ CLASSIFICATION_MAX_TOKENS = 500
 # Max retries for LLM calls
 MAX_LLM_RETRIES = 3
 
+# Ideas longer than this are never packed into a multi-idea prompt
+BATCH_MAX_IDEA_CHARS = 500
+
+# Reasoning set when the LLM response cannot be parsed (never cached)
+PARSE_FAILURE_REASONING = "Failed to parse LLM response"
+
 
 class ClassificationService:
     """Service for classifying ideas using LLM and rule-based fallback.
@@ -64,6 +75,9 @@ class ClassificationService:
 
         # Get stored result
         result = await service.get_classification_result("idea-123")
+
+    LLM outcomes are cached by (normalised content, taxonomy, prompt
+    version, model), so re-classifying unchanged ideas skips the LLM.
     """
 
     def __init__(
@@ -72,6 +86,7 @@ class ClassificationService:
         taxonomy_service: LabelTaxonomyService | None = None,
         ideas_service: IdeasService | None = None,
         llm_factory: LLMClientFactory | None = None,
+        cache: ClassificationCache | None = None,
     ) -> None:
         """Initialize the classification service.
 
@@ -80,11 +95,14 @@ class ClassificationService:
             taxonomy_service: Optional taxonomy service for label management.
             ideas_service: Optional ideas service for retrieving ideas.
             llm_factory: Optional LLM factory for creating LLM clients.
+            cache: Optional result cache. Defaults to a ClassificationCache
+                with the configured TTL.
         """
         self._redis_client = redis_client
         self._taxonomy_service = taxonomy_service
         self._ideas_service = ideas_service
         self._llm_factory = llm_factory
+        self._cache = cache if cache is not None else ClassificationCache()
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create the Redis client.
@@ -182,12 +200,14 @@ class ClassificationService:
         # Build prompt
         prompt = self.build_classification_prompt(idea.content, taxonomy_text)
 
-        # Try LLM classification
+        # Try LLM classification (served from cache when unchanged)
         try:
             result = await self._classify_with_llm(
                 idea_id=idea_id,
                 prompt=prompt,
                 taxonomy=taxonomy,
+                content=idea.content,
+                taxonomy_fp=taxonomy_fingerprint(taxonomy.version, taxonomy_text),
             )
         except Exception as e:
             logger.warning(
@@ -199,25 +219,105 @@ class ClassificationService:
                 taxonomy=taxonomy,
             )
 
-        # Store the result
+        await self._apply_result(idea, result)
+        return result
+
+    async def classify_ideas(
+        self,
+        idea_ids: list[str],
+        force: bool = False,
+    ) -> dict[str, ClassificationResult | Exception]:
+        """Classify several ideas, packing short ones into one LLM prompt.
+
+        Ideas up to BATCH_MAX_IDEA_CHARS are classified together with a
+        single multi-idea prompt. Longer ideas, and any idea missing from
+        the multi-idea response, go through classify_idea individually.
+
+        Args:
+            idea_ids: The IDs of the ideas to classify.
+            force: If True, reclassify even if already classified.
+
+        Returns:
+            dict: Result per idea ID, or the exception raised for that idea.
+        """
+        ideas_service = self._get_ideas_service()
+        ideas = await asyncio.gather(
+            *(ideas_service.get_idea(idea_id) for idea_id in idea_ids)
+        )
+
+        results: dict[str, ClassificationResult | Exception] = {}
+        packed = []
+        single: list[str] = []
+        for idea_id, idea in zip(idea_ids, ideas, strict=True):
+            if idea is None:
+                results[idea_id] = ValueError(f"Idea not found: {idea_id}")
+            elif not force and idea.classification != IdeaClassification.UNDETERMINED:
+                single.append(idea_id)
+            elif len(idea.content) <= BATCH_MAX_IDEA_CHARS:
+                packed.append(idea)
+            else:
+                single.append(idea_id)
+
+        if len(packed) == 1:
+            single.append(packed.pop().id)
+
+        if packed:
+            taxonomy_service = self._get_taxonomy_service()
+            taxonomy = await taxonomy_service.get_taxonomy()
+            taxonomy_text = await taxonomy_service.to_prompt_format()
+            try:
+                batch_results = await self._classify_batch_with_llm(
+                    packed, taxonomy, taxonomy_text
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batch LLM classification of {len(packed)} ideas failed, "
+                    f"classifying individually: {e}"
+                )
+                batch_results = {}
+
+            for idea in packed:
+                result = batch_results.get(idea.id)
+                if result is None:
+                    single.append(idea.id)
+                    continue
+                try:
+                    await self._apply_result(idea, result)
+                    results[idea.id] = result
+                except Exception as e:
+                    results[idea.id] = e
+
+        outcomes = await asyncio.gather(
+            *(self.classify_idea(idea_id, force=force) for idea_id in single),
+            return_exceptions=True,
+        )
+        results.update(zip(single, outcomes, strict=True))
+        return results
+
+    async def _apply_result(self, idea: Any, result: ClassificationResult) -> None:
+        """Store a result and update the idea's classification and labels.
+
+        Args:
+            idea: The classified idea.
+            result: The classification result.
+        """
         await self.store_classification_result(result)
 
-        # Update the idea with classification
         from src.orchestrator.api.models.idea import UpdateIdeaRequest
 
         update_request = UpdateIdeaRequest(
             classification=IdeaClassification(result.classification.value),
             labels=list(set(idea.labels + result.labels)),
         )
-        await ideas_service.update_idea(idea_id, update_request)
-
-        return result
+        await self._get_ideas_service().update_idea(idea.id, update_request)
 
     async def _classify_with_llm(
         self,
         idea_id: str,
         prompt: str,
         taxonomy: LabelTaxonomy,
+        content: str | None = None,
+        taxonomy_fp: str | None = None,
     ) -> ClassificationResult:
         """Classify an idea using the LLM.
 
@@ -225,6 +325,9 @@ class ClassificationService:
             idea_id: The ID of the idea.
             prompt: The classification prompt.
             taxonomy: The label taxonomy for validation.
+            content: Idea content, used with taxonomy_fp as the cache key.
+                The cache is bypassed when either is omitted.
+            taxonomy_fp: Fingerprint of the taxonomy used in the prompt.
 
         Returns:
             ClassificationResult: The classification result.
@@ -232,6 +335,17 @@ class ClassificationService:
         llm_factory = self._get_llm_factory()
         client = await llm_factory.get_client(AgentRole.DISCOVERY)
 
+        cache_key = None
+        if content is not None and taxonomy_fp is not None and self._cache.enabled:
+            redis_client = await self._get_redis()
+            cache_key = self._cache.make_key(
+                content, taxonomy_fp, get_prompt_version(), client.model
+            )
+            cached = await self._cache.get(redis_client, cache_key, idea_id)
+            if cached is not None:
+                logger.debug(f"Classification cache hit for {idea_id}")
+                return cached
+
         response = await client.generate(
             prompt=prompt,
             temperature=CLASSIFICATION_TEMPERATURE,
@@ -247,7 +361,7 @@ class ClassificationService:
         # Create result
         classification_type = ClassificationType(parsed["classification"])
 
-        return ClassificationResult(
+        result = ClassificationResult(
             idea_id=idea_id,
             classification=classification_type,
             confidence=parsed["confidence"],
@@ -256,6 +370,89 @@ class ClassificationService:
             model_version=f"{client.model}:{get_prompt_version()}",
         )
 
+        if cache_key is not None and result.reasoning != PARSE_FAILURE_REASONING:
+            await self._cache.set(await self._get_redis(), cache_key, result)
+
+        return result
+
+    async def _classify_batch_with_llm(
+        self,
+        ideas: list[Any],
+        taxonomy: LabelTaxonomy,
+        taxonomy_text: str,
+    ) -> dict[str, ClassificationResult]:
+        """Classify several ideas with one multi-idea LLM call.
+
+        Cached outcomes are used where available; only the remaining
+        ideas are sent to the LLM.
+
+        Args:
+            ideas: The ideas to classify.
+            taxonomy: The label taxonomy for validation.
+            taxonomy_text: Formatted taxonomy text for the prompt.
+
+        Returns:
+            dict: Results for cached ideas and those present in the response.
+        """
+        llm_factory = self._get_llm_factory()
+        client = await llm_factory.get_client(AgentRole.DISCOVERY)
+        prompt_version = get_prompt_version()
+
+        results: dict[str, ClassificationResult] = {}
+        cache_keys: dict[str, str] = {}
+        if self._cache.enabled:
+            redis_client = await self._get_redis()
+            taxonomy_fp = taxonomy_fingerprint(taxonomy.version, taxonomy_text)
+            for idea in ideas:
+                cache_keys[idea.id] = self._cache.make_key(
+                    idea.content, taxonomy_fp, prompt_version, client.model
+                )
+            cached = await asyncio.gather(
+                *(
+                    self._cache.get(redis_client, cache_keys[idea.id], idea.id)
+                    for idea in ideas
+                )
+            )
+            results = {
+                idea.id: result
+                for idea, result in zip(ideas, cached, strict=True)
+                if result is not None
+            }
+
+        misses = [idea for idea in ideas if idea.id not in results]
+        if not misses:
+            return results
+
+        prompt = self.build_batch_classification_prompt(
+            [idea.content for idea in misses], taxonomy_text
+        )
+        response = await client.generate(
+            prompt=prompt,
+            temperature=CLASSIFICATION_TEMPERATURE,
+            max_tokens=CLASSIFICATION_MAX_TOKENS * len(misses),
+        )
+
+        parsed = self.parse_batch_classification_response(
+            response.content, len(misses)
+        )
+
+        model_version = f"{client.model}:{prompt_version}"
+        for index, item in parsed.items():
+            idea_id = misses[index].id
+            result = ClassificationResult(
+                idea_id=idea_id,
+                classification=ClassificationType(item["classification"]),
+                confidence=item["confidence"],
+                labels=self.validate_labels(item.get("labels", []), taxonomy),
+                reasoning=item.get("reasoning", ""),
+                model_version=model_version,
+            )
+            results[idea_id] = result
+            if idea_id in cache_keys:
+                await self._cache.set(redis_client, cache_keys[idea_id], result)
+
+        return results
+
     def _classify_with_rules(
         self,
         idea_id: str,
@@ -362,6 +559,77 @@ class ClassificationService:
             taxonomy_text=taxonomy_text,
         )
 
+    def build_batch_classification_prompt(
+        self,
+        idea_contents: list[str],
+        taxonomy_text: str,
+    ) -> str:
+        """Build a prompt classifying several ideas at once.
+
+        Args:
+            idea_contents: The contents of the ideas, numbered from 1.
+            taxonomy_text: Formatted taxonomy text for the prompt.
+
+        Returns:
+            str: The complete multi-idea classification prompt.
+        """
+        from src.orchestrator.services.classification_prompts import (
+            BATCH_CLASSIFICATION_PROMPT,
+        )
+
+        ideas_text = "\n\n".join(
+            f"### Idea {number}\n{content}"
+            for number, content in enumerate(idea_contents, start=1)
+        )
+        return BATCH_CLASSIFICATION_PROMPT.format(
+            ideas_text=ideas_text,
+            taxonomy_text=taxonomy_text,
+        )
+
+    def parse_batch_classification_response(
+        self,
+        response: str,
+        count: int,
+    ) -> dict[int, dict[str, Any]]:
+        """Parse a multi-idea LLM classification response.
+
+        Each entry is normalized by parse_classification_response. Entries
+        with a missing or out-of-range id are dropped.
+
+        Args:
+            response: The raw LLM response string.
+            count: Number of ideas in the prompt.
+
+        Returns:
+            dict: Parsed classification data keyed by zero-based idea index.
+        """
+        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", response)
+        if json_match:
+            response = json_match.group(1)
+
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse batch classification response as JSON")
+            return {}
+
+        items = data.get("results", []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return {}
+
+        parsed: dict[int, dict[str, Any]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("id")) - 1
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < count and index not in parsed:
+                parsed[index] = self.parse_classification_response(json.dumps(item))
+
+        return parsed
+
     def parse_classification_response(self, response: str) -> dict[str, Any]:
         """Parse the LLM classification response.
 
@@ -383,7 +651,7 @@ class ClassificationService:
             return {
                 "classification": "undetermined",
                 "confidence": 0.0,
-                "reasoning": "Failed to parse LLM response",
+                "reasoning": PARSE_FAILURE_REASONING,
                 "labels": [],
                 "label_scores": {},
             }
@@ -0,0 +1,291 @@
+"""Conversation context management for ideation chat.
+
+Keeps the context sent to IdeationAgent bounded as a session grows: the
+messages already folded into a rolling summary are not reloaded, and the
+summary plus the recent messages are trimmed so they never cost more than
+the agent's previous fixed window of the last messages. The summary is
+refreshed every few turns, off the request path, and stored with the
+session.
+
+The summary leads the prompt and only changes on a refresh, so it is a
+stable prefix between refreshes. The recent-message window after it
+slides by a turn whenever it is trimmed, so the prompt prefix does not
+extend past the summary in that case.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# Default token budget for the summary and recent messages together.
+# Sized to the agent's old window of 10 messages of a few hundred tokens;
+# build() also caps each turn at what that window would have cost.
+DEFAULT_CONTEXT_TOKEN_BUDGET = 2500
+
+# Default window of most recent messages, matching IdeationAgent's own
+# history limit, that bounds the context of every turn
+DEFAULT_HISTORY_MESSAGES = 10
+
+# Default number of turns (user + assistant message pairs) between refreshes
+DEFAULT_SUMMARY_EVERY_TURNS = 8
+
+# Default number of most recent messages kept verbatim after a refresh
+DEFAULT_KEEP_RECENT_MESSAGES = 6
+
+# Default token budget for the rolling summary itself
+DEFAULT_SUMMARY_MAX_TOKENS = 800
+
+# Per-message overhead for the role label and separators
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+# System prompt for summary refreshes
+SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a product ideation interview.
+
+Update the existing summary with the new messages. Keep every concrete fact
+the user stated: the problem, target users, requirements, constraints,
+success criteria, risks and open questions. Drop pleasantries and repeated
+questions. Write compact bullet points grouped by topic. Respond with the
+summary text only."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text.
+
+    Uses the ~4 characters per token heuristic, which is close enough for
+    budgeting and avoids loading a tokenizer in the orchestrator.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        int: Estimated token count.
+    """
+    return (len(text) + 3) // 4
+
+
+def _message_tokens(message: dict[str, str]) -> int:
+    """Estimate the tokens a message takes in the prompt."""
+    return estimate_tokens(message["content"]) + _MESSAGE_OVERHEAD_TOKENS
+
+
+@dataclass
+class ConversationContext:
+    """Context passed to IdeationAgent for one turn.
+
+    Attributes:
+        summary: Rolling summary of messages before the window.
+        recent: Recent messages, oldest first, as role/content dicts.
+        summarized_count: Number of messages folded into the summary.
+        unsummarized_count: Number of messages after the summary, including
+            any trimmed from the window to fit the budget.
+    """
+
+    summary: str = ""
+    recent: list[dict[str, str]] = field(default_factory=list)
+    summarized_count: int = 0
+    unsummarized_count: int = 0
+
+    @property
+    def token_estimate(self) -> int:
+        """Estimated tokens of the summary and recent messages."""
+        return estimate_tokens(self.summary) + sum(
+            _message_tokens(m) for m in self.recent
+        )
+
+
+class ConversationContextManager:
+    """Builds token-budgeted conversation context with rolling summaries.
+
+    Environment variables:
+        IDEATION_CONTEXT_TOKEN_BUDGET: Token budget for the summary and
+            recent messages (default: 2500)
+        IDEATION_CONTEXT_HISTORY_MESSAGES: Most recent messages included,
+            and the window whose size caps each turn's context (default: 10)
+        IDEATION_SUMMARY_EVERY_TURNS: Turns between summary refreshes
+            (default: 8)
+        IDEATION_KEEP_RECENT_MESSAGES: Messages kept verbatim after a
+            refresh (default: 6)
+
+    Usage:
+        manager = ConversationContextManager()
+        context = manager.build(summary, summarized_count, messages)
+        ...
+        if manager.needs_refresh(context.unsummarized_count + 2):
+            fold = manager.messages_to_fold(messages)
+            summary = await manager.summarize(llm_client, summary, fold)
+    """
+
+    def __init__(
+        self,
+        token_budget: int | None = None,
+        summary_every_turns: int | None = None,
+        keep_recent_messages: int | None = None,
+        summary_max_tokens: int = DEFAULT_SUMMARY_MAX_TOKENS,
+        history_messages: int | None = None,
+    ) -> None:
+        """Initialize the context manager.
+
+        Args:
+            token_budget: Token budget for the summary and recent messages.
+            summary_every_turns: Turns between summary refreshes.
+            keep_recent_messages: Messages kept verbatim after a refresh.
+            summary_max_tokens: Max tokens requested for the summary.
+            history_messages: Most recent messages included.
+        """
+        self.token_budget = token_budget or int(
+            os.environ.get(
+                "IDEATION_CONTEXT_TOKEN_BUDGET", DEFAULT_CONTEXT_TOKEN_BUDGET
+            )
+        )
+        self.summary_every_turns = summary_every_turns or int(
+            os.environ.get("IDEATION_SUMMARY_EVERY_TURNS", DEFAULT_SUMMARY_EVERY_TURNS)
+        )
+        if keep_recent_messages is None:
+            keep_recent_messages = int(
+                os.environ.get(
+                    "IDEATION_KEEP_RECENT_MESSAGES", DEFAULT_KEEP_RECENT_MESSAGES
+                )
+            )
+        self.keep_recent_messages = keep_recent_messages
+        self.summary_max_tokens = summary_max_tokens
+        self.history_messages = history_messages or int(
+            os.environ.get(
+                "IDEATION_CONTEXT_HISTORY_MESSAGES", DEFAULT_HISTORY_MESSAGES
+            )
+        )
+
+    @property
+    def max_unsummarized_messages(self) -> int:
+        """Most messages expected after the summary when loading context.
+
+        Refreshes run asynchronously, so this allows for one more refresh
+        interval of messages arriving while a refresh is in flight.
+        """
+        return self.keep_recent_messages + 4 * self.summary_every_turns
+
+    def build(
+        self,
+        summary: str,
+        summarized_count: int,
+        messages: list[dict[str, str]],
+        unsummarized_count: int | None = None,
+    ) -> ConversationContext:
+        """Build the context for a turn.
+
+        Keeps the newest messages, at most history_messages of them, such
+        that the summary and messages fit the token budget and cost no more
+        than the last history_messages messages alone would have. The
+        newest message is always kept.
+
+        Args:
+            summary: The session's rolling summary.
+            summarized_count: Messages folded into the summary.
+            messages: Messages after the summarized ones, oldest first.
+            unsummarized_count: Messages after the summary when more exist
+                than were loaded. Defaults to len(messages).
+
+        Returns:
+            ConversationContext: The context for the agent.
+        """
+        window = messages[-self.history_messages :]
+        budget = min(
+            self.token_budget,
+            sum(_message_tokens(m) for m in window),
+        ) - estimate_tokens(summary)
+
+        recent: list[dict[str, str]] = []
+        used = 0
+        for message in reversed(window):
+            cost = _message_tokens(message)
+            if used + cost > budget and recent:
+                break
+            recent.append(message)
+            used += cost
+        recent.reverse()
+
+        if len(recent) < len(messages):
+            logger.debug(
+                f"Kept {len(recent)} of {len(messages)} messages within "
+                f"the context budget"
+            )
+
+        return ConversationContext(
+            summary=summary,
+            recent=recent,
+            summarized_count=summarized_count,
+            unsummarized_count=(
+                len(messages) if unsummarized_count is None else unsummarized_count
+            ),
+        )
+
+    def needs_refresh(self, unsummarized_count: int) -> bool:
+        """Check whether the summary should be refreshed.
+
+        Args:
+            unsummarized_count: Messages after the summary.
+
+        Returns:
+            bool: True once summary_every_turns turns have accumulated
+                beyond the messages kept verbatim.
+        """
+        return (
+            unsummarized_count
+            >= self.keep_recent_messages + 2 * self.summary_every_turns
+        )
+
+    def messages_to_fold(
+        self, messages: list[dict[str, str]]
+    ) -> list[dict[str, str]]:
+        """Select the messages a refresh folds into the summary.
+
+        Args:
+            messages: Messages after the summary, oldest first.
+
+        Returns:
+            list[dict[str, str]]: All but the most recent messages.
+        """
+        if len(messages) <= self.keep_recent_messages:
+            return []
+        return messages[: len(messages) - self.keep_recent_messages]
+
+    async def summarize(
+        self,
+        llm_client: Any,
+        summary: str,
+        messages: list[dict[str, str]],
+    ) -> str:
+        """Fold messages into the rolling summary.
+
+        Args:
+            llm_client: LLM client used to write the summary.
+            summary: The current summary (may be empty).
+            messages: Messages to fold in, oldest first.
+
+        Returns:
+            str: The updated summary.
+        """
+        if not messages:
+            return summary
+
+        transcript = "\n\n".join(
+            f"{m.get('role', 'user').upper()}: {m.get('content', '')}"
+            for m in messages
+        )
+        prompt = (
+            f"Existing summary:\n{summary or '(none)'}\n\n"
+            f"New messages:\n{transcript}\n\n"
+            "Updated summary:"
+        )
+        response = await llm_client.generate(
+            prompt=prompt,
+            system=SUMMARY_SYSTEM_PROMPT,
+            max_tokens=self.summary_max_tokens,
+            temperature=0.0,
+        )
+        return response.content.strip() or summary
@@ -9,6 +9,7 @@ PostgreSQL (default) and Redis backends via the repository factory.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import uuid
@@ -19,6 +20,7 @@ from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from src.core.models.ideation import (
     ChatMessage,
+    MessageCursor,
     MessageRole,
 )
 from src.core.models.ideation import (
@@ -33,6 +35,10 @@ from src.infrastructure.llm.factory import (
     get_llm_client_factory,
 )
 from src.orchestrator.api.models.llm_config import AgentRole
+from src.orchestrator.services.ideation_context import (
+    ConversationContext,
+    ConversationContextManager,
+)
 from src.orchestrator.repositories.factory import (
     RepositoryFactory,
     get_repository_factory,
@@ -59,6 +65,9 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# Messages returned by get_session when no message_limit is given
+DEFAULT_SESSION_MESSAGE_LIMIT = 1000
+
 
 class IdeationServiceImpl:
     """Real implementation of IdeationService using LLM factory.
@@ -79,6 +88,7 @@ class IdeationServiceImpl:
         llm_factory: LLMClientFactory | None = None,
         repository_factory: RepositoryFactory | None = None,
         database: Database | None = None,
+        context_manager: ConversationContextManager | None = None,
     ) -> None:
         """Initialize the ideation service.
 
@@ -86,11 +96,15 @@ class IdeationServiceImpl:
             llm_factory: Optional LLM client factory. Uses global singleton if not provided.
             repository_factory: Optional repository factory. Uses env-based factory if not provided.
             database: Optional database instance for PostgreSQL backend.
+            context_manager: Optional conversation context manager. Uses
+                env-based defaults if not provided.
         """
         self._llm_factory = llm_factory
         self._repository_factory = repository_factory
         self._database = database
         self._backend = os.getenv("IDEATION_PERSISTENCE_BACKEND", "postgres")
+        self._context_manager = context_manager or ConversationContextManager()
+        self._summary_tasks: dict[str, asyncio.Task[None]] = {}
 
     def _get_factory(self) -> LLMClientFactory:
         """Get the LLM client factory.
@@ -292,13 +306,15 @@ class IdeationServiceImpl:
             # Fall back to raising to let API return appropriate error
             raise
 
-        # Create ideation agent with the configured client
+        # Create ideation agent with the configured client. The context
+        # manager windows the history, so the agent includes all of it.
         agent = IdeationAgent(
             llm_client=llm_client,
             config=IdeationConfig(
                 model=llm_client.model,
                 max_tokens=llm_client.max_tokens,
                 temperature=llm_client.temperature,
+                max_history_messages=None,
             ),
         )
 
@@ -318,8 +334,8 @@ class IdeationServiceImpl:
             data_source=getattr(request, "dataSource", "mock"),
         )
 
-        # Get conversation history from session if available
-        conversation_history = await self._get_conversation_history(request.sessionId)
+        # Get the rolling summary and the recent messages after it
+        conversation = await self._get_conversation_context(request.sessionId)
 
         # Get current maturity from session or request
         current_maturity = await self._get_session_maturity_dict(request.sessionId)
@@ -331,7 +347,8 @@ class IdeationServiceImpl:
             context,
             {
                 "user_message": request.message,
-                "conversation_history": conversation_history,
+                "conversation_history": conversation.recent,
+                "conversation_summary": conversation.summary,
                 "current_maturity": current_maturity,
             },
         )
@@ -418,6 +435,10 @@ class IdeationServiceImpl:
         # Save updated maturity
         await self._save_session_maturity(request.sessionId, current_maturity)
 
+        # Fold older messages into the summary in the background
+        if self._context_manager.needs_refresh(conversation.unsummarized_count + 2):
+            self._schedule_summary_refresh(request.sessionId, llm_client)
+
         return IdeationChatResponse(
             message=message,
             maturityUpdate=maturity_state,
@@ -576,7 +597,7 @@ class IdeationServiceImpl:
             result = []
             for session in sessions:
                 msg_repo = self._get_message_repository(db_session)
-                messages = await msg_repo.get_by_session(session.id, limit=1000, offset=0)
+                message_count = await msg_repo.count_by_session(session.id)
 
                 mat_repo = self._get_maturity_repository(db_session)
                 maturity = await mat_repo.get_by_session(session.id)
@@ -587,17 +608,23 @@ class IdeationServiceImpl:
                     "status": session.status.value,
                     "created_at": session.created_at.isoformat(),
                     "updated_at": session.updated_at.isoformat(),
-                    "message_count": len(messages),
+                    "message_count": message_count,
                     "maturity_score": float(maturity.score) if maturity else 0.0,
                 })
 
             return result, len(sessions)
 
-    async def get_session(self, session_id: str) -> dict | None:
+    async def get_session(
+        self,
+        session_id: str,
+        message_limit: int | None = None,
+    ) -> dict | None:
         """Get full session details including messages and maturity.
 
         Args:
             session_id: Session identifier.
+            message_limit: Return only the last N messages. Defaults to
+                the last DEFAULT_SESSION_MESSAGE_LIMIT messages if None.
 
         Returns:
             dict | None: Session details or None if not found.
@@ -610,7 +637,9 @@ class IdeationServiceImpl:
                 return None
 
             msg_repo = self._get_message_repository(db_session)
-            messages = await msg_repo.get_by_session(session_id, limit=1000, offset=0)
+            messages = await msg_repo.get_latest(
+                session_id, limit=message_limit or DEFAULT_SESSION_MESSAGE_LIMIT
+            )
 
             mat_repo = self._get_maturity_repository(db_session)
             maturity = await mat_repo.get_by_session(session_id)
@@ -629,6 +658,35 @@ class IdeationServiceImpl:
                 "updated_at": session.updated_at.isoformat(),
             }
 
+    async def get_messages(
+        self,
+        session_id: str,
+        limit: int = 50,
+        after: MessageCursor | None = None,
+        before: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """Get a page of a session's messages.
+
+        With no cursor, returns the newest messages. Pages are selected by
+        (timestamp, id) keyset, so their cost does not depend on how far
+        into the conversation they are.
+
+        Args:
+            session_id: Session identifier.
+            limit: Maximum number of messages to return.
+            after: Return messages strictly after this position.
+            before: Return messages strictly before this position. Ignored
+                if after is given.
+
+        Returns:
+            list[ChatMessage]: Messages ordered oldest first.
+        """
+        async with self._db_session() as db_session:
+            msg_repo = self._get_message_repository(db_session)
+            if after is not None:
+                return await msg_repo.get_page(session_id, limit=limit, after=after)
+            return await msg_repo.get_latest(session_id, limit=limit, before=before)
+
     async def update_session(
         self,
         session_id: str,
@@ -668,23 +726,137 @@ class IdeationServiceImpl:
     # Session Storage Helpers
     # =========================================================================
 
-    async def _get_conversation_history(self, session_id: str) -> list[dict[str, str]]:
-        """Get conversation history using message repository.
+    async def _get_conversation_context(self, session_id: str) -> ConversationContext:
+        """Get the conversation context for the next agent turn.
+
+        Loads the session's rolling summary and the newest messages after
+        it, at most max_unsummarized_messages of them.
 
         Args:
             session_id: Session identifier.
 
         Returns:
-            list[dict[str, str]]: Conversation history as list of role/content dicts.
+            ConversationContext: Summary and token-budgeted recent messages.
         """
+        limit = self._context_manager.max_unsummarized_messages
         async with self._db_session() as db_session:
+            session_repo = self._get_session_repository(db_session)
+            session = await session_repo.get_by_id(session_id)
+            summary = session.context_summary if session else ""
+            summarized_count = session.summarized_message_count if session else 0
+
+            # Newest messages after the summary; older ones beyond the limit
+            # are left for the next refresh to fold in
             message_repo = self._get_message_repository(db_session)
-            messages = await message_repo.get_by_session(session_id)
+            total = await message_repo.count_by_session(session_id)
+            unsummarized_count = max(total - summarized_count, 0)
+            messages = await message_repo.get_latest(
+                session_id, limit=min(limit, unsummarized_count)
+            )
+
+        return self._context_manager.build(
+            summary,
+            summarized_count,
+            [{"role": msg.role.value, "content": msg.content} for msg in messages],
+            unsummarized_count=unsummarized_count,
+        )
+
+    async def _load_unsummarized(
+        self, session_id: str
+    ) -> tuple[str, int, list[dict[str, str]]]:
+        """Load a session's summary and the oldest messages not folded into it.
+
+        Refreshes fold messages in order, so this reads the oldest
+        max_unsummarized_messages after the summary.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            tuple[str, int, list[dict[str, str]]]: The summary, the number of
+                summarized messages, and the following messages as
+                role/content dicts.
+        """
+        async with self._db_session() as db_session:
+            session_repo = self._get_session_repository(db_session)
+            session = await session_repo.get_by_id(session_id)
+            summary = session.context_summary if session else ""
+            summarized_count = session.summarized_message_count if session else 0
+
+            message_repo = self._get_message_repository(db_session)
+            messages = await message_repo.get_by_session(
+                session_id,
+                limit=self._context_manager.max_unsummarized_messages,
+                offset=summarized_count,
+            )
+
+        return (
+            summary,
+            summarized_count,
+            [{"role": msg.role.value, "content": msg.content} for msg in messages],
+        )
+
+    def _schedule_summary_refresh(self, session_id: str, llm_client: Any) -> None:
+        """Start a background summary refresh unless one is running.
+
+        Args:
+            session_id: Session identifier.
+            llm_client: LLM client used to write the summary.
+        """
+        if session_id in self._summary_tasks:
+            return
+
+        task = asyncio.create_task(
+            self._refresh_context_summary(session_id, llm_client)
+        )
+        self._summary_tasks[session_id] = task
+        task.add_done_callback(lambda _: self._summary_tasks.pop(session_id, None))
+
+    async def _refresh_context_summary(self, session_id: str, llm_client: Any) -> None:
+        """Fold older messages into the session's rolling summary.
+
+        Failures are logged and leave the previous summary in place; the
+        next turn schedules another attempt.
+
+        Args:
+            session_id: Session identifier.
+            llm_client: LLM client used to write the summary.
+        """
+        try:
+            summary, summarized_count, messages = await self._load_unsummarized(
+                session_id
+            )
+            fold = self._context_manager.messages_to_fold(messages)
+            if not fold:
+                return
+
+            new_summary = await self._context_manager.summarize(
+                llm_client, summary, fold
+            )
+
+            async with self._db_session() as db_session:
+                session_repo = self._get_session_repository(db_session)
+                session = await session_repo.get_by_id(session_id)
+                if session is None or session.summarized_message_count != summarized_count:
+                    return
+                session.context_summary = new_summary
+                session.summarized_message_count = summarized_count + len(fold)
+                await session_repo.update(session)
+
+            logger.info(
+                f"Folded {len(fold)} messages into context summary for "
+                f"session {session_id}"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Context summary refresh failed for session {session_id}: {e}"
+            )
 
-            # Convert domain messages to dict format expected by agent
-            return [
-                {"role": msg.role.value, "content": msg.content} for msg in messages
-            ]
+    async def wait_for_summary_refreshes(self) -> None:
+        """Wait for in-flight summary refreshes to finish."""
+        tasks = list(self._summary_tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _save_conversation_message(
         self,
@@ -7,7 +7,9 @@ Supports three modes:
 3. Mock mode (when neither is available) - same pattern as VictoriaMetrics mock
 
 Features:
-- 10 second TTL caching for all data
+- Watch-based informer cache: nodes and pods are kept up to date in memory
+  by background list/watch threads, so reads never call the K8s API
+- 10 second TTL caching of direct API reads until the informer has synced
 - Graceful fallback to mock mode on errors
 - Filtering and pagination for pods
 """
@@ -17,6 +19,7 @@ from __future__ import annotations
 import logging
 import os
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -34,12 +37,22 @@ from src.orchestrator.api.models.k8s import (
     NodeUsage,
     PodStatus,
 )
+from src.orchestrator.services.k8s_informer import (
+    NODES,
+    PODS,
+    ClusterInformer,
+    KubernetesWatchSource,
+    WatchSource,
+)
 
 logger = logging.getLogger(__name__)
 
 # Cache TTL in seconds
 CACHE_TTL = 10
 
+# Seconds to wait for the informer's initial list when starting it
+INFORMER_SYNC_TIMEOUT = 10.0
+
 # Try to import kubernetes client and configure
 MOCK_MODE = True
 config = None
@@ -74,17 +87,199 @@ except Exception as e:
     MOCK_MODE = True
 
 
+def _format_age(created: Optional[datetime]) -> str:
+    """Format the time since a creation timestamp as kubectl does (5d, 3h, 12m).
+
+    Args:
+        created: Creation timestamp, or None.
+
+    Returns:
+        Age string, or "unknown" without a timestamp.
+    """
+    if not created:
+        return "unknown"
+    delta = datetime.now(timezone.utc) - created
+    if delta.days > 0:
+        return f"{delta.days}d"
+    if delta.seconds // 3600 > 0:
+        return f"{delta.seconds // 3600}h"
+    return f"{delta.seconds // 60}m"
+
+
+def _node_to_model(node: object, pods_count: int = 0) -> K8sNode:
+    """Convert a K8s V1Node into a K8sNode.
+
+    Args:
+        node: V1Node from the K8s API.
+        pods_count: Number of pods scheduled on the node.
+
+    Returns:
+        K8sNode model.
+    """
+    # Extract roles from labels
+    roles = []
+    for label in node.metadata.labels or {}:
+        if label.startswith("node-role.kubernetes.io/"):
+            role = label.replace("node-role.kubernetes.io/", "")
+            if role:
+                roles.append(role)
+    if not roles:
+        roles = ["worker"]
+
+    # Get conditions
+    conditions = []
+    for cond in node.status.conditions or []:
+        cond_status = ConditionStatus.UNKNOWN
+        if cond.status == "True":
+            cond_status = ConditionStatus.TRUE
+        elif cond.status == "False":
+            cond_status = ConditionStatus.FALSE
+
+        conditions.append(NodeCondition(
+            type=cond.type,
+            status=cond_status,
+            reason=cond.reason or "",
+            message=cond.message or "",
+            last_transition=cond.last_transition_time.isoformat() if cond.last_transition_time else "",
+        ))
+
+    # Determine status
+    status = NodeStatus.UNKNOWN
+    ready_cond = next((c for c in node.status.conditions if c.type == "Ready"), None)
+    if ready_cond:
+        if ready_cond.status == "True":
+            status = NodeStatus.READY
+        else:
+            status = NodeStatus.NOT_READY
+
+    # Get capacity
+    capacity = node.status.capacity or {}
+    allocatable = node.status.allocatable or {}
+
+    return K8sNode(
+        name=node.metadata.name,
+        status=status,
+        roles=roles,
+        version=node.status.node_info.kubelet_version if node.status.node_info else "unknown",
+        os=node.status.node_info.os_image if node.status.node_info else "unknown",
+        container_runtime=node.status.node_info.container_runtime_version if node.status.node_info else "unknown",
+        capacity=NodeCapacity(
+            cpu=capacity.get("cpu", "0"),
+            memory=capacity.get("memory", "0"),
+            pods=int(capacity.get("pods", 0)),
+        ),
+        allocatable=NodeCapacity(
+            cpu=allocatable.get("cpu", "0"),
+            memory=allocatable.get("memory", "0"),
+            pods=int(allocatable.get("pods", 0)),
+        ),
+        usage=NodeUsage(
+            cpu_percent=50.0,  # Would need metrics API for real values
+            memory_percent=60.0,
+            pods_count=pods_count,
+        ),
+        conditions=conditions,
+        created_at=node.metadata.creation_timestamp.isoformat() if node.metadata.creation_timestamp else "",
+    )
+
+
+def _pod_to_model(pod: object) -> K8sPod:
+    """Convert a K8s V1Pod into a K8sPod.
+
+    Args:
+        pod: V1Pod from the K8s API.
+
+    Returns:
+        K8sPod model.
+    """
+    # Map phase to status
+    phase = pod.status.phase or "Unknown"
+    pod_status = PodStatus.UNKNOWN
+    if phase == "Running":
+        pod_status = PodStatus.RUNNING
+    elif phase == "Pending":
+        pod_status = PodStatus.PENDING
+    elif phase == "Succeeded":
+        pod_status = PodStatus.SUCCEEDED
+    elif phase == "Failed":
+        pod_status = PodStatus.FAILED
+
+    # Get containers
+    containers = []
+    total_restarts = 0
+    for cs in pod.status.container_statuses or []:
+        # Determine state
+        state = ContainerStateType.WAITING
+        state_reason = None
+        if cs.state.running:
+            state = ContainerStateType.RUNNING
+        elif cs.state.terminated:
+            state = ContainerStateType.TERMINATED
+            state_reason = cs.state.terminated.reason
+        elif cs.state.waiting:
+            state = ContainerStateType.WAITING
+            state_reason = cs.state.waiting.reason
+
+        containers.append(Container(
+            name=cs.name,
+            image=cs.image,
+            ready=cs.ready,
+            restart_count=cs.restart_count,
+            state=state,
+            state_reason=state_reason,
+        ))
+        total_restarts += cs.restart_count
+
+    # Get owner reference
+    owner_kind = ""
+    owner_name = ""
+    if pod.metadata.owner_references:
+        owner_kind = pod.metadata.owner_references[0].kind
+        owner_name = pod.metadata.owner_references[0].name
+
+    return K8sPod(
+        name=pod.metadata.name,
+        namespace=pod.metadata.namespace,
+        status=pod_status,
+        phase=phase,
+        node_name=pod.spec.node_name or "",
+        pod_ip=pod.status.pod_ip or "",
+        host_ip=pod.status.host_ip or "",
+        containers=containers,
+        restarts=total_restarts,
+        age=_format_age(pod.metadata.creation_timestamp),
+        created_at=pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else "",
+        labels=pod.metadata.labels or {},
+        owner_kind=owner_kind,
+        owner_name=owner_name,
+    )
+
+
 class K8sClusterService:
     """Service for K8s cluster information.
 
     Provides cluster health, nodes, and pods data with caching.
     Falls back to mock data when K8s API is unavailable.
+
+    Once start_informer() has synced, reads are served from the informer's
+    in-memory store. Until then (or with K8S_INFORMER_ENABLED=false) they
+    list the cluster directly, cached for CACHE_TTL seconds.
+
+    Args:
+        watch_source: Source for the informer. Defaults to the K8s API;
+            pass a MockWatchSource to run the informer without a cluster.
     """
 
-    def __init__(self) -> None:
-        """Initialize the K8s cluster service."""
+    def __init__(self, watch_source: Optional[WatchSource] = None) -> None:
+        """Initialize the K8s cluster service.
+
+        Args:
+            watch_source: Source for the informer, or None for the K8s API.
+        """
         self.mock_mode = MOCK_MODE
         self._core_api: Optional[object] = None
+        self._watch_source = watch_source
+        self._informer: Optional[ClusterInformer] = None
 
         # Cache storage
         self._health_cache: Optional[ClusterHealth] = None
@@ -109,6 +304,49 @@ class K8sClusterService:
             self._core_api = client.CoreV1Api()
         return self._core_api
 
+    def start_informer(self, sync_timeout: Optional[float] = INFORMER_SYNC_TIMEOUT) -> bool:
+        """Start the background informer that serves reads from memory.
+
+        Does nothing in mock mode without a watch source, or when
+        K8S_INFORMER_ENABLED is "false".
+
+        Args:
+            sync_timeout: Seconds to wait for the initial list; 0 returns
+                immediately and reads use the direct API until synced.
+
+        Returns:
+            True if the informer has synced.
+        """
+        if os.getenv("K8S_INFORMER_ENABLED", "true").lower() != "true":
+            return False
+        if self._informer is None:
+            if self._watch_source is None:
+                if self.mock_mode:
+                    return False
+                self._watch_source = KubernetesWatchSource(self._get_core_api())
+            self._informer = ClusterInformer(
+                self._watch_source,
+                transforms={NODES: _node_to_model, PODS: _pod_to_model},
+            )
+        self._informer.start()
+        return self._informer.wait_for_sync(sync_timeout)
+
+    def stop_informer(self) -> None:
+        """Stop the background informer; reads fall back to the direct API."""
+        if self._informer is not None:
+            self._informer.stop()
+            self._informer = None
+
+    def _synced_informer(self) -> Optional[ClusterInformer]:
+        """Get the informer if it is serving reads.
+
+        Returns:
+            The informer once it has synced, otherwise None.
+        """
+        if self._informer is not None and self._informer.has_synced():
+            return self._informer
+        return None
+
     def _is_cache_valid(self, cache_time: Optional[float]) -> bool:
         """Check if cache is still valid.
 
@@ -128,6 +366,12 @@ class K8sClusterService:
         Returns:
             ClusterHealth with node/pod counts and resource usage.
         """
+        informer = self._synced_informer()
+        if informer is not None:
+            return self._cluster_health(
+                informer.items(NODES), informer.items(PODS)
+            )
+
         # Check cache
         if self._is_cache_valid(self._health_cache_time) and self._health_cache:
             return self._health_cache
@@ -193,6 +437,48 @@ class K8sClusterService:
             last_updated=datetime.now(timezone.utc).isoformat(),
         )
 
+    def _cluster_health(
+        self, nodes: list[K8sNode], pods: list[K8sPod]
+    ) -> ClusterHealth:
+        """Summarize cluster health from informer models.
+
+        Uses the same counts and thresholds as _get_real_cluster_health.
+
+        Args:
+            nodes: Cluster nodes.
+            pods: Pods in all namespaces.
+
+        Returns:
+            ClusterHealth for the cluster.
+        """
+        nodes_ready = sum(1 for n in nodes if n.status == NodeStatus.READY)
+        phases = Counter(p.phase for p in pods)
+        pods_running = phases["Running"]
+        pods_failed = phases["Failed"]
+
+        cpu_percent = min(100.0, (pods_running / max(len(nodes), 1)) * 10)
+        memory_percent = min(100.0, (pods_running / max(len(nodes), 1)) * 15)
+
+        if nodes_ready == len(nodes) and pods_failed == 0:
+            status = ClusterHealthStatus.HEALTHY
+        elif nodes_ready < len(nodes) or pods_failed > 5:
+            status = ClusterHealthStatus.CRITICAL
+        else:
+            status = ClusterHealthStatus.DEGRADED
+
+        return ClusterHealth(
+            status=status,
+            nodes_ready=nodes_ready,
+            nodes_total=len(nodes),
+            pods_running=pods_running,
+            pods_total=len(pods),
+            pods_pending=phases["Pending"],
+            pods_failed=pods_failed,
+            cpu_usage_percent=round(cpu_percent, 1),
+            memory_usage_percent=round(memory_percent, 1),
+            last_updated=datetime.now(timezone.utc).isoformat(),
+        )
+
     def _get_mock_cluster_health(self) -> ClusterHealth:
         """Get mock cluster health data.
 
@@ -218,6 +504,19 @@ class K8sClusterService:
         Returns:
             List of K8sNode objects.
         """
+        informer = self._synced_informer()
+        if informer is not None:
+            # Pod counts change with every scheduled pod, so derive them here
+            pods_per_node = Counter(p.node_name for p in informer.items(PODS))
+            return [
+                node.model_copy(update={
+                    "usage": node.usage.model_copy(
+                        update={"pods_count": pods_per_node[node.name]}
+                    ),
+                })
+                for node in informer.items(NODES)
+            ]
+
         # Check cache
         if self._is_cache_valid(self._nodes_cache_time) and self._nodes_cache:
             return self._nodes_cache
@@ -245,75 +544,13 @@ class K8sClusterService:
         api = self._get_core_api()
         nodes = api.list_node().items
 
-        result = []
-        for node in nodes:
-            # Extract roles from labels
-            roles = []
-            for label in node.metadata.labels or {}:
-                if label.startswith("node-role.kubernetes.io/"):
-                    role = label.replace("node-role.kubernetes.io/", "")
-                    if role:
-                        roles.append(role)
-            if not roles:
-                roles = ["worker"]
-
-            # Get conditions
-            conditions = []
-            for cond in node.status.conditions or []:
-                cond_status = ConditionStatus.UNKNOWN
-                if cond.status == "True":
-                    cond_status = ConditionStatus.TRUE
-                elif cond.status == "False":
-                    cond_status = ConditionStatus.FALSE
-
-                conditions.append(NodeCondition(
-                    type=cond.type,
-                    status=cond_status,
-                    reason=cond.reason or "",
-                    message=cond.message or "",
-                    last_transition=cond.last_transition_time.isoformat() if cond.last_transition_time else "",
-                ))
-
-            # Determine status
-            status = NodeStatus.UNKNOWN
-            ready_cond = next((c for c in node.status.conditions if c.type == "Ready"), None)
-            if ready_cond:
-                if ready_cond.status == "True":
-                    status = NodeStatus.READY
-                else:
-                    status = NodeStatus.NOT_READY
-
-            # Get capacity
-            capacity = node.status.capacity or {}
-            allocatable = node.status.allocatable or {}
-
-            result.append(K8sNode(
-                name=node.metadata.name,
-                status=status,
-                roles=roles,
-                version=node.status.node_info.kubelet_version if node.status.node_info else "unknown",
-                os=node.status.node_info.os_image if node.status.node_info else "unknown",
-                container_runtime=node.status.node_info.container_runtime_version if node.status.node_info else "unknown",
-                capacity=NodeCapacity(
-                    cpu=capacity.get("cpu", "0"),
-                    memory=capacity.get("memory", "0"),
-                    pods=int(capacity.get("pods", 0)),
-                ),
-                allocatable=NodeCapacity(
-                    cpu=allocatable.get("cpu", "0"),
-                    memory=allocatable.get("memory", "0"),
-                    pods=int(allocatable.get("pods", 0)),
-                ),
-                usage=NodeUsage(
-                    cpu_percent=50.0,  # Would need metrics API for real values
-                    memory_percent=60.0,
-                    pods_count=len([p for p in api.list_pod_for_all_namespaces().items if p.spec.node_name == node.metadata.name]),
-                ),
-                conditions=conditions,
-                created_at=node.metadata.creation_timestamp.isoformat() if node.metadata.creation_timestamp else "",
-            ))
-
-        return result
+        pods_per_node = Counter(
+            p.spec.node_name for p in api.list_pod_for_all_namespaces().items
+        )
+        return [
+            _node_to_model(node, pods_per_node[node.metadata.name])
+            for node in nodes
+        ]
 
     def _get_mock_nodes(self) -> list[K8sNode]:
         """Get mock node data.
@@ -411,8 +648,11 @@ class K8sClusterService:
         Returns:
             Tuple of (filtered pod list, total count before pagination).
         """
-        # Get all pods (from cache or fresh)
-        if self._is_cache_valid(self._pods_cache_time) and self._pods_cache:
+        # Get all pods (from the informer, cache or fresh)
+        informer = self._synced_informer()
+        if informer is not None:
+            all_pods = informer.items(PODS)
+        elif self._is_cache_valid(self._pods_cache_time) and self._pods_cache:
             all_pods = self._pods_cache
         else:
             if self.mock_mode:
@@ -444,6 +684,16 @@ class K8sClusterService:
 
         # Apply pagination
         paginated = filtered[offset : offset + limit]
+        if informer is not None:
+            # Stored pods keep the age from their last event
+            paginated = [
+                p.model_copy(update={
+                    "age": _format_age(
+                        datetime.fromisoformat(p.created_at) if p.created_at else None
+                    ),
+                })
+                for p in paginated
+            ]
 
         return paginated, total
 
@@ -456,82 +706,7 @@ class K8sClusterService:
         api = self._get_core_api()
         pods = api.list_pod_for_all_namespaces().items
 
-        result = []
-        for pod in pods:
-            # Map phase to status
-            phase = pod.status.phase or "Unknown"
-            pod_status = PodStatus.UNKNOWN
-            if phase == "Running":
-                pod_status = PodStatus.RUNNING
-            elif phase == "Pending":
-                pod_status = PodStatus.PENDING
-            elif phase == "Succeeded":
-                pod_status = PodStatus.SUCCEEDED
-            elif phase == "Failed":
-                pod_status = PodStatus.FAILED
-
-            # Get containers
-            containers = []
-            total_restarts = 0
-            for cs in pod.status.container_statuses or []:
-                # Determine state
-                state = ContainerStateType.WAITING
-                state_reason = None
-                if cs.state.running:
-                    state = ContainerStateType.RUNNING
-                elif cs.state.terminated:
-                    state = ContainerStateType.TERMINATED
-                    state_reason = cs.state.terminated.reason
-                elif cs.state.waiting:
-                    state = ContainerStateType.WAITING
-                    state_reason = cs.state.waiting.reason
-
-                containers.append(Container(
-                    name=cs.name,
-                    image=cs.image,
-                    ready=cs.ready,
-                    restart_count=cs.restart_count,
-                    state=state,
-                    state_reason=state_reason,
-                ))
-                total_restarts += cs.restart_count
-
-            # Get owner reference
-            owner_kind = ""
-            owner_name = ""
-            if pod.metadata.owner_references:
-                owner_kind = pod.metadata.owner_references[0].kind
-                owner_name = pod.metadata.owner_references[0].name
-
-            # Calculate age
-            age = "unknown"
-            if pod.metadata.creation_timestamp:
-                delta = datetime.now(timezone.utc) - pod.metadata.creation_timestamp
-                if delta.days > 0:
-                    age = f"{delta.days}d"
-                elif delta.seconds // 3600 > 0:
-                    age = f"{delta.seconds // 3600}h"
-                else:
-                    age = f"{delta.seconds // 60}m"
-
-            result.append(K8sPod(
-                name=pod.metadata.name,
-                namespace=pod.metadata.namespace,
-                status=pod_status,
-                phase=phase,
-                node_name=pod.spec.node_name or "",
-                pod_ip=pod.status.pod_ip or "",
-                host_ip=pod.status.host_ip or "",
-                containers=containers,
-                restarts=total_restarts,
-                age=age,
-                created_at=pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else "",
-                labels=pod.metadata.labels or {},
-                owner_kind=owner_kind,
-                owner_name=owner_name,
-            ))
-
-        return result
+        return [_pod_to_model(pod) for pod in pods]
 
     def _get_mock_pods(self) -> list[K8sPod]:
         """Get mock pod data.
@@ -0,0 +1,469 @@
+"""Watch-based informer cache for Kubernetes nodes and pods.
+
+Keeps an in-memory copy of cluster resources up to date from the K8s watch
+API, so request handlers read from memory instead of listing the cluster.
+Each resource kind runs in its own background thread, because the
+kubernetes client is synchronous:
+
+1. List the resource once and record the list's resourceVersion.
+2. Watch from that resourceVersion, applying ADDED/MODIFIED/DELETED events
+   and advancing the resourceVersion on every event and BOOKMARK.
+3. When the watch times out, resume it from the last resourceVersion.
+4. When the API server reports the resourceVersion as expired (410 Gone),
+   list again.
+
+Objects are converted by a per-kind transform when the event arrives, so
+deserialisation and model building stay off the request path.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import Any, Optional, Protocol
+
+from src.infrastructure.metrics import (
+    K8S_INFORMER_CACHE_AGE,
+    K8S_INFORMER_EVENTS,
+    K8S_INFORMER_RELISTS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Resource kinds kept by the informer
+NODES = "nodes"
+PODS = "pods"
+
+# Server-side timeout for one watch request, after which it is resumed
+DEFAULT_WATCH_TIMEOUT_SECONDS = 300
+
+# Backoff bounds after a failed list or watch
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class WatchExpired(Exception):
+    """The watch resourceVersion is too old (HTTP 410 Gone); list again."""
+
+
+class WatchSource(Protocol):
+    """Source of resource lists and watch events for the informer."""
+
+    def list(self, kind: str) -> tuple[list[Any], str]:
+        """List all objects of a kind.
+
+        Args:
+            kind: Resource kind (NODES or PODS).
+
+        Returns:
+            Tuple of (objects, list resourceVersion).
+        """
+        ...
+
+    def watch(
+        self, kind: str, resource_version: str, timeout_seconds: int
+    ) -> Iterator[tuple[str, Any]]:
+        """Watch a kind from a resourceVersion.
+
+        Args:
+            kind: Resource kind (NODES or PODS).
+            resource_version: resourceVersion to resume from.
+            timeout_seconds: How long the watch may stay open.
+
+        Yields:
+            (event type, object) pairs. BOOKMARK objects only carry
+            metadata.resource_version.
+
+        Raises:
+            WatchExpired: If resource_version is no longer available.
+        """
+        ...
+
+    def close(self) -> None:
+        """Ask the watches currently open to end early."""
+        ...
+
+
+class KubernetesWatchSource:
+    """WatchSource backed by the kubernetes CoreV1Api."""
+
+    _LIST_METHODS = {
+        NODES: "list_node",
+        PODS: "list_pod_for_all_namespaces",
+    }
+
+    def __init__(self, core_api: Any) -> None:
+        """Initialize the watch source.
+
+        Args:
+            core_api: kubernetes CoreV1Api instance.
+        """
+        self._core_api = core_api
+        self._watches: set[Any] = set()
+
+    def list(self, kind: str) -> tuple[list[Any], str]:
+        """List all objects of a kind from the API server."""
+        response = getattr(self._core_api, self._LIST_METHODS[kind])()
+        return response.items, response.metadata.resource_version
+
+    def watch(
+        self, kind: str, resource_version: str, timeout_seconds: int
+    ) -> Iterator[tuple[str, Any]]:
+        """Stream watch events for a kind from the API server."""
+        from kubernetes import watch
+        from kubernetes.client.exceptions import ApiException
+
+        w = watch.Watch()
+        self._watches.add(w)
+        try:
+            for event in w.stream(
+                getattr(self._core_api, self._LIST_METHODS[kind]),
+                resource_version=resource_version,
+                timeout_seconds=timeout_seconds,
+                allow_watch_bookmarks=True,
+            ):
+                if event["type"] == "ERROR":
+                    raw = event.get("raw_object") or {}
+                    if raw.get("code") == 410:
+                        raise WatchExpired(raw.get("message", "resourceVersion expired"))
+                    raise RuntimeError(f"Watch error: {raw.get('message', raw)}")
+                yield event["type"], event["object"]
+        except ApiException as e:
+            if e.status == 410:
+                raise WatchExpired(str(e.reason)) from e
+            raise
+        finally:
+            w.stop()
+            self._watches.discard(w)
+
+    def close(self) -> None:
+        """Stop open watches after their next event or timeout."""
+        for w in list(self._watches):
+            w.stop()
+
+
+class MockWatchSource:
+    """In-memory WatchSource for tests and local development.
+
+    Objects need a `metadata` attribute with `name` and, for namespaced
+    kinds, `namespace`; the source stamps `metadata.resource_version`.
+
+    Usage:
+        source = MockWatchSource(nodes=[node], pods=[pod])
+        informer = ClusterInformer(source)
+        informer.start()
+        source.modify(PODS, updated_pod)
+        source.expire(PODS)  # next watch raises WatchExpired
+    """
+
+    def __init__(
+        self,
+        nodes: Optional[list[Any]] = None,
+        pods: Optional[list[Any]] = None,
+    ) -> None:
+        """Initialize the source with optional initial objects."""
+        self._lock = threading.Lock()
+        self._version = 0
+        self._objects: dict[str, dict[str, Any]] = {NODES: {}, PODS: {}}
+        self._events: dict[str, queue.Queue] = {NODES: queue.Queue(), PODS: queue.Queue()}
+        self._generation = 0
+        self.list_calls: Counter[str] = Counter()
+        self.watch_calls: list[tuple[str, str]] = []
+        for kind, objects in ((NODES, nodes or []), (PODS, pods or [])):
+            for obj in objects:
+                self._stamp(obj)
+                self._objects[kind][object_key(obj)] = obj
+
+    def list(self, kind: str) -> tuple[list[Any], str]:
+        """List the current objects of a kind."""
+        with self._lock:
+            self.list_calls[kind] += 1
+            # Events queued before the list are already reflected in it
+            self._drain(kind)
+            return list(self._objects[kind].values()), str(self._version)
+
+    def watch(
+        self, kind: str, resource_version: str, timeout_seconds: int
+    ) -> Iterator[tuple[str, Any]]:
+        """Yield queued events newer than resource_version until timeout."""
+        self.watch_calls.append((kind, resource_version))
+        generation = self._generation
+        deadline = time.monotonic() + timeout_seconds
+        while (remaining := deadline - time.monotonic()) > 0 and generation == self._generation:
+            try:
+                event_type, obj = self._events[kind].get(timeout=min(remaining, 0.05))
+            except queue.Empty:
+                continue
+            if event_type == "EXPIRED":
+                raise WatchExpired("resourceVersion expired")
+            if int(obj.metadata.resource_version) > int(resource_version):
+                yield event_type, obj
+
+    def close(self) -> None:
+        """End the watches currently open."""
+        self._generation += 1
+
+    def add(self, kind: str, obj: Any) -> None:
+        """Add an object and emit an ADDED event."""
+        self._emit(kind, "ADDED", obj)
+
+    def modify(self, kind: str, obj: Any) -> None:
+        """Replace an object and emit a MODIFIED event."""
+        self._emit(kind, "MODIFIED", obj)
+
+    def delete(self, kind: str, obj: Any) -> None:
+        """Remove an object and emit a DELETED event."""
+        self._emit(kind, "DELETED", obj)
+
+    def expire(self, kind: str) -> None:
+        """Make the next watch of a kind fail with WatchExpired."""
+        self._events[kind].put(("EXPIRED", None))
+
+    def _emit(self, kind: str, event_type: str, obj: Any) -> None:
+        with self._lock:
+            self._stamp(obj)
+            if event_type == "DELETED":
+                self._objects[kind].pop(object_key(obj), None)
+            else:
+                self._objects[kind][object_key(obj)] = obj
+            self._events[kind].put((event_type, obj))
+
+    def _stamp(self, obj: Any) -> None:
+        self._version += 1
+        obj.metadata.resource_version = str(self._version)
+
+    def _drain(self, kind: str) -> None:
+        pending = []
+        while True:
+            try:
+                pending.append(self._events[kind].get_nowait())
+            except queue.Empty:
+                break
+        # Keep expiries so tests can still force a relist after listing
+        for event_type, obj in pending:
+            if event_type == "EXPIRED":
+                self._events[kind].put((event_type, obj))
+
+
+def object_key(obj: Any) -> str:
+    """Store key of a K8s object: `namespace/name`, or `name` if cluster-scoped."""
+    namespace = getattr(obj.metadata, "namespace", None)
+    return f"{namespace}/{obj.metadata.name}" if namespace else obj.metadata.name
+
+
+class ResourceStore:
+    """Thread-safe store of converted objects for one resource kind.
+
+    Args:
+        transform: Converts a K8s object into the stored value.
+    """
+
+    def __init__(self, transform: Callable[[Any], Any]) -> None:
+        """Initialize an empty, unsynced store."""
+        self._transform = transform
+        self._lock = threading.Lock()
+        self._items: dict[str, Any] = {}
+        self._synced = threading.Event()
+        self.resource_version: Optional[str] = None
+        self.last_sync: Optional[float] = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the initial list has been loaded."""
+        return self._synced.is_set()
+
+    def wait_synced(self, timeout: Optional[float]) -> bool:
+        """Block until the initial list has been loaded or timeout."""
+        return self._synced.wait(timeout)
+
+    def replace(self, objects: list[Any], resource_version: str) -> None:
+        """Replace the contents with a fresh list."""
+        items = {object_key(obj): self._transform(obj) for obj in objects}
+        with self._lock:
+            self._items = items
+            self.resource_version = resource_version
+            self.last_sync = time.monotonic()
+        self._synced.set()
+
+    def apply(self, event_type: str, obj: Any) -> None:
+        """Apply one watch event."""
+        resource_version = obj.metadata.resource_version
+        value = self._transform(obj) if event_type in ("ADDED", "MODIFIED") else None
+        with self._lock:
+            if value is not None:
+                self._items[object_key(obj)] = value
+            elif event_type == "DELETED":
+                self._items.pop(object_key(obj), None)
+            if resource_version:
+                self.resource_version = resource_version
+            self.last_sync = time.monotonic()
+
+    def touch(self) -> None:
+        """Record that the store was confirmed current without changes."""
+        with self._lock:
+            self.last_sync = time.monotonic()
+
+    def items(self) -> list[Any]:
+        """Snapshot of the stored values."""
+        with self._lock:
+            return list(self._items.values())
+
+    def age(self) -> float:
+        """Seconds since the store last heard from the API server."""
+        if self.last_sync is None:
+            return 0.0
+        return time.monotonic() - self.last_sync
+
+
+class ClusterInformer:
+    """Background list/watch cache for K8s nodes and pods.
+
+    Environment variables:
+        K8S_INFORMER_WATCH_TIMEOUT: Seconds per watch request before it is
+            resumed (default: 300)
+
+    Usage:
+        informer = ClusterInformer(source, transforms={PODS: to_model})
+        informer.start()
+        informer.wait_for_sync(timeout=10)
+        pods = informer.items(PODS)
+        ...
+        informer.stop()
+    """
+
+    def __init__(
+        self,
+        source: WatchSource,
+        transforms: Optional[dict[str, Callable[[Any], Any]]] = None,
+        watch_timeout_seconds: Optional[int] = None,
+    ) -> None:
+        """Initialize the informer.
+
+        Args:
+            source: Where lists and watch events come from.
+            transforms: Per-kind conversion applied to each object as it
+                arrives. Objects are stored unchanged for kinds without one.
+            watch_timeout_seconds: Seconds per watch request.
+        """
+        self._source = source
+        self.watch_timeout_seconds = watch_timeout_seconds or int(
+            os.environ.get("K8S_INFORMER_WATCH_TIMEOUT", DEFAULT_WATCH_TIMEOUT_SECONDS)
+        )
+        transforms = transforms or {}
+        self._stores = {
+            kind: ResourceStore(transforms.get(kind, lambda obj: obj))
+            for kind in (NODES, PODS)
+        }
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+        for kind, store in self._stores.items():
+            K8S_INFORMER_CACHE_AGE.labels(resource=kind).set_function(store.age)
+
+    @property
+    def running(self) -> bool:
+        """Whether the watch threads are running."""
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self) -> None:
+        """Start one list/watch thread per resource kind."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(
+                target=self._run, args=(kind,), name=f"k8s-informer-{kind}", daemon=True
+            )
+            for kind in self._stores
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("K8s informer started")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the watch threads.
+
+        Threads exit after their current event, or when the open watch
+        request ends; they are daemons, so a watch still blocked on the
+        API server after timeout never blocks process exit.
+
+        Args:
+            timeout: Seconds to wait for the threads in total.
+        """
+        self._stop.set()
+        self._source.close()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def has_synced(self) -> bool:
+        """Whether every kind has completed its initial list."""
+        return all(store.synced for store in self._stores.values())
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until every kind has completed its initial list.
+
+        Args:
+            timeout: Seconds to wait in total, or None to wait forever.
+
+        Returns:
+            bool: True if synced.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for store in self._stores.values():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not store.wait_synced(remaining):
+                return False
+        return True
+
+    def items(self, kind: str) -> list[Any]:
+        """Snapshot of the converted objects of a kind."""
+        return self._stores[kind].items()
+
+    def cache_age(self, kind: str) -> float:
+        """Seconds since a kind's store last heard from the API server."""
+        return self._stores[kind].age()
+
+    def _run(self, kind: str) -> None:
+        """List and watch one kind until stopped."""
+        store = self._stores[kind]
+        resource_version: Optional[str] = None
+        backoff = INITIAL_BACKOFF_SECONDS
+
+        while not self._stop.is_set():
+            try:
+                if resource_version is None:
+                    objects, resource_version = self._source.list(kind)
+                    store.replace(objects, resource_version)
+                    K8S_INFORMER_RELISTS.labels(resource=kind).inc()
+                    logger.debug(f"K8s informer listed {len(objects)} {kind}")
+
+                for event_type, obj in self._source.watch(
+                    kind, resource_version, self.watch_timeout_seconds
+                ):
+                    if event_type == "BOOKMARK":
+                        store.touch()
+                        resource_version = obj.metadata.resource_version or resource_version
+                    else:
+                        store.apply(event_type, obj)
+                        resource_version = store.resource_version
+                    K8S_INFORMER_EVENTS.labels(resource=kind, type=event_type).inc()
+                    if self._stop.is_set():
+                        return
+
+                # Watch closed by its timeout: the store is current, resume
+                store.touch()
+                backoff = INITIAL_BACKOFF_SECONDS
+            except WatchExpired:
+                logger.info(f"K8s informer {kind} resourceVersion expired, relisting")
+                resource_version = None
+            except Exception as e:
+                logger.warning(f"K8s informer {kind} watch failed, retrying in {backoff:.0f}s: {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
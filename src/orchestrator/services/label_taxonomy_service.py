@@ -242,8 +242,25 @@ class LabelTaxonomyService:
         }
 
         await redis_client.set(REDIS_TAXONOMY_KEY, json.dumps(taxonomy_dict))
+        await self._invalidate_classification_cache(redis_client)
         return updated_taxonomy
 
+    async def _invalidate_classification_cache(self, redis_client: redis.Redis) -> None:
+        """Drop cached classification results after a taxonomy change.
+
+        Cache keys already include a taxonomy fingerprint, so a failure here
+        only leaves unreachable entries behind until their TTL expires.
+
+        Args:
+            redis_client: The Redis client.
+        """
+        from src.orchestrator.services.classification_cache import ClassificationCache
+
+        try:
+            await ClassificationCache().invalidate(redis_client)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate classification cache: {e}")
+
     async def add_label(self, label: LabelDefinition) -> LabelTaxonomy:
         """Add a new label to the taxonomy.
 
@@ -6,12 +6,14 @@ API keys, and per-agent model configurations. Data is stored in Redis.
 
 from __future__ import annotations
 
+import inspect
 import json
 import logging
 import time
 import uuid
+import weakref
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 import redis.asyncio as redis
 
@@ -35,6 +37,7 @@ logger = logging.getLogger(__name__)
 REDIS_KEY_PREFIX = "llm:keys:"
 REDIS_AGENT_PREFIX = "llm:agents:"
 REDIS_MODELS_PREFIX = "llm:models:"
+REDIS_CONFIG_VERSION_KEY = "llm:config_version"
 
 # Cache TTL for discovered models (24 hours)
 MODELS_CACHE_TTL = 86400
@@ -181,6 +184,7 @@ class LLMConfigService:
         """
         self._redis_client = redis_client
         self._encryption = EncryptionService()
+        self._change_listeners: list[Callable[[], Callable[[], None] | None]] = []
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create the Redis client.
@@ -200,6 +204,61 @@ class LLMConfigService:
             self._redis_client = redis.from_url(redis_url)
         return self._redis_client
 
+    # =========================================================================
+    # Change Notification
+    # =========================================================================
+
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked after agent configs or keys change.
+
+        Bound methods are held weakly so short-lived listeners (e.g. a
+        per-request LLMClientFactory) do not leak. References to collected
+        listeners are pruned on every registration as well as on notify.
+
+        Args:
+            callback: Zero-argument callable.
+        """
+        self._change_listeners = [
+            ref for ref in self._change_listeners if ref() is not None
+        ]
+        if inspect.ismethod(callback):
+            self._change_listeners.append(weakref.WeakMethod(callback))
+        else:
+            self._change_listeners.append(lambda: callback)
+
+    async def get_config_version(self) -> int:
+        """Get the shared configuration version.
+
+        The version is incremented on every agent config or key change so
+        other processes can detect that cached clients are stale.
+
+        Returns:
+            int: The current version (0 if never changed).
+        """
+        redis_client = await self._get_redis()
+        value = await redis_client.get(REDIS_CONFIG_VERSION_KEY)
+        return int(value) if value else 0
+
+    async def _notify_config_changed(self) -> None:
+        """Bump the shared config version and notify local listeners."""
+        try:
+            redis_client = await self._get_redis()
+            await redis_client.incr(REDIS_CONFIG_VERSION_KEY)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to bump LLM config version: {e}")
+
+        live = []
+        for ref in self._change_listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            live.append(ref)
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"LLM config change listener failed: {e}")
+        self._change_listeners = live
+
     async def get_providers(self) -> list[LLMProvider]:
         """Get list of supported LLM providers.
 
@@ -370,6 +429,8 @@ class LLMConfigService:
         """
         redis_client = await self._get_redis()
         deleted = await redis_client.delete(f"{REDIS_KEY_PREFIX}{key_id}")
+        if deleted > 0:
+            await self._notify_config_changed()
         return deleted > 0
 
     async def get_decrypted_key(self, key_id: str) -> str | None:
@@ -477,6 +538,7 @@ class LLMConfigService:
             f"{REDIS_AGENT_PREFIX}{config.role.value}",
             json.dumps(config_dict),
         )
+        await self._notify_config_changed()
 
         return config
 
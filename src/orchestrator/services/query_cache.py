@@ -0,0 +1,115 @@
+"""Response cache with request coalescing for upstream queries.
+
+Used by the VictoriaMetrics proxy (metrics_api) and ServiceHealthService.
+Successful results are kept for a TTL in a size-bounded LRU, and
+concurrent lookups of the same key share one upstream call. Errors reach
+every waiter and are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Lookup outcomes reported to on_lookup
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_COALESCED = "coalesced"
+
+
+class QueryCache(Generic[T]):
+    """TTL and LRU bounded cache that coalesces concurrent misses.
+
+    Args:
+        ttl_seconds: How long a result is served from cache.
+        max_entries: Entries kept; the least recently used are evicted.
+
+    Example:
+        cache = QueryCache(ttl_seconds=10.0, max_entries=256)
+        data = await cache.get(key, lambda: fetch(query))
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        """Initialize an empty cache."""
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        """Number of cached entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over cached keys, least recently used first."""
+        return iter(list(self._entries))
+
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]],
+        on_lookup: Callable[[str], None] | None = None,
+    ) -> T:
+        """Return the cached result for key, fetching it on a miss.
+
+        Args:
+            key: Cache key identifying the request.
+            fetch: Coroutine function producing the result.
+            on_lookup: Called with hit, miss or coalesced.
+
+        Returns:
+            The cached or freshly fetched result.
+
+        Raises:
+            Exception: Whatever fetch raised.
+        """
+        now = time.monotonic()
+        cached = self._entries.get(key)
+        if cached is not None:
+            if now - cached[1] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                if on_lookup is not None:
+                    on_lookup(CACHE_HIT)
+                return cached[0]
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            outcome = CACHE_COALESCED
+        else:
+            outcome = CACHE_MISS
+
+            async def _fetch() -> T:
+                result = await fetch()
+                self._store(key, result)
+                return result
+
+            task = asyncio.create_task(_fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+
+        if on_lookup is not None:
+            on_lookup(outcome)
+        # Shielded so one caller giving up does not cancel the others
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Drop every cached entry and forget in-flight requests."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    def _store(self, key: Hashable, result: T) -> None:
+        """Cache a result, evicting expired and then least recently used entries."""
+        now = time.monotonic()
+        self._entries[key] = (result, now)
+        self._entries.move_to_end(key)
+        expired = [k for k, (_, at) in self._entries.items() if now - at >= self.ttl_seconds]
+        for k in expired:
+            del self._entries[k]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,14 +1,17 @@
 """Service health aggregation service.
 
 This module provides functions to aggregate health information for aSDLC
-services by querying VictoriaMetrics. It includes caching to reduce query
-load and graceful degradation when VictoriaMetrics is unavailable.
+services by querying VictoriaMetrics. All services are fetched with one
+``by (service)`` query per metric over a shared, pooled HTTP client. It
+includes caching to reduce query load and graceful degradation when
+VictoriaMetrics is unavailable.
 
 P06-F07: K8s Cluster Monitoring.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import random
@@ -26,6 +29,7 @@ from src.orchestrator.api.models.service_health import (
     ServiceSparklineResponse,
     SparklineDataPoint,
 )
+from src.orchestrator.services.query_cache import QueryCache
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +68,36 @@ MEMORY_UNHEALTHY_THRESHOLD = 95.0
 # Cache configuration
 HEALTH_CACHE_TTL = 300  # 5 minutes in seconds
 SPARKLINE_CACHE_TTL = 60  # 1 minute in seconds
+# Short-lived cache for raw query responses, shared by all dashboard viewers
+QUERY_CACHE_TTL = float(os.environ.get("VICTORIAMETRICS_QUERY_CACHE_TTL", "15"))
+QUERY_CACHE_MAX_ENTRIES = int(
+    os.environ.get("VICTORIAMETRICS_QUERY_CACHE_MAX_ENTRIES", "256")
+)
+
+# Services without HTTP request metrics
+NON_HTTP_SERVICES = ("redis", "elasticsearch")
+
+# Matcher selecting every aSDLC service in a single query
+ALL_SERVICES_LABEL = f'service=~"{"|".join(sorted(VALID_SERVICES))}"'
+
+# One query per metric returning a series per service
+BATCH_HEALTH_QUERIES: dict[str, str] = {
+    "cpu": f"max by (service) (asdlc_process_cpu_percent{{{ALL_SERVICES_LABEL}}})",
+    "memory": (
+        f'max by (service) (asdlc_process_memory_bytes{{type="rss", {ALL_SERVICES_LABEL}}})'
+        " / 1073741824 * 100"
+    ),
+    "pods": (
+        f'count by (service) (kube_pod_status_phase{{{ALL_SERVICES_LABEL}, phase="Running"}})'
+    ),
+    "rate": (
+        f"sum by (service) (rate(asdlc_http_requests_total{{{ALL_SERVICES_LABEL}}}[5m]))"
+    ),
+    "latency": (
+        "histogram_quantile(0.50, sum by (service, le) "
+        f"(rate(asdlc_http_request_duration_seconds_bucket{{{ALL_SERVICES_LABEL}}}[5m])))"
+    ),
+}
 
 DEFAULT_SERVICE_CONNECTIONS: list[dict[str, str]] = [
     {"from": "hitl-ui", "to": "orchestrator", "type": "http"},
@@ -110,6 +144,56 @@ class ServiceHealthService:
         self._vm_url = victoriametrics_url or VICTORIAMETRICS_URL
         self._health_cache: dict[str, tuple[ServiceHealthInfo, float]] = {}
         self._sparkline_cache: dict[str, tuple[ServiceSparklineResponse, float]] = {}
+        self._query_cache: QueryCache[dict[str, Any]] = QueryCache(
+            QUERY_CACHE_TTL, QUERY_CACHE_MAX_ENTRIES
+        )
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: Pooled client reused across queries.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self._vm_url,
+                timeout=QUERY_TIMEOUT,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, path: str, params: dict[str, str]) -> dict[str, Any]:
+        """Run a VictoriaMetrics API request through the response cache.
+
+        Identical requests within QUERY_CACHE_TTL are served from a cache
+        of at most QUERY_CACHE_MAX_ENTRIES responses, and concurrent
+        identical requests share one HTTP call.
+
+        Args:
+            path: API path (e.g. /api/v1/query).
+            params: Query parameters.
+
+        Returns:
+            VictoriaMetrics JSON response.
+
+        Raises:
+            Exception: If query fails.
+        """
+        key = (path, *sorted(f"{k}={v}" for k, v in params.items()))
+
+        async def _fetch() -> dict[str, Any]:
+            response = await self._get_client().get(path, params=params)
+            response.raise_for_status()
+            return response.json()
+
+        return await self._query_cache.get(key, _fetch)
 
     async def _query_instant(self, query: str) -> dict[str, Any]:
         """Execute an instant PromQL query against VictoriaMetrics.
@@ -123,14 +207,7 @@ class ServiceHealthService:
         Raises:
             Exception: If query fails.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self._vm_url}/api/v1/query",
-                params={"query": query},
-                timeout=QUERY_TIMEOUT,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get("/api/v1/query", {"query": query})
 
     async def _query_range(
         self, query: str, start: str, end: str, step: str
@@ -149,19 +226,10 @@ class ServiceHealthService:
         Raises:
             Exception: If query fails.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self._vm_url}/api/v1/query_range",
-                params={
-                    "query": query,
-                    "start": start,
-                    "end": end,
-                    "step": step,
-                },
-                timeout=QUERY_TIMEOUT,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get(
+            "/api/v1/query_range",
+            {"query": query, "start": start, "end": end, "step": step},
+        )
 
     def _extract_value(
         self, data: dict[str, Any], default: float = 0.0
@@ -186,6 +254,30 @@ class ServiceHealthService:
                 return default
         return default
 
+    def _extract_by_service(self, data: dict[str, Any]) -> dict[str, float]:
+        """Extract per-service values from a ``by (service)`` response.
+
+        Args:
+            data: VictoriaMetrics JSON response.
+
+        Returns:
+            Mapping of service name to value; NaN or malformed series are
+            skipped.
+        """
+        values: dict[str, float] = {}
+        for result in data.get("data", {}).get("result", []):
+            service = result.get("metric", {}).get("service")
+            if not service:
+                continue
+            try:
+                value = result.get("value", [0, "NaN"])[1]
+                if value == "NaN":
+                    continue
+                values[service] = float(value)
+            except (ValueError, IndexError, TypeError):
+                continue
+        return values
+
     def _get_mock_health_data(self, service_name: str) -> ServiceHealthInfo:
         """Generate mock health data when VictoriaMetrics is unavailable.
 
@@ -257,45 +349,34 @@ class ServiceHealthService:
             ServiceHealthInfo with current metrics.
         """
         label = SERVICE_POD_LABELS.get(service_name, f'service="{service_name}"')
+        is_http = service_name not in NON_HTTP_SERVICES
+
+        # CPU is asdlc_process_cpu_percent (already a percentage); memory is
+        # asdlc_process_memory_bytes as a percentage of an assumed 1GB limit
+        queries = [
+            f'asdlc_process_cpu_percent{{{label}}}',
+            f'asdlc_process_memory_bytes{{type="rss", {label}}} / 1073741824 * 100',
+            f'count(kube_pod_status_phase{{{label}, phase="Running"}})',
+        ]
+        if is_http:
+            # Request rate and latency may not exist for all services
+            queries.append(f'sum(rate(asdlc_http_requests_total{{{label}}}[5m]))')
+            queries.append(
+                f'histogram_quantile(0.50, sum(rate(asdlc_http_request_duration_seconds_bucket{{{label}}}[5m])) by (le))'
+            )
+        results = await asyncio.gather(*(self._query_instant(q) for q in queries))
+
+        cpu_percent = self._extract_value(results[0])
+        memory_percent = self._extract_value(results[1])
+        pod_count = int(self._extract_value(results[2], default=1.0))
 
-        # Query CPU usage (use asdlc_process_cpu_percent - already percentage)
-        cpu_query = f'asdlc_process_cpu_percent{{{label}}}'
-        cpu_data = await self._query_instant(cpu_query)
-        cpu_percent = self._extract_value(cpu_data)
-
-        # Query memory usage (use asdlc_process_memory_bytes, convert to percentage)
-        # Try percentage based on assumed 1GB limit first
-        memory_query = f'asdlc_process_memory_bytes{{type="rss", {label}}} / 1073741824 * 100'
-        memory_data = await self._query_instant(memory_query)
-        memory_percent = self._extract_value(memory_data)
-        # If percentage query fails, use raw memory value as a fallback estimate
-        if memory_percent == 0.0:
-            raw_memory_query = f'asdlc_process_memory_bytes{{type="rss", {label}}}'
-            raw_memory_data = await self._query_instant(raw_memory_query)
-            raw_memory = self._extract_value(raw_memory_data)
-            # Estimate percentage based on 1GB assumed limit
-            memory_percent = (raw_memory / (1024 * 1024 * 1024)) * 100
-
-        # Query pod count
-        pod_query = f'count(kube_pod_status_phase{{{label}, phase="Running"}})'
-        pod_data = await self._query_instant(pod_query)
-        pod_count = int(self._extract_value(pod_data, default=1.0))
-
-        # Query request rate (optional - may not exist for all services)
         request_rate = None
-        if service_name not in ("redis", "elasticsearch"):
-            rate_query = f'sum(rate(asdlc_http_requests_total{{{label}}}[5m]))'
-            rate_data = await self._query_instant(rate_query)
-            rate_value = self._extract_value(rate_data)
+        latency_p50 = None
+        if is_http:
+            rate_value = self._extract_value(results[3])
             if rate_value > 0:
                 request_rate = round(rate_value, 1)
-
-        # Query latency p50 (optional - may not exist for all services)
-        latency_p50 = None
-        if service_name not in ("redis", "elasticsearch"):
-            latency_query = f'histogram_quantile(0.50, sum(rate(asdlc_http_request_duration_seconds_bucket{{{label}}}[5m])) by (le))'
-            latency_data = await self._query_instant(latency_query)
-            latency_value = self._extract_value(latency_data)
+            latency_value = self._extract_value(results[4])
             if latency_value > 0:
                 # Convert seconds to milliseconds
                 latency_p50 = round(latency_value * 1000, 1)
@@ -343,16 +424,86 @@ class ServiceHealthService:
             )
             return self._get_mock_health_data(service_name)
 
+    async def _fetch_all_services_health(self) -> dict[str, ServiceHealthInfo]:
+        """Fetch health for every service with one query per metric.
+
+        Returns:
+            Mapping of service name to ServiceHealthInfo.
+
+        Raises:
+            Exception: If any query fails.
+        """
+        names = list(BATCH_HEALTH_QUERIES)
+        responses = await asyncio.gather(
+            *(self._query_instant(BATCH_HEALTH_QUERIES[n]) for n in names)
+        )
+        by_metric = {
+            name: self._extract_by_service(data)
+            for name, data in zip(names, responses, strict=True)
+        }
+
+        health: dict[str, ServiceHealthInfo] = {}
+        for service_name in VALID_SERVICES:
+            cpu_percent = by_metric["cpu"].get(service_name, 0.0)
+            memory_percent = by_metric["memory"].get(service_name, 0.0)
+            request_rate = None
+            latency_p50 = None
+            if service_name not in NON_HTTP_SERVICES:
+                rate_value = by_metric["rate"].get(service_name, 0.0)
+                if rate_value > 0:
+                    request_rate = round(rate_value, 1)
+                latency_value = by_metric["latency"].get(service_name, 0.0)
+                if latency_value > 0:
+                    latency_p50 = round(latency_value * 1000, 1)
+
+            health[service_name] = ServiceHealthInfo(
+                name=service_name,
+                status=determine_health_status(cpu_percent, memory_percent),
+                cpu_percent=round(cpu_percent, 1),
+                memory_percent=round(memory_percent, 1),
+                pod_count=int(by_metric["pods"].get(service_name, 1.0)),
+                request_rate=request_rate,
+                latency_p50=latency_p50,
+                last_restart=None,
+            )
+        return health
+
     async def get_all_services_health(self) -> ServicesHealthResponse:
         """Get health information for all aSDLC services.
 
+        Serves from the health cache when every service is fresh;
+        otherwise refreshes all services with batched queries, falling
+        back to concurrent per-service lookups if the batch fails.
+
         Returns:
             ServicesHealthResponse with health for all 5 services.
         """
-        services = []
-        for service_name in sorted(VALID_SERVICES):
-            health = await self.get_service_health(service_name)
-            services.append(health)
+        now = time.time()
+        service_names = sorted(VALID_SERVICES)
+        cached = {
+            name: entry[0]
+            for name, entry in self._health_cache.items()
+            if now - entry[1] < HEALTH_CACHE_TTL
+        }
+
+        if all(name in cached for name in service_names):
+            services = [cached[name] for name in service_names]
+        else:
+            try:
+                fetched = await self._fetch_all_services_health()
+                fetched_at = time.time()
+                for name, health in fetched.items():
+                    self._health_cache[name] = (health, fetched_at)
+                services = [fetched[name] for name in service_names]
+            except Exception as e:
+                logger.warning(
+                    f"Batched health query failed, querying services individually: {e}"
+                )
+                services = list(
+                    await asyncio.gather(
+                        *(self.get_service_health(name) for name in service_names)
+                    )
+                )
 
         connections = [
             ServiceConnection(
@@ -400,8 +551,13 @@ class ServiceHealthService:
         }
         query = query_map.get(metric, query_map["cpu"])
 
-        # Calculate time range (15 minutes)
-        end = datetime.now(UTC)
+        # Calculate time range (15 minutes), with the end rounded up to the
+        # step so concurrent viewers produce identical, cacheable queries
+        # and the partial last minute is still included
+        now = datetime.now(UTC)
+        end = now.replace(second=0, microsecond=0)
+        if end < now:
+            end += timedelta(minutes=1)
         start = end - timedelta(minutes=15)
         start_str = start.strftime("%Y-%m-%dT%H:%M:%SZ")
         end_str = end.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -459,6 +615,7 @@ class ServiceHealthService:
         """Clear all cached data."""
         self._health_cache.clear()
         self._sparkline_cache.clear()
+        self._query_cache.clear()
 
 
 # Module-level service instance for convenience
@@ -475,3 +632,9 @@ def get_service_health_service() -> ServiceHealthService:
     if _service_instance is None:
         _service_instance = ServiceHealthService()
     return _service_instance
+
+
+async def shutdown_service_health_service() -> None:
+    """Close the singleton's HTTP client. Safe to call if never created."""
+    if _service_instance is not None:
+        await _service_instance.close()
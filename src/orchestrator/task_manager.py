@@ -1,6 +1,9 @@
 """Task and session management for aSDLC orchestration.
 
 Provides persistent storage of task state and session tracking in Redis hashes.
+
+Task state/session indexes for existing data can be rebuilt with:
+    python -m src.orchestrator.task_manager reindex [--tenant TENANT ...]
 """
 
 from __future__ import annotations
@@ -11,15 +14,33 @@ from datetime import datetime, timezone
 from typing import Any
 
 import redis.asyncio as redis
+from redis.exceptions import WatchError
 
 from src.core.config import get_redis_config, get_tenant_config
-from src.core.exceptions import TaskNotFoundError, TaskStateError
+from src.core.exceptions import RedisOperationError, TaskNotFoundError
 from src.core.redis_client import get_redis_client
 from src.core.tenant import TenantContext
 from src.orchestrator.state_machine import TaskState, TaskStateMachine
 
 logger = logging.getLogger(__name__)
 
+# Removes index members whose task hash is gone or no longer matches the
+# index. The hash is re-read server-side so an entry re-added by a
+# concurrent transition is kept.
+# KEYS[1] = index key, KEYS[2..] = task hash keys
+# ARGV[1] = indexed state, ARGV[2] = indexed session ("" for none),
+# ARGV[3..] = task IDs matching KEYS[2..]
+_PRUNE_INDEX_SCRIPT = """
+local removed = 0
+for i = 2, #KEYS do
+    local fields = redis.call('HMGET', KEYS[i], 'state', 'session_id')
+    if fields[1] ~= ARGV[1] or (ARGV[2] ~= '' and fields[2] ~= ARGV[2]) then
+        removed = removed + redis.call('ZREM', KEYS[1], ARGV[i + 1])
+    end
+end
+return removed
+"""
+
 
 @dataclass
 class Task:
@@ -141,9 +162,18 @@ class TaskManager:
     """Manages task state in Redis hashes.
 
     Provides CRUD operations for tasks with state machine validation.
+
+    Each task hash is accompanied by sorted-set indexes (scored by creation
+    time) per state, per session, and per (session, state). Index updates
+    are applied in the same MULTI/EXEC transaction as the hash write, so
+    list_tasks_by_state never has to scan the keyspace.
     """
 
     KEY_PREFIX = "asdlc:task:"
+    INDEX_PREFIX = "asdlc:task_index:"
+
+    # Attempts at an optimistic state update before giving up
+    MAX_UPDATE_ATTEMPTS = 5
 
     def __init__(self, client: redis.Redis | None = None):
         """Initialize the task manager.
@@ -160,6 +190,18 @@ class TaskManager:
             self._client = await get_redis_client()
         return self._client
 
+    def _tenant_prefix(self) -> str:
+        """Get the tenant key prefix, or an empty string if tenancy is off."""
+        tenant_config = get_tenant_config()
+        if tenant_config.enabled:
+            try:
+                tenant_id = TenantContext.get_current_tenant()
+                return f"tenant:{tenant_id}:"
+            except Exception:
+                return f"tenant:{tenant_config.default_tenant}:"
+
+        return ""
+
     def _get_key(self, task_id: str) -> str:
         """Get the Redis key for a task.
 
@@ -169,17 +211,31 @@ class TaskManager:
         Returns:
             The full Redis key with optional tenant prefix.
         """
-        base_key = f"{self.KEY_PREFIX}{task_id}"
+        return f"{self._tenant_prefix()}{self.KEY_PREFIX}{task_id}"
 
-        tenant_config = get_tenant_config()
-        if tenant_config.enabled:
-            try:
-                tenant_id = TenantContext.get_current_tenant()
-                return f"tenant:{tenant_id}:{base_key}"
-            except Exception:
-                return f"tenant:{tenant_config.default_tenant}:{base_key}"
+    def _index_key(self, state: TaskState | None, session_id: str | None) -> str:
+        """Get the sorted-set index key for a state and/or session.
 
-        return base_key
+        Args:
+            state: State to index by, or None for a session-only index.
+            session_id: Session to index by, or None for a state-only index.
+
+        Returns:
+            The full Redis key with optional tenant prefix.
+        """
+        parts = []
+        if session_id is not None:
+            parts.append(f"session:{session_id}")
+        if state is not None:
+            parts.append(f"state:{state.value}")
+        return f"{self._tenant_prefix()}{self.INDEX_PREFIX}{':'.join(parts)}"
+
+    def _add_to_indexes(self, pipe: Any, task: Task) -> None:
+        """Queue index insertions for a task on a pipeline."""
+        member = {task.task_id: task.created_at.timestamp()}
+        pipe.zadd(self._index_key(task.state, None), member)
+        pipe.zadd(self._index_key(None, task.session_id), member)
+        pipe.zadd(self._index_key(task.state, task.session_id), member)
 
     async def create_task(self, task: Task) -> Task:
         """Create a new task in Redis.
@@ -193,7 +249,10 @@ class TaskManager:
         client = await self._get_client()
         key = self._get_key(task.task_id)
 
-        await client.hset(key, mapping=task.to_dict())
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=task.to_dict())
+            self._add_to_indexes(pipe, task)
+            await pipe.execute()
         logger.info(f"Created task: {task.task_id}")
 
         return task
@@ -232,36 +291,62 @@ class TaskManager:
         Returns:
             The updated task.
 
+        The task hash is WATCHed while the current state is read and
+        validated, so a concurrent update aborts the transaction and the
+        transition is re-validated against the new state.
+
         Raises:
             TaskNotFoundError: If task doesn't exist.
             TaskStateError: If transition is invalid.
+            RedisOperationError: If concurrent updates keep conflicting.
         """
-        task = await self.get_task(task_id)
-        if task is None:
-            raise TaskNotFoundError(
-                f"Task not found: {task_id}",
-                details={"task_id": task_id},
-            )
-
-        # Validate transition
-        self._state_machine.validate_transition(task.state, new_state)
-
-        # Update the task
         client = await self._get_client()
         key = self._get_key(task_id)
 
-        task.state = new_state
-        task.updated_at = datetime.now(timezone.utc)
-
-        # Apply additional updates
-        for field_name, value in updates.items():
-            if hasattr(task, field_name):
-                setattr(task, field_name, value)
-
-        await client.hset(key, mapping=task.to_dict())
-        logger.info(f"Updated task {task_id} state: {new_state.value}")
-
-        return task
+        for _ in range(self.MAX_UPDATE_ATTEMPTS):
+            async with client.pipeline(transaction=True) as pipe:
+                await pipe.watch(key)
+                data = await pipe.hgetall(key)
+                if not data:
+                    raise TaskNotFoundError(
+                        f"Task not found: {task_id}",
+                        details={"task_id": task_id},
+                    )
+                task = Task.from_dict(data)
+
+                # Validate transition
+                self._state_machine.validate_transition(task.state, new_state)
+
+                old_state = task.state
+                old_session_id = task.session_id
+
+                task.state = new_state
+                task.updated_at = datetime.now(timezone.utc)
+
+                # Apply additional updates
+                for field_name, value in updates.items():
+                    if hasattr(task, field_name):
+                        setattr(task, field_name, value)
+
+                pipe.multi()
+                pipe.hset(key, mapping=task.to_dict())
+                pipe.zrem(self._index_key(old_state, None), task_id)
+                pipe.zrem(self._index_key(None, old_session_id), task_id)
+                pipe.zrem(self._index_key(old_state, old_session_id), task_id)
+                self._add_to_indexes(pipe, task)
+                try:
+                    await pipe.execute()
+                except WatchError:
+                    logger.debug(f"Task {task_id} changed during update, retrying")
+                    continue
+
+            logger.info(f"Updated task {task_id} state: {new_state.value}")
+            return task
+
+        raise RedisOperationError(
+            f"Task {task_id} kept changing during state update",
+            details={"task_id": task_id, "new_state": new_state.value},
+        )
 
     async def increment_fail_count(self, task_id: str) -> int:
         """Atomically increment the fail count.
@@ -289,41 +374,164 @@ class TaskManager:
         self,
         state: TaskState,
         session_id: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> list[Task]:
-        """List tasks in a given state.
+        """List tasks in a given state, oldest first.
 
-        Note: This is a scan operation and may be slow for large datasets.
-        Consider adding a secondary index for production use.
+        Reads task IDs from the state (or session+state) index and fetches
+        the hashes in one pipelined round trip. Index entries whose hash is
+        gone or no longer matches are removed from the index, and the page
+        is refilled from the entries after them.
 
         Args:
             state: Filter by this state.
             session_id: Optional session filter.
+            offset: Number of indexed tasks to skip.
+            limit: Maximum number of tasks to return. None for all.
 
         Returns:
             List of tasks matching the criteria.
         """
         client = await self._get_client()
-
-        # Determine key pattern
-        tenant_config = get_tenant_config()
-        if tenant_config.enabled:
-            try:
-                tenant_id = TenantContext.get_current_tenant()
-                pattern = f"tenant:{tenant_id}:{self.KEY_PREFIX}*"
-            except Exception:
-                pattern = f"tenant:{tenant_config.default_tenant}:{self.KEY_PREFIX}*"
-        else:
-            pattern = f"{self.KEY_PREFIX}*"
-
-        tasks = []
-        async for key in client.scan_iter(match=pattern, count=100):
-            data = await client.hgetall(key)
-            if data and data.get("state") == state.value:
-                if session_id is None or data.get("session_id") == session_id:
+        index_key = self._index_key(state, session_id)
+
+        tasks: list[Task] = []
+        start = offset
+        while True:
+            wanted = None if limit is None else limit - len(tasks)
+            end = -1 if wanted is None else start + wanted - 1
+            task_ids = await client.zrange(index_key, start, end)
+            if not task_ids:
+                break
+
+            async with client.pipeline(transaction=False) as pipe:
+                for task_id in task_ids:
+                    pipe.hgetall(self._get_key(task_id))
+                results = await pipe.execute()
+
+            stale = []
+            for task_id, data in zip(task_ids, results, strict=True):
+                if (
+                    data
+                    and data.get("state") == state.value
+                    and (session_id is None or data.get("session_id") == session_id)
+                ):
                     tasks.append(Task.from_dict(data))
+                else:
+                    stale.append(task_id)
+
+            if not stale:
+                break
+            removed = await self._prune_index(client, index_key, state, session_id, stale)
+            if wanted is None or len(task_ids) < wanted:
+                break
+            # Entries after the removed ones shift down into the page
+            start += len(task_ids) - removed
 
         return tasks
 
+    async def _prune_index(
+        self,
+        client: redis.Redis,
+        index_key: str,
+        state: TaskState,
+        session_id: str | None,
+        task_ids: list[str],
+    ) -> int:
+        """Remove index members that no longer match their task hash.
+
+        Args:
+            client: Redis client.
+            index_key: The index the members were read from.
+            state: State the index covers.
+            session_id: Session the index covers, if any.
+            task_ids: Members found stale.
+
+        Returns:
+            Number of members removed.
+        """
+        removed = await client.eval(
+            _PRUNE_INDEX_SCRIPT,
+            1 + len(task_ids),
+            index_key,
+            *(self._get_key(task_id) for task_id in task_ids),
+            state.value,
+            session_id or "",
+            *task_ids,
+        )
+        if removed:
+            logger.debug(f"Removed {removed} stale entries from {index_key}")
+        return int(removed)
+
+    async def count_tasks_by_state(
+        self,
+        state: TaskState,
+        session_id: str | None = None,
+    ) -> int:
+        """Count tasks in a given state from the index.
+
+        Args:
+            state: Filter by this state.
+            session_id: Optional session filter.
+
+        Returns:
+            Number of indexed tasks.
+        """
+        client = await self._get_client()
+        return await client.zcard(self._index_key(state, session_id))
+
+    async def reindex(self, batch_size: int = 500) -> int:
+        """Rebuild all task indexes for the current tenant from task hashes.
+
+        One-time backfill for tasks created before indexes existed, or
+        repair after manual edits. Existing index keys are dropped first.
+
+        Args:
+            batch_size: Number of task hashes fetched per pipeline.
+
+        Returns:
+            Number of tasks indexed.
+        """
+        client = await self._get_client()
+        prefix = self._tenant_prefix()
+
+        stale_keys = [
+            key async for key in client.scan_iter(
+                match=f"{prefix}{self.INDEX_PREFIX}*", count=batch_size
+            )
+        ]
+        if stale_keys:
+            await client.delete(*stale_keys)
+
+        indexed = 0
+        batch: list[str] = []
+
+        async def _flush() -> int:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.hgetall(key)
+                results = await pipe.execute()
+            tasks = [Task.from_dict(data) for data in results if data]
+            async with client.pipeline(transaction=False) as pipe:
+                for task in tasks:
+                    self._add_to_indexes(pipe, task)
+                await pipe.execute()
+            batch.clear()
+            return len(tasks)
+
+        async for key in client.scan_iter(
+            match=f"{prefix}{self.KEY_PREFIX}*", count=batch_size
+        ):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                indexed += await _flush()
+        if batch:
+            indexed += await _flush()
+
+        logger.info(f"Reindexed {indexed} tasks")
+        return indexed
+
 
 class SessionManager:
     """Manages session state in Redis hashes."""
@@ -438,3 +646,37 @@ class SessionManager:
 
         await client.hset(key, "status", status)
         logger.info(f"Updated session {session_id} status: {status}")
+
+
+async def _reindex_main(tenant_ids: list[str]) -> None:
+    """Rebuild task indexes for the given tenants (or the default keyspace)."""
+    manager = TaskManager()
+    if not tenant_ids:
+        count = await manager.reindex()
+        print(f"Indexed {count} tasks")
+        return
+
+    for tenant_id in tenant_ids:
+        with TenantContext.tenant_scope(tenant_id):
+            count = await manager.reindex()
+        print(f"Indexed {count} tasks for tenant {tenant_id}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Backfill task state/session indexes from existing task hashes.",
+    )
+    parser.add_argument("command", choices=["reindex"])
+    parser.add_argument(
+        "--tenant",
+        action="append",
+        default=[],
+        help="Tenant to reindex (repeatable). Uses the current keyspace if omitted.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_reindex_main(args.tenant))
@@ -8,6 +8,8 @@ LLM API calls.
 from src.workers.agents.backends.base import (
     AgentBackend,
     BackendConfig,
+    BackendEvent,
+    BackendEventCallback,
     BackendResult,
 )
 from src.workers.agents.backends.response_parser import parse_json_from_response
@@ -15,6 +17,8 @@ from src.workers.agents.backends.response_parser import parse_json_from_response
 __all__ = [
     "AgentBackend",
     "BackendConfig",
+    "BackendEvent",
+    "BackendEventCallback",
     "BackendResult",
     "parse_json_from_response",
 ]
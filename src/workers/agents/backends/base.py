@@ -7,10 +7,28 @@ LLM APIs directly.
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 
+@dataclass
+class BackendEvent:
+    """Progress event emitted while a backend is running.
+
+    Attributes:
+        type: Event type ("turn", "tool_use", "usage", or "result").
+        data: Event payload.
+    """
+
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+# Callback receiving progress events; may be sync or async
+BackendEventCallback = Callable[[BackendEvent], Awaitable[None] | None]
+
+
 @dataclass
 class BackendConfig:
     """Configuration for a backend execution.
@@ -24,6 +42,10 @@ class BackendConfig:
         timeout_seconds: Hard timeout for execution.
         system_prompt: System prompt override.
         extra_flags: Additional CLI flags (CLI backends only).
+        max_total_tokens: Terminate once reported input plus output
+            tokens exceed this (CLI backends only).
+        on_event: Callback for progress events. Setting this or
+            max_total_tokens switches CLI backends to streaming output.
     """
 
     max_turns: int | None = None
@@ -34,6 +56,8 @@ class BackendConfig:
     timeout_seconds: int = 300
     system_prompt: str | None = None
     extra_flags: list[str] = field(default_factory=list)
+    max_total_tokens: int | None = None
+    on_event: BackendEventCallback | None = None
 
 
 @dataclass
@@ -3,19 +3,34 @@
 Executes agent work by running a coding CLI tool as a subprocess
 in headless mode. Supports Claude Code (-p), Codex (exec), and
 Cursor (--print) with vendor-specific flag translation.
+
+Output is read incrementally. With streaming output (stream-json for
+Claude Code and Cursor, JSONL for Codex) each line is parsed as it
+arrives so turn, tool and token usage events can be published and a
+token budget enforced while the CLI runs. Buffered output past a size
+threshold spills to a temporary file, and a streamed line longer than
+the threshold is parsed from that file once the CLI exits rather than
+held in memory. Without streaming, output is only buffered and is
+parsed once at exit.
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import logging
+import os
 import shutil
-from typing import Any
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import IO, Any
 
 from src.workers.agents.backends.base import (
     AgentBackend,
     BackendConfig,
+    BackendEvent,
     BackendResult,
 )
 
@@ -34,6 +49,7 @@ _CLI_PROFILES: dict[str, dict[str, Any]] = {
     "claude": {
         "print_flag": "-p",
         "output_flag": ["--output-format", "json"],
+        "stream_output_flag": ["--output-format", "stream-json", "--verbose"],
         "skip_permissions": "--dangerously-skip-permissions",
         "max_turns_flag": "--max-turns",
         "budget_flag": "--max-budget-usd",
@@ -45,6 +61,7 @@ _CLI_PROFILES: dict[str, dict[str, Any]] = {
     "codex": {
         "print_flag": "exec",
         "output_flag": ["--json"],
+        "stream_output_flag": ["--json"],
         "skip_permissions": "--full-auto",
         "max_turns_flag": None,
         "budget_flag": None,
@@ -56,6 +73,7 @@ _CLI_PROFILES: dict[str, dict[str, Any]] = {
     "cursor": {
         "print_flag": "-p",
         "output_flag": ["--output-format", "json"],
+        "stream_output_flag": ["--output-format", "stream-json"],
         "skip_permissions": "--force",
         "max_turns_flag": None,
         "budget_flag": None,
@@ -66,6 +84,121 @@ _CLI_PROFILES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Buffered stdout spills to a temp file past this size (4 MiB)
+DEFAULT_SPILL_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Bytes of stderr kept for error messages
+STDERR_CAPTURE_BYTES = 64 * 1024
+
+# Pipe read size
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Seconds to wait after SIGTERM before killing the CLI
+TERMINATE_GRACE_SECONDS = 5.0
+
+# Codex item types reported as tool use
+_CODEX_TOOL_ITEMS = frozenset(
+    {"command_execution", "file_change", "mcp_tool_call", "web_search"}
+)
+
+
+class _SpillBuffer:
+    """Byte buffer that moves to a temporary file past a size threshold."""
+
+    def __init__(self, threshold: int) -> None:
+        self._threshold = threshold
+        self._memory = bytearray()
+        self._file: IO[bytes] | None = None
+        self.size = 0
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the buffer has moved to disk."""
+        return self._file is not None
+
+    def write(self, data: bytes) -> None:
+        """Append data, spilling to disk once over the threshold."""
+        self.size += len(data)
+        if self._file is None and self.size > self._threshold:
+            self._file = tempfile.TemporaryFile(prefix="cli-output-")
+            self._file.write(self._memory)
+            self._memory = bytearray()
+        if self._file is not None:
+            self._file.write(data)
+        else:
+            self._memory.extend(data)
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Return length bytes of the buffered output from offset."""
+        if self._file is None:
+            return bytes(self._memory[offset:offset + length])
+        self._file.seek(offset)
+        data = self._file.read(length)
+        self._file.seek(0, os.SEEK_END)
+        return data
+
+    def iter_lines(self) -> Iterator[bytes]:
+        """Yield the buffered output line by line, without newlines."""
+        if self._file is None:
+            yield from self._memory.split(b"\n")
+            return
+        self._file.seek(0)
+        try:
+            partial = bytearray()
+            while chunk := self._file.read(_READ_CHUNK_BYTES):
+                start = 0
+                while (end := chunk.find(b"\n", start)) != -1:
+                    partial += chunk[start:end]
+                    yield bytes(partial)
+                    partial.clear()
+                    start = end + 1
+                partial += chunk[start:]
+            if partial:
+                yield bytes(partial)
+        finally:
+            self._file.seek(0, os.SEEK_END)
+
+    def getvalue(self) -> str:
+        """Return the full buffered output as text."""
+        if self._file is None:
+            return self._memory.decode("utf-8", errors="replace")
+        self._file.seek(0)
+        data = self._file.read()
+        self._file.seek(0, os.SEEK_END)
+        return data.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Release the spill file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclass
+class _StreamState:
+    """Progress accumulated from streamed CLI output."""
+
+    turns: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    messages_seen: int = 0
+    last_text: str | None = None
+    result: dict[str, Any] | None = None
+    budget_exceeded: str | None = None
+    _message_ids: set[str] = field(default_factory=set)
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens reported so far."""
+        return self.input_tokens + self.output_tokens
+
+    def usage(self) -> dict[str, int]:
+        """Token usage as a dict."""
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
 
 class CLIAgentBackend:
     """Agent backend that delegates to a coding CLI tool.
@@ -87,12 +220,16 @@ class CLIAgentBackend:
         self,
         cli: str = "claude",
         skip_permissions: bool = True,
+        spill_threshold_bytes: int | None = None,
     ) -> None:
         """Initialize CLI backend.
 
         Args:
             cli: CLI tool name ("claude", "codex", or "cursor").
             skip_permissions: Auto-approve all tool operations.
+            spill_threshold_bytes: Buffered output size at which stdout
+                spills to a temp file. Defaults to the
+                CLI_BACKEND_SPILL_BYTES env var or 4 MiB.
         """
         if cli not in _CLI_PROFILES:
             raise ValueError(
@@ -101,6 +238,9 @@ class CLIAgentBackend:
         self._cli = cli
         self._profile = _CLI_PROFILES[cli]
         self._skip_permissions = skip_permissions
+        self._spill_threshold = spill_threshold_bytes or int(
+            os.environ.get("CLI_BACKEND_SPILL_BYTES", DEFAULT_SPILL_THRESHOLD_BYTES)
+        )
 
     @property
     def backend_name(self) -> str:
@@ -111,12 +251,14 @@ class CLIAgentBackend:
         self,
         prompt: str,
         config: BackendConfig,
+        streaming: bool = False,
     ) -> list[str]:
         """Build the CLI command with flags.
 
         Args:
             prompt: The task prompt.
             config: Execution configuration.
+            streaming: Request line-delimited streaming output.
 
         Returns:
             Command as a list of strings.
@@ -133,7 +275,7 @@ class CLIAgentBackend:
             pass
 
         # Output format
-        cmd.extend(profile["output_flag"])
+        cmd.extend(profile["stream_output_flag" if streaming else "output_flag"])
 
         # Skip permissions
         if self._skip_permissions and profile["skip_permissions"]:
@@ -195,11 +337,18 @@ class CLIAgentBackend:
             BackendResult with parsed CLI output.
         """
         config = config or BackendConfig()
-        cmd = self._build_command(prompt, config)
+        # Stream when events are wanted or a budget must be enforced here
+        # because the CLI has no flag for it
+        streaming = (
+            config.on_event is not None
+            or config.max_total_tokens is not None
+            or bool(config.max_turns and not self._profile["max_turns_flag"])
+        )
+        cmd = self._build_command(prompt, config, streaming=streaming)
 
         logger.info(
             f"Executing {self._cli} CLI in {workspace_path} "
-            f"(max_turns={config.max_turns})"
+            f"(max_turns={config.max_turns}, streaming={streaming})"
         )
         logger.debug(f"Command: {' '.join(cmd[:3])}... ({len(cmd)} args)")
 
@@ -210,42 +359,366 @@ class CLIAgentBackend:
                 stderr=asyncio.subprocess.PIPE,
                 cwd=workspace_path,
             )
-
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(),
-                timeout=config.timeout_seconds,
+        except FileNotFoundError:
+            logger.error(f"{self._cli} CLI not found in PATH")
+            return BackendResult(
+                success=False,
+                error=f"{self._cli} not found. Install it or check PATH.",
             )
 
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
-            stderr = stderr_bytes.decode("utf-8", errors="replace")
+        stdout = _SpillBuffer(self._spill_threshold)
+        stderr = bytearray()
+        state = _StreamState()
+        try:
+            try:
+                await asyncio.wait_for(
+                    self._run(process, config, stdout, stderr, state, streaming),
+                    timeout=config.timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                await self._terminate(process)
+                logger.error(
+                    f"{self._cli} CLI timed out after {config.timeout_seconds}s"
+                )
+                return BackendResult(
+                    success=False,
+                    error=f"CLI timed out after {config.timeout_seconds}s",
+                )
+
+            if state.budget_exceeded:
+                logger.warning(
+                    f"{self._cli} CLI terminated: {state.budget_exceeded} exceeded "
+                    f"(turns={state.turns}, tokens={state.total_tokens})"
+                )
+                return BackendResult(
+                    success=False,
+                    output=state.last_text or "",
+                    turns=state.turns,
+                    error=f"CLI terminated: {state.budget_exceeded} exceeded",
+                    metadata={
+                        "usage": state.usage(),
+                        "terminated": state.budget_exceeded,
+                    },
+                )
 
             if process.returncode != 0:
+                stderr_text = stderr.decode("utf-8", errors="replace")
                 logger.error(
                     f"{self._cli} CLI failed (rc={process.returncode}): "
-                    f"{stderr[:500]}"
+                    f"{stderr_text[:500]}"
                 )
                 return BackendResult(
                     success=False,
-                    output=stdout,
-                    error=f"CLI exited with code {process.returncode}: {stderr[:500]}",
+                    output=state.last_text or (
+                        "" if stdout.spilled else stdout.getvalue()
+                    ),
+                    error=(
+                        f"CLI exited with code {process.returncode}: "
+                        f"{stderr_text[:500]}"
+                    ),
                 )
 
-            return self._parse_output(stdout)
+            return self._build_result(stdout, state)
+        finally:
+            stdout.close()
 
-        except asyncio.TimeoutError:
-            logger.error(
-                f"{self._cli} CLI timed out after {config.timeout_seconds}s"
-            )
-            return BackendResult(
-                success=False,
-                error=f"CLI timed out after {config.timeout_seconds}s",
+    async def _run(
+        self,
+        process: asyncio.subprocess.Process,
+        config: BackendConfig,
+        stdout: _SpillBuffer,
+        stderr: bytearray,
+        state: _StreamState,
+        streaming: bool,
+    ) -> None:
+        """Read the CLI's output until it exits or a budget is exceeded.
+
+        Args:
+            process: The running CLI process.
+            config: Execution configuration.
+            stdout: Buffer receiving stdout.
+            stderr: Buffer receiving the start of stderr.
+            state: Stream state to update.
+            streaming: Parse lines as they arrive; otherwise only buffer
+                the output and parse it once the CLI exits.
+        """
+
+        async def read_stderr() -> None:
+            while chunk := await process.stderr.read(_READ_CHUNK_BYTES):
+                if len(stderr) < STDERR_CAPTURE_BYTES:
+                    stderr.extend(chunk[: STDERR_CAPTURE_BYTES - len(stderr)])
+
+        stderr_task = asyncio.create_task(read_stderr())
+        try:
+            if streaming:
+                await self._read_lines(process, config, stdout, state)
+                if state.budget_exceeded:
+                    await self._terminate(process)
+                    return
+            else:
+                while chunk := await process.stdout.read(_READ_CHUNK_BYTES):
+                    stdout.write(chunk)
+
+            await process.wait()
+            await stderr_task
+
+            if not streaming:
+                for line in stdout.iter_lines():
+                    self._parse_line(line, state)
+        finally:
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+    async def _read_lines(
+        self,
+        process: asyncio.subprocess.Process,
+        config: BackendConfig,
+        stdout: _SpillBuffer,
+        state: _StreamState,
+    ) -> None:
+        """Buffer stdout and handle each line as it completes.
+
+        Only each new chunk is searched for newlines. A line that grows
+        past the spill threshold is not accumulated; its position is
+        noted and it is read back from the buffer after EOF.
+
+        Args:
+            process: The running CLI process.
+            config: Execution configuration.
+            stdout: Buffer receiving stdout.
+            state: Stream state to update; reading stops once a budget
+                is exceeded.
+        """
+        pending = bytearray()
+        line_start = 0
+        oversized: list[tuple[int, int]] = []
+        dropping = False
+
+        while chunk := await process.stdout.read(_READ_CHUNK_BYTES):
+            base = stdout.size
+            stdout.write(chunk)
+            start = 0
+            while (end := chunk.find(b"\n", start)) != -1:
+                if dropping:
+                    oversized.append((line_start, base + end - line_start))
+                    dropping = False
+                else:
+                    pending += chunk[start:end]
+                    await self._handle_line(bytes(pending), config, state)
+                pending.clear()
+                start = end + 1
+                line_start = base + start
+            if not dropping:
+                pending += chunk[start:]
+                if len(pending) > self._spill_threshold:
+                    pending.clear()
+                    dropping = True
+            if state.budget_exceeded:
+                return
+
+        if dropping:
+            oversized.append((line_start, stdout.size - line_start))
+        elif pending:
+            await self._handle_line(bytes(pending), config, state)
+
+        for offset, length in oversized:
+            await self._handle_line(
+                stdout.read(offset, length), config, state, check_budgets=False
             )
-        except FileNotFoundError:
-            logger.error(f"{self._cli} CLI not found in PATH")
-            return BackendResult(
-                success=False,
-                error=f"{self._cli} not found. Install it or check PATH.",
+
+    async def _terminate(self, process: asyncio.subprocess.Process) -> None:
+        """Stop the CLI, killing it if it ignores SIGTERM.
+
+        Args:
+            process: The CLI process.
+        """
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), TERMINATE_GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            pass
+
+    async def _handle_line(
+        self,
+        line: bytes,
+        config: BackendConfig,
+        state: _StreamState,
+        check_budgets: bool = True,
+    ) -> None:
+        """Parse one output line, publish its events and check budgets.
+
+        Args:
+            line: A complete stdout line.
+            config: Execution configuration.
+            state: Stream state to update.
+            check_budgets: Flag an exceeded budget in state.
+        """
+        for event in self._parse_line(line, state):
+            await self._publish(config, event)
+
+        if not check_budgets:
+            return
+        if config.max_turns and state.turns > config.max_turns:
+            state.budget_exceeded = "max_turns"
+        elif config.max_total_tokens and state.total_tokens > config.max_total_tokens:
+            state.budget_exceeded = "max_total_tokens"
+
+    def _parse_line(self, line: bytes, state: _StreamState) -> list[BackendEvent]:
+        """Parse one output line into stream state.
+
+        Args:
+            line: A complete stdout line.
+            state: Stream state to update.
+
+        Returns:
+            Progress events for the line (none if it is not a message).
+        """
+        line = line.strip()
+        if not line.startswith(b"{"):
+            return []
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return []
+        if not isinstance(data, dict) or "type" not in data:
+            return []
+
+        state.messages_seen += 1
+        return self._parse_stream_message(data, state)
+
+    def _parse_stream_message(
+        self,
+        data: dict[str, Any],
+        state: _StreamState,
+    ) -> list[BackendEvent]:
+        """Update stream state from one streamed message.
+
+        Handles Claude Code and Cursor stream-json messages (system,
+        assistant, user, tool_call, result) and Codex JSONL events
+        (turn.*, item.*).
+
+        Args:
+            data: Parsed message.
+            state: Stream state to update.
+
+        Returns:
+            Progress events for the message.
+        """
+        events: list[BackendEvent] = []
+        msg_type = data.get("type")
+
+        if msg_type == "assistant":
+            message = data.get("message") or {}
+            # Claude Code emits one message per content block, sharing an id
+            msg_id = message.get("id")
+            if msg_id is None or msg_id not in state._message_ids:
+                if msg_id is not None:
+                    state._message_ids.add(msg_id)
+                state.turns += 1
+                events.append(BackendEvent("turn", {"turn": state.turns}))
+                usage = message.get("usage")
+                if usage:
+                    state.input_tokens += usage.get("input_tokens", 0)
+                    state.output_tokens += usage.get("output_tokens", 0)
+                    events.append(BackendEvent("usage", state.usage()))
+            for block in message.get("content") or []:
+                if not isinstance(block, dict):
+                    continue
+                if block.get("type") == "tool_use":
+                    events.append(BackendEvent(
+                        "tool_use", {"name": block.get("name"), "id": block.get("id")}
+                    ))
+                elif block.get("type") == "text":
+                    state.last_text = block.get("text")
+
+        elif msg_type == "tool_call" and data.get("subtype") == "started":
+            tool_call = data.get("tool_call") or {}
+            events.append(BackendEvent(
+                "tool_use", {"name": next(iter(tool_call), None), "id": data.get("call_id")}
+            ))
+
+        elif msg_type == "turn.started":
+            state.turns += 1
+            events.append(BackendEvent("turn", {"turn": state.turns}))
+
+        elif msg_type == "turn.completed":
+            usage = data.get("usage") or {}
+            state.input_tokens += usage.get("input_tokens", 0)
+            state.output_tokens += usage.get("output_tokens", 0)
+            events.append(BackendEvent("usage", state.usage()))
+
+        elif msg_type in ("item.started", "item.completed"):
+            item = data.get("item") or {}
+            item_type = item.get("type")
+            if msg_type == "item.started" and item_type in _CODEX_TOOL_ITEMS:
+                events.append(BackendEvent(
+                    "tool_use", {"name": item_type, "id": item.get("id")}
+                ))
+            elif msg_type == "item.completed" and item_type == "agent_message":
+                state.last_text = item.get("text")
+
+        elif msg_type == "result":
+            state.result = data
+            events.append(BackendEvent("result", {
+                "subtype": data.get("subtype"),
+                "is_error": data.get("is_error", False),
+                "num_turns": data.get("num_turns"),
+                "total_cost_usd": data.get("total_cost_usd"),
+            }))
+
+        return events
+
+    async def _publish(self, config: BackendConfig, event: BackendEvent) -> None:
+        """Deliver a progress event to the configured callback.
+
+        Callback errors are logged and do not stop execution.
+
+        Args:
+            config: Execution configuration.
+            event: The event to deliver.
+        """
+        if config.on_event is None:
+            return
+        try:
+            result = config.on_event(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Backend event callback failed for {event.type}: {e}")
+
+    def _build_result(self, stdout: _SpillBuffer, state: _StreamState) -> BackendResult:
+        """Build the result of a completed run.
+
+        Uses the streamed result message when there was one, otherwise
+        the accumulated stream state (Codex), otherwise the whole output.
+
+        Args:
+            stdout: Buffered stdout.
+            state: Stream state.
+
+        Returns:
+            Parsed BackendResult.
+        """
+        if state.result is not None:
+            result = self._parse_result_message(state.result)
+        elif state.messages_seen and state.last_text is not None:
+            result = BackendResult(
+                success=True,
+                output=state.last_text,
+                turns=state.turns or None,
+                metadata={"usage": state.usage()},
             )
+        else:
+            result = self._parse_output(stdout.getvalue())
+
+        result.metadata["output_bytes"] = stdout.size
+        return result
 
     def _parse_output(self, stdout: str) -> BackendResult:
         """Parse CLI JSON output into BackendResult.
@@ -275,21 +748,7 @@ class CLIAgentBackend:
 
         # Handle Claude Code JSON format
         if isinstance(data, dict) and "result" in data:
-            return BackendResult(
-                success=not data.get("is_error", False),
-                output=data.get("result", ""),
-                structured_output=data.get("structured_output"),
-                session_id=data.get("session_id"),
-                cost_usd=data.get("total_cost_usd"),
-                turns=data.get("num_turns"),
-                error=data.get("result") if data.get("is_error") else None,
-                metadata={
-                    "duration_ms": data.get("duration_ms"),
-                    "duration_api_ms": data.get("duration_api_ms"),
-                    "usage": data.get("usage", {}),
-                    "subtype": data.get("subtype"),
-                },
-            )
+            return self._parse_result_message(data)
 
         # Handle array format (older Claude Code versions)
         if isinstance(data, list):
@@ -315,6 +774,31 @@ class CLIAgentBackend:
             structured_output=data if isinstance(data, dict) else None,
         )
 
+    def _parse_result_message(self, data: dict[str, Any]) -> BackendResult:
+        """Convert a Claude Code result message into a BackendResult.
+
+        Args:
+            data: The result message.
+
+        Returns:
+            Parsed BackendResult.
+        """
+        return BackendResult(
+            success=not data.get("is_error", False),
+            output=data.get("result", ""),
+            structured_output=data.get("structured_output"),
+            session_id=data.get("session_id"),
+            cost_usd=data.get("total_cost_usd"),
+            turns=data.get("num_turns"),
+            error=data.get("result") if data.get("is_error") else None,
+            metadata={
+                "duration_ms": data.get("duration_ms"),
+                "duration_api_ms": data.get("duration_api_ms"),
+                "usage": data.get("usage", {}),
+                "subtype": data.get("subtype"),
+            },
+        )
+
     async def health_check(self) -> bool:
         """Check if the CLI tool is available.
 
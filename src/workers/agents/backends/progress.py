@@ -0,0 +1,120 @@
+"""Live progress publishing and token budgets for agent backends.
+
+Agents pass a BackendProgressPublisher as BackendConfig.on_event so turn,
+tool and token usage events from CLI backends are written to the agent's
+telemetry log (agent:logs:{agent_id}) as they arrive, where the Agent
+Telemetry API serves them. The token budget for a backend run comes from
+the AGENT_BACKEND_MAX_TOTAL_TOKENS environment variable.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import UTC, datetime
+from typing import Any
+
+from src.core.redis_client import get_redis_client
+from src.orchestrator.services.agent_telemetry import (
+    AGENT_LOGS_KEY_PREFIX,
+    MAX_LOG_LIMIT,
+)
+from src.workers.agents.backends.base import BackendEvent
+
+logger = logging.getLogger(__name__)
+
+# Default token budget (input plus output) for one backend run
+DEFAULT_MAX_TOTAL_TOKENS = 1_000_000
+
+
+def backend_token_budget() -> int | None:
+    """Return the token budget for one backend run.
+
+    Reads AGENT_BACKEND_MAX_TOTAL_TOKENS, falling back to
+    DEFAULT_MAX_TOTAL_TOKENS. A value of 0 disables the budget.
+
+    Returns:
+        int | None: The budget, or None when disabled.
+    """
+    budget = int(
+        os.environ.get("AGENT_BACKEND_MAX_TOTAL_TOKENS", DEFAULT_MAX_TOTAL_TOKENS)
+    )
+    return budget or None
+
+
+class BackendProgressPublisher:
+    """BackendConfig.on_event callback writing events to the telemetry log.
+
+    Each event becomes one entry on agent:logs:{agent_id}, newest first and
+    capped at MAX_LOG_LIMIT entries. Redis errors are logged and dropped so
+    progress publishing never fails a backend run.
+
+    Args:
+        agent_type: Type of the agent running the backend.
+        task_id: Task the agent is executing.
+        redis_client: Redis client. Uses the shared client if omitted.
+
+    Example:
+        config = BackendConfig(
+            on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+            max_total_tokens=backend_token_budget(),
+        )
+    """
+
+    def __init__(
+        self,
+        agent_type: str,
+        task_id: str,
+        redis_client: Any | None = None,
+    ) -> None:
+        self.agent_id = f"{agent_type}:{task_id}" if task_id else agent_type
+        self._redis = redis_client
+
+    async def __call__(self, event: BackendEvent) -> None:
+        """Append an event to the agent's telemetry log.
+
+        Args:
+            event: The backend progress event.
+        """
+        entry = json.dumps({
+            "timestamp": datetime.now(UTC).isoformat(),
+            "level": "error" if event.data.get("is_error") else "info",
+            "message": _describe(event),
+            "agent_id": self.agent_id,
+            "event_type": event.type,
+            "data": event.data,
+        })
+        key = f"{AGENT_LOGS_KEY_PREFIX}{self.agent_id}"
+        try:
+            client = await self._get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.lpush(key, entry)
+                pipe.ltrim(key, 0, MAX_LOG_LIMIT - 1)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish {event.type} event for {self.agent_id}: {e}")
+
+    async def _get_client(self) -> Any:
+        """Return the Redis client, using the shared one by default."""
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+
+def _describe(event: BackendEvent) -> str:
+    """Render a progress event as a log message."""
+    data = event.data
+    if event.type == "turn":
+        return f"Turn {data.get('turn')}"
+    if event.type == "tool_use":
+        return f"Tool use: {data.get('name')}"
+    if event.type == "usage":
+        return (
+            f"Tokens: {data.get('input_tokens', 0)} in, "
+            f"{data.get('output_tokens', 0)} out"
+        )
+    if event.type == "result":
+        status = "failed" if data.get("is_error") else "completed"
+        return f"Run {status} after {data.get('num_turns')} turns"
+    return event.type
@@ -4,7 +4,7 @@ Orchestrates the validation and deployment workflow across multiple agents,
 handling HITL gate interactions, approvals, and rejections.
 
 Workflow:
-1. Validation Phase: Validation -> Security -> HITL-5
+1. Validation Phase: Validation + Security (concurrent) -> HITL-5
 2. Deployment Phase: Release -> Deployment -> HITL-6 -> Monitor
 """
 
@@ -24,6 +24,7 @@ from src.workers.agents.deployment.deployment_agent import DeploymentAgent
 from src.workers.agents.deployment.monitor_agent import MonitorAgent
 from src.workers.agents.deployment.release_agent import ReleaseAgent
 from src.workers.agents.protocols import AgentContext, AgentResult
+from src.workers.agents.stage_graph import Stage, StageError, StageGraph
 from src.workers.agents.validation.config import ValidationConfig
 from src.workers.agents.validation.models import (
     SecurityReport,
@@ -85,6 +86,7 @@ class ValidationResult:
         hitl5_request_id: HITL-5 request ID if submitted.
         failed_at: Which step failed (validation/security).
         error: Error message if failed.
+        stage_timings: Seconds spent in each stage that ran.
     """
 
     success: bool = False
@@ -94,6 +96,7 @@ class ValidationResult:
     hitl5_request_id: str | None = None
     failed_at: str | None = None
     error: str | None = None
+    stage_timings: dict[str, float] = field(default_factory=dict)
 
     @classmethod
     def failed(cls, at: str, error: str = "") -> ValidationResult:
@@ -264,7 +267,7 @@ class ValidationDeploymentCoordinator:
     """Coordinates validation and deployment workflow across agents.
 
     Orchestrates the sequence:
-    - Validation Phase: Validation Agent -> Security Agent -> HITL-5
+    - Validation Phase: Validation Agent + Security Agent (concurrent) -> HITL-5
     - Deployment Phase: Release Agent -> Deployment Agent -> HITL-6 -> Monitor Agent
 
     Example:
@@ -323,7 +326,10 @@ class ValidationDeploymentCoordinator:
     ) -> ValidationResult:
         """Run the validation phase workflow.
 
-        Workflow: Validation Agent -> Security Agent -> HITL-5
+        Workflow: (Validation Agent | Security Agent) -> HITL-5
+
+        The two agents run concurrently; if either fails, the other is
+        cancelled and the failed stage is reported in failed_at.
 
         Args:
             context: Execution context.
@@ -336,57 +342,57 @@ class ValidationDeploymentCoordinator:
         """
         logger.info(f"Starting validation workflow for task {context.task_id}")
 
-        try:
-            # Step 1: Run Validation Agent
-            validation_result = await self._run_validation_agent(
+        async def validation_stage(_: dict[str, Any]) -> tuple[AgentResult, ValidationReport]:
+            result = await self._run_validation_agent(
                 context=context,
                 implementation=implementation,
                 acceptance_criteria=acceptance_criteria,
             )
-
-            if not validation_result.success:
+            if not result.success:
                 logger.warning(
                     f"Validation failed for task {context.task_id}: "
-                    f"{validation_result.error_message}"
-                )
-                return ValidationResult.failed(
-                    at="validation",
-                    error=validation_result.error_message or "Validation failed",
-                )
-
-            # Extract validation report
-            validation_report = self._extract_validation_report(validation_result)
-            if not validation_report or not validation_report.passed:
-                return ValidationResult.failed(
-                    at="validation",
-                    error="Validation checks failed",
+                    f"{result.error_message}"
                 )
-
-            # Step 2: Run Security Agent
-            security_result = await self._run_security_agent(
+                raise StageError(result.error_message or "Validation failed")
+            report = self._extract_validation_report(result)
+            if not report or not report.passed:
+                raise StageError("Validation checks failed")
+            return result, report
+
+        async def security_stage(_: dict[str, Any]) -> tuple[AgentResult, SecurityReport]:
+            result = await self._run_security_agent(
                 context=context,
                 implementation=implementation,
             )
-
-            if not security_result.success:
+            if not result.success:
                 logger.warning(
                     f"Security scan failed for task {context.task_id}: "
-                    f"{security_result.error_message}"
-                )
-                return ValidationResult.failed(
-                    at="security",
-                    error=security_result.error_message or "Security scan failed",
+                    f"{result.error_message}"
                 )
+                raise StageError(result.error_message or "Security scan failed")
+            report = self._extract_security_report(result)
+            if not report or not report.passed:
+                raise StageError("Security scan found blocking findings")
+            return result, report
 
-            # Extract security report
-            security_report = self._extract_security_report(security_result)
-            if not security_report or not security_report.passed:
-                return ValidationResult.failed(
-                    at="security",
-                    error="Security scan found blocking findings",
-                )
-
-            # Step 3: Submit to HITL-5
+        try:
+            # Step 1: Validation and Security Agents both only read the
+            # implementation, so run them concurrently
+            stages = await StageGraph([
+                Stage("validation", validation_stage),
+                Stage("security", security_stage),
+            ]).run()
+
+            failure = stages.first_failure
+            if failure is not None:
+                result = ValidationResult.failed(at=failure.name, error=failure.error or "")
+                result.stage_timings = stages.timings
+                return result
+
+            validation_result, validation_report = stages.results["validation"]
+            security_result, security_report = stages.results["security"]
+
+            # Step 2: Submit to HITL-5
             if not skip_hitl and self.hitl_dispatcher:
                 request_id = await self._submit_hitl5(
                     context=context,
@@ -400,18 +406,22 @@ class ValidationDeploymentCoordinator:
 
                 if request_id:
                     logger.info(f"Submitted HITL-5 request: {request_id}")
-                    return ValidationResult.pending_approval(
+                    result = ValidationResult.pending_approval(
                         validation_report=validation_report,
                         security_report=security_report,
                         request_id=request_id,
                     )
+                    result.stage_timings = stages.timings
+                    return result
 
             # No HITL submission - return success
             logger.info(f"Validation workflow completed for task {context.task_id}")
-            return ValidationResult.succeeded(
+            result = ValidationResult.succeeded(
                 validation_report=validation_report,
                 security_report=security_report,
             )
+            result.stage_timings = stages.timings
+            return result
 
         except Exception as e:
             logger.error(f"Validation workflow failed: {e}", exc_info=True)
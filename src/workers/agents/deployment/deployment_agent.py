@@ -14,6 +14,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.deployment.config import DeploymentConfig, DeploymentStrategy
 from src.workers.agents.deployment.models import (
@@ -191,6 +195,7 @@ class DeploymentAgent:
                 release_manifest=release_manifest,
                 target_environment=target_environment,
                 strategy=strategy,
+                task_id=context.task_id,
             )
 
             if not deployment_plan:
@@ -237,6 +242,7 @@ class DeploymentAgent:
         release_manifest: ReleaseManifest,
         target_environment: str,
         strategy: DeploymentStrategy,
+        task_id: str = "",
     ) -> DeploymentPlan | None:
         """Generate deployment plan using backend.
 
@@ -244,6 +250,7 @@ class DeploymentAgent:
             release_manifest: Release manifest from release agent.
             target_environment: Target environment (staging, production, etc.).
             strategy: Deployment strategy to use.
+            task_id: Task ID for progress events.
 
         Returns:
             DeploymentPlan | None: Generated plan or None if failed.
@@ -262,6 +269,8 @@ class DeploymentAgent:
                 output_schema=DEPLOYMENT_OUTPUT_SCHEMA,
                 system_prompt=DEPLOYMENT_SYSTEM_PROMPT,
                 timeout_seconds=300,
+                on_event=BackendProgressPublisher(self.agent_type, task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Execute via backend
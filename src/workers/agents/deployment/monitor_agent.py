@@ -14,6 +14,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.deployment.config import DeploymentConfig
 from src.workers.agents.deployment.models import (
@@ -251,6 +255,8 @@ class MonitorAgent:
                 output_schema=MONITOR_OUTPUT_SCHEMA,
                 system_prompt=MONITOR_SYSTEM_PROMPT,
                 timeout_seconds=300,
+                on_event=BackendProgressPublisher(self.agent_type, task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Execute via backend
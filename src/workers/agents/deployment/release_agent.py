@@ -14,6 +14,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.deployment.config import DeploymentConfig
 from src.workers.agents.deployment.models import (
@@ -170,6 +174,7 @@ class ReleaseAgent:
                 security_report=security_report,
                 commits=commits,
                 version=version,
+                task_id=context.task_id,
             )
 
             if not release_manifest:
@@ -217,6 +222,7 @@ class ReleaseAgent:
         security_report: SecurityReport,
         commits: list[dict[str, Any]],
         version: str | None,
+        task_id: str = "",
     ) -> ReleaseManifest | None:
         """Generate release manifest using backend.
 
@@ -225,6 +231,7 @@ class ReleaseAgent:
             security_report: Security report from security agent.
             commits: List of commit message dictionaries.
             version: Optional version string.
+            task_id: Task ID for progress events.
 
         Returns:
             ReleaseManifest | None: Generated manifest or None if failed.
@@ -244,6 +251,8 @@ class ReleaseAgent:
                 output_schema=RELEASE_OUTPUT_SCHEMA,
                 system_prompt=RELEASE_SYSTEM_PROMPT,
                 timeout_seconds=300,
+                on_event=BackendProgressPublisher(self.agent_type, task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Execute via backend
@@ -13,6 +13,10 @@ from typing import Any, TYPE_CHECKING
 
 from src.workers.agents.protocols import AgentContext, AgentResult
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.design.config import DesignConfig
 from src.workers.agents.design.models import (
     ComplexityLevel,
@@ -365,6 +369,8 @@ class PlannerAgent:
             system_prompt=PLANNER_SYSTEM_PROMPT,
             timeout_seconds=300,
             allowed_tools=["Read", "Glob", "Grep"],
+            on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+            max_total_tokens=backend_token_budget(),
         )
 
         try:
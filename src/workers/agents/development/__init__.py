@@ -69,6 +69,7 @@ from src.workers.agents.development.tdd_orchestrator import (
     TDDOrchestrator,
     TDDOrchestratorError,
 )
+from src.workers.agents.development.test_impact import TestImpactSelector
 from src.workers.agents.development.test_runner import (
     TestRunner,
     TestRunnerError,
@@ -114,6 +115,7 @@ __all__ = [
     "TestRunner",
     "TestRunnerError",
     "TestTimeoutError",
+    "TestImpactSelector",
     # Metadata and Registration
     "AGENT_METADATA",
     "register_development_agents",
@@ -11,6 +11,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.development.config import DevelopmentConfig
 from src.workers.agents.development.models import (
@@ -294,6 +298,8 @@ class CodingAgent:
                 system_prompt=CODING_SYSTEM_PROMPT,
                 timeout_seconds=self._config.test_timeout_seconds,
                 allowed_tools=["Read", "Glob", "Grep", "Write", "Edit"],
+                on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Execute via backend
@@ -13,6 +13,10 @@ import re
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.development.config import DevelopmentConfig
 from src.workers.agents.development.models import (
@@ -341,6 +345,8 @@ class DebuggerAgent:
                 timeout_seconds=self._config.test_timeout_seconds,
                 allowed_tools=["Read", "Glob", "Grep"],
                 system_prompt=DEBUGGER_SYSTEM_PROMPT,
+                on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Single backend execution replaces the 3 sequential LLM calls
@@ -7,10 +7,15 @@ security scanning to the ``security_scanner`` module.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import AgentBackend, BackendConfig
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.development.config import DevelopmentConfig
 from src.workers.agents.development.models import (
@@ -22,7 +27,10 @@ from src.workers.agents.development.prompts.reviewer_prompts import (
     QUALITY_REVIEW_PROMPT,
     format_quality_review_prompt,
 )
-from src.workers.agents.development.security_scanner import run_security_scan
+from src.workers.agents.development.security_scanner import (
+    run_security_scan,
+    scan_files,
+)
 from src.workers.agents.protocols import AgentContext, AgentResult
 
 if TYPE_CHECKING:
@@ -117,6 +125,8 @@ class ReviewerAgent:
             event_metadata: Additional metadata from triggering event.
                 Expected keys:
                 - implementation: Implementation code to review (required)
+                - implementation_files: Optional mapping of file path to
+                  content, scanned per file by the security scanner
                 - test_suite: Optional test suite code
                 - test_results: Optional test execution results
 
@@ -140,7 +150,13 @@ class ReviewerAgent:
             test_results = event_metadata.get("test_results")
 
             # Pattern-based security scan (no LLM needed)
-            security_scan_findings = run_security_scan(implementation)
+            implementation_files = event_metadata.get("implementation_files")
+            if implementation_files:
+                security_scan_findings = await asyncio.to_thread(
+                    scan_files, implementation_files,
+                )
+            else:
+                security_scan_findings = run_security_scan(implementation)
 
             # LLM-powered code review
             code_review = await self._generate_code_review(
@@ -265,6 +281,8 @@ Set "passed" to false if any critical or high severity issues are found.
                 timeout_seconds=300,
                 allowed_tools=["Read", "Glob", "Grep"],
                 system_prompt=QUALITY_REVIEW_PROMPT,
+                on_event=BackendProgressPublisher(self.agent_type, task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             result = await self._backend.execute(
@@ -382,7 +400,12 @@ Set "passed" to false if any critical or high severity issues are found.
                 existing_ids.add(finding.id)
 
         for finding in security_findings:
-            concern = f"{finding.description} (line {finding.line_number})"
+            location = (
+                f"{finding.file_path}:{finding.line_number}"
+                if finding.file_path
+                else f"line {finding.line_number}"
+            )
+            concern = f"{finding.description} ({location})"
             if concern not in code_review.security_concerns:
                 code_review.security_concerns.append(concern)
 
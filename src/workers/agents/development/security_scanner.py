@@ -2,14 +2,27 @@
 
 Pattern-based detection of hardcoded secrets, injection vulnerabilities,
 and common OWASP security patterns.
+
+Every pattern has literal anchors, at least one of which appears in any
+line it can match. The code is scanned once for all anchors with a
+single compiled regex, match offsets are mapped back to line numbers,
+and each pattern is then run only on the lines containing its anchors.
+Findings are identical to running every pattern on every line.
 """
 
 from __future__ import annotations
 
+import bisect
+import logging
+import os
 import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 
 from src.workers.agents.development.models import IssueSeverity, ReviewIssue
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Patterns for detecting hardcoded secrets
 # ---------------------------------------------------------------------------
@@ -114,6 +127,138 @@ OWASP_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
+# Literal anchors for each pattern, index-aligned with the pattern lists.
+# A line can only match a pattern if it contains (case-insensitively) one
+# of the pattern's anchors. Anchors are lowercase and none may be a
+# prefix of another.
+SECRET_ANCHORS: list[tuple[str, ...]] = [
+    ("api",),
+    ("akia",),
+    ("sk-",),
+    ("passw", "pwd"),
+    ("passw",),
+    ("token", "bearer"),
+    ("ghp_",),
+    ("eyj",),
+    ("secret", "private_key"),
+]
+
+INJECTION_ANCHORS: list[tuple[str, ...]] = [
+    ("select",),
+    ("insert",),
+    ("update",),
+    ("delete",),
+    ("select",),
+    ("insert",),
+    ("select",),
+    ("select",),
+    ("os.system",),
+    ("os.system",),
+    ("subprocess",),
+    ("subprocess",),
+    ('f"<', "f'<"),
+    ('"<', "'<"),
+    ('f"<',),
+    ("f'<",),
+]
+
+OWASP_ANCHORS: list[tuple[str, ...]] = [
+    ("pickle.",),
+    ("yaml.load",),
+    ("marshal.",),
+    ("eval",),
+    ("exec",),
+    ("__import__",),
+    ("open",),
+    ("open",),
+    ("/data/",),
+    ("hashlib.",),
+    ("hashlib.",),
+    ("admin",),
+]
+
+# Combined input size above which multi-file scans use worker processes
+PARALLEL_SCAN_MIN_BYTES = 256 * 1024
+
+
+class _PatternSet:
+    """Compiled patterns for one scan category, indexed by anchor."""
+
+    def __init__(
+        self,
+        patterns: list[tuple[str, str]],
+        anchors: list[tuple[str, ...]],
+        flags: int = 0,
+    ) -> None:
+        if len(patterns) != len(anchors):
+            raise ValueError("Every pattern needs an anchor entry")
+        self.regexes = [re.compile(pattern, flags) for pattern, _ in patterns]
+        self.descriptions = [description for _, description in patterns]
+        self.by_anchor: dict[str, list[int]] = {}
+        for idx, pattern_anchors in enumerate(anchors):
+            for anchor in pattern_anchors:
+                self.by_anchor.setdefault(anchor, []).append(idx)
+
+
+class _AnchorScanner:
+    """Finds candidate lines for pattern sets in one pass over the code."""
+
+    def __init__(self, *pattern_sets: _PatternSet) -> None:
+        anchors = sorted({a for ps in pattern_sets for a in ps.by_anchor})
+        for a, b in zip(anchors, anchors[1:], strict=False):
+            if b.startswith(a):
+                raise ValueError(f"Anchor {a!r} is a prefix of {b!r}")
+        alternation = "|".join(re.escape(a) for a in anchors)
+        self.pattern_sets = pattern_sets
+        # Anchors are lowercase; ASCII code is lowercased and searched
+        # case-sensitively, which is much faster than re.IGNORECASE
+        self._ascii_re = re.compile(alternation)
+        self._unicode_re = re.compile(alternation, re.IGNORECASE)
+
+    def candidates(self, code: str) -> list[dict[int, set[int]]]:
+        """Scan the code once for anchors and map them to candidate lines.
+
+        Args:
+            code: Source code to scan.
+
+        Returns:
+            For each pattern set, a mapping of 1-based line number to the
+            indexes of patterns that may match on that line.
+        """
+        if code.isascii():
+            haystack, anchor_re = code.lower(), self._ascii_re
+        else:
+            haystack, anchor_re = code, self._unicode_re
+
+        found: list[dict[int, set[int]]] = [{} for _ in self.pattern_sets]
+        newlines: list[int] | None = None
+        pos = 0
+        # No anchor is a prefix of another, so at most one anchor starts at
+        # each offset; resuming one character later finds overlapping ones
+        while match := anchor_re.search(haystack, pos):
+            pos = match.start() + 1
+            if newlines is None:
+                newlines = [m.start() for m in re.finditer("\n", code)]
+            line_num = bisect.bisect_left(newlines, match.start()) + 1
+            anchor = match.group().casefold()
+            for ps, lines in zip(self.pattern_sets, found, strict=True):
+                indexes = ps.by_anchor.get(anchor)
+                if indexes:
+                    lines.setdefault(line_num, set()).update(indexes)
+        return found
+
+
+_SECRETS = _PatternSet(SECRET_PATTERNS, SECRET_ANCHORS)
+_INJECTION = _PatternSet(INJECTION_PATTERNS, INJECTION_ANCHORS, re.IGNORECASE)
+_OWASP = _PatternSet(OWASP_PATTERNS, OWASP_ANCHORS, re.IGNORECASE)
+_SAFE_REGEXES = [re.compile(pattern) for pattern in SAFE_PATTERNS]
+
+_SECRETS_SCANNER = _AnchorScanner(_SECRETS)
+_INJECTION_SCANNER = _AnchorScanner(_INJECTION)
+_OWASP_SCANNER = _AnchorScanner(_OWASP)
+_ALL_SCANNER = _AnchorScanner(_SECRETS, _INJECTION, _OWASP)
+
+
 def _is_safe_line(line: str) -> bool:
     """Check whether a line matches a safe pattern.
 
@@ -123,10 +268,7 @@ def _is_safe_line(line: str) -> bool:
     Returns:
         True if the line uses an environment variable or config lookup.
     """
-    for safe_pattern in SAFE_PATTERNS:
-        if re.search(safe_pattern, line):
-            return True
-    return False
+    return any(regex.search(line) for regex in _SAFE_REGEXES)
 
 
 def scan_for_secrets(code: str) -> list[ReviewIssue]:
@@ -135,25 +277,41 @@ def scan_for_secrets(code: str) -> list[ReviewIssue]:
     Args:
         code: Source code to scan.
 
+    Returns:
+        List of security issues found.
+    """
+    (candidates,) = _SECRETS_SCANNER.candidates(code)
+    return _secret_issues(code.split("\n"), candidates)
+
+
+def _secret_issues(
+    lines: list[str],
+    candidates: dict[int, set[int]],
+) -> list[ReviewIssue]:
+    """Build secret findings for candidate lines.
+
+    Args:
+        lines: Source lines.
+        candidates: Line number to candidate pattern indexes.
+
     Returns:
         List of security issues found.
     """
     issues: list[ReviewIssue] = []
     issue_counter = 0
 
-    lines = code.split("\n")
-    for line_num, line in enumerate(lines, 1):
+    for line_num in sorted(candidates):
+        line = lines[line_num - 1]
         if _is_safe_line(line):
             continue
 
-        for pattern, description in SECRET_PATTERNS:
-            matches = re.finditer(pattern, line)
-            for _match in matches:
+        for idx in sorted(candidates[line_num]):
+            for _match in _SECRETS.regexes[idx].finditer(line):
                 issue_counter += 1
                 issues.append(
                     ReviewIssue(
                         id=f"SEC-{issue_counter:03d}",
-                        description=description,
+                        description=_SECRETS.descriptions[idx],
                         severity=IssueSeverity.CRITICAL,
                         file_path="",
                         line_number=line_num,
@@ -174,21 +332,38 @@ def scan_for_injection_vulnerabilities(code: str) -> list[ReviewIssue]:
     Args:
         code: Source code to scan.
 
+    Returns:
+        List of injection vulnerability issues found.
+    """
+    (candidates,) = _INJECTION_SCANNER.candidates(code)
+    return _injection_issues(code.split("\n"), candidates)
+
+
+def _injection_issues(
+    lines: list[str],
+    candidates: dict[int, set[int]],
+) -> list[ReviewIssue]:
+    """Build injection findings for candidate lines.
+
+    Args:
+        lines: Source lines.
+        candidates: Line number to candidate pattern indexes.
+
     Returns:
         List of injection vulnerability issues found.
     """
     issues: list[ReviewIssue] = []
     issue_counter = 0
 
-    lines = code.split("\n")
-    for line_num, line in enumerate(lines, 1):
-        for pattern, description in INJECTION_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
+    for line_num in sorted(candidates):
+        line = lines[line_num - 1]
+        for idx in sorted(candidates[line_num]):
+            if _INJECTION.regexes[idx].search(line):
                 issue_counter += 1
                 issues.append(
                     ReviewIssue(
                         id=f"INJ-{issue_counter:03d}",
-                        description=description,
+                        description=_INJECTION.descriptions[idx],
                         severity=IssueSeverity.CRITICAL,
                         file_path="",
                         line_number=line_num,
@@ -209,16 +384,34 @@ def scan_for_owasp_vulnerabilities(code: str) -> list[ReviewIssue]:
     Args:
         code: Source code to scan.
 
+    Returns:
+        List of OWASP vulnerability issues found.
+    """
+    (candidates,) = _OWASP_SCANNER.candidates(code)
+    return _owasp_issues(code.split("\n"), candidates)
+
+
+def _owasp_issues(
+    lines: list[str],
+    candidates: dict[int, set[int]],
+) -> list[ReviewIssue]:
+    """Build OWASP findings for candidate lines.
+
+    Args:
+        lines: Source lines.
+        candidates: Line number to candidate pattern indexes.
+
     Returns:
         List of OWASP vulnerability issues found.
     """
     issues: list[ReviewIssue] = []
     issue_counter = 0
 
-    lines = code.split("\n")
-    for line_num, line in enumerate(lines, 1):
-        for pattern, description in OWASP_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
+    for line_num in sorted(candidates):
+        line = lines[line_num - 1]
+        for idx in sorted(candidates[line_num]):
+            if _OWASP.regexes[idx].search(line):
+                description = _OWASP.descriptions[idx]
                 issue_counter += 1
                 severity = IssueSeverity.CRITICAL
                 suggestion = "Review and replace with a secure alternative"
@@ -263,7 +456,7 @@ def run_security_scan(code: str) -> list[ReviewIssue]:
     """Run all security scans on the provided code.
 
     Combines secret detection, injection vulnerability scanning,
-    and OWASP pattern checks.
+    and OWASP pattern checks in a single pass over the code.
 
     Args:
         code: Source code to scan.
@@ -271,10 +464,58 @@ def run_security_scan(code: str) -> list[ReviewIssue]:
     Returns:
         Combined list of all security issues found.
     """
+    secrets, injection, owasp = _ALL_SCANNER.candidates(code)
+    if not (secrets or injection or owasp):
+        return []
+
+    lines = code.split("\n")
     all_issues: list[ReviewIssue] = []
 
-    all_issues.extend(scan_for_secrets(code))
-    all_issues.extend(scan_for_injection_vulnerabilities(code))
-    all_issues.extend(scan_for_owasp_vulnerabilities(code))
+    all_issues.extend(_secret_issues(lines, secrets))
+    all_issues.extend(_injection_issues(lines, injection))
+    all_issues.extend(_owasp_issues(lines, owasp))
+
+    return all_issues
+
+
+def scan_files(
+    files: Mapping[str, str],
+    max_workers: int | None = None,
+) -> list[ReviewIssue]:
+    """Run all security scans on several files.
+
+    Files are scanned in worker processes when there is more than one
+    and their combined size exceeds PARALLEL_SCAN_MIN_BYTES. Findings
+    carry their file path and per-file line numbers, and are renumbered
+    so IDs stay unique across files.
+
+    Args:
+        files: Mapping of file path to source code.
+        max_workers: Maximum worker processes (defaults to CPU count).
+
+    Returns:
+        Combined list of all security issues found, in file order.
+    """
+    paths = list(files)
+    sources = [files[path] for path in paths]
+
+    total_bytes = sum(len(source) for source in sources)
+    if len(sources) > 1 and total_bytes >= PARALLEL_SCAN_MIN_BYTES:
+        workers = min(len(sources), max_workers or os.cpu_count() or 1)
+        logger.debug(f"Scanning {len(sources)} files in {workers} processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_security_scan, sources))
+    else:
+        results = [run_security_scan(source) for source in sources]
+
+    all_issues: list[ReviewIssue] = []
+    counters: dict[str, int] = {}
+    for path, issues in zip(paths, results, strict=True):
+        for issue in issues:
+            prefix = issue.id.rsplit("-", 1)[0]
+            counters[prefix] = counters.get(prefix, 0) + 1
+            issue.id = f"{prefix}-{counters[prefix]:03d}"
+            issue.file_path = path
+            all_issues.append(issue)
 
     return all_issues
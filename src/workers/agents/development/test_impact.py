@@ -0,0 +1,281 @@
+"""Test impact analysis for selecting tests affected by a change.
+
+Parses the Python files in a workspace with the repo_mapper parser,
+resolves their imports to workspace modules, and selects the test files
+that import, directly or transitively, any of the changed files.
+
+Import resolution errs towards selecting more tests: an import maps to
+every workspace module whose dotted name ends with it, `from pkg import
+name` also maps to the submodule `pkg.name` if there is one, and
+importing a module also depends on the packages containing it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from src.workers.repo_mapper.models import ImportInfo, ParsedFile
+from src.workers.repo_mapper.parsers.python_parser import PythonParser
+
+logger = logging.getLogger(__name__)
+
+
+# Directories never scanned for source files
+_EXCLUDED_DIRS = frozenset(
+    {".git", ".venv", "venv", ".tox", "node_modules", "__pycache__", "build", "dist"}
+)
+
+
+def is_test_file(path: Path) -> bool:
+    """Check whether a path names a pytest test module.
+
+    Args:
+        path: File path.
+
+    Returns:
+        bool: True for test_*.py and *_test.py files.
+    """
+    return path.suffix == ".py" and (
+        path.name.startswith("test_") or path.stem.endswith("_test")
+    )
+
+
+def find_test_files(test_path: Path) -> list[Path]:
+    """List the test modules under a path.
+
+    Args:
+        test_path: Test file or directory.
+
+    Returns:
+        list[Path]: Sorted test files (the path itself if it is a file).
+    """
+    if test_path.is_file():
+        return [test_path]
+    return sorted(
+        p
+        for p in test_path.rglob("*.py")
+        if is_test_file(p)
+        and not _EXCLUDED_DIRS.intersection(p.relative_to(test_path).parts)
+    )
+
+
+@dataclass
+class TestImpactSelector:
+    """Selects the tests affected by a set of changed files.
+
+    Parsed files are cached by modification time, so repeated selections
+    in the same workspace only re-parse files that changed.
+
+    Attributes:
+        max_depth: Maximum import chain length followed from a changed
+            file to a test.
+
+    Example:
+        selector = TestImpactSelector()
+        tests = selector.select(
+            root=Path("/workspace"),
+            test_path=Path("/workspace/tests"),
+            changed_files=["src/calculator.py"],
+        )
+        if tests is None:
+            ...  # run everything
+    """
+
+    max_depth: int = 5
+    _parser: PythonParser = field(default_factory=PythonParser, init=False, repr=False)
+    _cache: dict[str, tuple[int, ParsedFile]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def select(
+        self,
+        root: Path,
+        test_path: Path,
+        changed_files: Iterable[str | Path],
+    ) -> list[Path] | None:
+        """Select the test files affected by changed files.
+
+        Args:
+            root: Workspace root that relative changed paths resolve against.
+            test_path: Test file or directory to select from.
+            changed_files: Files modified since the last run.
+
+        Returns:
+            list[Path] | None: Affected test files, or None when the change
+                cannot be analysed (non-Python files, conftest.py, or files
+                that fail to parse) and the full suite should run.
+        """
+        root = root.resolve()
+        test_path = test_path.resolve()
+        changed = [
+            (p if p.is_absolute() else root / p).resolve()
+            for p in map(Path, changed_files)
+        ]
+        if not changed:
+            return None
+
+        for path in changed:
+            if path.suffix != ".py" or path.name == "conftest.py":
+                logger.debug(f"Full test run required by change to {path}")
+                return None
+
+        importers = self._build_importers(root)
+        if importers is None:
+            return None
+
+        selected: set[Path] = set()
+        for path in changed:
+            if not path.exists():
+                continue
+            if not path.is_relative_to(root):
+                return None
+            key = path.relative_to(root).as_posix()
+            if key not in importers:
+                logger.debug(f"Full test run required: {path} could not be parsed")
+                return None
+            candidates = [root / p for p in _reachable(importers, key, self.max_depth)]
+            selected.update(
+                p for p in candidates if is_test_file(p) and p.is_relative_to(test_path)
+            )
+
+        logger.info(
+            f"Selected {len(selected)} affected test files for {len(changed)} changed files"
+        )
+        return sorted(selected)
+
+    def _build_importers(self, root: Path) -> dict[str, set[str]] | None:
+        """Map each parsed file under root to the files that import it.
+
+        Args:
+            root: Workspace root.
+
+        Returns:
+            dict[str, set[str]] | None: Root-relative path to the paths of
+                its direct importers, or None if root has no Python files.
+        """
+        files = sorted(
+            p
+            for p in root.rglob("*.py")
+            if not _EXCLUDED_DIRS.intersection(p.relative_to(root).parts)
+        )
+        if not files:
+            return None
+
+        parsed = [
+            pf for pf in (self._parse(root, p) for p in files) if pf is not None
+        ]
+
+        # Every dotted suffix of a module name, so `calc.ops` also finds
+        # src/calc/ops.py when src/ is on the import path
+        modules: dict[str, set[str]] = {}
+        for pf in parsed:
+            parts = _module_name(pf.path).split(".")
+            for i in range(len(parts)):
+                modules.setdefault(".".join(parts[i:]), set()).add(pf.path)
+
+        importers: dict[str, set[str]] = {pf.path: set() for pf in parsed}
+        for pf in parsed:
+            for info in pf.imports:
+                for name in _imported_modules(pf.path, info):
+                    for target in modules.get(name, ()):
+                        if target != pf.path:
+                            importers[target].add(pf.path)
+        return importers
+
+    def _parse(self, root: Path, path: Path) -> ParsedFile | None:
+        """Parse a file, reusing the cached result if it is unchanged.
+
+        Parsed files are keyed by their root-relative path so import
+        resolution does not match against the workspace location.
+
+        Args:
+            root: Workspace root.
+            path: Absolute file path.
+
+        Returns:
+            ParsedFile | None: The parsed file, or None if it cannot be parsed.
+        """
+        key = str(path)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            parsed = replace(
+                self._parser.parse_file(key),
+                path=path.relative_to(root).as_posix(),
+            )
+        except (SyntaxError, UnicodeDecodeError, OSError) as e:
+            logger.debug(f"Skipping unparseable file {path}: {e}")
+            self._cache.pop(key, None)
+            return None
+
+        self._cache[key] = (mtime, parsed)
+        return parsed
+
+
+def _module_name(path: str) -> str:
+    """Dotted module name of a root-relative path (packages drop __init__)."""
+    parts = list(Path(path).with_suffix("").parts)
+    if parts[-1] == "__init__" and len(parts) > 1:
+        parts.pop()
+    return ".".join(parts)
+
+
+def _imported_modules(path: str, info: ImportInfo) -> set[str]:
+    """List the modules an import statement may load, with their packages.
+
+    Args:
+        path: Root-relative path of the importing file.
+        info: The parsed import.
+
+    Returns:
+        set[str]: Dotted module names; relative imports are resolved
+            against the importing file's package.
+    """
+    source = info.source
+    if info.is_relative:
+        level = len(source) - len(source.lstrip("."))
+        package = list(Path(path).parent.parts)
+        if level - 1 > len(package):
+            return set()
+        package = package[: len(package) - (level - 1)]
+        source = ".".join(package + [p for p in source[level:].split(".") if p])
+
+    # `import a.b` and `from a import b` both may load a.b; b may also be
+    # a plain attribute, in which case the extra name simply matches nothing
+    names = {source} if source else set()
+    for name in info.names:
+        if name == "*":
+            continue
+        if source:
+            names.add(f"{source}.{name}")
+        if not info.is_relative or not source:
+            names.add(name)
+
+    # Importing a module runs its packages' __init__ too
+    modules: set[str] = set()
+    for name in names:
+        parts = name.split(".")
+        modules.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+    return modules
+
+
+def _reachable(importers: dict[str, set[str]], start: str, max_depth: int) -> set[str]:
+    """Files that import start within max_depth hops, including start."""
+    seen = {start}
+    frontier = {start}
+    for _ in range(max_depth):
+        frontier = {i for f in frontier for i in importers.get(f, ())} - seen
+        if not frontier:
+            break
+        seen |= frontier
+    return seen
@@ -2,16 +2,39 @@
 
 Provides a TestRunner class that executes pytest on specified test files,
 captures output and errors, calculates coverage, and returns structured results.
+
+run_tests_async() is the non-blocking variant used by the TDD loop. It
+runs only the tests affected by the changed files, shards them across
+parallel pytest processes and reads results from JUnit XML and coverage
+JSON reports rather than parsing stdout.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import os
 import re
 import subprocess
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from .models import TestResult, TestRunResult
+from .test_impact import TestImpactSelector, find_test_files
+
+logger = logging.getLogger(__name__)
+
+
+# Pytest exit code when a shard collected no tests
+_PYTEST_NO_TESTS_COLLECTED = 5
+
+# Assumed duration for test files without timing history (seconds)
+_DEFAULT_FILE_DURATION_SECONDS = 1.0
 
 
 class TestRunnerError(Exception):
@@ -36,10 +59,21 @@ class TestRunner:
     Attributes:
         timeout_seconds: Maximum time in seconds for test execution.
         working_directory: Working directory for test execution.
+        max_workers: Maximum parallel pytest processes for run_tests_async.
+            Defaults to the TEST_RUNNER_WORKERS env var or min(4, CPUs).
     """
 
     timeout_seconds: int = 300
     working_directory: Path = field(default_factory=Path.cwd)
+    max_workers: int = field(
+        default_factory=lambda: int(
+            os.environ.get("TEST_RUNNER_WORKERS", min(4, os.cpu_count() or 1))
+        )
+    )
+    _selector: TestImpactSelector = field(
+        default_factory=TestImpactSelector, init=False, repr=False
+    )
+    _durations: dict[str, float] = field(default_factory=dict, init=False, repr=False)
 
     def run_tests(
         self,
@@ -94,6 +128,310 @@ class TestRunner:
             suite_id or str(test_path),
         )
 
+    async def run_tests_async(
+        self,
+        test_path: Path,
+        with_coverage: bool = False,
+        coverage_source: Path | None = None,
+        extra_args: list[str] | None = None,
+        suite_id: str | None = None,
+        changed_files: Iterable[str | Path] | None = None,
+        source_root: Path | None = None,
+    ) -> TestRunResult:
+        """Run the affected tests in parallel pytest processes.
+
+        When changed_files is given, only test files that import a changed
+        file (directly or transitively) are run. If the change cannot be
+        analysed or selects nothing, every test under test_path runs.
+        Selected files are split into up to max_workers shards, balanced
+        by the durations seen in earlier runs.
+
+        Args:
+            test_path: Path to test file or directory.
+            with_coverage: Whether to enable coverage measurement.
+            coverage_source: Source directory for coverage measurement.
+            extra_args: Additional pytest arguments.
+            suite_id: Optional suite ID (defaults to test path).
+            changed_files: Files changed since the last run.
+            source_root: Root that changed_files are relative to
+                (defaults to working_directory).
+
+        Returns:
+            TestRunResult: Structured test results with pass/fail counts
+                and coverage information.
+
+        Raises:
+            TestTimeoutError: If test execution exceeds timeout.
+            TestRunnerError: If test execution encounters an error (not test failure).
+        """
+        started = time.monotonic()
+        test_files: list[Path] | None = None
+        if changed_files is not None:
+            test_files = await asyncio.to_thread(
+                self._selector.select,
+                source_root or self.working_directory,
+                test_path,
+                changed_files,
+            )
+        selected = bool(test_files)
+        if not test_files:
+            test_files = find_test_files(test_path) or [test_path]
+
+        shards = self._shard(test_files)
+        logger.info(
+            f"Running {len(test_files)} test files in {len(shards)} shards "
+            f"({'affected' if selected else 'full'} run)"
+        )
+
+        with tempfile.TemporaryDirectory(prefix="test-runner-") as report_dir:
+            tasks = [
+                asyncio.create_task(
+                    self._run_shard(
+                        Path(report_dir) / f"shard-{i}",
+                        shard,
+                        with_coverage,
+                        coverage_source,
+                        extra_args,
+                    )
+                )
+                for i, shard in enumerate(shards)
+            ]
+            try:
+                done, pending = await asyncio.wait(
+                    tasks,
+                    timeout=self.timeout_seconds,
+                    return_when=asyncio.FIRST_EXCEPTION,
+                )
+                for task in tasks:
+                    if task in done and task.exception() is not None:
+                        raise task.exception()
+                if pending:
+                    raise TestTimeoutError(
+                        f"Test execution timed out after {self.timeout_seconds} seconds"
+                    )
+                outcomes = [task.result() for task in tasks]
+            finally:
+                # Kill shards still running before the report directory goes
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            results: list[TestResult] = []
+            coverage_files: list[dict] = []
+            skipped = 0
+            for report_base, shard_results, shard_skipped in outcomes:
+                results.extend(shard_results)
+                skipped += shard_skipped
+                if with_coverage:
+                    coverage_files.append(self._read_coverage_json(report_base))
+
+        return TestRunResult(
+            suite_id=suite_id or str(test_path),
+            results=results,
+            passed=sum(1 for r in results if r.passed),
+            failed=sum(1 for r in results if not r.passed),
+            coverage=self._merge_coverage(coverage_files),
+            metadata={
+                "selected_files": [str(p) for p in test_files],
+                "affected_only": selected,
+                "shards": len(shards),
+                "skipped": skipped,
+                "duration_seconds": round(time.monotonic() - started, 3),
+            },
+        )
+
+    def _shard(self, test_files: list[Path]) -> list[list[Path]]:
+        """Split test files into balanced shards.
+
+        Assigns the slowest files first, each to the least loaded shard,
+        using durations recorded by earlier runs.
+
+        Args:
+            test_files: Files to run.
+
+        Returns:
+            list[list[Path]]: Non-empty shards.
+        """
+        shard_count = max(1, min(self.max_workers, len(test_files)))
+        shards: list[list[Path]] = [[] for _ in range(shard_count)]
+        loads = [0.0] * shard_count
+
+        def duration(path: Path) -> float:
+            return self._durations.get(str(path.resolve()), _DEFAULT_FILE_DURATION_SECONDS)
+
+        for path in sorted(test_files, key=duration, reverse=True):
+            idx = loads.index(min(loads))
+            shards[idx].append(path)
+            loads[idx] += duration(path)
+
+        return [shard for shard in shards if shard]
+
+    async def _run_shard(
+        self,
+        report_base: Path,
+        test_files: list[Path],
+        with_coverage: bool,
+        coverage_source: Path | None,
+        extra_args: list[str] | None,
+    ) -> tuple[Path, list[TestResult], int]:
+        """Run one shard in its own pytest process.
+
+        Args:
+            report_base: Path prefix for the shard's report files.
+            test_files: Test files in the shard.
+            with_coverage: Whether to enable coverage measurement.
+            coverage_source: Source directory for coverage measurement.
+            extra_args: Additional pytest arguments.
+
+        Returns:
+            tuple: Report prefix, parsed test results and skipped count.
+
+        Raises:
+            TestRunnerError: If pytest fails to run the shard.
+        """
+        junit_path = report_base.with_suffix(".xml")
+        cmd = [
+            "pytest",
+            "-q",
+            "-p", "no:cacheprovider",
+            f"--junitxml={junit_path}",
+            "-o", "junit_family=xunit1",
+            *(str(p) for p in test_files),
+        ]
+        if with_coverage:
+            cmd.append(f"--cov={coverage_source}" if coverage_source else "--cov")
+            cmd.append(f"--cov-report=json:{report_base.with_suffix('.cov.json')}")
+        if extra_args:
+            cmd.extend(extra_args)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.working_directory,
+            )
+        except FileNotFoundError as e:
+            raise TestRunnerError(f"Pytest execution error: {e}") from e
+
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        returncode = process.returncode or 0
+        if returncode >= 2 and returncode != _PYTEST_NO_TESTS_COLLECTED:
+            error_msg = (
+                stderr.decode("utf-8", errors="replace")
+                or stdout.decode("utf-8", errors="replace")
+                or "Unknown error"
+            )
+            raise TestRunnerError(f"Pytest execution error: {error_msg}")
+
+        if not junit_path.exists():
+            return report_base, [], 0
+        results, skipped = self._parse_junit(junit_path)
+        return report_base, results, skipped
+
+    def _parse_junit(self, junit_path: Path) -> tuple[list[TestResult], int]:
+        """Parse a JUnit XML report and record per-file durations.
+
+        Args:
+            junit_path: Path to the JUnit XML report.
+
+        Returns:
+            tuple: Test results (skipped tests excluded) and skipped count.
+
+        Raises:
+            TestRunnerError: If the report cannot be parsed.
+        """
+        try:
+            root = ET.parse(junit_path).getroot()
+        except ET.ParseError as e:
+            raise TestRunnerError(f"Invalid JUnit report {junit_path}: {e}") from e
+
+        results: list[TestResult] = []
+        skipped = 0
+        file_durations: dict[str, float] = {}
+        for case in root.iter("testcase"):
+            seconds = float(case.get("time") or 0)
+            file_attr = case.get("file")
+            if file_attr:
+                key = str((self.working_directory / file_attr).resolve())
+                file_durations[key] = file_durations.get(key, 0.0) + seconds
+
+            if case.find("skipped") is not None:
+                skipped += 1
+                continue
+
+            failure = case.find("failure")
+            if failure is None:
+                failure = case.find("error")
+            error = None
+            if failure is not None:
+                error = failure.get("message") or (failure.text or "").strip()[:500]
+
+            results.append(
+                TestResult(
+                    test_id=case.get("name", ""),
+                    passed=failure is None,
+                    output=(failure.text or "") if failure is not None else "",
+                    error=error,
+                    duration_ms=int(seconds * 1000),
+                    metadata={"classname": case.get("classname"), "file": file_attr},
+                )
+            )
+
+        self._durations.update(file_durations)
+        return results, skipped
+
+    def _read_coverage_json(self, report_base: Path) -> dict:
+        """Read a shard's coverage JSON report.
+
+        Args:
+            report_base: Path prefix for the shard's report files.
+
+        Returns:
+            dict: Per-file coverage data (empty if there is no report).
+        """
+        path = report_base.with_suffix(".cov.json")
+        try:
+            return json.loads(path.read_text()).get("files", {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read coverage report {path}: {e}")
+            return {}
+
+    def _merge_coverage(self, shard_files: list[dict]) -> float:
+        """Combine per-shard coverage into one percentage.
+
+        Executed lines are unioned per file, since shards may cover the
+        same source files.
+
+        Args:
+            shard_files: Per-file coverage data from each shard.
+
+        Returns:
+            float: Line coverage percentage (0.0 if no data).
+        """
+        executed: dict[str, set[int]] = {}
+        statements: dict[str, set[int]] = {}
+        for files in shard_files:
+            for name, data in files.items():
+                lines = set(data.get("executed_lines", []))
+                executed.setdefault(name, set()).update(lines)
+                statements.setdefault(name, set()).update(
+                    lines, data.get("missing_lines", [])
+                )
+
+        total = sum(len(lines) for lines in statements.values())
+        if not total:
+            return 0.0
+        covered = sum(len(lines) for lines in executed.values())
+        return round(covered / total * 100, 2)
+
     def _build_command(
         self,
         test_path: Path,
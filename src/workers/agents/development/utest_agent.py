@@ -13,6 +13,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.development.config import DevelopmentConfig
 from src.workers.agents.development.models import (
@@ -247,6 +251,8 @@ class UTestAgent:
                 output_schema=UTEST_OUTPUT_SCHEMA,
                 timeout_seconds=300,
                 allowed_tools=["Read", "Glob", "Grep"],
+                on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Execute via backend
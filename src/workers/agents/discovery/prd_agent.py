@@ -12,6 +12,10 @@ import logging
 from typing import Any, TYPE_CHECKING
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.protocols import AgentContext, AgentResult, BaseAgent
 from src.workers.agents.discovery.config import DiscoveryConfig
@@ -269,6 +273,8 @@ class PRDAgent:
                 system_prompt=PRD_SYSTEM_PROMPT,
                 timeout_seconds=300,
                 allowed_tools=["Read", "Glob", "Grep"],
+                on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+                max_total_tokens=backend_token_budget(),
             )
 
             # Execute via backend
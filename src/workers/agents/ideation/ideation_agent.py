@@ -107,6 +107,7 @@ _DEFAULT_TEMPERATURE = 0.4
 _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_RETRY_DELAY_SECONDS = 1.0
 _DEFAULT_SUBMIT_THRESHOLD = 80.0
+_DEFAULT_MAX_HISTORY_MESSAGES = 10
 
 
 @dataclass
@@ -120,6 +121,9 @@ class IdeationConfig:
         max_retries: Maximum retry attempts on failure.
         retry_delay_seconds: Delay between retries.
         submit_threshold: Minimum maturity score to submit PRD.
+        max_history_messages: Most recent history messages included in the
+            prompt, or None to include all (for callers that window the
+            history themselves).
     """
 
     model: str = _DEFAULT_MODEL
@@ -128,6 +132,7 @@ class IdeationConfig:
     max_retries: int = _DEFAULT_MAX_RETRIES
     retry_delay_seconds: float = _DEFAULT_RETRY_DELAY_SECONDS
     submit_threshold: float = _DEFAULT_SUBMIT_THRESHOLD
+    max_history_messages: int | None = _DEFAULT_MAX_HISTORY_MESSAGES
 
 
 # System prompt for the ideation agent
@@ -211,6 +216,8 @@ class IdeationAgent:
                 Expected keys:
                 - user_message: User's message (required)
                 - conversation_history: Previous messages (optional)
+                - conversation_summary: Summary of messages older than
+                  conversation_history (optional)
                 - current_maturity: Current category scores (optional)
 
         Returns:
@@ -230,6 +237,7 @@ class IdeationAgent:
                 )
 
             conversation_history = event_metadata.get("conversation_history", [])
+            conversation_summary = event_metadata.get("conversation_summary", "")
             current_maturity = event_metadata.get("current_maturity", {})
 
             # Build the prompt
@@ -237,6 +245,7 @@ class IdeationAgent:
                 user_message=user_message,
                 conversation_history=conversation_history,
                 current_maturity=current_maturity,
+                conversation_summary=conversation_summary,
             )
 
             # Get response from LLM
@@ -285,35 +294,51 @@ class IdeationAgent:
         user_message: str,
         conversation_history: list[dict[str, str]],
         current_maturity: dict[str, float],
+        conversation_summary: str = "",
     ) -> str:
         """Build the prompt for the LLM.
 
+        The conversation summary comes first and the maturity state and
+        user message last. The summary only changes when it is refreshed,
+        so provider-side prompt caching can reuse it across turns.
+
         Args:
             user_message: The user's current message.
             conversation_history: Previous conversation messages.
             current_maturity: Current maturity scores by category.
+            conversation_summary: Summary of earlier conversation.
 
         Returns:
             str: The formatted prompt.
         """
-        # Build maturity context
-        maturity_context = "Current maturity scores:\n"
-        overall = self.calculate_overall_maturity(current_maturity)
-        maturity_context += f"Overall: {overall:.1f}%\n"
-
-        for category in MATURITY_CATEGORIES:
-            score = current_maturity.get(category.id, 0)
-            maturity_context += f"- {category.name}: {score}%\n"
+        # Build summary context
+        summary_context = ""
+        if conversation_summary:
+            summary_context = (
+                f"Summary of earlier conversation:\n{conversation_summary}\n"
+            )
 
         # Build conversation context
         conversation_context = ""
         if conversation_history:
+            limit = self._config.max_history_messages
+            if limit is not None:
+                conversation_history = conversation_history[-limit:]
             conversation_context = "Conversation history:\n"
-            for msg in conversation_history[-10:]:  # Last 10 messages
+            for msg in conversation_history:
                 role = msg.get("role", "user")
                 content = msg.get("content", "")
                 conversation_context += f"{role.upper()}: {content}\n\n"
 
+        # Build maturity context
+        maturity_context = "Current maturity scores:\n"
+        overall = self.calculate_overall_maturity(current_maturity)
+        maturity_context += f"Overall: {overall:.1f}%\n"
+
+        for category in MATURITY_CATEGORIES:
+            score = current_maturity.get(category.id, 0)
+            maturity_context += f"- {category.name}: {score}%\n"
+
         # Identify gaps
         gaps = self.identify_gaps(current_maturity, threshold=50)
         gaps_context = ""
@@ -321,9 +346,10 @@ class IdeationAgent:
             gaps_context = f"\nCategories needing attention: {', '.join(gaps)}\n"
 
         prompt = f"""
+{summary_context}
+{conversation_context}
 {maturity_context}
 {gaps_context}
-{conversation_context}
 
 USER MESSAGE: {user_message}
 
@@ -0,0 +1,289 @@
+"""Dependency-graph executor for coordinator stages.
+
+Coordinators run a workflow as a set of stages, each usually one agent run.
+StageGraph starts every stage as soon as the stages it depends on have
+succeeded, so independent stages (for example validation and security,
+which only read the same implementation) run concurrently instead of one
+after the other.
+
+A stage fails by raising; StageError carries a message for expected
+failures such as an agent reporting failed checks. With fail_fast (the
+default) the first failure cancels the stages still running and skips
+those not started. Outcomes are always reported in declaration order,
+whatever order the stages finished in, so callers merge results
+deterministically.
+
+Example:
+    graph = StageGraph([
+        Stage("validation", run_validation),
+        Stage("security", run_security),
+        Stage("report", build_report, depends_on=("validation", "security")),
+    ])
+    result = await graph.run()
+    if not result.succeeded:
+        failure = result.first_failure
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class StageError(Exception):
+    """Raised by a stage to fail it with a message."""
+
+    pass
+
+
+class StageGraphError(Exception):
+    """Raised when a stage graph is invalid (unknown dependency or cycle)."""
+
+    pass
+
+
+class StageStatus(str, Enum):
+    """Final status of a stage."""
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class Stage:
+    """One unit of coordinator work.
+
+    Attributes:
+        name: Unique stage name.
+        run: Coroutine function called with the results of the stages it
+            depends on, keyed by stage name. Its return value is the
+            stage result; raising fails the stage.
+        depends_on: Names of stages that must succeed first.
+        timeout_seconds: Fail the stage if it runs longer (None: no limit).
+    """
+
+    name: str
+    run: Callable[[dict[str, Any]], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    timeout_seconds: float | None = None
+
+
+@dataclass
+class StageOutcome:
+    """What happened to one stage.
+
+    Attributes:
+        name: Stage name.
+        status: Final status.
+        result: Return value if the stage succeeded.
+        error: Failure message if the stage failed.
+        duration_seconds: Wall time from start to finish (0 if never started).
+    """
+
+    name: str
+    status: StageStatus
+    result: Any = None
+    error: str | None = None
+    duration_seconds: float = 0.0
+
+
+@dataclass
+class StageGraphResult:
+    """Outcomes of a stage graph run, in stage declaration order.
+
+    Attributes:
+        outcomes: Outcome per stage name.
+        duration_seconds: Wall time of the whole run.
+    """
+
+    outcomes: dict[str, StageOutcome] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every stage succeeded."""
+        return all(o.status == StageStatus.SUCCEEDED for o in self.outcomes.values())
+
+    @property
+    def first_failure(self) -> StageOutcome | None:
+        """The first failed stage in declaration order, if any."""
+        return next(
+            (o for o in self.outcomes.values() if o.status == StageStatus.FAILED),
+            None,
+        )
+
+    @property
+    def results(self) -> dict[str, Any]:
+        """Results of the stages that succeeded."""
+        return {
+            name: o.result
+            for name, o in self.outcomes.items()
+            if o.status == StageStatus.SUCCEEDED
+        }
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Duration in seconds of each stage that started."""
+        return {
+            name: round(o.duration_seconds, 3)
+            for name, o in self.outcomes.items()
+            if o.status != StageStatus.SKIPPED
+        }
+
+
+class StageGraph:
+    """Runs stages concurrently, respecting their dependencies.
+
+    Args:
+        stages: Stages in declaration order.
+
+    Raises:
+        StageGraphError: If names repeat, a dependency is unknown, or the
+            dependencies form a cycle.
+    """
+
+    def __init__(self, stages: list[Stage]) -> None:
+        """Validate and store the stages."""
+        self._stages = {s.name: s for s in stages}
+        if len(self._stages) != len(stages):
+            raise StageGraphError("Stage names must be unique")
+        for stage in stages:
+            unknown = set(stage.depends_on) - self._stages.keys()
+            if unknown:
+                raise StageGraphError(
+                    f"Stage '{stage.name}' depends on unknown stages: {sorted(unknown)}"
+                )
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        """Raise StageGraphError if the dependencies contain a cycle."""
+        done: set[str] = set()
+        remaining = dict(self._stages)
+        while remaining:
+            ready = [n for n, s in remaining.items() if set(s.depends_on) <= done]
+            if not ready:
+                raise StageGraphError(
+                    f"Stage dependencies form a cycle: {sorted(remaining)}"
+                )
+            for name in ready:
+                done.add(name)
+                del remaining[name]
+
+    async def run(self, fail_fast: bool = True) -> StageGraphResult:
+        """Run all stages.
+
+        Args:
+            fail_fast: Cancel running stages and skip the rest on the first
+                failure. Otherwise only dependants of a failed stage are
+                skipped.
+
+        Returns:
+            StageGraphResult: Outcome of every stage.
+        """
+        started = time.perf_counter()
+        outcomes: dict[str, StageOutcome] = {}
+        running: dict[asyncio.Task, str] = {}
+        failed = False
+
+        def start_ready() -> None:
+            for name, stage in self._stages.items():
+                if name in outcomes or name in running.values():
+                    continue
+                deps = [outcomes.get(d) for d in stage.depends_on]
+                if any(d is not None and d.status != StageStatus.SUCCEEDED for d in deps):
+                    outcomes[name] = StageOutcome(name, StageStatus.SKIPPED)
+                elif all(d is not None for d in deps):
+                    inputs = {d: outcomes[d].result for d in stage.depends_on}
+                    task = asyncio.create_task(self._run_stage(stage, inputs))
+                    running[task] = name
+
+        try:
+            start_ready()
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    running.pop(task)
+                    outcome = task.result()
+                    outcomes[outcome.name] = outcome
+                    failed = failed or outcome.status == StageStatus.FAILED
+
+                if failed and fail_fast:
+                    await self._cancel(running, outcomes)
+                    break
+                start_ready()
+        finally:
+            # Cancelled from outside: do not leave stages running
+            if running:
+                await self._cancel(running, outcomes)
+
+        for name in self._stages:
+            outcomes.setdefault(name, StageOutcome(name, StageStatus.SKIPPED))
+
+        result = StageGraphResult(
+            outcomes={name: outcomes[name] for name in self._stages},
+            duration_seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            f"Stage graph finished in {result.duration_seconds:.2f}s: "
+            + ", ".join(
+                f"{o.name}={o.status.value} ({o.duration_seconds:.2f}s)"
+                for o in result.outcomes.values()
+            )
+        )
+        return result
+
+    async def _run_stage(self, stage: Stage, inputs: dict[str, Any]) -> StageOutcome:
+        """Run one stage and capture its outcome."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(stage.run(inputs), stage.timeout_seconds)
+        except TimeoutError:
+            error = f"Stage '{stage.name}' timed out after {stage.timeout_seconds}s"
+            return StageOutcome(
+                stage.name,
+                StageStatus.FAILED,
+                error=error,
+                duration_seconds=time.perf_counter() - started,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not isinstance(e, StageError):
+                logger.error(f"Stage '{stage.name}' raised: {e}", exc_info=True)
+            return StageOutcome(
+                stage.name,
+                StageStatus.FAILED,
+                error=str(e),
+                duration_seconds=time.perf_counter() - started,
+            )
+        return StageOutcome(
+            stage.name,
+            StageStatus.SUCCEEDED,
+            result=result,
+            duration_seconds=time.perf_counter() - started,
+        )
+
+    @staticmethod
+    async def _cancel(
+        running: dict[asyncio.Task, str], outcomes: dict[str, StageOutcome]
+    ) -> None:
+        """Cancel running stages and record them as cancelled."""
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        for task, name in running.items():
+            if task.cancelled() or task.exception() is not None:
+                outcomes[name] = StageOutcome(name, StageStatus.CANCELLED)
+            else:
+                # Finished before the cancellation reached it
+                outcomes[name] = task.result()
+        running.clear()
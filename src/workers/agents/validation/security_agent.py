@@ -16,6 +16,10 @@ import re
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.protocols import AgentContext, AgentResult
 from src.workers.agents.validation.config import ValidationConfig
@@ -535,6 +539,8 @@ class SecurityAgent:
             system_prompt=SECURITY_SYSTEM_PROMPT,
             timeout_seconds=300,
             allowed_tools=["Read", "Glob", "Grep"],
+            on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+            max_total_tokens=backend_token_budget(),
         )
 
         # Execute via backend
@@ -11,6 +11,10 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.progress import (
+    BackendProgressPublisher,
+    backend_token_budget,
+)
 from src.workers.agents.backends.response_parser import parse_json_from_response
 from src.workers.agents.development.models import TestRunResult
 from src.workers.agents.protocols import AgentContext, AgentResult
@@ -294,6 +298,8 @@ class ValidationAgent:
             system_prompt=VALIDATION_SYSTEM_PROMPT,
             timeout_seconds=self._config.e2e_test_timeout,
             allowed_tools=["Read", "Glob", "Grep"],
+            on_event=BackendProgressPublisher(self.agent_type, context.task_id),
+            max_total_tokens=backend_token_budget(),
         )
 
         # Execute via backend
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
@@ -16,6 +17,12 @@ from typing import TYPE_CHECKING, Any
 
 import redis.asyncio as redis
 
+from src.infrastructure.metrics.definitions import (
+    CLASSIFICATION_BATCH_DURATION,
+    CLASSIFICATION_BATCH_THROUGHPUT,
+    CLASSIFICATION_IDEA_LATENCY,
+    CLASSIFICATION_IDEAS_PROCESSED,
+)
 from src.orchestrator.api.models.classification import (
     ClassificationJobStatus,
     ClassificationResult,
@@ -37,6 +44,9 @@ DEFAULT_TIMEOUT = 30  # seconds to wait for queue item
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
 MAX_BACKOFF = 60.0  # seconds
+DEFAULT_CONCURRENCY = 4  # jobs classified at the same time
+DEFAULT_PACK_SIZE = 1  # ideas per LLM prompt (1 disables packing)
+MAX_DRAIN_COUNT = 50  # max queue items taken per wake-up
 
 
 class ClassificationWorker:
@@ -44,6 +54,9 @@ class ClassificationWorker:
 
     Consumes classification jobs from a Redis list and processes them
     asynchronously, with support for retry logic and graceful shutdown.
+    Up to ``concurrency`` jobs run at once; each wake-up drains as many
+    queue items as there are free slots. With ``pack_size`` > 1, short
+    ideas are classified several at a time in one multi-idea prompt.
 
     Usage:
         worker = ClassificationWorker(redis_client, classification_service)
@@ -62,16 +75,32 @@ class ClassificationWorker:
         self,
         redis_client: redis.Redis,
         classification_service: ClassificationService,
+        concurrency: int | None = None,
+        pack_size: int | None = None,
     ) -> None:
         """Initialize the classification worker.
 
         Args:
             redis_client: Redis client for queue operations.
             classification_service: Service for performing classifications.
+            concurrency: Max jobs in flight. Defaults to the
+                CLASSIFICATION_WORKER_CONCURRENCY env var or 4.
+            pack_size: Max ideas per LLM prompt. Defaults to the
+                CLASSIFICATION_WORKER_PACK_SIZE env var or 1.
         """
         self._redis_client = redis_client
         self._classification_service = classification_service
         self._running = False
+        self._concurrency = max(1, concurrency or int(
+            os.environ.get("CLASSIFICATION_WORKER_CONCURRENCY", DEFAULT_CONCURRENCY)
+        ))
+        self._pack_size = max(1, pack_size or int(
+            os.environ.get("CLASSIFICATION_WORKER_PACK_SIZE", DEFAULT_PACK_SIZE)
+        ))
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        self._in_flight: set[asyncio.Task] = set()
+        # Serializes read-modify-write updates of job metadata
+        self._job_lock = asyncio.Lock()
 
     async def enqueue(
         self,
@@ -154,17 +183,22 @@ class ClassificationWorker:
             json.dumps(job_meta),
         )
 
-        # Add each idea to queue with batch job reference
-        for idea_id in idea_ids:
-            job_data = {
-                "job_id": job_id,
-                "idea_id": idea_id,
-                "force": force,
-                "retry_count": 0,
-                "batch_job_id": job_id,
-                "queued_at": now.isoformat(),
-            }
-            await self._redis_client.lpush(REDIS_QUEUE_KEY, json.dumps(job_data))
+        # Add each idea to queue with batch job reference, in one LPUSH
+        if idea_ids:
+            await self._redis_client.lpush(
+                REDIS_QUEUE_KEY,
+                *(
+                    json.dumps({
+                        "job_id": job_id,
+                        "idea_id": idea_id,
+                        "force": force,
+                        "retry_count": 0,
+                        "batch_job_id": job_id,
+                        "queued_at": now.isoformat(),
+                    })
+                    for idea_id in idea_ids
+                ),
+            )
 
         logger.info(
             f"Enqueued batch classification job {job_id} for {len(idea_ids)} ideas"
@@ -197,40 +231,131 @@ class ClassificationWorker:
     async def stop(self) -> None:
         """Stop the worker gracefully.
 
-        Allows the current job to complete before stopping.
+        Allows in-flight jobs to complete before stopping.
         """
         self._running = False
         logger.info("Classification worker stopping")
 
+    @property
+    def in_flight(self) -> int:
+        """Number of job units currently being processed."""
+        return len(self._in_flight)
+
     async def process_queue(self) -> None:
         """Process classification jobs from the queue.
 
         Runs until _running is set to False or an unrecoverable error occurs.
+        In-flight jobs are awaited before returning.
+        """
+        try:
+            while self._running:
+                try:
+                    await self._wait_for_free_slot()
+
+                    free = self._concurrency - len(self._in_flight)
+                    jobs = await self._fetch_jobs(
+                        min(free * self._pack_size, MAX_DRAIN_COUNT)
+                    )
+                    for unit in self._pack_jobs(jobs):
+                        self._spawn(unit)
+
+                except asyncio.CancelledError:
+                    logger.info("Classification worker cancelled")
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in classification worker: {e}")
+                    # Brief delay before retrying
+                    await asyncio.sleep(1)
+        finally:
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _wait_for_free_slot(self) -> None:
+        """Block until fewer than ``concurrency`` job units are in flight."""
+        while len(self._in_flight) >= self._concurrency:
+            await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+    async def _fetch_jobs(self, max_items: int) -> list[dict[str, Any]]:
+        """Wait for a job, then drain up to ``max_items`` without blocking.
+
+        Args:
+            max_items: Maximum number of queue items to take.
+
+        Returns:
+            list: Decoded job data, oldest first. Empty on timeout.
         """
-        while self._running:
+        result = await self._redis_client.brpop(
+            REDIS_QUEUE_KEY,
+            timeout=DEFAULT_TIMEOUT,
+        )
+        if result is None:
+            # Timeout, continue waiting
+            return []
+
+        _, job_data_str = result
+        raw_items = [job_data_str]
+        if max_items > 1:
+            extra = await self._redis_client.rpop(REDIS_QUEUE_KEY, max_items - 1)
+            if extra:
+                raw_items.extend(extra)
+
+        jobs = []
+        for raw in raw_items:
             try:
-                # Wait for a job from the queue
-                result = await self._redis_client.brpop(
-                    REDIS_QUEUE_KEY,
-                    timeout=DEFAULT_TIMEOUT,
-                )
+                jobs.append(json.loads(raw))
+            except (TypeError, ValueError) as e:
+                logger.error(f"Dropping malformed classification job: {e}")
+        return jobs
+
+    def _pack_jobs(
+        self,
+        jobs: list[dict[str, Any]],
+    ) -> list[list[dict[str, Any]]]:
+        """Group jobs into units of up to ``pack_size`` with the same force flag.
+
+        Args:
+            jobs: Decoded job data.
+
+        Returns:
+            list: Job units, each processed by one task.
+        """
+        if self._pack_size == 1:
+            return [[job] for job in jobs]
+
+        by_force: dict[bool, list[dict[str, Any]]] = {}
+        for job in jobs:
+            by_force.setdefault(bool(job.get("force", False)), []).append(job)
+
+        units = []
+        for group in by_force.values():
+            for i in range(0, len(group), self._pack_size):
+                units.append(group[i:i + self._pack_size])
+        return units
 
-                if result is None:
-                    # Timeout, continue waiting
-                    continue
+    def _spawn(self, unit: list[dict[str, Any]]) -> None:
+        """Start processing a job unit as a tracked task.
 
-                _, job_data_str = result
-                job_data = json.loads(job_data_str)
+        Args:
+            unit: One job, or several jobs to classify in one prompt.
+        """
+        task = asyncio.create_task(self._run_unit(unit))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
 
-                await self._process_job(job_data)
+    async def _run_unit(self, unit: list[dict[str, Any]]) -> None:
+        """Process a job unit under the concurrency semaphore.
 
-            except asyncio.CancelledError:
-                logger.info("Classification worker cancelled")
-                raise
+        Args:
+            unit: One job, or several jobs to classify in one prompt.
+        """
+        async with self._semaphore:
+            try:
+                if len(unit) == 1:
+                    await self._process_job(unit[0])
+                else:
+                    await self._process_pack(unit)
             except Exception as e:
-                logger.error(f"Error in classification worker: {e}")
-                # Brief delay before retrying
-                await asyncio.sleep(1)
+                logger.error(f"Unhandled error processing classification jobs: {e}")
 
     async def _process_job(self, job_data: dict[str, Any]) -> None:
         """Process a single classification job.
@@ -241,7 +366,6 @@ class ClassificationWorker:
         job_id = job_data["job_id"]
         idea_id = job_data["idea_id"]
         force = job_data.get("force", False)
-        retry_count = job_data.get("retry_count", 0)
         batch_job_id = job_data.get("batch_job_id")
 
         logger.info(f"Processing classification job {job_id} for idea {idea_id}")
@@ -259,26 +383,129 @@ class ClassificationWorker:
                 force=force,
             )
 
-            # Update job with success
-            await self._mark_job_success(
-                batch_job_id or job_id,
+        except Exception as e:
+            await self._handle_job_error(job_data, e)
+            return
+
+        await self._handle_job_result(job_data, result)
+
+    async def _process_pack(self, jobs: list[dict[str, Any]]) -> None:
+        """Classify several queued ideas with one service call.
+
+        Args:
+            jobs: Job data from the queue, all with the same force flag.
+        """
+        idea_ids = [job["idea_id"] for job in jobs]
+        logger.info(f"Processing {len(jobs)} classification jobs in one pack")
+
+        try:
+            for job_id in {job.get("batch_job_id") or job["job_id"] for job in jobs}:
+                await self._update_job_status(job_id, ClassificationJobStatus.PROCESSING)
+
+            results = await self._classification_service.classify_ideas(
+                idea_ids,
+                force=bool(jobs[0].get("force", False)),
+            )
+        except Exception as e:
+            results = {idea_id: e for idea_id in idea_ids}
+
+        for job in jobs:
+            outcome = results.get(job["idea_id"])
+            if outcome is None:
+                outcome = RuntimeError("No classification result returned")
+            if isinstance(outcome, Exception):
+                await self._handle_job_error(job, outcome)
+            else:
+                await self._handle_job_result(job, outcome)
+
+    async def _handle_job_result(
+        self,
+        job_data: dict[str, Any],
+        result: ClassificationResult,
+    ) -> None:
+        """Record a successful classification for a job.
+
+        Args:
+            job_data: The job data from the queue.
+            result: The classification result.
+        """
+        await self._mark_job_success(
+            job_data.get("batch_job_id") or job_data["job_id"],
+            job_data["idea_id"],
+            result,
+        )
+        self._observe_idea(job_data, "success")
+
+        logger.info(
+            f"Classification complete for {job_data['idea_id']}: "
+            f"{result.classification.value}"
+        )
+
+    async def _handle_job_error(
+        self,
+        job_data: dict[str, Any],
+        error: Exception,
+    ) -> None:
+        """Retry or fail a job after a classification error.
+
+        Args:
+            job_data: The job data from the queue.
+            error: The exception raised while classifying.
+        """
+        idea_id = job_data["idea_id"]
+        retry_count = job_data.get("retry_count", 0)
+        logger.error(f"Classification failed for {idea_id}: {error}")
+
+        if self._should_retry(error) and retry_count < MAX_RETRIES:
+            # Retry with exponential backoff
+            self._observe_idea(job_data, "retried")
+            await self._retry_job(job_data, retry_count + 1)
+        else:
+            # Mark as failed
+            await self._mark_job_failed(
+                job_data.get("batch_job_id") or job_data["job_id"],
                 idea_id,
-                result,
+                str(error),
             )
+            self._observe_idea(job_data, "failed")
+
+    def _observe_idea(self, job_data: dict[str, Any], status: str) -> None:
+        """Export per-idea counters and enqueue-to-result latency.
 
-            logger.info(
-                f"Classification complete for {idea_id}: {result.classification.value}"
+        Args:
+            job_data: The job data from the queue.
+            status: Outcome label (success, failed or retried).
+        """
+        CLASSIFICATION_IDEAS_PROCESSED.labels(status=status).inc()
+        if status == "retried":
+            return
+        queued_at = job_data.get("queued_at")
+        if queued_at:
+            try:
+                queued = datetime.fromisoformat(queued_at)
+            except ValueError:
+                return
+            CLASSIFICATION_IDEA_LATENCY.observe(
+                max(0.0, (datetime.now(timezone.utc) - queued).total_seconds())
             )
 
-        except Exception as e:
-            logger.error(f"Classification failed for {idea_id}: {e}")
+    def _observe_batch(self, job_meta: dict[str, Any]) -> None:
+        """Export duration and throughput of a finished batch job.
 
-            if self._should_retry(e) and retry_count < MAX_RETRIES:
-                # Retry with exponential backoff
-                await self._retry_job(job_data, retry_count + 1)
-            else:
-                # Mark as failed
-                await self._mark_job_failed(batch_job_id or job_id, idea_id, str(e))
+        Args:
+            job_meta: The job metadata at completion.
+        """
+        if "results" not in job_meta or not job_meta.get("created_at"):
+            return
+        try:
+            created = datetime.fromisoformat(job_meta["created_at"])
+        except ValueError:
+            return
+        duration = max(
+            (datetime.now(timezone.utc) - created).total_seconds(), 1e-6
+        )
+        CLASSIFICATION_BATCH_DURATION.observe(duration)
+        CLASSIFICATION_BATCH_THROUGHPUT.set(job_meta["total"] / duration)
 
     async def _update_job_status(
         self,
@@ -292,11 +519,14 @@ class ClassificationWorker:
             status: The new status.
         """
         key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
-        data = await self._redis_client.get(key)
-        if data:
-            job_meta = json.loads(data)
-            job_meta["status"] = status.value
-            await self._redis_client.set(key, json.dumps(job_meta))
+        async with self._job_lock:
+            data = await self._redis_client.get(key)
+            if data:
+                job_meta = json.loads(data)
+                if job_meta.get("status") == status.value:
+                    return
+                job_meta["status"] = status.value
+                await self._redis_client.set(key, json.dumps(job_meta))
 
     async def _mark_job_success(
         self,
@@ -312,8 +542,10 @@ class ClassificationWorker:
             result: The classification result.
         """
         key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
-        data = await self._redis_client.get(key)
-        if data:
+        async with self._job_lock:
+            data = await self._redis_client.get(key)
+            if not data:
+                return
             job_meta = json.loads(data)
             job_meta["completed"] = job_meta.get("completed", 0) + 1
 
@@ -326,11 +558,17 @@ class ClassificationWorker:
                 })
 
             # Check if job is complete
-            if job_meta["completed"] + job_meta.get("failed", 0) >= job_meta["total"]:
+            finished = (
+                job_meta["completed"] + job_meta.get("failed", 0) >= job_meta["total"]
+            )
+            if finished:
                 job_meta["status"] = ClassificationJobStatus.COMPLETED.value
 
             await self._redis_client.set(key, json.dumps(job_meta))
 
+        if finished:
+            self._observe_batch(job_meta)
+
     async def _mark_job_failed(
         self,
         job_id: str,
@@ -345,8 +583,10 @@ class ClassificationWorker:
             error: The error message.
         """
         key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
-        data = await self._redis_client.get(key)
-        if data:
+        async with self._job_lock:
+            data = await self._redis_client.get(key)
+            if not data:
+                return
             job_meta = json.loads(data)
             job_meta["failed"] = job_meta.get("failed", 0) + 1
 
@@ -359,7 +599,8 @@ class ClassificationWorker:
             })
 
             # Check if job is complete (all items processed, some failed)
-            if job_meta["completed"] + job_meta["failed"] >= job_meta["total"]:
+            finished = job_meta["completed"] + job_meta["failed"] >= job_meta["total"]
+            if finished:
                 if job_meta["failed"] == job_meta["total"]:
                     job_meta["status"] = ClassificationJobStatus.FAILED.value
                 else:
@@ -367,6 +608,9 @@ class ClassificationWorker:
 
             await self._redis_client.set(key, json.dumps(job_meta))
 
+        if finished:
+            self._observe_batch(job_meta)
+
     def _should_retry(self, error: Exception) -> bool:
         """Determine if an error should trigger a retry.
 
@@ -28,6 +28,9 @@ class WorkerConfig:
         shutdown_timeout_seconds: Time to wait for graceful shutdown.
         consumer_group: Redis consumer group name.
         consumer_name: Unique name for this consumer instance.
+        priority_lanes: Also consume the urgent lane stream, ahead of bulk.
+        backlog_refresh_seconds: Interval for refreshing queue depth and
+            lag statistics.
     """
 
     pool_size: int = 4
@@ -36,6 +39,8 @@ class WorkerConfig:
     shutdown_timeout_seconds: int = 30
     consumer_group: str = "development-handlers"
     consumer_name: str = field(default_factory=_generate_consumer_name)
+    priority_lanes: bool = True
+    backlog_refresh_seconds: int = 10
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -51,6 +56,10 @@ class WorkerConfig:
             raise ValueError(
                 f"shutdown_timeout_seconds must be positive, got {self.shutdown_timeout_seconds}"
             )
+        if self.backlog_refresh_seconds < 1:
+            raise ValueError(
+                f"backlog_refresh_seconds must be positive, got {self.backlog_refresh_seconds}"
+            )
 
     @classmethod
     def from_env(cls) -> WorkerConfig:
@@ -63,6 +72,8 @@ class WorkerConfig:
             WORKER_SHUTDOWN_TIMEOUT: Shutdown timeout in seconds (default: 30)
             WORKER_CONSUMER_GROUP: Redis consumer group (default: development-handlers)
             WORKER_CONSUMER_NAME: Consumer instance name (default: auto-generated)
+            WORKER_PRIORITY_LANES: Consume the urgent lane (default: true)
+            WORKER_BACKLOG_REFRESH_SECONDS: Queue stats interval (default: 10)
 
         Returns:
             WorkerConfig: Configuration loaded from environment.
@@ -78,6 +89,9 @@ class WorkerConfig:
             shutdown_timeout_seconds=int(os.getenv("WORKER_SHUTDOWN_TIMEOUT", "30")),
             consumer_group=os.getenv("WORKER_CONSUMER_GROUP", "development-handlers"),
             consumer_name=consumer_name,
+            priority_lanes=os.getenv("WORKER_PRIORITY_LANES", "true").lower()
+            in ("true", "1", "yes"),
+            backlog_refresh_seconds=int(os.getenv("WORKER_BACKLOG_REFRESH_SECONDS", "10")),
         )
 
 
@@ -7,13 +7,15 @@ filtering for AGENT_STARTED events that trigger agent execution.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import redis.asyncio as redis
 
 from src.core.config import get_redis_config
-from src.core.events import ASDLCEvent, EventType
-from src.core.exceptions import StreamError
+from src.core.events import ASDLCEvent, EventPriority, EventType
+from src.core.exceptions import ConsumerGroupError, StreamError
+from src.infrastructure.redis_streams import create_consumer_group, get_lane_stream_name
 from src.workers.config import WorkerConfig
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,8 @@ class EventConsumer:
 
     Reads events from the configured consumer group and filters
     for AGENT_STARTED events that should trigger agent execution.
+    With priority lanes enabled, the urgent lane stream is read before
+    the bulk stream, and reads never return more events than requested.
 
     Attributes:
         group_name: Name of the consumer group.
@@ -60,55 +64,84 @@ class EventConsumer:
             return f"tenant:{self._tenant_id}:{base_name}"
         return base_name
 
+    @property
+    def lanes(self) -> list[EventPriority]:
+        """Lanes this consumer reads, most urgent first."""
+        if self._config.priority_lanes:
+            return [EventPriority.URGENT, EventPriority.BULK]
+        return [EventPriority.BULK]
+
+    def lane_stream_name(self, priority: EventPriority) -> str:
+        """Get the stream name for a lane.
+
+        Args:
+            priority: The lane.
+
+        Returns:
+            str: The lane's stream name.
+        """
+        return get_lane_stream_name(self.stream_name, priority)
+
+    async def ensure_lanes(self) -> None:
+        """Create the consumer group on every lane stream.
+
+        The bulk stream group is normally created at startup by
+        initialize_consumer_groups; the urgent lane is created here.
+        """
+        for lane in self.lanes:
+            try:
+                await create_consumer_group(
+                    self._client, self.lane_stream_name(lane), self.group_name
+                )
+            except ConsumerGroupError as e:
+                logger.warning(f"Failed to create consumer group for {lane.value} lane: {e}")
+
     async def read_events(
         self,
         block_ms: int | None = None,
+        count: int | None = None,
     ) -> list[ASDLCEvent]:
         """Read AGENT_STARTED events from the stream.
 
-        Reads a batch of events from the consumer group and filters
-        for AGENT_STARTED events only.
+        Reads up to count events from the consumer group, urgent lane
+        first, and filters for AGENT_STARTED events only. Blocking only
+        happens when no lane has events ready. A blocking read over two
+        lanes may return one event more than requested when count is 1.
 
         Args:
             block_ms: Optional blocking timeout in milliseconds.
+            count: Maximum number of events to read. Capped at batch_size;
+                defaults to batch_size.
 
         Returns:
-            list[ASDLCEvent]: List of AGENT_STARTED events.
+            list[ASDLCEvent]: List of AGENT_STARTED events, urgent first.
 
         Raises:
             StreamError: If reading from the stream fails.
         """
-        try:
-            kwargs: dict[str, Any] = {
-                "groupname": self.group_name,
-                "consumername": self.consumer_name,
-                "count": self.batch_size,
-                "streams": {self.stream_name: ">"},
-            }
-            if block_ms is not None:
-                kwargs["block"] = block_ms
-
-            result = await self._client.xreadgroup(**kwargs)
-
-            events = []
-            if result:
-                for stream_data in result:
-                    _, messages = stream_data
-                    for message_id, message_data in messages:
-                        event = ASDLCEvent.from_stream_dict(message_id, message_data)
-
-                        # Filter for AGENT_STARTED events only
-                        if event.event_type == EventType.AGENT_STARTED:
-                            events.append(event)
-                        else:
-                            # Acknowledge non-AGENT_STARTED events immediately
-                            # (they're meant for other consumer groups)
-                            await self.acknowledge(message_id)
-                            logger.debug(
-                                f"Skipped non-AGENT_STARTED event: {event.event_type}"
-                            )
+        count = min(count or self.batch_size, self.batch_size)
+        lanes = self.lanes
 
-            return events
+        try:
+            if len(lanes) == 1:
+                return await self._read_lanes(lanes, count, block_ms)
+
+            urgent = await self._read_lanes([EventPriority.URGENT], count, None)
+            if urgent:
+                remaining = count - len(urgent)
+                if remaining > 0:
+                    urgent.extend(
+                        await self._read_lanes([EventPriority.BULK], remaining, None)
+                    )
+                return urgent
+
+            bulk = await self._read_lanes([EventPriority.BULK], count, None)
+            if bulk or block_ms is None:
+                return bulk
+
+            # Both lanes are empty: wait on both, splitting the count so the
+            # combined result stays within budget
+            return await self._read_lanes(lanes, max(1, count // len(lanes)), block_ms)
 
         except redis.RedisError as e:
             raise StreamError(
@@ -116,11 +149,68 @@ class EventConsumer:
                 details={"stream": self.stream_name, "group": self.group_name},
             ) from e
 
-    async def acknowledge(self, event_id: str) -> bool:
+    async def _read_lanes(
+        self,
+        lanes: list[EventPriority],
+        count: int,
+        block_ms: int | None,
+    ) -> list[ASDLCEvent]:
+        """Read new entries from the given lanes.
+
+        Args:
+            lanes: Lanes to read, most urgent first.
+            count: Maximum entries per lane.
+            block_ms: Optional blocking timeout in milliseconds.
+
+        Returns:
+            list[ASDLCEvent]: AGENT_STARTED events, in lane order.
+        """
+        streams = {self.lane_stream_name(lane): lane for lane in lanes}
+        kwargs: dict[str, Any] = {
+            "groupname": self.group_name,
+            "consumername": self.consumer_name,
+            "count": count,
+            "streams": {stream: ">" for stream in streams},
+        }
+        if block_ms is not None:
+            kwargs["block"] = block_ms
+
+        result = await self._client.xreadgroup(**kwargs)
+
+        events = []
+        if result:
+            for stream_data in result:
+                stream, messages = stream_data
+                lane = streams.get(stream, EventPriority.BULK)
+                for message_id, message_data in messages:
+                    event = ASDLCEvent.from_stream_dict(message_id, message_data)
+                    # The lane an event was read from decides where it is acked
+                    event.priority = lane
+
+                    # Filter for AGENT_STARTED events only
+                    if event.event_type == EventType.AGENT_STARTED:
+                        events.append(event)
+                    else:
+                        # Acknowledge non-AGENT_STARTED events immediately
+                        # (they're meant for other consumer groups)
+                        await self.acknowledge(message_id, lane)
+                        logger.debug(
+                            f"Skipped non-AGENT_STARTED event: {event.event_type}"
+                        )
+
+        events.sort(key=lambda e: e.priority != EventPriority.URGENT)
+        return events
+
+    async def acknowledge(
+        self,
+        event_id: str,
+        priority: EventPriority = EventPriority.BULK,
+    ) -> bool:
         """Acknowledge an event as processed.
 
         Args:
             event_id: The event ID to acknowledge.
+            priority: The lane the event was read from.
 
         Returns:
             bool: True if the event was acknowledged.
@@ -130,7 +220,7 @@ class EventConsumer:
         """
         try:
             result = await self._client.xack(
-                self.stream_name, self.group_name, event_id
+                self.lane_stream_name(priority), self.group_name, event_id
             )
             return result > 0
         except redis.RedisError as e:
@@ -143,16 +233,59 @@ class EventConsumer:
         """Get the count of pending events for this consumer group.
 
         Returns:
-            int: Number of pending (unacknowledged) events.
+            int: Number of pending (unacknowledged) events across all lanes.
         """
-        try:
-            result = await self._client.xpending(self.stream_name, self.group_name)
-            if result and isinstance(result, dict):
-                return result.get("pending", 0)
-            return 0
-        except redis.RedisError as e:
-            logger.warning(f"Failed to get pending count: {e}")
-            return 0
+        total = 0
+        for lane in self.lanes:
+            try:
+                result = await self._client.xpending(
+                    self.lane_stream_name(lane), self.group_name
+                )
+                if result and isinstance(result, dict):
+                    total += result.get("pending", 0)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to get pending count for {lane.value} lane: {e}")
+        return total
+
+    async def get_backlog(self) -> dict[str, dict[str, float]]:
+        """Get queue depth and lag for each lane.
+
+        Depth is the number of entries not yet delivered to the group plus
+        entries delivered but not acknowledged. Lag is the age in seconds
+        of the oldest undelivered entry (0 when caught up).
+
+        Returns:
+            dict: Mapping of lane name to {"depth", "pending", "lag_seconds"}.
+                Lanes whose stats cannot be read are omitted.
+        """
+        backlog: dict[str, dict[str, float]] = {}
+        for lane in self.lanes:
+            stream = self.lane_stream_name(lane)
+            try:
+                groups = await self._client.xinfo_groups(stream)
+                group = next((g for g in groups if g.get("name") == self.group_name), None)
+                if group is None:
+                    continue
+
+                pending = int(group.get("pending") or 0)
+                undelivered = int(group.get("lag") or 0)
+                lag_seconds = 0.0
+                last_delivered = group.get("last-delivered-id") or "0-0"
+                oldest = await self._client.xrange(
+                    stream, min=f"({last_delivered}", max="+", count=1
+                )
+                if oldest:
+                    oldest_ms = int(str(oldest[0][0]).split("-")[0])
+                    lag_seconds = max(0.0, time.time() - oldest_ms / 1000)
+
+                backlog[lane.value] = {
+                    "depth": undelivered + pending,
+                    "pending": pending,
+                    "lag_seconds": lag_seconds,
+                }
+            except redis.RedisError as e:
+                logger.debug(f"Failed to read backlog for {stream}: {e}")
+        return backlog
 
     async def claim_stale_events(
         self,
@@ -162,55 +295,64 @@ class EventConsumer:
         """Claim stale events from dead consumers.
 
         Uses XCLAIM to take ownership of messages that have been pending
-        for longer than min_idle_ms.
+        for longer than min_idle_ms, urgent lane first.
 
         Args:
             min_idle_ms: Minimum idle time in milliseconds.
-            count: Maximum number of messages to claim.
+            count: Maximum number of messages to claim across all lanes.
 
         Returns:
-            list[ASDLCEvent]: List of claimed AGENT_STARTED events.
+            list[ASDLCEvent]: List of claimed AGENT_STARTED events, each
+                tagged with the lane it was claimed from.
         """
-        try:
-            # Get pending messages
-            pending = await self._client.xpending_range(
-                name=self.stream_name,
-                groupname=self.group_name,
-                min="-",
-                max="+",
-                count=count,
-            )
+        events: list[ASDLCEvent] = []
+        remaining = count
+        for lane in self.lanes:
+            if remaining <= 0:
+                break
+            stream = self.lane_stream_name(lane)
+            try:
+                # Get pending messages
+                pending = await self._client.xpending_range(
+                    name=stream,
+                    groupname=self.group_name,
+                    min="-",
+                    max="+",
+                    count=remaining,
+                )
+
+                # Filter for stale entries
+                stale_ids = [
+                    p["message_id"]
+                    for p in pending
+                    if p.get("time_since_delivered", 0) >= min_idle_ms
+                ]
+
+                if not stale_ids:
+                    continue
+
+                # Claim the stale messages
+                result = await self._client.xclaim(
+                    stream,
+                    self.group_name,
+                    self.consumer_name,
+                    min_idle_time=min_idle_ms,
+                    message_ids=stale_ids,
+                )
+                remaining -= len(stale_ids)
+
+                for message_id, message_data in result:
+                    if message_data:
+                        event = ASDLCEvent.from_stream_dict(message_id, message_data)
+                        # Acks must go back to the lane it was claimed from
+                        event.priority = lane
+                        # Only claim AGENT_STARTED events
+                        if event.event_type == EventType.AGENT_STARTED:
+                            events.append(event)
 
-            # Filter for stale entries
-            stale_ids = [
-                p["message_id"]
-                for p in pending
-                if p.get("time_since_delivered", 0) >= min_idle_ms
-            ]
-
-            if not stale_ids:
-                return []
-
-            # Claim the stale messages
-            result = await self._client.xclaim(
-                self.stream_name,
-                self.group_name,
-                self.consumer_name,
-                min_idle_time=min_idle_ms,
-                message_ids=stale_ids,
-            )
-
-            events = []
-            for message_id, message_data in result:
-                if message_data:
-                    event = ASDLCEvent.from_stream_dict(message_id, message_data)
-                    # Only claim AGENT_STARTED events
-                    if event.event_type == EventType.AGENT_STARTED:
-                        events.append(event)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to claim stale events from {lane.value} lane: {e}")
 
+        if events:
             logger.info(f"Claimed {len(events)} stale AGENT_STARTED events")
-            return events
-
-        except redis.RedisError as e:
-            logger.warning(f"Failed to claim stale events: {e}")
-            return []
+        return events
@@ -36,10 +36,12 @@ class WorkerPool:
     """Manages concurrent agent execution.
 
     The worker pool:
-    - Consumes AGENT_STARTED events from Redis Streams
+    - Consumes AGENT_STARTED events from Redis Streams, urgent lane first
+    - Reads only as many events as it has free slots, so unstarted events
+      stay in the stream where idle workers can take them
     - Dispatches events to registered agents via the dispatcher
-    - Manages concurrency with a semaphore
     - Publishes AGENT_COMPLETED or AGENT_ERROR events
+    - Tracks per-lane queue depth and lag for autoscaling
     - Handles graceful shutdown
 
     Example:
@@ -91,9 +93,13 @@ class WorkerPool:
 
         # State
         self._state = WorkerPoolState.STOPPED
-        self._semaphore = asyncio.Semaphore(config.pool_size)
         self._active_tasks: set[asyncio.Task] = set()
+        self._slot_freed = asyncio.Event()
         self._shutdown_event = asyncio.Event()
+        # Events read beyond free capacity (at most one per extra lane)
+        self._held: list[ASDLCEvent] = []
+        self._backlog: dict[str, dict[str, float]] = {}
+        self._backlog_task: asyncio.Task | None = None
 
         # Metrics
         self._events_processed = 0
@@ -110,11 +116,17 @@ class WorkerPool:
         """Return the concurrency limit."""
         return self._config.pool_size
 
+    @property
+    def free_slots(self) -> int:
+        """Return the number of idle execution slots."""
+        return max(0, self._config.pool_size - len(self._active_tasks))
+
     def get_stats(self) -> dict[str, Any]:
         """Return pool statistics.
 
         Returns:
-            dict: Statistics including state, counts, and active workers.
+            dict: Statistics including state, counts, active workers, and
+                per-lane queue depth and lag as of the last refresh.
         """
         return {
             "state": self._state.value,
@@ -123,6 +135,7 @@ class WorkerPool:
             "events_failed": self._events_failed,
             "active_workers": len(self._active_tasks),
             "concurrency_limit": self._config.pool_size,
+            "lanes": {lane: dict(stats) for lane, stats in self._backlog.items()},
         }
 
     async def start(self) -> None:
@@ -142,9 +155,14 @@ class WorkerPool:
             f"consumer_group={self._config.consumer_group})"
         )
 
+        await self._consumer.ensure_lanes()
+        self._backlog_task = asyncio.create_task(self._run_backlog_refresh())
+
         try:
             await self._run_event_loop()
         finally:
+            self._backlog_task.cancel()
+            self._backlog_task = None
             self._state = WorkerPoolState.STOPPED
             logger.info("Worker pool stopped")
 
@@ -182,8 +200,17 @@ class WorkerPool:
                 if self._shutdown_event.is_set():
                     break
 
-                # Read batch of events
-                events = await self._consumer.read_events(block_ms=1000)
+                # Only read once a slot is free, and only as many events as
+                # there are free slots
+                if not await self._wait_for_free_slot():
+                    continue
+
+                if self._held:
+                    events, self._held = self._held, []
+                else:
+                    events = await self._consumer.read_events(
+                        block_ms=1000, count=self.free_slots
+                    )
 
                 # Yield control to allow other tasks to run
                 # This is important when mocking returns immediately
@@ -192,9 +219,10 @@ class WorkerPool:
                 for event in events:
                     if self._state != WorkerPoolState.RUNNING:
                         break
+                    if self.free_slots == 0:
+                        self._held.append(event)
+                        continue
 
-                    # Process event with concurrency control
-                    await self._semaphore.acquire()
                     task = asyncio.create_task(self._process_event(event))
                     self._active_tasks.add(task)
                     task.add_done_callback(self._task_done)
@@ -205,10 +233,39 @@ class WorkerPool:
                 logger.error(f"Error in event loop: {e}")
                 await asyncio.sleep(1)  # Back off on error
 
+    async def _wait_for_free_slot(self, timeout: float = 1.0) -> bool:
+        """Wait until an execution slot is free.
+
+        Args:
+            timeout: Maximum seconds to wait before re-checking for shutdown.
+
+        Returns:
+            bool: True if a slot is free.
+        """
+        if self.free_slots > 0:
+            return True
+        self._slot_freed.clear()
+        try:
+            await asyncio.wait_for(self._slot_freed.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        return self.free_slots > 0
+
     def _task_done(self, task: asyncio.Task) -> None:
         """Callback when a task completes."""
         self._active_tasks.discard(task)
-        self._semaphore.release()
+        self._slot_freed.set()
+
+    async def _run_backlog_refresh(self) -> None:
+        """Periodically refresh per-lane queue depth and lag."""
+        while True:
+            try:
+                self._backlog = await self._consumer.get_backlog()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Failed to refresh queue backlog: {e}")
+            await asyncio.sleep(self._config.backlog_refresh_seconds)
 
     async def _process_event(self, event: ASDLCEvent) -> None:
         """Process a single event.
@@ -223,7 +280,7 @@ class WorkerPool:
             is_new = await self._idempotency.check_and_mark_if_new(event)
             if not is_new:
                 logger.info(f"Skipping duplicate event: {event.event_id}")
-                await self._consumer.acknowledge(event.event_id)
+                await self._consumer.acknowledge(event.event_id, event.priority)
                 return
 
             # Build context
@@ -253,21 +310,21 @@ class WorkerPool:
             await self._publish_result(event, result)
 
             # Acknowledge the original event
-            await self._consumer.acknowledge(event.event_id)
+            await self._consumer.acknowledge(event.event_id, event.priority)
 
         except AgentNotFoundError as e:
             logger.error(f"Agent not found for event {event.event_id}: {e}")
             self._events_processed += 1
             self._events_failed += 1
             await self._publish_error(event, str(e))
-            await self._consumer.acknowledge(event.event_id)
+            await self._consumer.acknowledge(event.event_id, event.priority)
 
         except Exception as e:
             logger.exception(f"Error processing event {event.event_id}: {e}")
             self._events_processed += 1
             self._events_failed += 1
             await self._publish_error(event, str(e))
-            await self._consumer.acknowledge(event.event_id)
+            await self._consumer.acknowledge(event.event_id, event.priority)
 
     async def _publish_result(
         self,
@@ -1,12 +1,26 @@
 """Audit trail generation for RLM exploration.
 
 Provides persistence and replay capabilities for exploration trajectories.
+
+Result payloads are stored gzip-compressed, one file per result. An SQLite
+index (index.db) records one row per result, indexed by task ID and
+timestamp, so saving is an append and lookups do not scan the whole index.
+Standalone trajectory files are recorded in a separate table so they count
+against the retention budget. An index.json written by earlier versions is
+imported on first use, along with any trajectory files next to it.
+
+Run ``python -m src.workers.rlm.audit compact`` to apply the retention
+policy (RLM_AUDIT_MAX_BYTES, RLM_AUDIT_RETENTION_DAYS).
 """
 
 from __future__ import annotations
 
+import argparse
+import gzip
 import json
 import logging
+import sqlite3
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +34,49 @@ from src.workers.rlm.models import (
 
 logger = logging.getLogger(__name__)
 
+# Index written by earlier versions, imported into the SQLite index
+LEGACY_INDEX_FILE = "index.json"
+
+# gzip level for result payloads (favours speed; JSON compresses well)
+COMPRESS_LEVEL = 6
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS audits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    query TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    findings_count INTEGER NOT NULL,
+    iterations INTEGER NOT NULL,
+    subcalls_used INTEGER NOT NULL,
+    wall_time_seconds REAL NOT NULL,
+    file_path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_audits_task_id ON audits(task_id, id);
+CREATE INDEX IF NOT EXISTS idx_audits_timestamp ON audits(timestamp);
+
+CREATE TABLE IF NOT EXISTS trajectories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    file_path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_trajectories_timestamp ON trajectories(timestamp);
+"""
+
+# Suffix of trajectory files written by earlier versions
+_LEGACY_TRAJECTORY_SUFFIX = "_trajectory.json"
+
+_ENTRY_COLUMNS = (
+    "task_id, timestamp, query, success, findings_count, iterations, "
+    "subcalls_used, wall_time_seconds, file_path, size_bytes"
+)
+
 
 @dataclass
 class AuditEntry:
@@ -35,6 +92,7 @@ class AuditEntry:
         subcalls_used: Total sub-calls made
         wall_time_seconds: Total wall time
         file_path: Path to saved audit file
+        size_bytes: Size of the saved audit file on disk
     """
 
     task_id: str
@@ -46,6 +104,7 @@ class AuditEntry:
     subcalls_used: int
     wall_time_seconds: float
     file_path: str
+    size_bytes: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -59,6 +118,7 @@ class AuditEntry:
             "subcalls_used": self.subcalls_used,
             "wall_time_seconds": self.wall_time_seconds,
             "file_path": self.file_path,
+            "size_bytes": self.size_bytes,
         }
 
     @classmethod
@@ -74,6 +134,23 @@ class AuditEntry:
             subcalls_used=data["subcalls_used"],
             wall_time_seconds=data["wall_time_seconds"],
             file_path=data["file_path"],
+            size_bytes=data.get("size_bytes", 0),
+        )
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> AuditEntry:
+        """Create from an index row."""
+        return cls(
+            task_id=row["task_id"],
+            timestamp=datetime.fromtimestamp(row["timestamp"], tz=timezone.utc),
+            query=row["query"],
+            success=bool(row["success"]),
+            findings_count=row["findings_count"],
+            iterations=row["iterations"],
+            subcalls_used=row["subcalls_used"],
+            wall_time_seconds=row["wall_time_seconds"],
+            file_path=row["file_path"],
+            size_bytes=row["size_bytes"],
         )
 
 
@@ -85,7 +162,7 @@ class RLMAuditor:
 
     Attributes:
         audit_dir: Directory for saving audit files
-        index_file: Path to the audit index file
+        index_file: Name of the SQLite index file
 
     Example:
         auditor = RLMAuditor(audit_dir="telemetry/rlm")
@@ -96,14 +173,16 @@ class RLMAuditor:
         # Load for analysis
         trajectory = auditor.load_trajectory(task_id)
 
-        # List all audits
-        entries = auditor.list_audits()
+        # List audits from the last day
+        entries = auditor.list_audits(since=datetime.now(timezone.utc) - timedelta(days=1))
+
+        # Enforce a 500 MB budget
+        auditor.compact(max_bytes=500 * 1024 * 1024)
     """
 
     audit_dir: str = "telemetry/rlm"
-    index_file: str = "index.json"
-    _index: list[AuditEntry] = field(default_factory=list, init=False)
-    _loaded: bool = field(default=False, init=False)
+    index_file: str = "index.db"
+    _conn: sqlite3.Connection | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Ensure audit directory exists."""
@@ -119,30 +198,117 @@ class RLMAuditor:
         """Get path to index file."""
         return Path(self.audit_dir) / self.index_file
 
-    def _load_index(self) -> None:
-        """Load audit index from disk."""
-        if self._loaded:
+    def _db(self) -> sqlite3.Connection:
+        """Open the index, creating and migrating it if needed."""
+        if self._conn is not None:
+            return self._conn
+
+        self._ensure_dir()
+        conn = sqlite3.connect(str(self._get_index_path()))
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA_SQL)
+        self._conn = conn
+        self._import_legacy_index()
+        return conn
+
+    def _import_legacy_index(self) -> None:
+        """Import an index.json written by earlier versions."""
+        legacy_path = Path(self.audit_dir) / LEGACY_INDEX_FILE
+        if not legacy_path.exists():
             return
 
-        index_path = self._get_index_path()
-        if index_path.exists():
-            try:
-                with open(index_path) as f:
-                    data = json.load(f)
-                    self._index = [AuditEntry.from_dict(e) for e in data]
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load audit index: {e}")
-                self._index = []
-        else:
-            self._index = []
+        try:
+            with open(legacy_path) as f:
+                entries = [AuditEntry.from_dict(e) for e in json.load(f)]
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Failed to import legacy audit index: {e}")
+            return
 
-        self._loaded = True
+        for entry in entries:
+            path = Path(entry.file_path)
+            if path.exists():
+                entry.size_bytes = path.stat().st_size
+            self._insert(entry, commit=False)
+
+        # Earlier versions never indexed trajectory files; stems are
+        # {date}_{time}_{task_id}_trajectory.json
+        trajectories = sorted(Path(self.audit_dir).glob(f"*{_LEGACY_TRAJECTORY_SUFFIX}"))
+        for path in trajectories:
+            stem = path.name.removesuffix(_LEGACY_TRAJECTORY_SUFFIX)
+            stat = path.stat()
+            self._insert_trajectory(
+                stem.split("_", 2)[-1], stat.st_mtime, path, stat.st_size, commit=False
+            )
+        self._db().commit()
+
+        legacy_path.rename(legacy_path.with_name(f"{LEGACY_INDEX_FILE}.migrated"))
+        logger.info(
+            f"Imported {len(entries)} entries and {len(trajectories)} trajectories "
+            "from legacy audit index"
+        )
+
+    def _insert(self, entry: AuditEntry, commit: bool = True) -> None:
+        """Append an entry to the index."""
+        conn = self._db()
+        conn.execute(
+            f"INSERT INTO audits ({_ENTRY_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.task_id,
+                entry.timestamp.timestamp(),
+                entry.query,
+                int(entry.success),
+                entry.findings_count,
+                entry.iterations,
+                entry.subcalls_used,
+                entry.wall_time_seconds,
+                entry.file_path,
+                entry.size_bytes,
+            ),
+        )
+        if commit:
+            conn.commit()
+
+    def _insert_trajectory(
+        self,
+        task_id: str,
+        timestamp: float,
+        file_path: Path,
+        size_bytes: int,
+        commit: bool = True,
+    ) -> None:
+        """Record a trajectory file so compaction accounts for it."""
+        conn = self._db()
+        conn.execute(
+            "INSERT INTO trajectories (task_id, timestamp, file_path, size_bytes) "
+            "VALUES (?, ?, ?, ?)",
+            (task_id, timestamp, str(file_path), size_bytes),
+        )
+        if commit:
+            conn.commit()
+
+    def _write_payload(self, filename: str, payload: dict[str, Any]) -> Path:
+        """Write a gzip-compressed JSON payload.
 
-    def _save_index(self) -> None:
-        """Save audit index to disk."""
-        index_path = self._get_index_path()
-        with open(index_path, "w") as f:
-            json.dump([e.to_dict() for e in self._index], f, indent=2)
+        Args:
+            filename: File name without the .json.gz suffix
+            payload: JSON-serializable data
+
+        Returns:
+            Path to the written file
+        """
+        file_path = self._ensure_dir() / f"{filename}.json.gz"
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        tmp_path.write_bytes(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+        tmp_path.replace(file_path)
+        return file_path
+
+    @staticmethod
+    def _file_stem(timestamp: datetime, task_id: str) -> str:
+        """Build a unique, filesystem-safe file stem for a task."""
+        safe_task_id = task_id.replace("/", "_").replace("\\", "_")
+        return f"{timestamp.strftime('%Y%m%d_%H%M%S_%f')}_{safe_task_id}"
 
     def save_result(self, result: RLMResult) -> str:
         """Save an RLM result to the audit trail.
@@ -153,20 +319,11 @@ class RLMAuditor:
         Returns:
             Path to the saved file
         """
-        self._ensure_dir()
-        self._load_index()
-
-        # Generate filename
         timestamp = datetime.now(timezone.utc)
-        safe_task_id = result.task_id.replace("/", "_").replace("\\", "_")
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_task_id}.json"
-        file_path = Path(self.audit_dir) / filename
-
-        # Save full result
-        with open(file_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
+        file_path = self._write_payload(
+            self._file_stem(timestamp, result.task_id), result.to_dict()
+        )
 
-        # Create index entry
         entry = AuditEntry(
             task_id=result.task_id,
             timestamp=timestamp,
@@ -177,10 +334,9 @@ class RLMAuditor:
             subcalls_used=result.usage.subcall_count,
             wall_time_seconds=result.usage.wall_time_seconds,
             file_path=str(file_path),
+            size_bytes=file_path.stat().st_size,
         )
-
-        self._index.append(entry)
-        self._save_index()
+        self._insert(entry)
 
         logger.info(f"Saved audit for task {result.task_id} to {file_path}")
 
@@ -189,6 +345,10 @@ class RLMAuditor:
     def save_trajectory(self, trajectory: ExplorationTrajectory, task_id: str) -> str:
         """Save just an exploration trajectory.
 
+        Trajectory files are recorded in the trajectories table so that
+        compact() counts them against the size budget. They are not
+        returned by list_audits() or load_result().
+
         Args:
             trajectory: The trajectory to save
             task_id: Task identifier
@@ -196,16 +356,14 @@ class RLMAuditor:
         Returns:
             Path to the saved file
         """
-        self._ensure_dir()
-        self._load_index()
-
         timestamp = datetime.now(timezone.utc)
-        safe_task_id = task_id.replace("/", "_").replace("\\", "_")
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_task_id}_trajectory.json"
-        file_path = Path(self.audit_dir) / filename
+        file_path = self._write_payload(
+            f"{self._file_stem(timestamp, task_id)}_trajectory", trajectory.to_dict()
+        )
 
-        with open(file_path, "w") as f:
-            json.dump(trajectory.to_dict(), f, indent=2)
+        self._insert_trajectory(
+            task_id, timestamp.timestamp(), file_path, file_path.stat().st_size
+        )
 
         logger.info(f"Saved trajectory for task {task_id} to {file_path}")
 
@@ -220,14 +378,7 @@ class RLMAuditor:
         Returns:
             RLMResult if found, None otherwise
         """
-        self._load_index()
-
-        # Find entry in index
-        entry = None
-        for e in reversed(self._index):  # Most recent first
-            if e.task_id == task_id:
-                entry = e
-                break
+        entry = self.get_audit_by_task_id(task_id)
 
         if entry is None:
             logger.warning(f"No audit found for task {task_id}")
@@ -238,6 +389,8 @@ class RLMAuditor:
     def load_result_from_file(self, file_path: str) -> RLMResult | None:
         """Load an RLM result from a specific file.
 
+        Reads both compressed (.json.gz) and plain (.json) audit files.
+
         Args:
             file_path: Path to the audit file
 
@@ -250,10 +403,14 @@ class RLMAuditor:
             return None
 
         try:
-            with open(path) as f:
-                data = json.load(f)
-                return RLMResult.from_dict(data)
-        except (json.JSONDecodeError, KeyError) as e:
+            if path.suffix == ".gz":
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                with open(path) as f:
+                    data = json.load(f)
+            return RLMResult.from_dict(data)
+        except (json.JSONDecodeError, KeyError, OSError) as e:
             logger.error(f"Failed to load audit from {file_path}: {e}")
             return None
 
@@ -275,30 +432,44 @@ class RLMAuditor:
         self,
         limit: int | None = None,
         success_only: bool = False,
+        since: datetime | None = None,
+        until: datetime | None = None,
     ) -> list[AuditEntry]:
         """List audit entries.
 
         Args:
             limit: Maximum number to return (newest first)
             success_only: Only return successful explorations
+            since: Only return audits saved at or after this time
+            until: Only return audits saved before this time
 
         Returns:
             List of AuditEntry objects
         """
-        self._load_index()
-
-        entries = list(reversed(self._index))  # Newest first
-
+        clauses: list[str] = []
+        params: list[Any] = []
         if success_only:
-            entries = [e for e in entries if e.success]
-
+            clauses.append("success = 1")
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until.timestamp())
+
+        sql = f"SELECT {_ENTRY_COLUMNS} FROM audits"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC"
         if limit:
-            entries = entries[:limit]
+            sql += " LIMIT ?"
+            params.append(limit)
 
-        return entries
+        rows = self._db().execute(sql, params).fetchall()
+        return [AuditEntry.from_row(row) for row in rows]
 
     def get_audit_by_task_id(self, task_id: str) -> AuditEntry | None:
-        """Get audit entry by task ID.
+        """Get the most recent audit entry for a task ID.
 
         Args:
             task_id: Task identifier
@@ -306,12 +477,12 @@ class RLMAuditor:
         Returns:
             AuditEntry if found, None otherwise
         """
-        self._load_index()
-
-        for entry in reversed(self._index):
-            if entry.task_id == task_id:
-                return entry
-        return None
+        row = self._db().execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM audits WHERE task_id = ? "
+            "ORDER BY id DESC LIMIT 1",
+            (task_id,),
+        ).fetchone()
+        return AuditEntry.from_row(row) if row else None
 
     def delete_audit(self, task_id: str) -> bool:
         """Delete an audit entry and its file.
@@ -322,23 +493,20 @@ class RLMAuditor:
         Returns:
             True if deleted, False if not found
         """
-        self._load_index()
-
-        for i, entry in enumerate(self._index):
-            if entry.task_id == task_id:
-                # Delete file
-                path = Path(entry.file_path)
-                if path.exists():
-                    path.unlink()
+        conn = self._db()
+        row = conn.execute(
+            "SELECT id, file_path FROM audits WHERE task_id = ? ORDER BY id LIMIT 1",
+            (task_id,),
+        ).fetchone()
+        if row is None:
+            return False
 
-                # Remove from index
-                del self._index[i]
-                self._save_index()
+        Path(row["file_path"]).unlink(missing_ok=True)
+        conn.execute("DELETE FROM audits WHERE id = ?", (row["id"],))
+        conn.commit()
 
-                logger.info(f"Deleted audit for task {task_id}")
-                return True
-
-        return False
+        logger.info(f"Deleted audit for task {task_id}")
+        return True
 
     def get_stats(self) -> dict[str, Any]:
         """Get audit statistics.
@@ -346,9 +514,15 @@ class RLMAuditor:
         Returns:
             Dictionary with audit statistics
         """
-        self._load_index()
-
-        if not self._index:
+        row = self._db().execute(
+            "SELECT COUNT(*) AS total, SUM(success) AS successful, "
+            "SUM(iterations) AS iterations, SUM(wall_time_seconds) AS wall_time, "
+            "SUM(subcalls_used) AS subcalls, SUM(findings_count) AS findings, "
+            "SUM(size_bytes) AS size_bytes FROM audits"
+        ).fetchone()
+        total = row["total"]
+
+        if not total:
             return {
                 "total_audits": 0,
                 "successful": 0,
@@ -358,44 +532,177 @@ class RLMAuditor:
                 "avg_wall_time": 0.0,
             }
 
-        successful = sum(1 for e in self._index if e.success)
-        total_iterations = sum(e.iterations for e in self._index)
-        total_wall_time = sum(e.wall_time_seconds for e in self._index)
-
+        successful = row["successful"]
         return {
-            "total_audits": len(self._index),
+            "total_audits": total,
             "successful": successful,
-            "failed": len(self._index) - successful,
-            "success_rate": (successful / len(self._index)) * 100,
-            "avg_iterations": total_iterations / len(self._index),
-            "avg_wall_time": total_wall_time / len(self._index),
-            "total_subcalls": sum(e.subcalls_used for e in self._index),
-            "total_findings": sum(e.findings_count for e in self._index),
+            "failed": total - successful,
+            "success_rate": (successful / total) * 100,
+            "avg_iterations": row["iterations"] / total,
+            "avg_wall_time": row["wall_time"] / total,
+            "total_subcalls": row["subcalls"],
+            "total_findings": row["findings"],
+            "total_bytes": row["size_bytes"],
         }
 
+    def compact(
+        self,
+        max_bytes: int | None = None,
+        max_age_days: float | None = None,
+    ) -> dict[str, int]:
+        """Apply the retention policy to indexed results and trajectories.
+
+        Drops index rows whose files are gone, deletes files older than
+        max_age_days, then deletes the oldest remaining files until the
+        indexed results and trajectories fit in max_bytes. Finally reclaims
+        index space.
+
+        Args:
+            max_bytes: Size budget for audit files (None for no limit)
+            max_age_days: Maximum file age in days (None for no limit)
+
+        Returns:
+            Dictionary with deleted, missing, bytes_freed, remaining and
+            total_bytes, counting results and trajectories together
+        """
+        conn = self._db()
+        rows = conn.execute(
+            "SELECT 'audits' AS source, id, timestamp, file_path, size_bytes FROM audits "
+            "UNION ALL "
+            "SELECT 'trajectories', id, timestamp, file_path, size_bytes FROM trajectories "
+            "ORDER BY timestamp DESC, id DESC"
+        ).fetchall()
+
+        cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+        kept_bytes = 0
+        doomed: list[sqlite3.Row] = []
+        missing: list[sqlite3.Row] = []
+        for row in rows:
+            if not Path(row["file_path"]).exists():
+                missing.append(row)
+            elif (cutoff is not None and row["timestamp"] < cutoff) or (
+                max_bytes is not None and kept_bytes + row["size_bytes"] > max_bytes
+            ):
+                doomed.append(row)
+            else:
+                kept_bytes += row["size_bytes"]
+
+        bytes_freed = 0
+        for row in doomed:
+            Path(row["file_path"]).unlink(missing_ok=True)
+            bytes_freed += row["size_bytes"]
+
+        deleted = missing + doomed
+        for source in ("audits", "trajectories"):
+            conn.executemany(
+                f"DELETE FROM {source} WHERE id = ?",
+                [(row["id"],) for row in deleted if row["source"] == source],
+            )
+        conn.commit()
+        if deleted:
+            conn.execute("VACUUM")
+
+        stats = {
+            "deleted": len(doomed),
+            "missing": len(missing),
+            "bytes_freed": bytes_freed,
+            "remaining": len(rows) - len(deleted),
+            "total_bytes": kept_bytes,
+        }
+        logger.info(
+            f"Compacted audit dir {self.audit_dir}: deleted {len(doomed)} files "
+            f"({bytes_freed} bytes), dropped {len(missing)} missing entries"
+        )
+        return stats
+
     def clear_all(self) -> int:
-        """Clear all audit files and index.
+        """Clear all audit and trajectory files and the index.
 
         Returns:
-            Number of entries cleared
+            Number of audit entries cleared
         """
-        self._load_index()
-        count = len(self._index)
+        conn = self._db()
+        rows = conn.execute("SELECT file_path FROM audits").fetchall()
+        trajectories = conn.execute("SELECT file_path FROM trajectories").fetchall()
 
         # Delete all files
-        for entry in self._index:
-            path = Path(entry.file_path)
-            if path.exists():
-                path.unlink()
+        for row in [*rows, *trajectories]:
+            Path(row["file_path"]).unlink(missing_ok=True)
 
         # Clear index
-        self._index = []
-        self._save_index()
+        conn.execute("DELETE FROM audits")
+        conn.execute("DELETE FROM trajectories")
+        conn.commit()
 
-        logger.info(f"Cleared {count} audit entries")
-        return count
+        logger.info(f"Cleared {len(rows)} audit entries")
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the index connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed audits."""
+        return self._db().execute("SELECT COUNT(*) FROM audits").fetchone()[0]
 
     def __repr__(self) -> str:
         """Return string representation."""
-        self._load_index()
-        return f"RLMAuditor(dir={self.audit_dir}, entries={len(self._index)})"
+        return f"RLMAuditor(dir={self.audit_dir}, entries={len(self)})"
+
+
+def _parse_size(value: str) -> int:
+    """Parse a byte size such as 500M or 2G."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    value = value.strip().upper().removesuffix("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run audit maintenance commands.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    from src.workers.rlm.config import RLMConfig
+
+    config = RLMConfig.from_env()
+    parser = argparse.ArgumentParser(prog="python -m src.workers.rlm.audit")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compact_parser = subparsers.add_parser(
+        "compact", help="Delete old results to enforce the retention policy"
+    )
+    compact_parser.add_argument("--audit-dir", default=config.audit_dir)
+    compact_parser.add_argument(
+        "--max-bytes",
+        type=_parse_size,
+        default=config.audit_max_bytes or None,
+        help="Size budget, e.g. 500M (default: RLM_AUDIT_MAX_BYTES)",
+    )
+    compact_parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=config.audit_retention_days or None,
+        help="Maximum result age (default: RLM_AUDIT_RETENTION_DAYS)",
+    )
+
+    args = parser.parse_args(argv)
+
+    auditor = RLMAuditor(audit_dir=args.audit_dir)
+    try:
+        stats = auditor.compact(max_bytes=args.max_bytes, max_age_days=args.max_age_days)
+    finally:
+        auditor.close()
+    print(json.dumps(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -22,6 +22,8 @@ class RLMConfig:
         max_tokens_per_subcall: Token limit per sub-query
         cache_enabled: Whether to enable sub-call caching
         audit_dir: Directory for audit logs
+        audit_max_bytes: Size budget for saved audits (0 for no limit)
+        audit_retention_days: Maximum age of saved audits (0 for no limit)
         repo_root: Root path of the repository being explored
     """
 
@@ -32,6 +34,8 @@ class RLMConfig:
     max_tokens_per_subcall: int = 500
     cache_enabled: bool = True
     audit_dir: str = "telemetry/rlm"
+    audit_max_bytes: int = 0
+    audit_retention_days: int = 0
     repo_root: str = "."
 
     @classmethod
@@ -46,6 +50,8 @@ class RLMConfig:
             RLM_MAX_TOKENS_PER_SUBCALL: Token limit per call (default: 500)
             RLM_CACHE_ENABLED: Enable caching (default: true)
             RLM_AUDIT_DIR: Audit log directory (default: telemetry/rlm)
+            RLM_AUDIT_MAX_BYTES: Audit size budget in bytes (default: 0, no limit)
+            RLM_AUDIT_RETENTION_DAYS: Audit retention in days (default: 0, no limit)
             RLM_REPO_ROOT: Repository root path (default: .)
 
         Returns:
@@ -59,6 +65,8 @@ class RLMConfig:
             max_tokens_per_subcall=int(os.getenv("RLM_MAX_TOKENS_PER_SUBCALL", "500")),
             cache_enabled=os.getenv("RLM_CACHE_ENABLED", "true").lower() == "true",
             audit_dir=os.getenv("RLM_AUDIT_DIR", "telemetry/rlm"),
+            audit_max_bytes=int(os.getenv("RLM_AUDIT_MAX_BYTES", "0")),
+            audit_retention_days=int(os.getenv("RLM_AUDIT_RETENTION_DAYS", "0")),
             repo_root=os.getenv("RLM_REPO_ROOT", "."),
         )
 
@@ -97,6 +105,12 @@ class RLMConfig:
         if self.max_tokens_per_subcall < 1:
             errors.append("max_tokens_per_subcall must be at least 1")
 
+        if self.audit_max_bytes < 0:
+            errors.append("audit_max_bytes cannot be negative")
+
+        if self.audit_retention_days < 0:
+            errors.append("audit_retention_days cannot be negative")
+
         if not self.model:
             errors.append("model cannot be empty")
 
@@ -116,5 +130,7 @@ class RLMConfig:
             "max_tokens_per_subcall": self.max_tokens_per_subcall,
             "cache_enabled": self.cache_enabled,
             "audit_dir": self.audit_dir,
+            "audit_max_bytes": self.audit_max_bytes,
+            "audit_retention_days": self.audit_retention_days,
             "repo_root": self.repo_root,
         }
@@ -14,12 +14,16 @@ public classes:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import shutil
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -28,6 +32,8 @@ from src.orchestrator.api.models.llm_config import AgentRole
 from src.workers.swarm.models import ReviewFinding, ReviewerResult, Severity
 
 if TYPE_CHECKING:
+    import httpx
+
     from src.infrastructure.llm.factory import LLMClientFactory
     from src.workers.swarm.reviewers.base import SpecializedReviewer
 
@@ -44,6 +50,16 @@ ALLOWED_EXTENSIONS: frozenset[str] = frozenset(
 MAX_FILE_SIZE_BYTES: int = 500 * 1024  # 500 KB
 MAX_TOTAL_LINES: int = 5000
 
+GITHUB_API_URL: str = "https://api.github.com"
+GITHUB_RAW_URL: str = "https://raw.githubusercontent.com"
+
+GITHUB_FETCH_CONCURRENCY: int = 8  # raw file downloads in flight per extraction
+GITHUB_CLONE_THRESHOLD: int = 300  # candidate files above which to shallow-clone
+GITHUB_CLONE_TIMEOUT_SECONDS: float = 120.0
+DEFAULT_GITHUB_CACHE_DIR: str = "/tmp/asdlc-swarm-cache"
+GITHUB_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024  # 2 GiB of blobs and clones
+GITHUB_CACHE_PRUNE_INTERVAL_SECONDS: float = 300.0
+
 REVIEW_JSON_SCHEMA: str = """{
   "findings": [
     {
@@ -61,6 +77,12 @@ REVIEW_JSON_SCHEMA: str = """{
   ]
 }"""
 
+# GitHub owner and repository names; anything else is never used in a path
+_GITHUB_OWNER_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+_GITHUB_REPO_RE = re.compile(r"^[A-Za-z0-9._-]{1,100}$")
+
+_SYMLINK_MODE: str = "120000"
+
 _SEVERITY_VALUES: frozenset[str] = frozenset(
     {s.value for s in Severity}
 )
@@ -111,13 +133,71 @@ class CodeExtractor:
     Applies extension filtering, file-size limits, and a total-line cap to
     prevent excessive LLM costs.
 
+    GitHub files are downloaded over one pooled HTTP client with a bounded
+    number of requests in flight, and cached on disk by git blob SHA, so
+    unchanged files are never downloaded twice.  Concurrent extractions of
+    the same repository share in-flight downloads.  Repositories with more
+    than *clone_threshold* candidate files (or a truncated tree listing)
+    are shallow-cloned into the cache directory instead, and later reviews
+    only fetch when HEAD has moved.
+
+    The cache directory is kept under *cache_max_bytes*: at most every
+    :data:`GITHUB_CACHE_PRUNE_INTERVAL_SECONDS`, a GitHub extraction evicts
+    the least recently used blobs and clones until the total fits.  Clones
+    in use by this process are never evicted.
+
     Args:
         workspace_root: Root directory prepended to local ``target_path``
             values.  Defaults to ``"/app/workspace"``.
+        cache_dir: Directory for the blob cache and shallow clones.
+            Defaults to ``SWARM_GITHUB_CACHE_DIR`` or
+            :data:`DEFAULT_GITHUB_CACHE_DIR`.
+        http_client: HTTP client for GitHub requests.  Created lazily and
+            reused across extractions if omitted.
+        fetch_concurrency: Maximum raw file downloads in flight.
+        clone_threshold: Candidate file count above which a shallow clone
+            is used.  Defaults to ``SWARM_GITHUB_CLONE_THRESHOLD`` or
+            :data:`GITHUB_CLONE_THRESHOLD`.
+        cache_max_bytes: Size the cache directory is pruned down to.
+            Defaults to ``SWARM_GITHUB_CACHE_MAX_BYTES`` or
+            :data:`GITHUB_CACHE_MAX_BYTES`.
     """
 
-    def __init__(self, workspace_root: str = "/app/workspace") -> None:
+    def __init__(
+        self,
+        workspace_root: str = "/app/workspace",
+        cache_dir: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        fetch_concurrency: int = GITHUB_FETCH_CONCURRENCY,
+        clone_threshold: int | None = None,
+        cache_max_bytes: int | None = None,
+    ) -> None:
         self._workspace_root = workspace_root
+        self._cache_dir = Path(
+            cache_dir
+            or os.getenv("SWARM_GITHUB_CACHE_DIR", DEFAULT_GITHUB_CACHE_DIR)
+        )
+        self._client = http_client
+        self._fetch_concurrency = max(1, fetch_concurrency)
+        self._clone_threshold = (
+            clone_threshold
+            if clone_threshold is not None
+            else int(os.getenv("SWARM_GITHUB_CLONE_THRESHOLD", str(GITHUB_CLONE_THRESHOLD)))
+        )
+        self._cache_max_bytes = (
+            cache_max_bytes
+            if cache_max_bytes is not None
+            else int(os.getenv("SWARM_GITHUB_CACHE_MAX_BYTES", str(GITHUB_CACHE_MAX_BYTES)))
+        )
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        self._clone_locks: dict[str, asyncio.Lock] = {}
+        self._last_prune: float | None = None
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     # -- public API ---------------------------------------------------------
 
@@ -135,9 +215,79 @@ class CodeExtractor:
             A :class:`CodeContext` containing the extracted files.
         """
         if target_path.startswith("https://github.com/"):
-            return await self._extract_github(target_path)
+            context = await self._extract_github(target_path)
+            await self._maybe_prune_cache()
+            return context
         return await self._extract_local(target_path)
 
+    async def prune_cache(self) -> int:
+        """Evict least recently used blobs and clones over the size limit.
+
+        Entries are ordered by last use (the later of atime and mtime; cache
+        hits touch both).  Clones are removed under their clone lock, and
+        clones locked at scan time are skipped.
+
+        Returns:
+            Number of bytes freed.
+        """
+        entries, total = await asyncio.to_thread(self._scan_cache)
+        freed = 0
+        for _, size, path, clone_key in entries:
+            if total - freed <= self._cache_max_bytes:
+                break
+            if clone_key is None:
+                path.unlink(missing_ok=True)
+            else:
+                lock = self._clone_locks.get(clone_key)
+                if lock is not None and lock.locked():
+                    continue
+                async with self._clone_locks.setdefault(clone_key, asyncio.Lock()):
+                    await asyncio.to_thread(shutil.rmtree, path, True)
+            freed += size
+        if freed:
+            logger.info(
+                "Pruned %d bytes from GitHub cache %s", freed, self._cache_dir
+            )
+        return freed
+
+    def _scan_cache(self) -> tuple[list[tuple[float, int, Path, str | None]], int]:
+        """List cache entries oldest first, with the total cache size.
+
+        Each entry is ``(last_used, size, path, clone_key)`` where
+        *clone_key* is ``"owner/repo"`` for clones and ``None`` for blobs.
+        """
+        entries: list[tuple[float, int, Path, str | None]] = []
+        blobs_dir = self._cache_dir / "blobs"
+        if blobs_dir.is_dir():
+            for path in blobs_dir.glob("*/*"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((max(st.st_atime, st.st_mtime), st.st_size, path, None))
+        clones_dir = self._cache_dir / "clones"
+        if clones_dir.is_dir():
+            for path in clones_dir.glob("*/*"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                size = sum(
+                    _file_size(os.path.join(root, name))
+                    for root, _, names in os.walk(path)
+                    for name in names
+                )
+                entries.append(
+                    (
+                        max(st.st_atime, st.st_mtime),
+                        size,
+                        path,
+                        f"{path.parent.name}/{path.name}",
+                    )
+                )
+        entries.sort(key=lambda entry: entry[0])
+        return entries, sum(entry[1] for entry in entries)
+
     # -- local extraction ---------------------------------------------------
 
     async def _extract_local(self, target_path: str) -> CodeContext:
@@ -237,15 +387,15 @@ class CodeExtractor:
             return context
 
         tree_url = (
-            f"https://api.github.com/repos/{owner}/{repo}"
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}"
             f"/git/trees/HEAD?recursive=1"
         )
 
+        client = self._get_client()
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.get(tree_url)
-                resp.raise_for_status()
-                tree_data = resp.json()
+            resp = await client.get(tree_url)
+            resp.raise_for_status()
+            tree_data = resp.json()
         except httpx.HTTPError as exc:
             context.extraction_errors.append(
                 f"GitHub tree fetch failed: {exc}"
@@ -253,49 +403,384 @@ class CodeExtractor:
             logger.warning("GitHub tree fetch failed for %s: %s", url, exc)
             return context
 
-        tree_entries = tree_data.get("tree", [])
-        blob_paths = [
-            entry["path"]
+        entries = self._candidate_entries(tree_data.get("tree", []))
+
+        if tree_data.get("truncated") or len(entries) > self._clone_threshold:
+            if await self._extract_from_clone(
+                owner, repo, tree_data.get("sha", ""), context
+            ):
+                return context
+            logger.info(
+                "Shallow clone of %s/%s unavailable, fetching files over HTTP",
+                owner,
+                repo,
+            )
+
+        await self._fetch_files(client, owner, repo, entries, context)
+        return context
+
+    async def _maybe_prune_cache(self) -> None:
+        """Prune the cache if the prune interval has elapsed."""
+        now = time.monotonic()
+        if (
+            self._last_prune is not None
+            and now - self._last_prune < GITHUB_CACHE_PRUNE_INTERVAL_SECONDS
+        ):
+            return
+        self._last_prune = now
+        try:
+            await self.prune_cache()
+        except OSError as exc:
+            logger.warning("GitHub cache prune failed: %s", exc)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self._fetch_concurrency * 2,
+                    max_keepalive_connections=self._fetch_concurrency,
+                ),
+            )
+        return self._client
+
+    @staticmethod
+    def _candidate_entries(tree_entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Filter tree entries down to reviewable blobs, keeping tree order.
+
+        Args:
+            tree_entries: Entries from the git tree API or ``git ls-tree``.
+
+        Returns:
+            Blob entries with an allowed extension and size.  Symlinks are
+            blobs too and are skipped.
+        """
+        return [
+            entry
             for entry in tree_entries
             if entry.get("type") == "blob"
+            and entry.get("mode") != _SYMLINK_MODE
             and Path(entry["path"]).suffix in ALLOWED_EXTENSIONS
             and entry.get("size", 0) <= MAX_FILE_SIZE_BYTES
         ]
 
-        for blob_path in blob_paths:
-            if context.total_lines >= MAX_TOTAL_LINES:
-                break
+    @staticmethod
+    def _add_content(context: CodeContext, path: str, content: str) -> bool:
+        """Add a file to *context* unless it would exceed the line cap.
 
-            raw_url = (
-                f"https://raw.githubusercontent.com/{owner}/{repo}"
-                f"/HEAD/{blob_path}"
-            )
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    resp = await client.get(raw_url)
-                    resp.raise_for_status()
-                    content = resp.text
-            except httpx.HTTPError as exc:
-                context.extraction_errors.append(
-                    f"Failed to fetch {blob_path}: {exc}"
+        Args:
+            context: The :class:`CodeContext` to populate.
+            path: Path recorded for the file.
+            content: File content.
+
+        Returns:
+            ``False`` if the line cap was reached and extraction should stop.
+        """
+        line_count = content.count("\n") + (
+            1 if content and not content.endswith("\n") else 0
+        )
+        if context.total_lines + line_count > MAX_TOTAL_LINES:
+            return False
+
+        context.files.append(
+            CodeFile(path=path, content=content, lines=line_count)
+        )
+        context.total_lines += line_count
+        return context.total_lines < MAX_TOTAL_LINES
+
+    # -- GitHub: HTTP fetch with blob cache -----------------------------------
+
+    async def _fetch_files(
+        self,
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        entries: list[dict[str, Any]],
+        context: CodeContext,
+    ) -> None:
+        """Download files concurrently and add them to *context* in tree order.
+
+        A sliding window keeps up to ``fetch_concurrency`` downloads in
+        flight ahead of the file being added, so the result is the same as
+        a sequential fetch, and at most one window is wasted once the line
+        cap is reached.
+
+        Args:
+            client: The pooled HTTP client.
+            owner: Repository owner.
+            repo: Repository name.
+            entries: Candidate blob entries in tree order.
+            context: The :class:`CodeContext` to populate.
+        """
+        import httpx
+
+        remaining = iter(entries)
+        window: deque[tuple[str, asyncio.Task[str]]] = deque()
+
+        def fill_window() -> None:
+            while len(window) < self._fetch_concurrency:
+                entry = next(remaining, None)
+                if entry is None:
+                    return
+                task = asyncio.ensure_future(
+                    self._read_blob(client, owner, repo, entry)
                 )
-                logger.warning(
-                    "Failed to fetch %s from GitHub: %s", blob_path, exc
+                window.append((entry["path"], task))
+
+        fill_window()
+        try:
+            while window:
+                blob_path, task = window.popleft()
+                try:
+                    content = await task
+                except httpx.HTTPError as exc:
+                    context.extraction_errors.append(
+                        f"Failed to fetch {blob_path}: {exc}"
+                    )
+                    logger.warning(
+                        "Failed to fetch %s from GitHub: %s", blob_path, exc
+                    )
+                    fill_window()
+                    continue
+
+                if not self._add_content(context, blob_path, content):
+                    break
+                fill_window()
+        finally:
+            for _, task in window:
+                task.cancel()
+
+    async def _read_blob(
+        self,
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        entry: dict[str, Any],
+    ) -> str:
+        """Return a file's content from the blob cache or GitHub.
+
+        Args:
+            client: The pooled HTTP client.
+            owner: Repository owner.
+            repo: Repository name.
+            entry: Tree entry with ``path`` and (normally) ``sha``.
+
+        Returns:
+            The decoded file content.
+
+        Raises:
+            httpx.HTTPError: If the download fails.
+        """
+        sha = entry.get("sha")
+        if not sha:
+            data = await self._download_blob(client, owner, repo, entry["path"], None)
+            return data.decode("utf-8", errors="replace")
+
+        data = self._cache_get(sha)
+        if data is None:
+            download = self._inflight.get(sha)
+            if download is None:
+                download = asyncio.ensure_future(
+                    self._download_blob(client, owner, repo, entry["path"], sha)
                 )
-                continue
+                self._inflight[sha] = download
+                download.add_done_callback(
+                    lambda done: self._inflight_done(sha, done)
+                )
+            # Shielded so one caller giving up does not cancel the others
+            data = await asyncio.shield(download)
+        return data.decode("utf-8", errors="replace")
+
+    def _inflight_done(self, sha: str, download: asyncio.Future[bytes]) -> None:
+        """Forget a finished shared download."""
+        self._inflight.pop(sha, None)
+        if not download.cancelled():
+            # Mark the exception retrieved even if every waiter gave up
+            download.exception()
+
+    async def _download_blob(
+        self,
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        blob_path: str,
+        sha: str | None,
+    ) -> bytes:
+        """Download a raw file and cache it if it matches *sha*.
 
-            line_count = content.count("\n") + (
-                1 if content and not content.endswith("\n") else 0
-            )
-            if context.total_lines + line_count > MAX_TOTAL_LINES:
-                break
+        Args:
+            client: The pooled HTTP client.
+            owner: Repository owner.
+            repo: Repository name.
+            blob_path: Path of the file in the repository.
+            sha: Expected git blob SHA, or ``None`` to skip caching.
 
-            context.files.append(
-                CodeFile(path=blob_path, content=content, lines=line_count)
-            )
-            context.total_lines += line_count
+        Returns:
+            The raw file bytes.
 
-        return context
+        Raises:
+            httpx.HTTPError: If the download fails.
+        """
+        raw_url = f"{GITHUB_RAW_URL}/{owner}/{repo}/HEAD/{blob_path}"
+        resp = await client.get(raw_url)
+        resp.raise_for_status()
+        data = resp.content
+
+        if sha is not None:
+            if _git_blob_sha(data) == sha:
+                self._cache_put(sha, data)
+            else:
+                # HEAD moved since the tree was listed; use but do not cache
+                logger.debug("Blob %s changed since tree fetch, not caching", blob_path)
+        return data
+
+    def _blob_cache_path(self, sha: str) -> Path:
+        """Return the cache file path for a blob SHA."""
+        return self._cache_dir / "blobs" / sha[:2] / sha
+
+    def _cache_get(self, sha: str) -> bytes | None:
+        """Read a cached blob, or ``None`` if it is not cached."""
+        path = self._blob_cache_path(sha)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        _touch(path)
+        return data
+
+    def _cache_put(self, sha: str, data: bytes) -> None:
+        """Write a blob to the cache atomically; failures are only logged."""
+        path = self._blob_cache_path(sha)
+        tmp_path = path.with_name(f"{sha}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not cache blob %s: %s", sha, exc)
+            tmp_path.unlink(missing_ok=True)
+
+    # -- GitHub: shallow clone ------------------------------------------------
+
+    @staticmethod
+    def _clone_url(owner: str, repo: str) -> str:
+        """Return the git URL to clone a repository from."""
+        return f"https://github.com/{owner}/{repo}.git"
+
+    async def _extract_from_clone(
+        self,
+        owner: str,
+        repo: str,
+        tree_sha: str,
+        context: CodeContext,
+    ) -> bool:
+        """Extract files from a cached shallow clone, cloning or updating it.
+
+        The clone is only fetched when its HEAD tree differs from
+        *tree_sha*.  Files are read in ``git ls-tree`` order, which matches
+        the tree API.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            tree_sha: Root tree SHA of the remote HEAD from the tree API.
+            context: The :class:`CodeContext` to populate.
+
+        Returns:
+            ``True`` if the clone was used, ``False`` to fall back to HTTP.
+        """
+        if shutil.which("git") is None:
+            return False
+
+        clone_dir = self._cache_dir / "clones" / owner / repo
+        lock = self._clone_locks.setdefault(f"{owner}/{repo}", asyncio.Lock())
+        async with lock:
+            if (clone_dir / ".git").is_dir():
+                head_tree = await self._git("-C", str(clone_dir), "rev-parse", "HEAD^{tree}")
+                if head_tree != tree_sha:
+                    fetched = await self._git(
+                        "-C", str(clone_dir), "fetch", "--quiet", "--depth", "1", "origin", "HEAD"
+                    )
+                    if fetched is None or await self._git(
+                        "-C", str(clone_dir), "reset", "--quiet", "--hard", "FETCH_HEAD"
+                    ) is None:
+                        return False
+            else:
+                shutil.rmtree(clone_dir, ignore_errors=True)
+                clone_dir.parent.mkdir(parents=True, exist_ok=True)
+                cloned = await self._git(
+                    "clone", "--quiet", "--depth", "1", "--single-branch",
+                    self._clone_url(owner, repo), str(clone_dir),
+                )
+                if cloned is None:
+                    shutil.rmtree(clone_dir, ignore_errors=True)
+                    return False
+
+            listing = await self._git("-C", str(clone_dir), "ls-tree", "-r", "--long", "-z", "HEAD")
+            if listing is None:
+                return False
+
+            root = clone_dir.resolve()
+            for entry in self._candidate_entries(_parse_ls_tree(listing)):
+                file_path = (clone_dir / entry["path"]).resolve()
+                if not file_path.is_relative_to(root):
+                    context.extraction_errors.append(
+                        f"Skipped {entry['path']}: resolves outside the repository"
+                    )
+                    continue
+                try:
+                    content = file_path.read_text(
+                        encoding="utf-8", errors="replace"
+                    )
+                except OSError as exc:
+                    context.extraction_errors.append(
+                        f"Could not read {entry['path']}: {exc}"
+                    )
+                    continue
+                if not self._add_content(context, entry["path"], content):
+                    break
+
+            _touch(clone_dir)
+
+        logger.info("Extracted %s/%s from shallow clone", owner, repo)
+        return True
+
+    @staticmethod
+    async def _git(*args: str) -> str | None:
+        """Run a git command, returning stdout or ``None`` on failure.
+
+        Args:
+            *args: Arguments after ``git``.
+
+        Returns:
+            Stripped stdout, or ``None`` if git failed or timed out.
+        """
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=GITHUB_CLONE_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.warning("git %s timed out", args[0] if args else "")
+            return None
+        if proc.returncode != 0:
+            logger.warning(
+                "git %s failed: %s", " ".join(args), stderr.decode(errors="replace").strip()
+            )
+            return None
+        return stdout.decode(errors="replace").strip()
 
     @staticmethod
     def _parse_github_url(url: str) -> tuple[str, str]:
@@ -308,14 +793,70 @@ class CodeExtractor:
 
         Returns:
             A ``(owner, repo)`` tuple.  Both elements are empty strings if
-            parsing fails.
+            parsing fails or either name is not a valid GitHub name, since
+            they become cache directory path components.
         """
         # Strip trailing slashes and optional segments after repo name
         parts = url.rstrip("/").split("/")
         # Expected: ['https:', '', 'github.com', owner, repo, ...]
-        if len(parts) >= 5:
-            return parts[3], parts[4]
-        return "", ""
+        if len(parts) < 5:
+            return "", ""
+        owner, repo = parts[3], parts[4]
+        if (
+            not _GITHUB_OWNER_RE.match(owner)
+            or not _GITHUB_REPO_RE.match(repo)
+            or repo in (".", "..")
+        ):
+            return "", ""
+        return owner, repo
+
+
+def _touch(path: Path) -> None:
+    """Mark a cache entry as used now, for LRU pruning."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _file_size(path: str) -> int:
+    """Return the size of *path* without following symlinks, or 0."""
+    try:
+        return os.lstat(path).st_size
+    except OSError:
+        return 0
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA-1 of *data*, as listed by the tree API."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _parse_ls_tree(output: str) -> list[dict[str, Any]]:
+    """Parse ``git ls-tree -r --long -z`` output into tree API style entries.
+
+    Args:
+        output: NUL-terminated records of ``<mode> <type> <sha> <size>``,
+            a tab, and the path.
+
+    Returns:
+        Entries with ``path``, ``mode``, ``type``, ``sha`` and ``size`` keys.
+    """
+    entries = []
+    for record in output.split("\0"):
+        meta, _, path = record.partition("\t")
+        parts = meta.split()
+        if len(parts) != 4 or not path:
+            continue
+        mode, entry_type, sha, size = parts
+        entries.append({
+            "path": path,
+            "mode": mode,
+            "type": entry_type,
+            "sha": sha,
+            "size": int(size) if size.isdigit() else 0,
+        })
+    return entries
 
 
 # ---------------------------------------------------------------------------
@@ -586,6 +1127,10 @@ class ReviewExecutor:
         self._factory = factory
         self._extractor = CodeExtractor(workspace_root)
 
+    async def aclose(self) -> None:
+        """Close the code extractor's pooled HTTP client."""
+        await self._extractor.aclose()
+
     async def execute_review(
         self,
         session_id: str,
@@ -327,6 +327,7 @@ async def async_main() -> None:
         except asyncio.CancelledError:
             pass
         # Cleanup
+        await review_executor.aclose()
         await close_redis_client()
         logger.info("Redis client closed")
 
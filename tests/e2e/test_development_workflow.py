@@ -418,7 +418,7 @@ def create_mock_reviewer_agent(review: CodeReview) -> MagicMock:
 def create_mock_test_runner(test_result: TestRunResult) -> MagicMock:
     """Create a mock test runner that returns the given result."""
     runner = MagicMock()
-    runner.run_tests = MagicMock(return_value=test_result)
+    runner.run_tests_async = AsyncMock(return_value=test_result)
     return runner
 
 
@@ -844,7 +844,7 @@ class TestTDDWorkflowRetryAndEscalationE2E:
 
         # Test runner: fail first time, pass second time
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(
+        mock_runner.run_tests_async = AsyncMock(
             side_effect=[failing_test_result, passing_test_result]
         )
 
@@ -957,7 +957,7 @@ class TestTDDWorkflowRetryAndEscalationE2E:
                 return passing_test_result
 
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(side_effect=run_tests_with_escalation)
+        mock_runner.run_tests_async = AsyncMock(side_effect=run_tests_with_escalation)
 
         orchestrator = TDDOrchestrator(
             utest_agent=mock_utest,
@@ -1018,7 +1018,7 @@ class TestTDDWorkflowRetryAndEscalationE2E:
                 return passing_test_result
 
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(side_effect=run_tests_n_failures)
+        mock_runner.run_tests_async = AsyncMock(side_effect=run_tests_n_failures)
 
         orchestrator = TDDOrchestrator(
             utest_agent=mock_utest,
@@ -1083,7 +1083,7 @@ class TestTDDWorkflowRetryAndEscalationE2E:
                 return passing_test_result
 
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(side_effect=run_tests_recovery)
+        mock_runner.run_tests_async = AsyncMock(side_effect=run_tests_recovery)
 
         orchestrator = TDDOrchestrator(
             utest_agent=mock_utest,
@@ -1183,7 +1183,7 @@ class TestTDDWorkflowRetryAndEscalationE2E:
                 return fail_res if call_count[0] == 1 else pass_res
 
             mock_runner = MagicMock()
-            mock_runner.run_tests = MagicMock(side_effect=run_tests)
+            mock_runner.run_tests_async = AsyncMock(side_effect=run_tests)
 
             orchestrator = TDDOrchestrator(
                 utest_agent=create_mock_utest_agent(test_suite),
@@ -1464,7 +1464,7 @@ class TestTDDWorkflowErrorHandling:
 
         # Test runner that times out
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(
+        mock_runner.run_tests_async = AsyncMock(
             side_effect=TestTimeoutError("Tests timed out after 30 seconds")
         )
 
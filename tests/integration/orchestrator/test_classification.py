@@ -355,8 +355,11 @@ class TestBatchClassificationProcessing:
         assert job_data["status"] == "pending"
         assert len(job_data["idea_ids"]) == 5
 
-        # Verify all ideas were added to queue
-        assert mock_redis.lpush.call_count == 5
+        # Verify all ideas were added to queue in one LPUSH
+        mock_redis.lpush.assert_awaited_once()
+        queued = [json.loads(item) for item in mock_redis.lpush.call_args.args[1:]]
+        assert [item["idea_id"] for item in queued] == idea_ids
+        assert {item["batch_job_id"] for item in queued} == {job_id}
 
     @pytest.mark.asyncio
     async def test_batch_job_status_tracking(
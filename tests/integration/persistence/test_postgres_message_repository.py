@@ -12,6 +12,7 @@ from src.core.models.ideation import (
     ChatMessage,
     DataSource,
     IdeationSession,
+    MessageCursor,
     MessageRole,
     ProjectStatus,
 )
@@ -265,6 +266,66 @@ class TestPostgresMessageRepositoryIntegration:
         assert result[0].metadata is None
 
 
+@pytest.mark.asyncio
+class TestMessageKeysetPaginationIntegration:
+    """Integration tests for keyset pagination and streaming."""
+
+    async def _create_messages(self, db_session, session, message_repo):
+        base_time = datetime.now(UTC)
+        # Messages 2-4 share a timestamp so ordering falls back to id
+        for i in range(8):
+            await message_repo.create(
+                ChatMessage(
+                    id=f"keyset-msg-{i}",
+                    session_id=session.id,
+                    role=MessageRole.USER,
+                    content=f"Message {i}",
+                    timestamp=base_time + timedelta(seconds=2 if 2 <= i <= 4 else i),
+                    maturity_delta=0,
+                    metadata=None,
+                )
+            )
+        await db_session.commit()
+
+    async def test_get_page_walks_all_messages(self, db_session, session_with_repo):
+        """Test keyset pages cover every message once, in order."""
+        session, _, message_repo = session_with_repo
+        await self._create_messages(db_session, session, message_repo)
+
+        seen = []
+        cursor = None
+        while page := await message_repo.get_page(session.id, limit=3, after=cursor):
+            seen.extend(m.id for m in page)
+            cursor = MessageCursor.of(page[-1])
+
+        assert seen == [f"keyset-msg-{i}" for i in range(8)]
+
+    async def test_get_latest_before_cursor(self, db_session, session_with_repo):
+        """Test paging backwards from the newest messages."""
+        session, _, message_repo = session_with_repo
+        await self._create_messages(db_session, session, message_repo)
+
+        latest = await message_repo.get_latest(session.id, limit=3)
+        older = await message_repo.get_latest(
+            session.id, limit=3, before=MessageCursor.of(latest[0])
+        )
+
+        assert [m.id for m in latest] == ["keyset-msg-5", "keyset-msg-6", "keyset-msg-7"]
+        assert [m.id for m in older] == ["keyset-msg-2", "keyset-msg-3", "keyset-msg-4"]
+
+    async def test_stream_and_count(self, db_session, session_with_repo):
+        """Test streaming yields every message and count matches."""
+        session, _, message_repo = session_with_repo
+        await self._create_messages(db_session, session, message_repo)
+
+        streamed = [
+            m async for m in message_repo.stream_by_session(session.id, batch_size=2)
+        ]
+
+        assert [m.id for m in streamed] == [f"keyset-msg-{i}" for i in range(8)]
+        assert await message_repo.count_by_session(session.id) == 8
+
+
 @pytest.mark.asyncio
 class TestMessageCascadeDeleteIntegration:
     """Integration tests for cascade delete via session deletion."""
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timezone, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -59,18 +59,23 @@ class TestHITLWorkflow:
                 return 1
             return 0
 
-        async def mock_zrange(key, start, end):
+        async def mock_zrange(key, start, end, withscores=False):
             if key not in client._sets:
                 return []
-            return list(client._sets[key].keys())
+            items = sorted(client._sets[key].items(), key=lambda kv: kv[1])
+            items = items[start:] if end == -1 else items[start:end + 1]
+            return items if withscores else [k for k, _ in items]
 
-        async def mock_zrangebyscore(key, min_score, max_score):
+        async def mock_zrangebyscore(key, min_score, max_score, start=None, num=None):
             if key not in client._sets:
                 return []
-            return [
-                k for k, v in client._sets[key].items()
+            ids = [
+                k for k, v in sorted(client._sets[key].items(), key=lambda kv: kv[1])
                 if min_score <= v <= max_score
             ]
+            if start is not None:
+                ids = ids[start:] if num is None else ids[start : start + num]
+            return ids
 
         async def mock_rpush(key, value):
             if key not in client._lists:
@@ -90,6 +95,51 @@ class TestHITLWorkflow:
             client._streams[stream].append((entry_id, entry))
             return entry_id
 
+        class MockPipeline:
+            """Queues commands and runs them against the mock on execute."""
+
+            def __init__(self):
+                self._calls = []
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return None
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self._calls.append(
+                    getattr(client, name)(*args, **kwargs)
+                )
+
+            async def execute(self):
+                return [await call for call in self._calls]
+
+        def mock_register_script(source):
+            # Python equivalent of the expiry sweep script
+            async def run(keys, args):
+                now, pending, expired_status, n = args[:4]
+                ids = args[4 : 4 + n]
+                pending_set = keys[0]
+                request_keys = keys[1 : 1 + n]
+                gate_sets = dict(zip(args[4 + n :], keys[1 + n :], strict=True))
+                rows = []
+                for request_id, request_key in zip(ids, request_keys, strict=True):
+                    score = client._sets.get(pending_set, {}).get(request_id)
+                    if score is None or score > now:
+                        continue
+                    await mock_zrem(pending_set, request_id)
+                    data = client._data.get(request_key, {})
+                    if data.get("status") == pending:
+                        data["status"] = expired_status
+                        await mock_zrem(gate_sets[data["gate_type"]], request_id)
+                        rows.append([x for pair in data.items() for x in pair])
+                return rows
+
+            return run
+
+        client.pipeline = lambda transaction=True: MockPipeline()
+        client.register_script = mock_register_script
         client.hset = mock_hset
         client.hgetall = mock_hgetall
         client.zadd = mock_zadd
@@ -441,7 +491,11 @@ class TestHITLWithStateMachine:
     async def test_task_manager_integration(self):
         """Test HITL state updates through task manager."""
         mock_redis = AsyncMock()
-        mock_redis.hgetall.return_value = {
+        pipe = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        # update_state reads the task on the WATCHing pipeline
+        pipe.hgetall.return_value = {
             "task_id": "task-123",
             "session_id": "session-456",
             "epic_id": "epic-789",
@@ -450,7 +504,11 @@ class TestHITLWithStateMachine:
             "created_at": datetime.now(timezone.utc).isoformat(),
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
-        mock_redis.hset.return_value = True
+        pipe.multi = MagicMock()
+        pipe.hset = MagicMock()
+        pipe.zadd = MagicMock()
+        pipe.zrem = MagicMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
 
         task_manager = TaskManager(mock_redis)
 
@@ -458,4 +516,5 @@ class TestHITLWithStateMachine:
         task = await task_manager.update_state("task-123", TaskState.COMPLETE)
 
         assert task.state == TaskState.COMPLETE
-        mock_redis.hset.assert_called()
+        pipe.hset.assert_called()
+        pipe.execute.assert_awaited_once()
@@ -456,7 +456,7 @@ def mock_test_runner(
 ) -> MagicMock:
     """Create a mock test runner that returns passing results."""
     runner = MagicMock()
-    runner.run_tests = MagicMock(return_value=passing_test_result)
+    runner.run_tests_async = AsyncMock(return_value=passing_test_result)
     return runner
 
 
@@ -468,7 +468,7 @@ def mock_test_runner_failing(
     """Create a mock test runner that fails then passes."""
     runner = MagicMock()
     # First call fails, second call passes
-    runner.run_tests = MagicMock(
+    runner.run_tests_async = AsyncMock(
         side_effect=[failing_test_result, passing_test_result]
     )
     return runner
@@ -480,7 +480,7 @@ def mock_test_runner_persistent_failure(
 ) -> MagicMock:
     """Create a mock test runner that always fails."""
     runner = MagicMock()
-    runner.run_tests = MagicMock(return_value=failing_test_result)
+    runner.run_tests_async = AsyncMock(return_value=failing_test_result)
     return runner
 
 
@@ -109,7 +109,7 @@ class TestDebuggerEscalation:
                 )
 
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(side_effect=run_tests_with_eventual_success)
+        mock_runner.run_tests_async = AsyncMock(side_effect=run_tests_with_eventual_success)
 
         orchestrator = TDDOrchestrator(
             utest_agent=mock_utest_agent_for_orchestrator,
@@ -230,7 +230,7 @@ class TestDebuggerEscalation:
                 )
 
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(side_effect=run_tests)
+        mock_runner.run_tests_async = AsyncMock(side_effect=run_tests)
 
         orchestrator = TDDOrchestrator(
             utest_agent=mock_utest,
@@ -107,7 +107,7 @@ class TestFullTDDLoop:
 
         assert result.success is True
         assert result.retry_count == 1
-        assert mock_test_runner_failing.run_tests.call_count == 2
+        assert mock_test_runner_failing.run_tests_async.call_count == 2
 
     @pytest.mark.asyncio
     async def test_tdd_loop_passes_test_errors_on_retry(
@@ -178,7 +178,7 @@ class TestFullTDDLoop:
 
         # Create mock test runner: fail once, then pass
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(
+        mock_runner.run_tests_async = AsyncMock(
             side_effect=[failing_test_result, passing_test_result]
         )
 
@@ -514,7 +514,7 @@ class TestTDDLoopErrorHandling:
 
         # Create test runner that throws timeout
         mock_runner = MagicMock()
-        mock_runner.run_tests = MagicMock(
+        mock_runner.run_tests_async = AsyncMock(
             side_effect=TestTimeoutError("Tests timed out after 30 seconds")
         )
 
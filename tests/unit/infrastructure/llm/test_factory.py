@@ -14,6 +14,7 @@ import pytest
 
 from src.infrastructure.llm.factory import LLMClientFactory, LLMClientError
 from src.infrastructure.llm.base_client import BaseLLMClient
+from src.infrastructure.llm.http_pool import HTTPClientPool
 from src.orchestrator.api.models.llm_config import (
     AgentLLMConfig,
     AgentRole,
@@ -388,3 +389,172 @@ class TestBaseLLMClientInterface:
         from src.infrastructure.llm.base_client import BaseLLMClient
 
         assert hasattr(BaseLLMClient, "model")
+
+
+class TestVersionAwareCaching:
+    """Tests for config-version-aware caching and shared HTTP pools."""
+
+    @pytest.fixture
+    def mock_config_service(self) -> MagicMock:
+        """Create a mock config service with a config version."""
+        service = MagicMock()
+        service.get_agent_config = AsyncMock()
+        service.get_decrypted_key = AsyncMock(return_value="sk-ant-test-key")
+        service.get_config_version = AsyncMock(return_value=1)
+        service.get_agent_config.side_effect = lambda role: AgentLLMConfig(
+            role=role,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-123",
+        )
+        return service
+
+    @pytest.fixture
+    def http_pool(self) -> HTTPClientPool:
+        """Create an isolated HTTP client pool."""
+        return HTTPClientPool()
+
+    @pytest.fixture
+    def factory(
+        self, mock_config_service: MagicMock, http_pool: HTTPClientPool
+    ) -> LLMClientFactory:
+        """Create a factory that checks the config version on every call."""
+        return LLMClientFactory(
+            config_service=mock_config_service,
+            http_pool=http_pool,
+            version_check_seconds=0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_version_change_creates_new_client(
+        self, factory: LLMClientFactory, mock_config_service: MagicMock
+    ) -> None:
+        """Test a config version bump invalidates cached clients."""
+        client1 = await factory.get_client(AgentRole.DISCOVERY)
+        assert await factory.get_client(AgentRole.DISCOVERY) is client1
+
+        mock_config_service.get_config_version.return_value = 2
+        client2 = await factory.get_client(AgentRole.DISCOVERY)
+
+        assert client2 is not client1
+        assert list(factory._client_cache) == [
+            ("anthropic", "claude-sonnet-4-20250514", "key-123",
+             AgentSettings().model_dump_json(), 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_version_checked_at_most_once_per_interval(
+        self, mock_config_service: MagicMock, http_pool: HTTPClientPool
+    ) -> None:
+        """Test cached lookups do not read the version on every call."""
+        factory = LLMClientFactory(
+            config_service=mock_config_service,
+            http_pool=http_pool,
+            version_check_seconds=60,
+        )
+
+        for _ in range(5):
+            await factory.get_client(AgentRole.DISCOVERY)
+
+        assert mock_config_service.get_config_version.await_count == 1
+        assert mock_config_service.get_agent_config.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_change_notification_forces_recheck(
+        self, mock_config_service: MagicMock, http_pool: HTTPClientPool
+    ) -> None:
+        """Test a local change notification bypasses the check interval."""
+        factory = LLMClientFactory(
+            config_service=mock_config_service,
+            http_pool=http_pool,
+            version_check_seconds=60,
+        )
+        listener = mock_config_service.add_change_listener.call_args[0][0]
+
+        client1 = await factory.get_client(AgentRole.DISCOVERY)
+        mock_config_service.get_config_version.return_value = 2
+        listener()
+        client2 = await factory.get_client(AgentRole.DISCOVERY)
+
+        assert client2 is not client1
+
+    @pytest.mark.asyncio
+    async def test_identical_configs_share_client(
+        self, factory: LLMClientFactory, mock_config_service: MagicMock
+    ) -> None:
+        """Test roles with identical configuration share one client."""
+        client1 = await factory.get_client(AgentRole.DISCOVERY)
+        client2 = await factory.get_client(AgentRole.CODING)
+
+        assert client1 is client2
+        assert mock_config_service.get_decrypted_key.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_same_key_shares_http_transport(
+        self,
+        factory: LLMClientFactory,
+        mock_config_service: MagicMock,
+        http_pool: HTTPClientPool,
+    ) -> None:
+        """Test clients for the same provider and key share an httpx client."""
+        mock_config_service.get_agent_config.side_effect = lambda role: AgentLLMConfig(
+            role=role,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-123",
+            settings=AgentSettings(
+                temperature=0.1 if role == AgentRole.DISCOVERY else 0.5
+            ),
+        )
+
+        client1 = await factory.get_client(AgentRole.DISCOVERY)
+        client2 = await factory.get_client(AgentRole.CODING)
+
+        assert client1 is not client2
+        assert client1._http_client is client2._http_client
+        assert len(http_pool) == 1
+        await http_pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_keeps_cached_client(
+        self, factory: LLMClientFactory, mock_config_service: MagicMock
+    ) -> None:
+        """Test an unreadable version keeps serving cached clients."""
+        client1 = await factory.get_client(AgentRole.DISCOVERY)
+        mock_config_service.get_config_version.side_effect = ConnectionError("down")
+
+        assert await factory.get_client(AgentRole.DISCOVERY) is client1
+
+    @pytest.mark.asyncio
+    async def test_warmup_skips_unconfigured_roles(
+        self, factory: LLMClientFactory, mock_config_service: MagicMock
+    ) -> None:
+        """Test warmup creates clients for configured roles only."""
+
+        def _config(role: AgentRole) -> AgentLLMConfig:
+            return AgentLLMConfig(
+                role=role,
+                provider=LLMProvider.ANTHROPIC,
+                model="claude-sonnet-4-20250514",
+                api_key_id="key-123" if role == AgentRole.DISCOVERY else "",
+            )
+
+        mock_config_service.get_agent_config.side_effect = _config
+
+        with patch.object(
+            HTTPClientPool, "warmup", new_callable=AsyncMock, return_value=1
+        ) as pool_warmup:
+            ready = await factory.warmup()
+
+        assert ready == 1
+        pool_warmup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_remove_from_cache(self, factory: LLMClientFactory) -> None:
+        """Test removing one role keeps clients still used by other roles."""
+        client = await factory.get_client(AgentRole.DISCOVERY)
+        await factory.get_client(AgentRole.CODING)
+
+        assert factory.remove_from_cache(AgentRole.DISCOVERY) is True
+        assert factory.remove_from_cache(AgentRole.DISCOVERY) is False
+        assert await factory.get_client(AgentRole.CODING) is client
@@ -0,0 +1,83 @@
+"""Unit tests for the shared LLM HTTP client pool."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.infrastructure.llm.http_pool import HTTPClientPool
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_same_provider_and_key_share_client(self) -> None:
+        """Test identical provider/key pairs get the same client."""
+        pool = HTTPClientPool()
+
+        client1 = pool.get("anthropic", "sk-ant-1")
+        client2 = pool.get("anthropic", "sk-ant-1")
+
+        assert client1 is client2
+        assert len(pool) == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_different_keys_get_separate_clients(self) -> None:
+        """Test different keys or providers get separate clients."""
+        pool = HTTPClientPool()
+
+        clients = {
+            id(pool.get("anthropic", "sk-ant-1")),
+            id(pool.get("anthropic", "sk-ant-2")),
+            id(pool.get("openai", "sk-ant-1")),
+        }
+
+        assert len(clients) == 3
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self) -> None:
+        """Test a closed client is recreated on next use."""
+        pool = HTTPClientPool()
+        client = pool.get("openai", "sk-1")
+        await client.aclose()
+
+        assert pool.get("openai", "sk-1") is not client
+        await pool.aclose()
+
+    def test_keys_are_not_stored_in_plaintext(self) -> None:
+        """Test the pool index does not hold plaintext API keys."""
+        pool = HTTPClientPool()
+        pool.get("anthropic", "sk-ant-secret")
+
+        assert all("sk-ant-secret" not in key for _, key in pool._clients)
+
+    @pytest.mark.asyncio
+    async def test_warmup_counts_successful_connections(self) -> None:
+        """Test warmup issues a HEAD per client and tolerates failures."""
+        pool = HTTPClientPool()
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.host)
+            if request.url.host == "api.openai.com":
+                raise httpx.ConnectError("unreachable")
+            return httpx.Response(404)
+
+        transport = httpx.MockTransport(handler)
+        pool._clients = {
+            ("anthropic", "a"): httpx.AsyncClient(transport=transport),
+            ("openai", "b"): httpx.AsyncClient(transport=transport),
+        }
+
+        assert await pool.warmup() == 1
+        assert sorted(requests) == ["api.anthropic.com", "api.openai.com"]
+        await pool.aclose()
+
+    def test_supports(self) -> None:
+        """Test only providers with injectable httpx clients are pooled."""
+        assert HTTPClientPool.supports("anthropic")
+        assert HTTPClientPool.supports("openai")
+        assert not HTTPClientPool.supports("google")
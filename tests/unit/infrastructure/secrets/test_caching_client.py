@@ -1,5 +1,6 @@
 """Tests for the caching secrets client with GCP primary and Infisical fallback."""
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -122,7 +123,8 @@ class TestCachingSecretsClient:
         # Should return the value
         assert result == "secret-value-123"
 
-        # Should have cached to Infisical
+        # Should have cached to Infisical (write-back runs in the background)
+        await caching_client.drain()
         cached_value = await infisical_client.get_secret("API_KEY", "dev")
         assert cached_value == "secret-value-123"
 
@@ -357,6 +359,7 @@ class TestCachingSecretsClient:
         # Get should succeed even though cache update fails
         with caplog.at_level(logging.DEBUG):
             result = await caching_client.get_secret("KEY", "dev")
+            await caching_client.drain()
 
         assert result == "value"
         # Should have logged cache update failure at debug level
@@ -371,6 +374,185 @@ class TestCachingSecretsClient:
         assert result is None
 
 
+class CountingSecretsClient(MockSecretsClient):
+    """Mock client that counts and optionally delays reads and writes."""
+
+    def __init__(self, backend_name: str = "counting", delay: float = 0.0):
+        super().__init__(backend_name)
+        self.get_calls = 0
+        self.set_calls = 0
+        self.delay = delay
+        self.fail = False
+
+    async def get_secret(self, name: str, environment: str = "dev") -> str | None:
+        self.get_calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("GCP connection failed")
+        return await super().get_secret(name, environment)
+
+    async def set_secret(self, name: str, value: str, environment: str = "dev") -> bool:
+        self.set_calls += 1
+        return await super().set_secret(name, value, environment)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalCache:
+    """Tests for the in-process TTL cache in front of GCP."""
+
+    @pytest.fixture
+    def gcp(self) -> CountingSecretsClient:
+        return CountingSecretsClient(backend_name="gcp")
+
+    @pytest.fixture
+    def infisical(self) -> CountingSecretsClient:
+        return CountingSecretsClient(backend_name="infisical")
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def client(self, gcp, infisical, clock):
+        from src.infrastructure.secrets.caching_client import CachingSecretsClient
+        return CachingSecretsClient(
+            gcp, infisical, ttl_seconds=60, stale_seconds=300, clock=clock
+        )
+
+    @pytest.mark.asyncio
+    async def test_fresh_value_served_locally(self, client, gcp, infisical):
+        """Repeated reads within the TTL make one GCP call and one write-back."""
+        await gcp.set_secret("KEY", "v1")
+        gcp.set_calls = 0
+
+        for _ in range(5):
+            assert await client.get_secret("KEY") == "v1"
+        await client.drain()
+
+        assert gcp.get_calls == 1
+        assert infisical.set_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(
+        self, client, gcp, infisical, clock
+    ):
+        """An expired value is returned immediately and refreshed in the background."""
+        await gcp.set_secret("KEY", "v1")
+        await client.get_secret("KEY")
+        await gcp.set_secret("KEY", "v2")
+        clock.now += 61
+
+        assert await client.get_secret("KEY") == "v1"
+        await client.drain()
+        assert await client.get_secret("KEY") == "v2"
+
+        assert gcp.get_calls == 2
+        assert await infisical.get_secret("KEY") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_value_past_stale_window_is_refetched(self, client, gcp, clock):
+        """Beyond the stale window the caller waits for GCP."""
+        await gcp.set_secret("KEY", "v1")
+        await client.get_secret("KEY")
+        await gcp.set_secret("KEY", "v2")
+        clock.now += 400
+
+        assert await client.get_secret("KEY") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_coalesce(self, infisical, clock):
+        """Concurrent misses for one secret share a single GCP request."""
+        from src.infrastructure.secrets.caching_client import CachingSecretsClient
+
+        gcp = CountingSecretsClient(backend_name="gcp", delay=0.01)
+        await gcp.set_secret("KEY", "v1")
+        client = CachingSecretsClient(gcp, infisical, ttl_seconds=60, clock=clock)
+
+        results = await asyncio.gather(*(client.get_secret("KEY") for _ in range(10)))
+
+        assert results == ["v1"] * 10
+        assert gcp.get_calls == 1
+        assert client._stats["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_unchanged_value_not_written_back(self, client, gcp, infisical, clock):
+        """Refreshes that return the same value skip the Infisical write."""
+        await gcp.set_secret("KEY", "v1")
+        await client.get_secret("KEY")
+        clock.now += 400
+        await client.get_secret("KEY")
+        await client.drain()
+
+        assert gcp.get_calls == 2
+        assert infisical.set_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_set_secret_updates_local_cache(self, client, gcp):
+        """Writes through the client are visible without a GCP read."""
+        await client.set_secret("KEY", "v1")
+
+        assert await client.get_secret("KEY") == "v1"
+        assert gcp.get_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_secret_evicts(self, client, gcp):
+        """Deleted secrets are not served from the local cache."""
+        await client.set_secret("KEY", "v1")
+        await client.delete_secret("KEY")
+
+        assert await client.get_secret("KEY") is None
+
+    @pytest.mark.asyncio
+    async def test_gcp_failure_during_refresh_keeps_stale_value(
+        self, client, gcp, clock
+    ):
+        """A failed background refresh leaves the stale value in place."""
+        await gcp.set_secret("KEY", "v1")
+        await client.get_secret("KEY")
+        gcp.fail = True
+        clock.now += 61
+
+        assert await client.get_secret("KEY") == "v1"
+        await client.drain()
+        assert await client.get_secret("KEY") == "v1"
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_local_cache(self, gcp, infisical):
+        """A TTL of 0 reads through to GCP every time."""
+        from src.infrastructure.secrets.caching_client import CachingSecretsClient
+
+        await gcp.set_secret("KEY", "v1")
+        client = CachingSecretsClient(gcp, infisical, ttl_seconds=0)
+
+        await client.get_secret("KEY")
+        await client.get_secret("KEY")
+
+        assert gcp.get_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_local_cache(self, client, gcp):
+        """health_check includes local cache statistics."""
+        await gcp.set_secret("KEY", "v1")
+        await client.get_secret("KEY")
+        await client.get_secret("KEY")
+
+        health = await client.health_check()
+
+        assert health["local_cache"]["entries"] == 1
+        assert health["local_cache"]["hit"] == 1
+        assert health["local_cache"]["miss"] == 1
+
+
 class TestCachingClientFactory:
     """Tests for the caching client factory integration."""
 
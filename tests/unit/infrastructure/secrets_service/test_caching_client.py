@@ -65,6 +65,7 @@ class TestCachingSecretsClientGetSecret:
         client.cache.set_secret.return_value = True
 
         await client.get_secret("MY_SECRET", "dev")
+        await client.drain()
 
         client.cache.set_secret.assert_called_once_with("MY_SECRET", "gcp-secret-value", "dev")
 
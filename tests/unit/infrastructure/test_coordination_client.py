@@ -1,8 +1,9 @@
 """Tests for coordination client base structure."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import redis.asyncio as redis
@@ -632,7 +633,7 @@ class TestCoordinationClientPublishMessage:
         assert len(publish_calls) == 2
 
         # Check channels
-        channels = [call[0][0] for call in publish_calls]
+        channels = [c.args[0] for c in publish_calls]
         assert "test:notify:orchestrator" in channels
         assert "test:notify:all" in channels
 
@@ -657,7 +658,7 @@ class TestCoordinationClientPublishMessage:
 
         pipe = mock_redis._pipeline
         publish_calls = pipe.publish.call_args_list
-        channels = [call[0][0] for call in publish_calls]
+        channels = [c.args[0] for c in publish_calls]
         assert "test:notify:all" in channels
 
 
@@ -1309,50 +1310,68 @@ class TestCoordinationClientPresence:
         """Create test configuration."""
         return CoordinationConfig(key_prefix="test", presence_timeout_minutes=5)
 
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        """Create mock Redis client with pipeline support."""
+        mock = AsyncMock(spec=redis.Redis)
+
+        mock_pipeline = AsyncMock()
+        mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+        mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+        mock_pipeline.hset = MagicMock()
+        mock_pipeline.hdel = MagicMock()
+        mock_pipeline.zadd = MagicMock()
+        mock_pipeline.zrem = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value=[1, 1])
+
+        mock.pipeline = MagicMock(return_value=mock_pipeline)
+        mock._pipeline = mock_pipeline
+        return mock
+
     @pytest.mark.asyncio
     async def test_register_instance_success(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test successful instance registration."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hset = AsyncMock()
         client = CoordinationClient(mock_redis, config)
 
         await client.register_instance("backend", session_id="session-123")
 
-        mock_redis.hset.assert_awaited_once()
-        call_args = mock_redis.hset.call_args
+        pipe = mock_redis._pipeline
+        pipe.hset.assert_called_once()
+        call_args = pipe.hset.call_args
         assert call_args[0][0] == "test:presence"
         mapping = call_args[1]["mapping"]
         assert "backend.active" in mapping
         assert "backend.last_heartbeat" in mapping
         assert "backend.session_id" in mapping
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_register_instance_without_session(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test registration without session ID."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hset = AsyncMock()
         client = CoordinationClient(mock_redis, config)
 
         await client.register_instance("backend")
 
-        call_args = mock_redis.hset.call_args
+        call_args = mock_redis._pipeline.hset.call_args
         mapping = call_args[1]["mapping"]
         assert "backend.session_id" not in mapping
 
     @pytest.mark.asyncio
     async def test_register_instance_redis_error(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test registration with Redis error."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hset = AsyncMock(side_effect=redis.RedisError("Failed"))
+        mock_redis._pipeline.execute = AsyncMock(side_effect=redis.RedisError("Failed"))
         client = CoordinationClient(mock_redis, config)
 
         with pytest.raises(PresenceError):
@@ -1361,28 +1380,29 @@ class TestCoordinationClientPresence:
     @pytest.mark.asyncio
     async def test_heartbeat_success(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test successful heartbeat."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hset = AsyncMock()
         client = CoordinationClient(mock_redis, config)
 
         await client.heartbeat("backend")
 
-        mock_redis.hset.assert_awaited_once()
-        call_args = mock_redis.hset.call_args
+        pipe = mock_redis._pipeline
+        pipe.hset.assert_called_once()
+        call_args = pipe.hset.call_args
         assert call_args[0][0] == "test:presence"
-        assert call_args[0][1] == "backend.last_heartbeat"
+        assert list(call_args[1]["mapping"]) == ["backend.last_heartbeat"]
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_heartbeat_redis_error(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test heartbeat with Redis error."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hset = AsyncMock(side_effect=redis.RedisError("Failed"))
+        mock_redis._pipeline.execute = AsyncMock(side_effect=redis.RedisError("Failed"))
         client = CoordinationClient(mock_redis, config)
 
         with pytest.raises(PresenceError):
@@ -1391,16 +1411,15 @@ class TestCoordinationClientPresence:
     @pytest.mark.asyncio
     async def test_unregister_instance_success(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test successful instance unregistration."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hdel = AsyncMock()
         client = CoordinationClient(mock_redis, config)
 
         await client.unregister_instance("backend")
 
-        mock_redis.hdel.assert_awaited_once_with(
+        mock_redis._pipeline.hdel.assert_called_once_with(
             "test:presence",
             "backend.active",
             "backend.last_heartbeat",
@@ -1410,11 +1429,11 @@ class TestCoordinationClientPresence:
     @pytest.mark.asyncio
     async def test_unregister_instance_redis_error(
         self,
+        mock_redis: AsyncMock,
         config: CoordinationConfig,
     ) -> None:
         """Test unregistration with Redis error."""
-        mock_redis = AsyncMock(spec=redis.Redis)
-        mock_redis.hdel = AsyncMock(side_effect=redis.RedisError("Failed"))
+        mock_redis._pipeline.execute = AsyncMock(side_effect=redis.RedisError("Failed"))
         client = CoordinationClient(mock_redis, config)
 
         with pytest.raises(PresenceError):
@@ -1920,3 +1939,204 @@ class TestCoordinationClientQueueIfOffline:
 
         # Should not raise - errors are logged but not propagated
         await client._queue_if_offline("orchestrator", sample_notification)
+
+
+class TestPresenceBatching:
+    """Tests for last-seen indexing and batched heartbeats."""
+
+    @pytest.fixture
+    def config(self) -> CoordinationConfig:
+        """Create test configuration."""
+        return CoordinationConfig(key_prefix="test", heartbeat_interval_seconds=1)
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        """Create mock Redis client with pipeline support."""
+        mock = AsyncMock(spec=redis.Redis)
+
+        mock_pipeline = AsyncMock()
+        mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+        mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+        mock_pipeline.hset = MagicMock()
+        mock_pipeline.hdel = MagicMock()
+        mock_pipeline.zadd = MagicMock()
+        mock_pipeline.zrem = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value=[1, 1])
+
+        mock.pipeline = MagicMock(return_value=mock_pipeline)
+        mock._pipeline = mock_pipeline
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_register_instance_records_last_seen(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that registration writes the hash and last-seen set together."""
+        client = CoordinationClient(mock_redis, config)
+
+        await client.register_instance("backend", session_id="session-1")
+
+        pipe = mock_redis._pipeline
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert mapping["backend.active"] == "1"
+        assert mapping["backend.session_id"] == "session-1"
+        zadd_args = pipe.zadd.call_args[0]
+        assert zadd_args[0] == "test:presence:seen"
+        assert "backend" in zadd_args[1]
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_many_single_round_trip(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that several heartbeats are written in one pipeline."""
+        client = CoordinationClient(mock_redis, config)
+
+        await client.heartbeat_many(["backend", "frontend", "orchestrator"])
+
+        pipe = mock_redis._pipeline
+        pipe.hset.assert_called_once()
+        pipe.zadd.assert_called_once()
+        pipe.execute.assert_awaited_once()
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert set(mapping) == {
+            "backend.last_heartbeat",
+            "frontend.last_heartbeat",
+            "orchestrator.last_heartbeat",
+        }
+        assert set(pipe.zadd.call_args[0][1]) == {"backend", "frontend", "orchestrator"}
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_many_empty_is_noop(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that an empty batch does not touch Redis."""
+        client = CoordinationClient(mock_redis, config)
+
+        await client.heartbeat_many([])
+
+        mock_redis.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queued_heartbeats_are_coalesced(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that repeated queued heartbeats collapse into one write."""
+        client = CoordinationClient(mock_redis, config)
+
+        for _ in range(5):
+            client.queue_heartbeat("backend")
+        client.queue_heartbeat("frontend")
+
+        flushed = await client.flush_heartbeats()
+
+        assert flushed == 2
+        mock_redis._pipeline.execute.assert_awaited_once()
+        assert await client.flush_heartbeats() == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_keeps_queued_heartbeats(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that a failed flush re-queues heartbeats for the next flush."""
+        mock_redis._pipeline.execute = AsyncMock(
+            side_effect=redis.RedisError("Connection lost")
+        )
+        client = CoordinationClient(mock_redis, config)
+        client.queue_heartbeat("backend")
+
+        with pytest.raises(PresenceError):
+            await client.flush_heartbeats()
+
+        mock_redis._pipeline.execute = AsyncMock(return_value=[1, 1])
+        assert await client.flush_heartbeats() == 1
+
+    @pytest.mark.asyncio
+    async def test_unregister_removes_last_seen(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that unregistration removes the instance from both keys."""
+        client = CoordinationClient(mock_redis, config)
+        client.queue_heartbeat("backend")
+
+        await client.unregister_instance("backend")
+
+        pipe = mock_redis._pipeline
+        assert pipe.hdel.call_args[0][0] == "test:presence"
+        pipe.zrem.assert_called_once_with("test:presence:seen", "backend")
+        assert await client.flush_heartbeats() == 0
+
+    @pytest.mark.asyncio
+    async def test_get_stale_instances_uses_score_range(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that staleness is answered with ZRANGEBYSCORE."""
+        mock_redis.zrangebyscore = AsyncMock(return_value=["old-session"])
+        client = CoordinationClient(mock_redis, config)
+
+        before = datetime.now(timezone.utc).timestamp()
+        stale = await client.get_stale_instances(timeout_minutes=5)
+
+        assert stale == ["old-session"]
+        key, low, cutoff = mock_redis.zrangebyscore.call_args[0]
+        assert key == "test:presence:seen"
+        assert low == "-inf"
+        assert cutoff == pytest.approx(before - 300, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_get_stale_instances_raises_presence_error(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that Redis errors surface as PresenceError."""
+        mock_redis.zrangebyscore = AsyncMock(
+            side_effect=redis.RedisError("Connection lost")
+        )
+        client = CoordinationClient(mock_redis, config)
+
+        with pytest.raises(PresenceError):
+            await client.get_stale_instances()
+
+    @pytest.mark.asyncio
+    async def test_background_heartbeat_task(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that the background task heartbeats and stops cleanly."""
+        client = CoordinationClient(mock_redis, config, instance_id="backend")
+
+        task = client.start_heartbeat(interval_seconds=0.01)
+        assert client.start_heartbeat() is task
+        await asyncio.sleep(0.05)
+        await client.stop_heartbeat()
+
+        assert task.done()
+        assert mock_redis._pipeline.execute.await_count >= 2
+        assert set(mock_redis._pipeline.zadd.call_args[0][1]) == {"backend"}
+
+    def test_start_heartbeat_requires_instance(
+        self,
+        mock_redis: AsyncMock,
+        config: CoordinationConfig,
+    ) -> None:
+        """Test that a client without instance_id needs explicit IDs."""
+        client = CoordinationClient(mock_redis, config)
+
+        with pytest.raises(CoordinationError):
+            client.start_heartbeat()
@@ -50,6 +50,11 @@ class TestCoordinationConfigDefaults:
         config = CoordinationConfig()
         assert config.timeline_max_size == 1000
 
+    def test_default_heartbeat_interval(self) -> None:
+        """Test default heartbeat interval."""
+        config = CoordinationConfig()
+        assert config.heartbeat_interval_seconds == 30
+
 
 class TestCoordinationConfigFromEnv:
     """Tests for loading configuration from environment variables."""
@@ -135,6 +140,11 @@ class TestCoordinationConfigKeyGeneration:
         key = config.presence_key()
         assert key == "test:presence"
 
+    def test_presence_seen_key(self, config: CoordinationConfig) -> None:
+        """Test last-seen sorted set key generation."""
+        key = config.presence_seen_key()
+        assert key == "test:presence:seen"
+
     def test_instance_channel(self, config: CoordinationConfig) -> None:
         """Test instance channel generation."""
         channel = config.instance_channel("frontend")
@@ -0,0 +1,168 @@
+"""Tests for the hook telemetry Prometheus exporter."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.hook_telemetry.prometheus_exporter import (
+    DURATION_BUCKETS,
+    OVERFLOW_LABEL,
+    JsonlTailer,
+    MetricsCollector,
+)
+
+
+def _append(path: Path, *records: dict, raw: str = "") -> None:
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write(raw)
+
+
+def _record(hook: str = "guard", duration: float = 0.002, **extra) -> dict:
+    return {
+        "hook_name": hook,
+        "event_type": "PreToolUse",
+        "exit_code": 0,
+        "duration_seconds": duration,
+        **extra,
+    }
+
+
+@pytest.fixture()
+def telemetry_file(tmp_path: Path) -> Path:
+    return tmp_path / "hook-telemetry.jsonl"
+
+
+class TestJsonlTailer:
+    """Tests for incremental, rotation-aware reading."""
+
+    def test_reads_only_new_records(self, telemetry_file: Path) -> None:
+        tailer = JsonlTailer(telemetry_file)
+        _append(telemetry_file, _record("a"))
+        assert [r["hook_name"] for r in tailer.read()] == ["a"]
+
+        _append(telemetry_file, _record("b"), _record("c"))
+        assert [r["hook_name"] for r in tailer.read()] == ["b", "c"]
+        assert list(tailer.read()) == []
+
+    def test_missing_file_yields_nothing(self, telemetry_file: Path) -> None:
+        assert list(JsonlTailer(telemetry_file).read()) == []
+
+    def test_partial_line_waits_for_newline(self, telemetry_file: Path) -> None:
+        tailer = JsonlTailer(telemetry_file)
+        _append(telemetry_file, _record("a"), raw='{"hook_name": "b"')
+        assert [r["hook_name"] for r in tailer.read()] == ["a"]
+
+        _append(telemetry_file, raw=', "event_type": "Stop"}\n')
+        assert [r["hook_name"] for r in tailer.read()] == ["b"]
+
+    def test_skips_invalid_json(self, telemetry_file: Path) -> None:
+        tailer = JsonlTailer(telemetry_file)
+        _append(telemetry_file, raw="not json\n")
+        _append(telemetry_file, _record("a"))
+        assert [r["hook_name"] for r in tailer.read()] == ["a"]
+
+    def test_truncation_restarts_from_beginning(self, telemetry_file: Path) -> None:
+        tailer = JsonlTailer(telemetry_file)
+        _append(telemetry_file, _record("a"), _record("b"))
+        list(tailer.read())
+
+        telemetry_file.write_text(json.dumps(_record("c")) + "\n")
+
+        assert [r["hook_name"] for r in tailer.read()] == ["c"]
+
+    def test_rotation_detected_by_inode(self, telemetry_file: Path) -> None:
+        tailer = JsonlTailer(telemetry_file)
+        _append(telemetry_file, _record("a"))
+        list(tailer.read())
+
+        rotated = telemetry_file.with_suffix(".1")
+        os.rename(telemetry_file, rotated)
+        # New file larger than the old offset, so only the inode reveals rotation
+        _append(telemetry_file, _record("b"), _record("c"))
+
+        assert [r["hook_name"] for r in tailer.read()] == ["b", "c"]
+
+
+class TestMetricsCollector:
+    """Tests for aggregation and exposition."""
+
+    def test_histogram_buckets_are_cumulative_once(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file)
+        _append(telemetry_file, _record(duration=0.0005), _record(duration=0.3))
+
+        text = collector.format_metrics()
+
+        lines = [l for l in text.splitlines() if l.startswith("asdlc_hook_duration_seconds_bucket")]
+        by_le = {l.split('le="')[1].split('"')[0]: int(l.rsplit(" ", 1)[1]) for l in lines}
+        assert len(by_le) == len(DURATION_BUCKETS) + 1
+        assert by_le["0.001"] == 1
+        assert by_le["0.25"] == 1
+        assert by_le["0.5"] == 2
+        assert by_le["10.0"] == 2
+        assert by_le["+Inf"] == 2
+
+    def test_duration_above_last_bucket_only_in_inf(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file)
+        _append(telemetry_file, _record(duration=30.0))
+
+        text = collector.format_metrics()
+
+        assert 'le="10.0"} 0' in text
+        assert 'le="+Inf"} 1' in text
+
+    def test_error_counter(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file)
+        _append(telemetry_file, _record(exit_code=124, error="timed out"))
+
+        text = collector.format_metrics()
+
+        assert 'asdlc_hook_errors_total{hook_name="guard",error_type="timeout"} 1' in text
+
+    def test_label_cardinality_capped(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file, max_label_values=2)
+        _append(telemetry_file, *(_record(f"hook-{i}") for i in range(5)))
+
+        text = collector.format_metrics()
+
+        assert 'hook_name="hook-0"' in text
+        assert 'hook_name="hook-1"' in text
+        assert 'hook_name="hook-2"' not in text
+        assert (
+            f'asdlc_hook_executions_total{{hook_name="{OVERFLOW_LABEL}",'
+            'event_type="PreToolUse",exit_code="0"} 3'
+        ) in text
+
+    def test_label_values_escaped(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file)
+        _append(telemetry_file, _record('say "hi"'))
+
+        assert 'hook_name="say \\"hi\\""' in collector.format_metrics()
+
+    def test_rendered_text_cached_until_change(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file)
+        _append(telemetry_file, _record())
+
+        first = collector.format_metrics()
+        assert collector.format_metrics() is first
+
+        _append(telemetry_file, _record())
+        assert collector.format_metrics() is not first
+
+    def test_background_tailer(self, telemetry_file: Path) -> None:
+        collector = MetricsCollector(telemetry_file)
+        collector.start(interval=0.01)
+        try:
+            _append(telemetry_file, _record())
+            deadline = time.time() + 2.0
+            while "asdlc_hook_executions_total" not in collector.format_metrics():
+                assert time.time() < deadline
+                time.sleep(0.01)
+        finally:
+            collector.stop()
@@ -25,6 +25,7 @@ from src.orchestrator.api.models.agent_telemetry import (
     AgentType,
 )
 from src.orchestrator.routes.agents_api import (
+    OVERFLOW_DISCONNECT,
     router,
     ws_router,
     get_telemetry_service,
@@ -32,10 +33,47 @@ from src.orchestrator.routes.agents_api import (
 )
 
 
+async def _idle_updates():
+    """Status feed that never publishes."""
+    await asyncio.Event().wait()
+    yield  # pragma: no cover
+
+
+def _updates(*statuses: AgentStatus):
+    """Build a subscribe_status_updates replacement yielding statuses."""
+
+    async def _gen():
+        for status in statuses:
+            yield status
+        await asyncio.Event().wait()
+
+    return MagicMock(side_effect=_gen)
+
+
+def _ws(send_json: AsyncMock | None = None) -> MagicMock:
+    """Create a mock WebSocket."""
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.send_json = send_json or AsyncMock()
+    return websocket
+
+
+def _status(agent_id: str, progress: int = 0) -> AgentStatus:
+    return AgentStatus(
+        agent_id=agent_id,
+        agent_type=AgentType.BACKEND,
+        status=AgentStatusEnum.RUNNING,
+        current_task=None,
+        progress=progress,
+    )
+
+
 @pytest.fixture
 def mock_service() -> AsyncMock:
     """Create a mock AgentTelemetryService."""
     service = AsyncMock()
+    service.subscribe_status_updates = MagicMock(side_effect=_idle_updates)
     return service
 
 
@@ -415,9 +453,11 @@ class TestConnectionManager:
     """Tests for WebSocket connection manager."""
 
     @pytest.fixture
-    def manager(self) -> ConnectionManager:
+    async def manager(self):
         """Create a connection manager instance."""
-        return ConnectionManager()
+        manager = ConnectionManager()
+        yield manager
+        await manager.shutdown()
 
     @pytest.mark.asyncio
     async def test_connect_adds_connection(self, manager: ConnectionManager) -> None:
@@ -460,6 +500,7 @@ class TestConnectionManager:
         message = {"type": "test", "data": "hello"}
 
         await manager.broadcast(message)
+        await manager.flush()
 
         ws1.send_json.assert_called_once_with(message)
         ws2.send_json.assert_called_once_with(message)
@@ -478,12 +519,167 @@ class TestConnectionManager:
         message = {"type": "test", "data": "hello"}
 
         await manager.broadcast(message)
+        await manager.flush()
 
         # ws2 should be removed due to error
         assert ws1 in manager.active_connections
         assert ws2 not in manager.active_connections
 
 
+class TestConnectionManagerBackpressure:
+    """Tests for per-client send queues and the status fan-out."""
+
+    @pytest.fixture
+    async def make_manager(self):
+        """Create connection managers and shut them down afterwards."""
+        managers: list[ConnectionManager] = []
+
+        def _make(**kwargs) -> ConnectionManager:
+            manager = ConnectionManager(**kwargs)
+            managers.append(manager)
+            return manager
+
+        yield _make
+        for manager in managers:
+            await manager.shutdown()
+
+    @staticmethod
+    def _blocked_ws() -> tuple[MagicMock, asyncio.Event]:
+        release = asyncio.Event()
+
+        async def _send(message):
+            await release.wait()
+
+        return _ws(AsyncMock(side_effect=_send)), release
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self, make_manager) -> None:
+        """Test that a stalled client does not block delivery to others."""
+        manager = make_manager(send_timeout=30)
+        slow, release = self._blocked_ws()
+        fast = _ws()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        await asyncio.wait_for(manager.broadcast({"type": "test"}), timeout=1)
+        await asyncio.sleep(0.01)
+
+        fast.send_json.assert_called_once_with({"type": "test"})
+        assert slow in manager.active_connections
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self, make_manager) -> None:
+        """Test that a lagging client keeps only the newest messages."""
+        manager = make_manager(max_queue_size=2, send_timeout=30)
+        slow, release = self._blocked_ws()
+        await manager.connect(slow)
+
+        for i in range(5):
+            await manager.broadcast({"seq": i})
+            await asyncio.sleep(0)
+        release.set()
+        await manager.flush()
+
+        sent = [call.args[0]["seq"] for call in slow.send_json.call_args_list]
+        # First message was in flight; 1-2 were dropped for 3-4
+        assert sent == [0, 3, 4]
+        assert slow in manager.active_connections
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnect_policy(self, make_manager) -> None:
+        """Test that the disconnect policy evicts a lagging client."""
+        manager = make_manager(
+            max_queue_size=1, send_timeout=30, overflow_policy=OVERFLOW_DISCONNECT
+        )
+        slow, release = self._blocked_ws()
+        await manager.connect(slow)
+
+        for i in range(3):
+            await manager.broadcast({"seq": i})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert slow not in manager.active_connections
+        slow.close.assert_awaited_once()
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_disconnects(self, make_manager) -> None:
+        """Test that a send exceeding the timeout evicts the client."""
+        manager = make_manager(send_timeout=0.01)
+        slow, release = self._blocked_ws()
+        await manager.connect(slow)
+
+        await manager.broadcast({"type": "test"})
+        await manager.flush()
+
+        assert slow not in manager.active_connections
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_channel_broadcast_only_reaches_subscribers(
+        self, make_manager, mock_service: AsyncMock
+    ) -> None:
+        """Test that channel broadcasts skip unsubscribed clients."""
+        manager = make_manager()
+        subscribed, other = _ws(), _ws()
+        await manager.connect(subscribed)
+        await manager.connect(other)
+        manager.subscribe(subscribed, "status", mock_service)
+
+        await manager.broadcast({"type": "status_delta"}, channel="status")
+        await manager.flush()
+
+        subscribed.send_json.assert_called_once()
+        other.send_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_status_feed_pushes_coalesced_deltas(
+        self, make_manager, mock_service: AsyncMock
+    ) -> None:
+        """Test that published changes reach subscribers, latest per agent."""
+        mock_service.subscribe_status_updates = _updates(
+            _status("agent-1", 10), _status("agent-2"), _status("agent-1", 20)
+        )
+        manager = make_manager()
+        viewers = [_ws() for _ in range(3)]
+        for viewer in viewers:
+            await manager.connect(viewer)
+            manager.subscribe(viewer, "status", mock_service)
+
+        for _ in range(100):
+            if all(v.send_json.called for v in viewers):
+                break
+            await asyncio.sleep(0.01)
+
+        # One Redis subscription shared by every viewer
+        mock_service.subscribe_status_updates.assert_called_once()
+        for viewer in viewers:
+            message = viewer.send_json.call_args.args[0]
+            assert message["type"] == "status_delta"
+            progress = {a["agent_id"]: a["progress"] for a in message["data"]["agents"]}
+            assert progress == {"agent-1": 20, "agent-2": 0}
+
+    @pytest.mark.asyncio
+    async def test_status_feed_stops_without_subscribers(
+        self, make_manager, mock_service: AsyncMock
+    ) -> None:
+        """Test that the feed is cancelled when the last subscriber leaves."""
+        manager = make_manager()
+        viewer = _ws()
+        await manager.connect(viewer)
+        manager.subscribe(viewer, "status", mock_service)
+        feed = manager._status_feed
+        assert feed is not None
+
+        manager.disconnect(viewer)
+        await asyncio.sleep(0)
+
+        assert manager._status_feed is None
+        assert feed.cancelled() or feed.done()
+
+
 class TestWebSocketAgents:
     """Tests for WebSocket /ws/agents endpoint."""
 
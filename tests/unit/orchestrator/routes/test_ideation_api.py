@@ -848,3 +848,81 @@ class TestGetSessionEndpoint:
         response = client.get("/api/studio/ideation/sessions/session-123")
 
         assert response.status_code == 500
+
+
+class TestGetSessionMessagesEndpoint:
+    """Tests for GET /api/studio/ideation/sessions/{session_id}/messages."""
+
+    @pytest.fixture
+    def messages(self) -> list:
+        from src.core.models.ideation import ChatMessage, MessageRole
+
+        return [
+            ChatMessage(
+                id=f"msg-{i}",
+                session_id="session-123",
+                role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+                content=f"message {i}",
+                timestamp=datetime(2024, 1, 15, 10, i, 0, tzinfo=timezone.utc),
+            )
+            for i in range(2)
+        ]
+
+    @pytest.fixture
+    def paging_client(self, client: TestClient, mock_service: AsyncMock):
+        with patch(
+            "src.orchestrator.routes.ideation_api._get_service",
+            return_value=mock_service,
+        ):
+            yield client
+
+    def test_returns_latest_page_with_cursors(
+        self, paging_client: TestClient, mock_service: AsyncMock, messages: list
+    ) -> None:
+        """Test the newest page includes cursors for older and newer messages."""
+        from src.core.models.ideation import MessageCursor
+
+        mock_service.get_messages.return_value = messages
+
+        response = paging_client.get(
+            "/api/studio/ideation/sessions/session-123/messages?limit=2"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["id"] for m in data["messages"]] == ["msg-0", "msg-1"]
+        assert MessageCursor.decode(data["prevCursor"]).id == "msg-0"
+        assert MessageCursor.decode(data["nextCursor"]).id == "msg-1"
+        mock_service.get_messages.assert_awaited_once_with("session-123", 2, None, None)
+
+    def test_passes_decoded_after_cursor(
+        self, paging_client: TestClient, mock_service: AsyncMock, messages: list
+    ) -> None:
+        """Test an after cursor is decoded and passed to the service."""
+        from src.core.models.ideation import MessageCursor
+
+        mock_service.get_messages.return_value = []
+        token = MessageCursor.of(messages[1]).encode()
+
+        response = paging_client.get(
+            f"/api/studio/ideation/sessions/session-123/messages?after={token}"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["messages"] == []
+        assert data["prevCursor"] is None
+        assert data["nextCursor"] == token
+        after = mock_service.get_messages.call_args.args[2]
+        assert after == MessageCursor.of(messages[1])
+
+    def test_invalid_cursor_returns_400(
+        self, paging_client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """Test a malformed cursor is rejected."""
+        response = paging_client.get(
+            "/api/studio/ideation/sessions/session-123/messages?before=not-a-cursor"
+        )
+
+        assert response.status_code == 400
+        mock_service.get_messages.assert_not_called()
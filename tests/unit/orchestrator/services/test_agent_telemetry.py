@@ -14,6 +14,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.orchestrator.services.agent_telemetry import (
+    AGENT_ACTIVE_SET_KEY,
+    AGENT_STATUS_CHANNEL,
     AgentTelemetryService,
     get_agent_telemetry_service,
 )
@@ -58,7 +60,7 @@ class TestGetAllAgentStatus:
         """Test that get_all_agent_status returns a list of AgentStatus."""
         # Mock Redis data
         service._redis_client.smembers.return_value = {"agent-1", "agent-2"}
-        service._redis_client.get.side_effect = [
+        service._redis_client.mget.return_value = [
             json.dumps({
                 "agent_id": "agent-1",
                 "agent_type": "backend",
@@ -98,13 +100,13 @@ class TestGetAllAgentStatus:
     ) -> None:
         """Test that agent data is correctly parsed."""
         service._redis_client.smembers.return_value = {"agent-1"}
-        service._redis_client.get.return_value = json.dumps({
+        service._redis_client.mget.return_value = [json.dumps({
             "agent_id": "agent-1",
             "agent_type": "backend",
             "status": "running",
             "current_task": "task-xyz",
             "progress": 75,
-        })
+        })]
 
         result = await service.get_all_agent_status()
 
@@ -122,13 +124,32 @@ class TestGetAllAgentStatus:
     ) -> None:
         """Test handling when agent status data is missing."""
         service._redis_client.smembers.return_value = {"agent-1"}
-        service._redis_client.get.return_value = None
+        service._redis_client.mget.return_value = [None]
 
         result = await service.get_all_agent_status()
 
         # Should skip agents with missing data
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_get_all_agent_status_single_round_trip(
+        self, service: AgentTelemetryService
+    ) -> None:
+        """Test that all status documents are read with one MGET."""
+        service._redis_client.smembers.return_value = {"agent-1", "agent-2", "agent-3"}
+        service._redis_client.mget.return_value = [None, None, None]
+
+        await service.get_all_agent_status()
+
+        service._redis_client.mget.assert_awaited_once()
+        keys = service._redis_client.mget.call_args.args[0]
+        assert sorted(keys) == [
+            "agent:status:agent-1",
+            "agent:status:agent-2",
+            "agent:status:agent-3",
+        ]
+        service._redis_client.get.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_all_agent_status_redis_error(
         self, service: AgentTelemetryService
@@ -274,7 +295,7 @@ class TestGetAgentMetrics:
             "agent:metrics:backend",
             "agent:metrics:frontend",
         ]
-        service._redis_client.get.side_effect = [
+        service._redis_client.mget.return_value = [
             json.dumps({
                 "agent_type": "backend",
                 "total_executions": 100,
@@ -301,12 +322,12 @@ class TestGetAgentMetrics:
     ) -> None:
         """Test that metrics data is correctly parsed."""
         service._redis_client.keys.return_value = ["agent:metrics:backend"]
-        service._redis_client.get.return_value = json.dumps({
+        service._redis_client.mget.return_value = [json.dumps({
             "agent_type": "backend",
             "total_executions": 100,
             "success_rate": 0.95,
             "avg_duration": 5.5,
-        })
+        })]
 
         result = await service.get_agent_metrics()
 
@@ -334,7 +355,7 @@ class TestGetAgentMetrics:
     ) -> None:
         """Test handling when metrics data is missing."""
         service._redis_client.keys.return_value = ["agent:metrics:backend"]
-        service._redis_client.get.return_value = None
+        service._redis_client.mget.return_value = [None]
 
         result = await service.get_agent_metrics()
 
@@ -342,6 +363,62 @@ class TestGetAgentMetrics:
         assert result == []
 
 
+class TestStatusUpdates:
+    """Tests for publishing and subscribing to status changes."""
+
+    @pytest.mark.asyncio
+    async def test_publish_agent_status_writes_and_publishes(self) -> None:
+        """Test that status, active set and channel are updated together."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, 1, 1])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        client = AsyncMock()
+        client.pipeline = MagicMock(return_value=pipe)
+        service = AgentTelemetryService(redis_client=client)
+
+        data = {"agent_id": "agent-1", "agent_type": "backend", "status": "running"}
+        await service.publish_agent_status(data, ttl_seconds=60)
+
+        client.pipeline.assert_called_once_with(transaction=True)
+        pipe.set.assert_called_once_with("agent:status:agent-1", json.dumps(data), ex=60)
+        pipe.sadd.assert_called_once_with(AGENT_ACTIVE_SET_KEY, "agent-1")
+        pipe.publish.assert_called_once_with(AGENT_STATUS_CHANNEL, json.dumps(data))
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_status_updates_yields_parsed_statuses(self) -> None:
+        """Test that published messages are parsed and bad ones skipped."""
+        messages = [
+            {"type": "message", "data": "not json"},
+            {"type": "message", "data": json.dumps({
+                "agent_id": "agent-1",
+                "agent_type": "backend",
+                "status": "running",
+                "progress": 40,
+            })},
+        ]
+
+        async def _listen():
+            for message in messages:
+                yield message
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.unsubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.listen = _listen
+        client = MagicMock()
+        client.pubsub = MagicMock(return_value=pubsub)
+        service = AgentTelemetryService(redis_client=client)
+
+        statuses = [s async for s in service.subscribe_status_updates()]
+
+        assert [(s.agent_id, s.progress) for s in statuses] == [("agent-1", 40)]
+        pubsub.subscribe.assert_awaited_once_with(AGENT_STATUS_CHANNEL)
+        pubsub.aclose.assert_awaited_once()
+
+
 class TestGetAgentTelemetryServiceSingleton:
     """Tests for the singleton get_agent_telemetry_service function."""
 
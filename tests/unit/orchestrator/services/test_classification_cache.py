@@ -0,0 +1,135 @@
+"""Unit tests for the classification result cache."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator
+
+import pytest
+
+from src.orchestrator.api.models.classification import (
+    ClassificationResult,
+    ClassificationType,
+)
+from src.orchestrator.services.classification_cache import (
+    REDIS_CLASSIFICATION_CACHE_PREFIX,
+    ClassificationCache,
+    content_hash,
+    taxonomy_fingerprint,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory Redis supporting the calls used by the cache."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.store[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def scan_iter(self, match: str, count: int = 10) -> AsyncIterator[str]:
+        prefix = match.rstrip("*")
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+    async def unlink(self, *keys: str) -> int:
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+def _result(idea_id: str = "idea-1") -> ClassificationResult:
+    return ClassificationResult(
+        idea_id=idea_id,
+        classification=ClassificationType.NON_FUNCTIONAL,
+        confidence=0.8,
+        labels=["performance"],
+        reasoning="Latency target",
+        model_version="claude-sonnet-4:1.0.0",
+    )
+
+
+class TestKeys:
+    """Tests for cache key derivation."""
+
+    def test_content_hash_normalises_whitespace_and_case(self) -> None:
+        assert content_hash("  Reduce  API\nlatency ") == content_hash("reduce api latency")
+        assert content_hash("reduce api latency") != content_hash("reduce db latency")
+
+    def test_taxonomy_fingerprint_changes_with_labels(self) -> None:
+        base = taxonomy_fingerprint("1.0", "- feature (Feature)")
+        assert base == taxonomy_fingerprint("1.0", "- feature (Feature)")
+        assert base != taxonomy_fingerprint("1.0", "- feature (Feature)\n- bug (Bug)")
+        assert base != taxonomy_fingerprint("1.1", "- feature (Feature)")
+
+    def test_key_includes_every_component(self) -> None:
+        cache = ClassificationCache(ttl_seconds=60)
+        key = cache.make_key("Idea", "fp", "1.0.0", "model-a")
+
+        assert key.startswith(REDIS_CLASSIFICATION_CACHE_PREFIX)
+        assert key != cache.make_key("Idea", "fp", "1.0.1", "model-a")
+        assert key != cache.make_key("Idea", "fp", "1.0.0", "model-b")
+        assert key != cache.make_key("Idea", "fp2", "1.0.0", "model-a")
+
+
+class TestCacheOperations:
+    """Tests for get/set/invalidate."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_rebinds_idea_id(self) -> None:
+        redis_client = FakeRedis()
+        cache = ClassificationCache(ttl_seconds=3600)
+        key = cache.make_key("Idea", "fp", "1.0.0", "model")
+
+        await cache.set(redis_client, key, _result("idea-1"))
+        cached = await cache.get(redis_client, key, "idea-2")
+
+        assert cached is not None
+        assert cached.idea_id == "idea-2"
+        assert cached.classification == ClassificationType.NON_FUNCTIONAL
+        assert cached.labels == ["performance"]
+        assert redis_client.ttls[key] == 3600
+        assert "idea_id" not in json.loads(redis_client.store[key])
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_miss_and_unreadable_entry(self) -> None:
+        redis_client = FakeRedis()
+        cache = ClassificationCache(ttl_seconds=3600)
+
+        assert await cache.get(redis_client, "missing", "idea-1") is None
+        redis_client.store["bad"] = "{not json"
+        assert await cache.get(redis_client, "bad", "idea-1") is None
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self) -> None:
+        redis_client = FakeRedis()
+        cache = ClassificationCache(ttl_seconds=0)
+
+        await cache.set(redis_client, "key", _result())
+
+        assert redis_client.store == {}
+        assert await cache.get(redis_client, "key", "idea-1") is None
+
+    def test_ttl_from_environment(self, monkeypatch: Any) -> None:
+        monkeypatch.setenv("CLASSIFICATION_CACHE_TTL_SECONDS", "120")
+        assert ClassificationCache().ttl_seconds == 120
+
+    @pytest.mark.asyncio
+    async def test_invalidate_removes_only_cache_keys(self) -> None:
+        redis_client = FakeRedis()
+        cache = ClassificationCache(ttl_seconds=3600)
+        for i in range(3):
+            await cache.set(redis_client, cache.make_key(f"idea {i}", "fp", "1", "m"), _result())
+        redis_client.store["classification:result:idea-1"] = "{}"
+
+        assert await cache.invalidate(redis_client) == 3
+        assert list(redis_client.store) == ["classification:result:idea-1"]
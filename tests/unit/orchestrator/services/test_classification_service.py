@@ -627,6 +627,254 @@ class TestLLMIntegration:
         assert "bug" in result.labels or result.classification == ClassificationType.UNDETERMINED
 
 
+class TestBatchClassification:
+    """Tests for multi-idea classification."""
+
+    @pytest.fixture
+    def service(self) -> ClassificationService:
+        """Create a service instance with mocked dependencies."""
+        return ClassificationService(
+            redis_client=AsyncMock(),
+            taxonomy_service=AsyncMock(),
+            ideas_service=AsyncMock(),
+            llm_factory=AsyncMock(),
+        )
+
+    @staticmethod
+    def _idea(idea_id: str, content: str) -> Idea:
+        now = datetime.now(timezone.utc)
+        return Idea(
+            id=idea_id,
+            content=content,
+            author_id="user-1",
+            author_name="Test",
+            status=IdeaStatus.ACTIVE,
+            classification=IdeaClassification.UNDETERMINED,
+            labels=[],
+            created_at=now,
+            updated_at=now,
+        )
+
+    @staticmethod
+    def _setup(service: ClassificationService, ideas: dict, response: dict) -> AsyncMock:
+        now = datetime.now(timezone.utc)
+        service._ideas_service.get_idea.side_effect = lambda idea_id: ideas.get(idea_id)
+        service._taxonomy_service.get_taxonomy.return_value = LabelTaxonomy(
+            id="default",
+            name="Default",
+            labels=[LabelDefinition(id="feature", name="Feature")],
+            version="1.0",
+            created_at=now,
+            updated_at=now,
+        )
+        service._taxonomy_service.to_prompt_format.return_value = "Labels: feature"
+        client = AsyncMock()
+        client.model = "claude-sonnet-4"
+        llm_response = MagicMock()
+        llm_response.content = json.dumps(response)
+        client.generate.return_value = llm_response
+        service._llm_factory.get_client.return_value = client
+        return client
+
+    def test_build_batch_prompt_numbers_ideas(
+        self, service: ClassificationService
+    ) -> None:
+        """Ideas are numbered from 1 in the multi-idea prompt."""
+        prompt = service.build_batch_classification_prompt(
+            ["Add dark mode", "Speed up search"], "Labels: feature"
+        )
+
+        assert "### Idea 1\nAdd dark mode" in prompt
+        assert "### Idea 2\nSpeed up search" in prompt
+        assert "Labels: feature" in prompt
+
+    def test_parse_batch_response(self, service: ClassificationService) -> None:
+        """Entries are normalized and keyed by zero-based index."""
+        response = "```json\n" + json.dumps({
+            "results": [
+                {"id": "2", "classification": "NON_FUNCTIONAL", "confidence": 0.8},
+                {"id": 1, "classification": "bogus"},
+                {"id": "9", "classification": "functional"},
+                {"classification": "functional"},
+            ]
+        }) + "\n```"
+
+        parsed = service.parse_batch_classification_response(response, 2)
+
+        assert set(parsed) == {0, 1}
+        assert parsed[1]["classification"] == "non_functional"
+        assert parsed[0]["classification"] == "undetermined"
+        assert parsed[0]["confidence"] == 0.5
+
+    def test_parse_batch_invalid_json(self, service: ClassificationService) -> None:
+        """Unparseable responses yield no entries."""
+        assert service.parse_batch_classification_response("nope", 3) == {}
+
+    @pytest.mark.asyncio
+    async def test_classify_ideas_packs_into_one_llm_call(
+        self, service: ClassificationService
+    ) -> None:
+        """Short ideas share one LLM call; missing ones fall back to single."""
+        ideas = {
+            "idea-1": self._idea("idea-1", "Add OAuth login"),
+            "idea-2": self._idea("idea-2", "Reduce latency"),
+            "idea-3": self._idea("idea-3", "Export to CSV"),
+        }
+        client = self._setup(service, ideas, {
+            "results": [
+                {"id": "1", "classification": "functional", "confidence": 0.9,
+                 "labels": ["feature", "unknown"]},
+                {"id": "2", "classification": "non_functional", "confidence": 0.8},
+            ]
+        })
+
+        results = await service.classify_ideas(["idea-1", "idea-2", "idea-3", "idea-x"])
+
+        assert results["idea-1"].classification == ClassificationType.FUNCTIONAL
+        assert results["idea-1"].labels == ["feature"]
+        assert results["idea-2"].classification == ClassificationType.NON_FUNCTIONAL
+        # idea-3 missing from the batch response: classified on its own
+        assert results["idea-3"].idea_id == "idea-3"
+        assert isinstance(results["idea-x"], ValueError)
+        assert client.generate.await_count == 2
+        first_prompt = client.generate.call_args_list[0].kwargs["prompt"]
+        assert "### Idea 3\nExport to CSV" in first_prompt
+        assert service._ideas_service.update_idea.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_classify_ideas_long_idea_not_packed(
+        self, service: ClassificationService
+    ) -> None:
+        """Ideas over the size limit are classified individually."""
+        from src.orchestrator.services.classification_service import (
+            BATCH_MAX_IDEA_CHARS,
+        )
+
+        ideas = {
+            "idea-1": self._idea("idea-1", "x" * (BATCH_MAX_IDEA_CHARS + 1)),
+            "idea-2": self._idea("idea-2", "Short idea"),
+        }
+        client = self._setup(service, ideas, {
+            "classification": "functional", "confidence": 0.9,
+        })
+
+        results = await service.classify_ideas(["idea-1", "idea-2"])
+
+        assert set(results) == {"idea-1", "idea-2"}
+        # Only one short idea left, so no multi-idea prompt is used
+        for call in client.generate.call_args_list:
+            assert "### Idea 1" not in call.kwargs["prompt"]
+
+
+class TestResultCache:
+    """Tests for the classification result cache integration."""
+
+    @pytest.fixture
+    def service(self) -> ClassificationService:
+        """Create a service backed by an in-memory Redis."""
+        from tests.unit.orchestrator.services.test_classification_cache import FakeRedis
+
+        from src.orchestrator.services.classification_cache import ClassificationCache
+
+        now = datetime.now(timezone.utc)
+        service = ClassificationService(
+            redis_client=FakeRedis(),
+            taxonomy_service=AsyncMock(),
+            ideas_service=AsyncMock(),
+            llm_factory=AsyncMock(),
+            cache=ClassificationCache(ttl_seconds=3600),
+        )
+        service._taxonomy_service.get_taxonomy.return_value = LabelTaxonomy(
+            id="default",
+            name="Default",
+            labels=[LabelDefinition(id="feature", name="Feature")],
+            version="1.0",
+            created_at=now,
+            updated_at=now,
+        )
+        service._taxonomy_service.to_prompt_format.return_value = "Labels: feature"
+        ideas = {
+            "idea-1": TestBatchClassification._idea("idea-1", "Add OAuth login"),
+            "idea-2": TestBatchClassification._idea("idea-2", "add  oauth LOGIN"),
+            "idea-3": TestBatchClassification._idea("idea-3", "Reduce latency"),
+        }
+        service._ideas_service.get_idea.side_effect = lambda idea_id: ideas.get(idea_id)
+
+        client = AsyncMock()
+        client.model = "claude-sonnet-4"
+        response = MagicMock()
+        response.content = json.dumps({
+            "classification": "functional",
+            "confidence": 0.9,
+            "labels": ["feature"],
+        })
+        client.generate.return_value = response
+        service._llm_factory.get_client.return_value = client
+        service.llm_client = client
+        return service
+
+    @pytest.mark.asyncio
+    async def test_forced_rerun_uses_cache(self, service: ClassificationService) -> None:
+        """Re-classifying unchanged content does not call the LLM again."""
+        first = await service.classify_idea("idea-1", force=True)
+        second = await service.classify_idea("idea-1", force=True)
+
+        assert service.llm_client.generate.await_count == 1
+        assert second.classification == first.classification
+        assert second.idea_id == "idea-1"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_shares_entry(
+        self, service: ClassificationService
+    ) -> None:
+        """Ideas with the same normalised content share a cache entry."""
+        await service.classify_idea("idea-1")
+        result = await service.classify_idea("idea-2")
+
+        assert service.llm_client.generate.await_count == 1
+        assert result.idea_id == "idea-2"
+
+    @pytest.mark.asyncio
+    async def test_taxonomy_change_misses(self, service: ClassificationService) -> None:
+        """A different taxonomy prompt produces a new cache key."""
+        await service.classify_idea("idea-1")
+        service._taxonomy_service.to_prompt_format.return_value = "Labels: feature, bug"
+        await service.classify_idea("idea-1", force=True)
+
+        assert service.llm_client.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_cached(
+        self, service: ClassificationService
+    ) -> None:
+        """Parse failures are not cached."""
+        service.llm_client.generate.return_value.content = "not json"
+        await service.classify_idea("idea-1")
+        await service.classify_idea("idea-1", force=True)
+
+        assert service.llm_client.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_only_sends_cache_misses(
+        self, service: ClassificationService
+    ) -> None:
+        """Cached ideas are left out of the multi-idea prompt."""
+        await service.classify_idea("idea-1")
+        service.llm_client.generate.return_value.content = json.dumps({
+            "results": [
+                {"id": "1", "classification": "non_functional", "confidence": 0.8},
+            ]
+        })
+
+        results = await service.classify_ideas(["idea-2", "idea-3"], force=True)
+
+        assert results["idea-2"].classification == ClassificationType.FUNCTIONAL
+        assert results["idea-3"].classification == ClassificationType.NON_FUNCTIONAL
+        prompt = service.llm_client.generate.call_args.kwargs["prompt"]
+        assert "### Idea 1\nReduce latency" in prompt
+        assert "oauth" not in prompt.lower()
+
+
 class TestGetClassificationService:
     """Tests for get_classification_service function."""
 
@@ -0,0 +1,244 @@
+"""Unit tests for ideation conversation context management."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from scripts.benchmarks.benchmark_ideation_context import make_service
+from src.core.models.ideation import ChatMessage, IdeationSession, MessageRole
+from src.infrastructure.llm.base_client import LLMResponse
+from src.orchestrator.routes.ideation_api import IdeationChatRequest
+from src.orchestrator.services.ideation_context import (
+    SUMMARY_SYSTEM_PROMPT,
+    ConversationContextManager,
+    estimate_tokens,
+)
+
+
+def _messages(count: int, words: int = 10) -> list[dict[str, str]]:
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": " ".join([f"m{i}"] * words),
+        }
+        for i in range(count)
+    ]
+
+
+def _request(message: str) -> IdeationChatRequest:
+    return IdeationChatRequest(sessionId="session-1", message=message, currentMaturity=0)
+
+
+class TestConversationContextManager:
+    """Tests for windowing and refresh decisions."""
+
+    def test_build_keeps_all_messages_within_budget(self) -> None:
+        manager = ConversationContextManager(token_budget=10_000)
+        messages = _messages(6)
+
+        context = manager.build("", 4, messages)
+
+        assert context.recent == messages
+        assert context.summarized_count == 4
+        assert context.unsummarized_count == 6
+
+    def test_build_trims_oldest_messages_to_budget(self) -> None:
+        messages = _messages(10, words=20)
+        per_message = estimate_tokens(messages[0]["content"]) + 4
+        manager = ConversationContextManager(token_budget=per_message * 3)
+
+        context = manager.build("", 0, messages)
+
+        assert context.recent == messages[-3:]
+        assert context.unsummarized_count == 10
+        assert context.token_estimate <= manager.token_budget
+
+    def test_build_keeps_at_most_history_messages(self) -> None:
+        manager = ConversationContextManager(token_budget=10_000, history_messages=4)
+        messages = _messages(10)
+
+        context = manager.build("", 0, messages)
+
+        assert context.recent == messages[-4:]
+
+    def test_build_never_exceeds_the_history_window(self) -> None:
+        manager = ConversationContextManager(token_budget=10_000, history_messages=4)
+        messages = _messages(10, words=20)
+        summary = " ".join(["fact"] * 30)
+        window_tokens = sum(estimate_tokens(m["content"]) + 4 for m in messages[-4:])
+
+        context = manager.build(summary, 8, messages)
+
+        assert context.summary == summary
+        assert context.recent == messages[-2:]
+        assert context.token_estimate <= window_tokens
+
+    def test_build_keeps_latest_message_over_budget(self) -> None:
+        manager = ConversationContextManager(token_budget=1)
+        messages = _messages(3, words=50)
+
+        context = manager.build("", 0, messages)
+
+        assert context.recent == messages[-1:]
+
+    def test_needs_refresh_after_interval(self) -> None:
+        manager = ConversationContextManager(
+            summary_every_turns=3, keep_recent_messages=4
+        )
+
+        assert manager.needs_refresh(9) is False
+        assert manager.needs_refresh(10) is True
+
+    def test_messages_to_fold_keeps_recent(self) -> None:
+        manager = ConversationContextManager(keep_recent_messages=4)
+        messages = _messages(10)
+
+        assert manager.messages_to_fold(messages) == messages[:6]
+        assert manager.messages_to_fold(messages[:4]) == []
+
+    def test_env_configuration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("IDEATION_CONTEXT_TOKEN_BUDGET", "1234")
+        monkeypatch.setenv("IDEATION_SUMMARY_EVERY_TURNS", "5")
+        monkeypatch.setenv("IDEATION_KEEP_RECENT_MESSAGES", "2")
+        monkeypatch.setenv("IDEATION_CONTEXT_HISTORY_MESSAGES", "7")
+
+        manager = ConversationContextManager()
+
+        assert manager.token_budget == 1234
+        assert manager.summary_every_turns == 5
+        assert manager.keep_recent_messages == 2
+        assert manager.history_messages == 7
+
+    @pytest.mark.asyncio
+    async def test_summarize_folds_messages_into_summary(self) -> None:
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(content=" - new summary ", model="m")
+        manager = ConversationContextManager()
+
+        summary = await manager.summarize(client, "old summary", _messages(2))
+
+        assert summary == "- new summary"
+        kwargs = client.generate.call_args.kwargs
+        assert kwargs["system"] == SUMMARY_SYSTEM_PROMPT
+        assert "old summary" in kwargs["prompt"]
+        assert "USER: m0" in kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_summarize_without_messages_keeps_summary(self) -> None:
+        client = AsyncMock()
+        manager = ConversationContextManager()
+
+        assert await manager.summarize(client, "old", []) == "old"
+        client.generate.assert_not_called()
+
+
+class TestIdeationServiceContext:
+    """Tests for rolling summaries in IdeationServiceImpl.process_chat."""
+
+    @pytest.mark.asyncio
+    async def test_summary_refreshes_every_interval(self) -> None:
+        manager = ConversationContextManager(
+            token_budget=100_000, summary_every_turns=2, keep_recent_messages=2
+        )
+        service, client, repos = make_service(manager)
+
+        for turn in range(3):
+            await service.process_chat(_request(f"turn {turn}"))
+            await service.wait_for_summary_refreshes()
+
+        session = repos.sessions["session-1"]
+        assert len(client.summary_prompts) == 1
+        assert session.context_summary
+        assert session.summarized_message_count == 4
+        assert len(repos.messages["session-1"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_prompt_uses_summary_and_unsummarized_messages(self) -> None:
+        manager = ConversationContextManager(
+            token_budget=100_000, summary_every_turns=2, keep_recent_messages=4
+        )
+        service, client, repos = make_service(manager)
+
+        for turn in range(5):
+            # Long enough that the summary leaves room for the window
+            await service.process_chat(_request(f"turn {turn} " + "detail " * 200))
+            await service.wait_for_summary_refreshes()
+
+        prompt = client.prompts[-1]
+        summary = repos.sessions["session-1"].context_summary
+        assert prompt.index(summary) < prompt.index("Conversation history")
+        assert "USER: turn 0" not in prompt
+        assert "USER: turn 3" in prompt
+        assert prompt.index("Conversation history") < prompt.index(
+            "Current maturity scores"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_state(self) -> None:
+        manager = ConversationContextManager(
+            token_budget=100_000, summary_every_turns=1, keep_recent_messages=0
+        )
+        service, client, repos = make_service(manager)
+        manager.summarize = AsyncMock(side_effect=RuntimeError("LLM down"))
+
+        response = await service.process_chat(_request("hello"))
+        await service.wait_for_summary_refreshes()
+
+        assert response.message.content
+        session = repos.sessions["session-1"]
+        assert session.context_summary == ""
+        assert session.summarized_message_count == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_only_unsummarized_messages(self) -> None:
+        manager = ConversationContextManager(
+            token_budget=100_000, summary_every_turns=2, keep_recent_messages=2
+        )
+        service, _, repos = make_service(manager)
+        turns = 20
+
+        for turn in range(turns):
+            await service.process_chat(_request(f"turn {turn}"))
+            await service.wait_for_summary_refreshes()
+
+        # Reloading the full history every turn would read 2 * turn rows
+        full_history_rows = sum(2 * turn for turn in range(turns))
+        assert repos.stats["rows_read"] < full_history_rows / 2
+
+    @pytest.mark.asyncio
+    async def test_context_uses_newest_messages_past_the_limit(self) -> None:
+        manager = ConversationContextManager(
+            token_budget=100_000, summary_every_turns=1, keep_recent_messages=2
+        )
+        service, _, repos = make_service(manager)
+        repos.sessions["session-1"] = IdeationSession(
+            id="session-1",
+            project_name="p",
+            user_id="u",
+            summarized_message_count=2,
+        )
+        repos.messages["session-1"] = [
+            ChatMessage(
+                id=f"msg-{i}",
+                session_id="session-1",
+                role=MessageRole.USER,
+                content=f"message {i}",
+            )
+            for i in range(30)
+        ]
+
+        context = await service._get_conversation_context("session-1")
+
+        assert manager.max_unsummarized_messages == 6
+        assert [m["content"] for m in context.recent] == [
+            f"message {i}" for i in range(24, 30)
+        ]
+        assert context.unsummarized_count == 28
+        assert manager.needs_refresh(context.unsummarized_count)
+
+        # Refreshes still fold the oldest unsummarized messages first
+        _, summarized_count, oldest = await service._load_unsummarized("session-1")
+        assert summarized_count == 2
+        assert oldest[0]["content"] == "message 2"
@@ -0,0 +1,311 @@
+"""Unit tests for the K8s watch-based informer cache."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.metrics import K8S_INFORMER_EVENTS, K8S_INFORMER_RELISTS
+from src.orchestrator.api.models.k8s import ClusterHealthStatus, NodeStatus
+from src.orchestrator.services.k8s_cluster import K8sClusterService
+from src.orchestrator.services.k8s_informer import (
+    NODES,
+    PODS,
+    ClusterInformer,
+    KubernetesWatchSource,
+    MockWatchSource,
+    WatchExpired,
+)
+
+
+def _node(name: str, ready: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(
+            name=name,
+            namespace=None,
+            labels={"node-role.kubernetes.io/worker": ""},
+            creation_timestamp=datetime.now(timezone.utc),
+        ),
+        status=SimpleNamespace(
+            conditions=[
+                SimpleNamespace(
+                    type="Ready",
+                    status="True" if ready else "False",
+                    reason="KubeletReady",
+                    message="",
+                    last_transition_time=None,
+                )
+            ],
+            capacity={"cpu": "4", "memory": "16Gi", "pods": "110"},
+            allocatable={"cpu": "4", "memory": "16Gi", "pods": "110"},
+            node_info=None,
+        ),
+    )
+
+
+def _pod(
+    name: str,
+    node: str = "worker-1",
+    phase: str = "Running",
+    namespace: str = "default",
+    age: timedelta = timedelta(minutes=5),
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(
+            name=name,
+            namespace=namespace,
+            labels={},
+            owner_references=None,
+            creation_timestamp=datetime.now(timezone.utc) - age,
+        ),
+        spec=SimpleNamespace(node_name=node),
+        status=SimpleNamespace(
+            phase=phase, pod_ip="", host_ip="", container_statuses=None
+        ),
+    )
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def source() -> MockWatchSource:
+    return MockWatchSource(nodes=[_node("worker-1")], pods=[_pod("a"), _pod("b")])
+
+
+@pytest.fixture
+def informer(source: MockWatchSource):
+    informer = ClusterInformer(source, watch_timeout_seconds=1)
+    informer.start()
+    assert informer.wait_for_sync(timeout=2)
+    yield informer
+    informer.stop()
+
+
+def _names(informer: ClusterInformer, kind: str) -> set[str]:
+    return {obj.metadata.name for obj in informer.items(kind)}
+
+
+class TestClusterInformer:
+    """Tests for list/watch synchronisation."""
+
+    def test_initial_list_populates_store(self, informer: ClusterInformer) -> None:
+        assert informer.has_synced()
+        assert _names(informer, NODES) == {"worker-1"}
+        assert _names(informer, PODS) == {"a", "b"}
+
+    def test_applies_watch_events(
+        self, source: MockWatchSource, informer: ClusterInformer
+    ) -> None:
+        source.add(PODS, _pod("c"))
+        source.delete(PODS, _pod("a"))
+        modified = _pod("b", phase="Failed")
+        source.modify(PODS, modified)
+
+        _wait_until(lambda: _names(informer, PODS) == {"b", "c"})
+        _wait_until(
+            lambda: {p.metadata.name: p.status.phase for p in informer.items(PODS)}["b"]
+            == "Failed"
+        )
+        assert source.list_calls[PODS] == 1
+
+    def test_resumes_from_last_resource_version(
+        self, source: MockWatchSource, informer: ClusterInformer
+    ) -> None:
+        pod = _pod("c")
+        source.add(PODS, pod)
+        _wait_until(lambda: "c" in _names(informer, PODS))
+
+        # Let the 1s watch time out and be resumed
+        _wait_until(lambda: len([c for c in source.watch_calls if c[0] == PODS]) >= 2)
+
+        resumed_from = [rv for kind, rv in source.watch_calls if kind == PODS][-1]
+        assert resumed_from == pod.metadata.resource_version
+        assert source.list_calls[PODS] == 1
+
+    def test_relists_when_resource_version_expires(
+        self, source: MockWatchSource, informer: ClusterInformer
+    ) -> None:
+        relists = K8S_INFORMER_RELISTS.labels(resource=PODS)._value.get()
+
+        source.expire(PODS)
+
+        _wait_until(lambda: source.list_calls[PODS] == 2)
+        assert K8S_INFORMER_RELISTS.labels(resource=PODS)._value.get() == relists + 1
+        source.add(PODS, _pod("c"))
+        _wait_until(lambda: _names(informer, PODS) == {"a", "b", "c"})
+
+    def test_retries_after_list_failure(self) -> None:
+        source = MockWatchSource(pods=[_pod("a")])
+        real_list = source.list
+        failures = iter([RuntimeError("API unavailable")])
+
+        def flaky_list(kind: str):
+            if kind == PODS:
+                error = next(failures, None)
+                if error:
+                    raise error
+            return real_list(kind)
+
+        source.list = flaky_list
+        informer = ClusterInformer(source, watch_timeout_seconds=1)
+        with patch("src.orchestrator.services.k8s_informer.INITIAL_BACKOFF_SECONDS", 0.01):
+            informer.start()
+            try:
+                assert informer.wait_for_sync(timeout=2)
+            finally:
+                informer.stop()
+
+        assert source.list_calls[PODS] == 1
+
+    def test_counts_events_and_reports_cache_age(
+        self, source: MockWatchSource, informer: ClusterInformer
+    ) -> None:
+        events = K8S_INFORMER_EVENTS.labels(resource=PODS, type="ADDED")._value.get()
+
+        source.add(PODS, _pod("c"))
+        _wait_until(lambda: "c" in _names(informer, PODS))
+
+        assert K8S_INFORMER_EVENTS.labels(resource=PODS, type="ADDED")._value.get() == events + 1
+        assert 0 <= informer.cache_age(PODS) < 1
+
+    def test_stop_ends_threads(self, informer: ClusterInformer) -> None:
+        informer.stop()
+
+        assert not informer.running
+
+
+class TestKubernetesWatchSource:
+    """Tests for the kubernetes client adapter."""
+
+    def test_list_returns_items_and_resource_version(self) -> None:
+        api = MagicMock()
+        api.list_node.return_value.items = ["n1"]
+        api.list_node.return_value.metadata.resource_version = "42"
+
+        assert KubernetesWatchSource(api).list(NODES) == (["n1"], "42")
+
+    def test_watch_resumes_with_resource_version_and_bookmarks(self) -> None:
+        api = MagicMock()
+        pod = object()
+        with patch("kubernetes.watch.Watch") as watch_cls:
+            watch_cls.return_value.stream.return_value = iter(
+                [{"type": "ADDED", "object": pod}]
+            )
+
+            events = list(KubernetesWatchSource(api).watch(PODS, "7", 30))
+
+        assert events == [("ADDED", pod)]
+        kwargs = watch_cls.return_value.stream.call_args.kwargs
+        assert kwargs["resource_version"] == "7"
+        assert kwargs["allow_watch_bookmarks"] is True
+        watch_cls.return_value.stop.assert_called_once()
+
+    def test_watch_raises_expired_on_410(self) -> None:
+        from kubernetes.client.exceptions import ApiException
+
+        with patch("kubernetes.watch.Watch") as watch_cls:
+            watch_cls.return_value.stream.side_effect = ApiException(status=410, reason="Gone")
+
+            with pytest.raises(WatchExpired):
+                list(KubernetesWatchSource(MagicMock()).watch(PODS, "7", 30))
+
+    def test_watch_raises_expired_on_410_error_event(self) -> None:
+        with patch("kubernetes.watch.Watch") as watch_cls:
+            watch_cls.return_value.stream.return_value = iter(
+                [{"type": "ERROR", "raw_object": {"code": 410, "message": "too old"}}]
+            )
+
+            with pytest.raises(WatchExpired):
+                list(KubernetesWatchSource(MagicMock()).watch(PODS, "7", 30))
+
+
+class TestK8sClusterServiceInformer:
+    """Tests for K8sClusterService reads served by the informer."""
+
+    @pytest.fixture
+    def service(self):
+        source = MockWatchSource(
+            nodes=[_node("worker-1"), _node("worker-2", ready=False)],
+            pods=[
+                _pod("a", node="worker-1"),
+                _pod("b", node="worker-1", phase="Pending", namespace="kube-system"),
+                _pod("c", node="worker-2", age=timedelta(days=3)),
+            ],
+        )
+        service = K8sClusterService(watch_source=source)
+        service.mock_mode = False
+        assert service.start_informer(sync_timeout=2)
+        yield service, source
+        service.stop_informer()
+
+    def test_reads_do_not_call_api(self, service) -> None:
+        svc, _ = service
+
+        with patch.object(svc, "_get_core_api", side_effect=AssertionError("API called")):
+            nodes = svc.get_nodes()
+            pods, total = svc.get_pods()
+            health = svc.get_cluster_health()
+
+        assert {n.name for n in nodes} == {"worker-1", "worker-2"}
+        assert total == 3
+        assert health.nodes_total == 2
+        assert health.nodes_ready == 1
+        assert health.pods_running == 2
+        assert health.pods_pending == 1
+        assert health.status == ClusterHealthStatus.CRITICAL
+
+    def test_node_pod_counts_follow_pod_events(self, service) -> None:
+        svc, source = service
+
+        source.add(PODS, _pod("d", node="worker-2"))
+        _wait_until(lambda: svc.get_pods()[1] == 4)
+
+        counts = {n.name: n.usage.pods_count for n in svc.get_nodes()}
+        assert counts == {"worker-1": 2, "worker-2": 2}
+        statuses = {n.name: n.status for n in svc.get_nodes()}
+        assert statuses["worker-2"] == NodeStatus.NOT_READY
+
+    def test_pod_filters_and_age(self, service) -> None:
+        svc, _ = service
+
+        pods, total = svc.get_pods(namespace="kube-system")
+        assert total == 1
+        assert pods[0].name == "b"
+        assert pods[0].age == "5m"
+
+        pods, _ = svc.get_pods(search="c")
+        assert pods[0].age == "3d"
+
+    def test_start_informer_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("K8S_INFORMER_ENABLED", "false")
+        svc = K8sClusterService(watch_source=MockWatchSource())
+
+        assert svc.start_informer(sync_timeout=0) is False
+        assert svc._informer is None
+
+    def test_start_informer_noop_in_mock_mode(self) -> None:
+        with patch("src.orchestrator.services.k8s_cluster.MOCK_MODE", True):
+            svc = K8sClusterService()
+
+        assert svc.start_informer(sync_timeout=0) is False
+        # Mock data is still served
+        assert len(svc.get_nodes()) == 3
+
+    def test_informer_restarts_after_stop(self, service) -> None:
+        svc, source = service
+
+        svc.stop_informer()
+        assert svc.start_informer(sync_timeout=2)
+        source.add(PODS, _pod("d"))
+
+        _wait_until(lambda: svc.get_pods()[1] == 4)
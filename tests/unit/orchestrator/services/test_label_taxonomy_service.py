@@ -142,6 +142,45 @@ class TestUpdateTaxonomy:
         # The updated_at should be newer than the original
         assert result.updated_at > old_time
 
+    @pytest.mark.asyncio
+    async def test_update_taxonomy_invalidates_classification_cache(
+        self, service: LabelTaxonomyService
+    ) -> None:
+        """Test that changing the taxonomy drops cached classifications."""
+        now = datetime.now(timezone.utc)
+        taxonomy = LabelTaxonomy(
+            id="test", name="Test", labels=[], version="1.0",
+            created_at=now, updated_at=now,
+        )
+
+        with patch(
+            "src.orchestrator.services.classification_cache.ClassificationCache.invalidate",
+            new_callable=AsyncMock,
+        ) as invalidate:
+            await service.update_taxonomy(taxonomy)
+
+        invalidate.assert_awaited_once_with(service._redis_client)
+
+    @pytest.mark.asyncio
+    async def test_update_taxonomy_survives_invalidation_failure(
+        self, service: LabelTaxonomyService
+    ) -> None:
+        """Test that a cache invalidation error does not fail the update."""
+        now = datetime.now(timezone.utc)
+        taxonomy = LabelTaxonomy(
+            id="test", name="Test", labels=[], version="1.0",
+            created_at=now, updated_at=now,
+        )
+
+        with patch(
+            "src.orchestrator.services.classification_cache.ClassificationCache.invalidate",
+            new_callable=AsyncMock,
+            side_effect=ConnectionError("down"),
+        ):
+            result = await service.update_taxonomy(taxonomy)
+
+        assert result.id == "test"
+
 
 class TestAddLabel:
     """Tests for add_label method."""
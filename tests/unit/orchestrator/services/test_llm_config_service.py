@@ -324,6 +324,68 @@ class TestAgentConfigOperations:
         assert value["provider"] == "anthropic"
         assert value["enabled"] is False
 
+    @pytest.mark.asyncio
+    async def test_update_agent_config_bumps_version_and_notifies(
+        self, service: LLMConfigService
+    ) -> None:
+        """Test that updates bump the shared version and call listeners."""
+        calls: list[str] = []
+
+        class Listener:
+            def on_change(self) -> None:
+                calls.append("changed")
+
+        listener = Listener()
+        service.add_change_listener(listener.on_change)
+        config = AgentLLMConfig(
+            role=AgentRole.CODING,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-1",
+        )
+
+        await service.update_agent_config(config)
+
+        service._redis_client.incr.assert_awaited_once_with("llm:config_version")
+        assert calls == ["changed"]
+
+    @pytest.mark.asyncio
+    async def test_change_listeners_are_weak(self, service: LLMConfigService) -> None:
+        """Test that bound-method listeners do not keep their owner alive."""
+
+        class Listener:
+            def on_change(self) -> None:
+                raise AssertionError("should have been collected")
+
+        service.add_change_listener(Listener().on_change)
+
+        await service._notify_config_changed()
+
+        assert service._change_listeners == []
+
+    def test_dead_listeners_pruned_on_registration(
+        self, service: LLMConfigService
+    ) -> None:
+        """Test that repeated registrations do not accumulate dead refs."""
+
+        class Listener:
+            def on_change(self) -> None:
+                pass
+
+        for _ in range(5):
+            service.add_change_listener(Listener().on_change)
+
+        assert len(service._change_listeners) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_config_version(self, service: LLMConfigService) -> None:
+        """Test reading the shared config version."""
+        service._redis_client.get.return_value = None
+        assert await service.get_config_version() == 0
+
+        service._redis_client.get.return_value = b"7"
+        assert await service.get_config_version() == 7
+
 
 class TestGetDecryptedKey:
     """Tests for get_decrypted_key method."""
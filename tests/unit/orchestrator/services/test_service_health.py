@@ -5,10 +5,12 @@ Tests query methods, caching, and error handling with mocked VictoriaMetrics res
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from src.orchestrator.api.models.service_health import (
@@ -230,8 +232,12 @@ class TestServiceHealthService:
             pod_count=1,
         )
         with patch.object(
+            service, "_fetch_all_services_health", new_callable=AsyncMock
+        ) as mock_batch, patch.object(
             service, "get_service_health", new_callable=AsyncMock
         ) as mock_get:
+            # Batched query fails, so each service is looked up individually
+            mock_batch.side_effect = Exception("Connection refused")
             mock_get.return_value = mock_health
 
             result = await service.get_all_services_health()
@@ -239,6 +245,7 @@ class TestServiceHealthService:
             assert isinstance(result, ServicesHealthResponse)
             assert len(result.services) == 5  # All 5 aSDLC services
             assert isinstance(result.timestamp, datetime)
+            assert mock_get.call_count == 5
 
     @pytest.mark.asyncio
     async def test_get_service_sparkline_success(
@@ -261,6 +268,30 @@ class TestServiceHealthService:
             assert result.data_points[0].timestamp == 1706367600
             assert result.data_points[0].value == 45.0
 
+    @pytest.mark.asyncio
+    async def test_get_service_sparkline_window_includes_current_minute(
+        self,
+        service: ServiceHealthService,
+        mock_vm_sparkline_response: dict,
+    ) -> None:
+        """Test that the sparkline end is rounded up to the next minute."""
+        with patch.object(
+            service, "_query_range", new_callable=AsyncMock
+        ) as mock_query:
+            mock_query.return_value = mock_vm_sparkline_response
+            before = datetime.now(timezone.utc)
+
+            await service.get_service_sparkline("orchestrator", "cpu")
+
+            _, start_str, end_str, step = mock_query.call_args.args
+            fmt = "%Y-%m-%dT%H:%M:%SZ"
+            start = datetime.strptime(start_str, fmt).replace(tzinfo=timezone.utc)
+            end = datetime.strptime(end_str, fmt).replace(tzinfo=timezone.utc)
+            assert end >= before
+            assert end.second == 0
+            assert end - start == timedelta(minutes=15)
+            assert step == "1m"
+
     @pytest.mark.asyncio
     async def test_get_service_sparkline_vm_unavailable(
         self,
@@ -322,3 +353,185 @@ class TestServiceHealthService:
             for metric in valid_metrics:
                 result = await service.get_service_sparkline("orchestrator", metric)
                 assert result.metric == metric
+
+
+def _by_service(values: dict[str, str]) -> dict[str, Any]:
+    """Build a VictoriaMetrics response with one series per service."""
+    return {
+        "status": "success",
+        "data": {
+            "result": [
+                {"metric": {"service": name}, "value": [1706367600, value]}
+                for name, value in values.items()
+            ]
+        },
+    }
+
+
+class TestBatchedServiceHealth:
+    """Tests for batched, cached and pooled querying."""
+
+    @pytest.fixture
+    def service(self) -> ServiceHealthService:
+        """Create a service instance for testing."""
+        return ServiceHealthService()
+
+    @pytest.fixture
+    def batch_responses(self) -> dict[str, dict[str, Any]]:
+        """Per-metric responses keyed by the metric name in the query."""
+        return {
+            "asdlc_process_cpu_percent": _by_service(
+                {"orchestrator": "45.5", "workers": "85.0", "redis": "NaN"}
+            ),
+            "asdlc_process_memory_bytes": _by_service({"orchestrator": "60.2"}),
+            "kube_pod_status_phase": _by_service({"orchestrator": "2", "workers": "5"}),
+            "asdlc_http_requests_total": _by_service({"orchestrator": "150.5"}),
+            "asdlc_http_request_duration_seconds_bucket": _by_service(
+                {"orchestrator": "0.025"}
+            ),
+        }
+
+    @staticmethod
+    def _responder(responses: dict[str, dict[str, Any]]):
+        async def _query(query: str) -> dict[str, Any]:
+            for metric, response in responses.items():
+                if f"{metric}{{" in query:
+                    return response
+            raise AssertionError(f"unexpected query: {query}")
+
+        return _query
+
+    @pytest.mark.asyncio
+    async def test_all_services_use_one_query_per_metric(
+        self, service: ServiceHealthService, batch_responses: dict
+    ) -> None:
+        """Test all services are fetched with five by (service) queries."""
+        with patch.object(
+            service, "_query_instant", side_effect=self._responder(batch_responses)
+        ) as mock_query:
+            result = await service.get_all_services_health()
+
+        assert mock_query.call_count == 5
+        assert all("by (service" in c.args[0] for c in mock_query.call_args_list)
+        health = {s.name: s for s in result.services}
+        assert [s.name for s in result.services] == sorted(health)
+        assert health["orchestrator"].cpu_percent == 45.5
+        assert health["orchestrator"].memory_percent == 60.2
+        assert health["orchestrator"].pod_count == 2
+        assert health["orchestrator"].request_rate == 150.5
+        assert health["orchestrator"].latency_p50 == 25.0
+        assert health["workers"].status == ServiceHealthStatus.DEGRADED
+        assert health["redis"].cpu_percent == 0.0
+        assert health["redis"].request_rate is None
+        assert health["elasticsearch"].pod_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_result_fills_health_cache(
+        self, service: ServiceHealthService, batch_responses: dict
+    ) -> None:
+        """Test a batch refresh serves later single and full lookups."""
+        with patch.object(
+            service, "_query_instant", side_effect=self._responder(batch_responses)
+        ) as mock_query:
+            await service.get_all_services_health()
+            await service.get_all_services_health()
+            single = await service.get_service_health("workers")
+
+        assert mock_query.call_count == 5
+        assert single.pod_count == 5
+
+    @pytest.mark.asyncio
+    async def test_service_queries_run_concurrently(
+        self, service: ServiceHealthService
+    ) -> None:
+        """Test the per-service queries are issued together."""
+        in_flight = 0
+        peak = 0
+
+        async def _query(query: str) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"data": {"result": []}}
+
+        with patch.object(service, "_query_instant", side_effect=_query):
+            await service.get_service_health("orchestrator")
+
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_share_one_request(
+        self, service: ServiceHealthService
+    ) -> None:
+        """Test concurrent identical queries are coalesced and cached."""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["query"])
+            return httpx.Response(200, json={"data": {"result": []}})
+
+        service._client = httpx.AsyncClient(
+            base_url="http://vm", transport=httpx.MockTransport(handler)
+        )
+
+        await asyncio.gather(*(service._query_instant("up") for _ in range(5)))
+        await service._query_instant("up")
+        await service._query_instant("down")
+
+        assert calls == ["up", "down"]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_query_cache_is_bounded(self, service: ServiceHealthService) -> None:
+        """Test the least recently used query responses are evicted."""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["query"])
+            return httpx.Response(200, json={"data": {"result": []}})
+
+        service._client = httpx.AsyncClient(
+            base_url="http://vm", transport=httpx.MockTransport(handler)
+        )
+        service._query_cache.max_entries = 2
+
+        for query in ("a", "b", "a", "c", "a", "b"):
+            await service._query_instant(query)
+
+        assert calls == ["a", "b", "c", "b"]
+        assert len(service._query_cache) == 2
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_queries_are_refetched(
+        self, service: ServiceHealthService
+    ) -> None:
+        """Test responses older than the TTL are fetched again and dropped."""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["query"])
+            return httpx.Response(200, json={"data": {"result": []}})
+
+        service._client = httpx.AsyncClient(
+            base_url="http://vm", transport=httpx.MockTransport(handler)
+        )
+        service._query_cache.ttl_seconds = 0
+
+        await service._query_instant("up")
+        await service._query_instant("up")
+
+        assert calls == ["up", "up"]
+        assert len(service._query_cache) == 0
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused(self, service: ServiceHealthService) -> None:
+        """Test one pooled client is used for all queries."""
+        client = service._get_client()
+
+        assert service._get_client() is client
+        await service.close()
+        assert service._client is None
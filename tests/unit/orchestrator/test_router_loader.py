@@ -0,0 +1,173 @@
+"""Unit tests for deferred orchestrator router loading."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.orchestrator.router_loader import (
+    ORCHESTRATOR_ROUTERS,
+    LazyRouterMiddleware,
+    RouterLoader,
+    RouterSpec,
+    get_router_loading_mode,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def router_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[RouterSpec, ...]:
+    """Throwaway router modules for this test only; `broken` fails to import."""
+    for name in ("alpha", "beta"):
+        (tmp_path / f"lazy_{name}_routes.py").write_text(textwrap.dedent(f"""
+            from fastapi import APIRouter
+
+            router = APIRouter(prefix="/api/{name}")
+
+            @router.get("/ping")
+            def ping() -> dict:
+                return {{"router": "{name}"}}
+        """))
+    (tmp_path / "lazy_broken_routes.py").write_text("raise ImportError('missing SDK')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield (
+        RouterSpec("alpha", "lazy_alpha_routes", "router", ("/api/alpha",)),
+        RouterSpec("beta", "lazy_beta_routes", "router", ("/api/beta",)),
+        RouterSpec("broken", "lazy_broken_routes", "router", ("/api/broken",)),
+    )
+    for name in ("lazy_alpha_routes", "lazy_beta_routes", "lazy_broken_routes"):
+        sys.modules.pop(name, None)
+
+
+def _lazy_app(specs: tuple[RouterSpec, ...]) -> tuple[FastAPI, RouterLoader]:
+    app = FastAPI()
+    loader = RouterLoader(app, specs)
+    app.add_middleware(LazyRouterMiddleware, loader=loader)
+
+    @app.get("/health")
+    def health() -> dict:
+        return {"status": "ok"}
+
+    return app, loader
+
+
+class TestRouterSpec:
+    """Tests for path matching."""
+
+    def test_serves_prefix_on_segment_boundary(self) -> None:
+        spec = RouterSpec("ideas", "m", "router", ("/api/ideas",))
+
+        assert spec.serves("/api/ideas")
+        assert spec.serves("/api/ideas/classify")
+        assert not spec.serves("/api/ideasx")
+        assert not spec.serves("/api/brainflare/ideas")
+
+    def test_orchestrator_specs_have_unique_names(self) -> None:
+        names = [s.name for s in ORCHESTRATOR_ROUTERS]
+
+        assert len(names) == len(set(names))
+
+
+class TestRouterLoader:
+    """Tests for lazy and background loading."""
+
+    def test_loads_router_on_first_request(self, router_modules) -> None:
+        app, loader = _lazy_app(router_modules)
+        client = TestClient(app)
+
+        assert client.get("/health").status_code == 200
+        assert "lazy_alpha_routes" not in sys.modules
+
+        response = client.get("/api/alpha/ping")
+
+        assert response.json() == {"router": "alpha"}
+        assert loader.is_loaded("alpha")
+        assert not loader.is_loaded("beta")
+        assert "lazy_beta_routes" not in sys.modules
+
+    def test_openapi_loads_every_router(self, router_modules) -> None:
+        app, loader = _lazy_app(router_modules)
+
+        paths = TestClient(app).get("/openapi.json").json()["paths"]
+
+        assert {"/api/alpha/ping", "/api/beta/ping"} <= set(paths)
+        assert [s.name for s in loader.pending] == ["broken"]
+
+    def test_failed_import_stays_pending(self, router_modules) -> None:
+        app, loader = _lazy_app(router_modules)
+        client = TestClient(app)
+
+        assert client.get("/api/broken/ping").status_code == 404
+        assert not loader.is_loaded("broken")
+        assert client.get("/api/beta/ping").status_code == 200
+
+    async def test_load_all_async(self, router_modules) -> None:
+        app, loader = _lazy_app(router_modules[:2])
+
+        await loader.load_all_async()
+
+        assert loader.pending == []
+        paths = app.openapi()["paths"]
+        assert {"/api/alpha/ping", "/api/beta/ping"} <= set(paths)
+
+    def test_load_all_raises_on_failed_import(self, router_modules) -> None:
+        _, loader = _lazy_app(router_modules)
+
+        with pytest.raises(ImportError):
+            loader.load_all()
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, "eager"), ("LAZY", "lazy"), ("background", "background"), ("bogus", "eager")],
+    )
+    def test_loading_mode_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, value: str | None, expected: str
+    ) -> None:
+        if value is None:
+            monkeypatch.delenv("ORCHESTRATOR_ROUTER_LOADING", raising=False)
+        else:
+            monkeypatch.setenv("ORCHESTRATOR_ROUTER_LOADING", value)
+
+        assert get_router_loading_mode() == expected
+
+
+class TestOrchestratorRouterLoading:
+    """Tests for router loading in create_app."""
+
+    def test_eager_mode_includes_every_router(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("ORCHESTRATOR_ROUTER_LOADING", raising=False)
+        from src.orchestrator.main import create_app
+
+        app = create_app()
+
+        assert app.state.router_loader.pending == []
+
+    def test_lazy_mode_defers_heavy_imports(self) -> None:
+        script = textwrap.dedent("""
+            import sys
+            from fastapi.testclient import TestClient
+            from src.orchestrator.main import create_app
+            app = create_app()
+            assert TestClient(app).get("/health").status_code == 200
+            heavy = [m for m in ("kubernetes", "elasticsearch", "anthropic") if m in sys.modules]
+            print(len(app.state.router_loader.pending), heavy)
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            env={"PATH": "", "PYTHONPATH": str(REPO_ROOT), "ORCHESTRATOR_ROUTER_LOADING": "lazy"},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split()[0] == str(len(ORCHESTRATOR_ROUTERS))
+        assert result.stdout.strip().endswith("[]")
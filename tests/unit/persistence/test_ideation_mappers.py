@@ -177,6 +177,27 @@ class TestSessionMapper:
         assert back.data_source == domain_session.data_source
         assert back.version == domain_session.version
 
+    def test_session_context_summary_roundtrip(self, domain_session: Any) -> None:
+        """Test the rolling context summary survives a roundtrip."""
+        mappers = import_mappers()
+        domain_session.context_summary = "- Users: finance team"
+        domain_session.summarized_message_count = 12
+
+        orm = mappers["SessionMapper"].to_orm(domain_session)
+        back = mappers["SessionMapper"].from_orm(orm)
+
+        assert back.context_summary == "- Users: finance team"
+        assert back.summarized_message_count == 12
+
+    def test_session_from_orm_without_context_summary(self, orm_session: Any) -> None:
+        """Test sessions without a stored summary map to empty defaults."""
+        mappers = import_mappers()
+
+        domain = mappers["SessionMapper"].from_orm(orm_session)
+
+        assert domain.context_summary == ""
+        assert domain.summarized_message_count == 0
+
 
 class TestMessageMapper:
     """Test MessageMapper domain <-> ORM conversion."""
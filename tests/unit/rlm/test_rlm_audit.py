@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import sqlite3
 import tempfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from src.workers.rlm.audit import AuditEntry, RLMAuditor
+from src.workers.rlm.audit import AuditEntry, RLMAuditor, _parse_size, main
 from src.workers.rlm.models import (
     Citation,
     ExplorationStep,
@@ -159,7 +161,7 @@ class TestRLMAuditorCreation:
             auditor = RLMAuditor(audit_dir=tmpdir)
 
             assert auditor.audit_dir == tmpdir
-            assert auditor.index_file == "index.json"
+            assert auditor.index_file == "index.db"
 
     def test_creates_directory(self) -> None:
         """Test that auditor creates directory if needed."""
@@ -192,13 +194,12 @@ class TestRLMAuditorSave:
 
             auditor.save_result(result)
 
-            index_path = Path(tmpdir) / "index.json"
+            index_path = Path(tmpdir) / "index.db"
             assert index_path.exists()
 
-            with open(index_path) as f:
-                index = json.load(f)
-                assert len(index) == 1
-                assert index[0]["task_id"] == result.task_id
+            with sqlite3.connect(index_path) as conn:
+                rows = conn.execute("SELECT task_id FROM audits").fetchall()
+            assert rows == [(result.task_id,)]
 
     def test_save_multiple_results(self) -> None:
         """Test saving multiple results."""
@@ -483,3 +484,191 @@ class TestRLMAuditorRepr:
 
             assert "RLMAuditor" in repr_str
             assert "entries=1" in repr_str
+
+
+class TestRLMAuditorStorage:
+    """Tests for compressed storage and legacy index migration."""
+
+    def test_result_saved_compressed(self) -> None:
+        """Test that results are written gzip-compressed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+
+            file_path = auditor.save_result(create_test_result())
+
+            assert file_path.endswith(".json.gz")
+            with gzip.open(file_path, "rt") as f:
+                assert json.load(f)["task_id"] == "test-task-123"
+            entry = auditor.get_audit_by_task_id("test-task-123")
+            assert entry.size_bytes == Path(file_path).stat().st_size
+
+    def test_load_plain_json_file(self) -> None:
+        """Test loading an uncompressed file written by earlier versions."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "old.json"
+            path.write_text(json.dumps(create_test_result().to_dict()))
+
+            loaded = RLMAuditor(audit_dir=tmpdir).load_result_from_file(str(path))
+
+            assert loaded is not None
+            assert loaded.task_id == "test-task-123"
+
+    def test_imports_legacy_index(self) -> None:
+        """Test that an existing index.json is imported once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "old.json"
+            path.write_text(json.dumps(create_test_result("legacy").to_dict()))
+            entry = AuditEntry(
+                task_id="legacy",
+                timestamp=datetime.now(timezone.utc),
+                query="Old query",
+                success=True,
+                findings_count=1,
+                iterations=1,
+                subcalls_used=5,
+                wall_time_seconds=1.0,
+                file_path=str(path),
+            )
+            (Path(tmpdir) / "index.json").write_text(json.dumps([entry.to_dict()]))
+
+            auditor = RLMAuditor(audit_dir=tmpdir)
+
+            assert auditor.load_result("legacy") is not None
+            assert auditor.get_audit_by_task_id("legacy").size_bytes > 0
+            assert not (Path(tmpdir) / "index.json").exists()
+            assert (Path(tmpdir) / "index.json.migrated").exists()
+            assert len(RLMAuditor(audit_dir=tmpdir).list_audits()) == 1
+
+    def test_imports_legacy_trajectories(self) -> None:
+        """Test that trajectory files from earlier versions are indexed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trajectory = create_test_result("legacy").trajectory.to_dict()
+            path = Path(tmpdir) / "20260101_120000_legacy_task_trajectory.json"
+            path.write_text(json.dumps(trajectory))
+            (Path(tmpdir) / "index.json").write_text("[]")
+
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            stats = auditor.compact(max_bytes=0)
+
+            assert stats["deleted"] == 1
+            assert stats["bytes_freed"] == len(json.dumps(trajectory))
+            assert not path.exists()
+
+
+class TestRLMAuditorTimeRange:
+    """Tests for time-range queries."""
+
+    def test_list_audits_since_until(self) -> None:
+        """Test filtering audits by save time."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            before = datetime.now(timezone.utc) - timedelta(seconds=1)
+            auditor.save_result(create_test_result("task-1"))
+            after = datetime.now(timezone.utc) + timedelta(seconds=1)
+
+            assert len(auditor.list_audits(since=before)) == 1
+            assert auditor.list_audits(since=after) == []
+            assert auditor.list_audits(until=before) == []
+            assert len(auditor.list_audits(since=before, until=after)) == 1
+
+
+class TestRLMAuditorCompact:
+    """Tests for retention and compaction."""
+
+    def _age(self, tmpdir: str, task_id: str, days: float) -> None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        with sqlite3.connect(Path(tmpdir) / "index.db") as conn:
+            conn.execute(
+                "UPDATE audits SET timestamp = ? WHERE task_id = ?",
+                (cutoff.timestamp(), task_id),
+            )
+
+    def test_compact_by_size_deletes_oldest(self) -> None:
+        """Test that the oldest results are deleted to fit the budget."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            paths = [auditor.save_result(create_test_result(f"task-{i}")) for i in range(3)]
+            budget = sum(Path(p).stat().st_size for p in paths[1:])
+
+            stats = auditor.compact(max_bytes=budget)
+
+            assert stats["deleted"] == 1
+            assert stats["remaining"] == 2
+            assert not Path(paths[0]).exists()
+            assert auditor.get_audit_by_task_id("task-0") is None
+            assert auditor.get_audit_by_task_id("task-2") is not None
+
+    def test_compact_counts_trajectories(self) -> None:
+        """Test that trajectory files count against the size budget."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            result = create_test_result("task-0")
+            old_trajectory = auditor.save_trajectory(result.trajectory, "task-0")
+            result_path = auditor.save_result(create_test_result("task-1"))
+            new_trajectory = auditor.save_trajectory(result.trajectory, "task-1")
+            budget = sum(Path(p).stat().st_size for p in (result_path, new_trajectory))
+
+            stats = auditor.compact(max_bytes=budget)
+
+            assert stats["deleted"] == 1
+            assert stats["remaining"] == 2
+            assert stats["total_bytes"] == budget
+            assert not Path(old_trajectory).exists()
+            assert Path(new_trajectory).exists()
+            assert [e.task_id for e in auditor.list_audits()] == ["task-1"]
+
+    def test_clear_all_removes_trajectories(self) -> None:
+        """Test that clearing also deletes trajectory files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            path = auditor.save_trajectory(create_test_result().trajectory, "task")
+
+            assert auditor.clear_all() == 0
+            assert not Path(path).exists()
+            assert auditor.compact()["remaining"] == 0
+
+    def test_compact_by_age(self) -> None:
+        """Test that results older than the retention period are deleted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            auditor.save_result(create_test_result("old"))
+            auditor.save_result(create_test_result("new"))
+            self._age(tmpdir, "old", days=40)
+
+            stats = auditor.compact(max_age_days=30)
+
+            assert stats["deleted"] == 1
+            assert [e.task_id for e in auditor.list_audits()] == ["new"]
+
+    def test_compact_drops_missing_files(self) -> None:
+        """Test that index rows whose files are gone are dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            Path(auditor.save_result(create_test_result())).unlink()
+
+            stats = auditor.compact()
+
+            assert stats == {
+                "deleted": 0,
+                "missing": 1,
+                "bytes_freed": 0,
+                "remaining": 0,
+                "total_bytes": 0,
+            }
+
+    def test_cli_compact(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the compact command."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            auditor.save_result(create_test_result())
+
+            assert main(["compact", "--audit-dir", tmpdir, "--max-bytes", "0"]) == 0
+
+            assert json.loads(capsys.readouterr().out)["deleted"] == 1
+            assert auditor.list_audits() == []
+
+    def test_parse_size(self) -> None:
+        """Test parsing size budgets."""
+        assert _parse_size("1024") == 1024
+        assert _parse_size("500M") == 500 * 1024**2
+        assert _parse_size("2gb") == 2 * 1024**3
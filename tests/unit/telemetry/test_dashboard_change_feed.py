@@ -0,0 +1,181 @@
+"""Tests for the telemetry dashboard change feed and SSE stream."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from scripts.telemetry import dashboard_server
+from scripts.telemetry.dashboard_server import ChangeFeed, DashboardHandler
+
+sqlite_store = dashboard_server.sqlite_store
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    """Create a temporary database for testing."""
+    path = tmp_path / "test_telemetry.db"
+    sqlite_store.init_db(path)
+    return path
+
+
+def _record(db_path: Path, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        sqlite_store.record_event(
+            f"hook-{i}", "PreToolUse", timestamp=1000.0, db_path=db_path,
+        )
+
+
+class TestEventCursor:
+    """Tests for id-based event retrieval."""
+
+    def test_get_events_after_orders_by_id(self, db_path: Path) -> None:
+        _record(db_path, 5)
+
+        rows = sqlite_store.get_events_after(2, db_path=db_path)
+
+        assert [r["id"] for r in rows] == [3, 4, 5]
+
+    def test_get_latest_event_id(self, db_path: Path) -> None:
+        assert sqlite_store.get_latest_event_id(db_path=db_path) == 0
+        _record(db_path, 3)
+        assert sqlite_store.get_latest_event_id(db_path=db_path) == 3
+
+
+class TestChangeFeed:
+    """Tests for the single-producer fan-out."""
+
+    def test_fans_out_to_all_subscribers(self, db_path: Path) -> None:
+        feed = ChangeFeed(db_path)
+        subs = [feed.subscribe() for _ in range(3)]
+        _record(db_path, 2)
+
+        assert feed.poll_once() == 2
+
+        for sub in subs:
+            batch = sub.get(timeout=0)
+            assert [e["id"] for e in batch] == [1, 2]
+
+    def test_bursts_are_not_dropped(self, db_path: Path) -> None:
+        # Rows with identical timestamps and more than one batch
+        feed = ChangeFeed(db_path, batch_size=50)
+        sub = feed.subscribe()
+        _record(db_path, 120)
+
+        while feed.poll_once() == feed.batch_size:
+            pass
+
+        seen: list[int] = []
+        while (batch := sub.get(timeout=0)) is not None:
+            seen.extend(e["id"] for e in batch)
+        assert seen == list(range(1, 121))
+
+    def test_start_skips_existing_rows(self, db_path: Path) -> None:
+        _record(db_path, 4)
+        feed = ChangeFeed(db_path, poll_interval=60)
+        feed.start()
+        try:
+            assert feed.last_id == 4
+        finally:
+            feed.stop()
+
+    def test_slow_subscriber_overflows_instead_of_dropping(self, db_path: Path) -> None:
+        feed = ChangeFeed(db_path, batch_size=1, max_queued_batches=2)
+        sub = feed.subscribe()
+        _record(db_path, 3)
+
+        for _ in range(3):
+            feed.poll_once()
+
+        assert sub.overflowed is True
+        assert feed.subscriber_count == 0
+
+    def test_unsubscribe(self, db_path: Path) -> None:
+        feed = ChangeFeed(db_path)
+        sub = feed.subscribe()
+        feed.unsubscribe(sub)
+        assert feed.subscriber_count == 0
+
+
+class TestSSEStream:
+    """End-to-end tests against a threaded dashboard server."""
+
+    @pytest.fixture()
+    def server(self, db_path: Path) -> Iterator[tuple[ThreadingHTTPServer, ChangeFeed]]:
+        feed = ChangeFeed(db_path, poll_interval=0.02)
+        feed.start()
+        handler = type(
+            "TestHandler",
+            (DashboardHandler,),
+            {"db_path": db_path, "change_feed": feed, "sse_heartbeat_seconds": 0.05},
+        )
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        httpd.daemon_threads = True
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd, feed
+        httpd.shutdown()
+        httpd.server_close()
+        feed.stop()
+
+    @staticmethod
+    def _read_message(
+        resp: http.client.HTTPResponse, timeout: float = 5.0
+    ) -> tuple[int, list[dict]]:
+        # Heartbeats keep the socket busy, so bound the wait here
+        deadline = time.monotonic() + timeout
+        event_id = None
+        while time.monotonic() < deadline:
+            line = resp.fp.readline().decode().rstrip("\n")
+            if line.startswith("id: "):
+                event_id = int(line[4:])
+            elif line.startswith("data: "):
+                return event_id, json.loads(line[6:])["events"]
+        raise TimeoutError("no SSE message before the deadline")
+
+    def test_stream_pushes_new_events(
+        self, server: tuple[ThreadingHTTPServer, ChangeFeed], db_path: Path
+    ) -> None:
+        httpd, _ = server
+        conn = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1], timeout=5)
+        conn.request("GET", "/stream")
+        resp = conn.getresponse()
+        assert resp.status == 200
+
+        _record(db_path, 3)
+        # Rows may arrive over several polls; read until all three are in
+        received: list[int] = []
+        deadline = time.monotonic() + 5
+        while len(received) < 3:
+            event_id, events = self._read_message(resp, deadline - time.monotonic())
+            ids = [e["id"] for e in events]
+            # Newest first within a message
+            assert ids == sorted(ids, reverse=True)
+            assert event_id == ids[0]
+            received.extend(ids)
+
+        assert sorted(received) == [1, 2, 3]
+        assert event_id == 3
+        conn.close()
+
+    def test_reconnect_backfills_from_last_event_id(
+        self, server: tuple[ThreadingHTTPServer, ChangeFeed], db_path: Path
+    ) -> None:
+        httpd, _ = server
+        _record(db_path, 5)
+
+        conn = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1], timeout=5)
+        conn.request("GET", "/stream", headers={"Last-Event-ID": "2"})
+        resp = conn.getresponse()
+        event_id, events = self._read_message(resp)
+
+        assert event_id == 5
+        assert [e["id"] for e in events] == [5, 4, 3]
+        conn.close()
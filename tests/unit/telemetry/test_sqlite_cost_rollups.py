@@ -0,0 +1,251 @@
+"""Tests for pre-aggregated cost rollup tables."""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.costs.models import CostFilter, CostRecord
+
+from scripts.telemetry.sqlite_store import (
+    _plan_cost_ranges,
+    get_cost_summary,
+    get_costs,
+    get_session_costs,
+    init_db,
+    prune_cost_records,
+    rebuild_cost_rollups,
+    record_cost,
+)
+
+DAY = 86400
+HOUR = 3600
+# 2026-01-10T00:00:00Z, day aligned
+BASE = 1768003200.0
+
+
+def _record(i: int, ts: float, **overrides) -> CostRecord:
+    fields = {
+        "id": f"cost-{i}",
+        "timestamp": ts,
+        "session_id": f"sess-{i % 3}",
+        "agent_id": ["pm", "backend", "frontend"][i % 3],
+        "model": ["claude-opus-4-6", "claude-sonnet-4-5"][i % 2],
+        "input_tokens": 100 + i,
+        "output_tokens": 50 + i,
+        "estimated_cost_usd": 0.001 * (i + 1),
+        "tool_name": ["Read", "Edit", None][i % 3],
+    }
+    fields.update(overrides)
+    return CostRecord(**fields)
+
+
+def _raw_summary(db_path: Path, group_col: str, lo: float | None, hi: float | None) -> dict:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        clauses, params = [], []
+        if lo is not None:
+            clauses.append("timestamp >= ?")
+            params.append(lo)
+        if hi is not None:
+            clauses.append("timestamp <= ?")
+            params.append(hi)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        rows = conn.execute(
+            f"SELECT {group_col}, SUM(estimated_cost_usd), SUM(input_tokens),"
+            f" SUM(output_tokens), COUNT(*) FROM cost_records{where} GROUP BY 1",
+            params,
+        ).fetchall()
+        return {r[0]: r[1:] for r in rows}
+    finally:
+        conn.close()
+
+
+def _as_map(groups: list[dict]) -> dict:
+    return {
+        g["group_key"]: (
+            g["total_cost_usd"],
+            g["total_input_tokens"],
+            g["total_output_tokens"],
+            g["record_count"],
+        )
+        for g in groups
+    }
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    """Create a temporary database for testing."""
+    path = tmp_path / "test_telemetry.db"
+    init_db(path)
+    return path
+
+
+@pytest.fixture()
+def spread_db(db_path: Path) -> Path:
+    """Populate records spread irregularly over several days."""
+    rng = random.Random(42)
+    for i in range(300):
+        record_cost(_record(i, BASE + rng.uniform(0, 5 * DAY)), db_path=db_path)
+    return db_path
+
+
+class TestRollupMaintenance:
+    """Rollups are kept in step with inserts."""
+
+    def test_rollup_tables_exist(self, db_path: Path) -> None:
+        conn = sqlite3.connect(str(db_path))
+        names = {
+            r[0]
+            for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        conn.close()
+        assert {"cost_rollup_hourly", "cost_rollup_daily"} <= names
+
+    def test_insert_updates_both_rollups(self, db_path: Path) -> None:
+        record_cost(_record(0, BASE + 10), db_path=db_path)
+        record_cost(_record(6, BASE + 20), db_path=db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        hourly = conn.execute(
+            "SELECT bucket_start, record_count, input_tokens FROM cost_rollup_hourly"
+        ).fetchall()
+        daily = conn.execute("SELECT bucket_start, record_count FROM cost_rollup_daily").fetchall()
+        conn.close()
+
+        # Same agent/model/session/tool for i=0 and i=6 -> one bucket row each
+        assert hourly == [(int(BASE), 2, 100 + 106)]
+        assert daily == [(int(BASE), 2)]
+
+    def test_init_backfills_existing_database(self, tmp_path: Path) -> None:
+        path = tmp_path / "legacy.db"
+        init_db(path)
+        record_cost(_record(1, BASE + 5), db_path=path)
+        conn = sqlite3.connect(str(path))
+        conn.executescript(
+            "DROP TRIGGER trg_cost_records_rollup;"
+            "DROP TABLE cost_rollup_hourly; DROP TABLE cost_rollup_daily;"
+        )
+        conn.close()
+
+        init_db(path)
+
+        summary = get_cost_summary(group_by="agent", db_path=path)
+        assert summary[0]["record_count"] == 1
+
+    def test_rebuild_matches_incremental(self, spread_db: Path) -> None:
+        before = _as_map(get_cost_summary(group_by="session", db_path=spread_db))
+
+        rebuild_cost_rollups(spread_db)
+
+        after = _as_map(get_cost_summary(group_by="session", db_path=spread_db))
+        assert before.keys() == after.keys()
+        for key in before:
+            assert after[key] == pytest.approx(before[key])
+
+
+class TestRollupQueries:
+    """Summaries read from rollups agree with raw aggregation."""
+
+    @pytest.mark.parametrize(
+        "group_by,raw_col",
+        [
+            ("agent", "agent_id"),
+            ("model", "model"),
+            ("session", "session_id"),
+            ("tool", "tool_name"),
+            ("day", "date(timestamp, 'unixepoch')"),
+        ],
+    )
+    def test_unfiltered_summary_matches_raw(
+        self, spread_db: Path, group_by: str, raw_col: str
+    ) -> None:
+        expected = _raw_summary(spread_db, raw_col, None, None)
+        actual = _as_map(get_cost_summary(group_by=group_by, db_path=spread_db))
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            assert actual[key] == pytest.approx(expected[key])
+
+    def test_unaligned_ranges_match_raw(self, spread_db: Path) -> None:
+        rng = random.Random(7)
+        for _ in range(25):
+            lo = BASE + rng.uniform(-DAY, 5 * DAY)
+            hi = lo + rng.uniform(0, 4 * DAY)
+            expected = _raw_summary(spread_db, "agent_id", lo, hi)
+            actual = _as_map(
+                get_cost_summary(
+                    group_by="agent",
+                    filters=CostFilter(date_from=lo, date_to=hi),
+                    db_path=spread_db,
+                )
+            )
+            assert actual.keys() == expected.keys()
+            for key in expected:
+                assert actual[key] == pytest.approx(expected[key])
+
+    def test_inclusive_upper_bound(self, db_path: Path) -> None:
+        record_cost(_record(0, BASE + HOUR), db_path=db_path)
+
+        groups = get_cost_summary(
+            filters=CostFilter(date_from=BASE, date_to=BASE + HOUR), db_path=db_path,
+        )
+
+        assert groups[0]["record_count"] == 1
+
+    def test_filters_apply_to_rollups(self, spread_db: Path) -> None:
+        groups = get_cost_summary(
+            group_by="model",
+            filters=CostFilter(agent_id="pm", session_id="sess-0"),
+            db_path=spread_db,
+        )
+        expected = _raw_summary(spread_db, "model", None, None)
+        assert {g["group_key"] for g in groups} <= set(expected)
+        assert sum(g["record_count"] for g in groups) == 100
+
+    def test_session_costs_from_rollup(self, spread_db: Path) -> None:
+        result = get_session_costs("sess-2", db_path=spread_db)
+        tools = {t["tool_name"]: t for t in result["tool_breakdown"]}
+        assert set(tools) == {None}
+        assert tools[None]["call_count"] == 100
+
+
+class TestPlanCostRanges:
+    """Tests for splitting a range into rollup and raw segments."""
+
+    def test_unbounded_uses_daily(self) -> None:
+        assert _plan_cost_ranges(None, None) == [("cost_rollup_daily", None, None)]
+
+    def test_sub_hour_range_uses_raw(self) -> None:
+        plan = _plan_cost_ranges(BASE + 10, BASE + 20)
+        assert [p[0] for p in plan] == ["cost_records"]
+
+    def test_mixed_range(self) -> None:
+        plan = _plan_cost_ranges(BASE - HOUR - 30, BASE + DAY + HOUR + 30)
+        tables = [p[0] for p in plan]
+        assert tables.count("cost_rollup_daily") == 1
+        assert tables.count("cost_rollup_hourly") == 2
+        assert tables.count("cost_records") == 2
+
+
+class TestPruneCostRecords:
+    """Retention pruning drops raw rows but keeps rollups."""
+
+    def test_prune_keeps_summaries(self, db_path: Path) -> None:
+        now = time.time()
+        record_cost(_record(0, now - 40 * DAY), db_path=db_path)
+        record_cost(_record(1, now - 60), db_path=db_path)
+
+        deleted = prune_cost_records(retention_days=30, db_path=db_path)
+
+        assert deleted == 1
+        _, total = get_costs(db_path=db_path)
+        assert total == 1
+        groups = get_cost_summary(group_by="agent", db_path=db_path)
+        assert sum(g["record_count"] for g in groups) == 2
+
+    def test_prune_fails_silently(self, tmp_path: Path) -> None:
+        assert prune_cost_records(db_path=tmp_path / "missing.db") == 0
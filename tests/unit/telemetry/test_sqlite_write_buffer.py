@@ -0,0 +1,215 @@
+"""Tests for the SQLite telemetry write-behind buffer."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.costs.models import CostRecord
+
+from scripts.telemetry import sqlite_store
+from scripts.telemetry.sqlite_store import (
+    WriteBuffer,
+    disable_write_buffer,
+    enable_write_buffer,
+    flush_writes,
+    init_db,
+    record_cost,
+    record_event,
+)
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    """Create a temporary database for testing."""
+    path = tmp_path / "test_telemetry.db"
+    init_db(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _reset_buffer() -> Iterator[None]:
+    """Make sure no buffer leaks between tests."""
+    yield
+    disable_write_buffer()
+
+
+def _count(db_path: Path, table: str) -> int:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _cost(i: int) -> CostRecord:
+    return CostRecord(
+        id=f"cost-{i}",
+        timestamp=time.time(),
+        session_id="sess-buf",
+        agent_id="pm",
+        model="claude-opus-4-6",
+        input_tokens=100,
+        output_tokens=50,
+        estimated_cost_usd=0.005,
+    )
+
+
+class TestImmediateWrites:
+    """Writes without a buffer are committed right away."""
+
+    def test_record_event_commits_immediately(self, db_path: Path) -> None:
+        record_event("hook", "PreToolUse", db_path=db_path)
+        assert _count(db_path, "hook_events") == 1
+
+    def test_flush_without_buffer_is_noop(self) -> None:
+        assert flush_writes() == 0
+
+
+class TestBufferedWrites:
+    """Tests for enable_write_buffer() in inline mode."""
+
+    def test_rows_held_until_size_threshold(self, db_path: Path) -> None:
+        enable_write_buffer(max_rows=3, max_delay_seconds=60)
+
+        record_event("hook", "PreToolUse", db_path=db_path)
+        record_cost(_cost(1), db_path=db_path)
+        assert _count(db_path, "hook_events") == 0
+        assert _count(db_path, "cost_records") == 0
+
+        record_event("hook", "PostToolUse", db_path=db_path)
+        assert _count(db_path, "hook_events") == 2
+        assert _count(db_path, "cost_records") == 1
+
+    def test_rows_flushed_on_time_threshold(self, db_path: Path) -> None:
+        enable_write_buffer(max_rows=1000, max_delay_seconds=0.0)
+
+        record_event("hook", "PreToolUse", db_path=db_path)
+
+        assert _count(db_path, "hook_events") == 1
+
+    def test_explicit_flush(self, db_path: Path) -> None:
+        enable_write_buffer(max_rows=1000, max_delay_seconds=60)
+        for i in range(5):
+            record_cost(_cost(i), db_path=db_path)
+
+        assert flush_writes() == 5
+        assert _count(db_path, "cost_records") == 5
+
+    def test_disable_flushes_pending_rows(self, db_path: Path) -> None:
+        enable_write_buffer(max_rows=1000, max_delay_seconds=60)
+        record_event("hook", "PreToolUse", db_path=db_path)
+
+        disable_write_buffer()
+
+        assert _count(db_path, "hook_events") == 1
+        record_event("hook", "PostToolUse", db_path=db_path)
+        assert _count(db_path, "hook_events") == 2
+
+    def test_enable_replaces_and_flushes_existing_buffer(self, db_path: Path) -> None:
+        enable_write_buffer(max_rows=1000, max_delay_seconds=60)
+        record_event("hook", "PreToolUse", db_path=db_path)
+
+        buffer = enable_write_buffer(max_rows=1000, max_delay_seconds=60)
+
+        assert _count(db_path, "hook_events") == 1
+        assert sqlite_store._write_buffer is buffer
+
+    def test_rows_grouped_per_database(self, tmp_path: Path) -> None:
+        first = tmp_path / "a.db"
+        second = tmp_path / "b.db"
+        init_db(first)
+        init_db(second)
+        enable_write_buffer(max_rows=1000, max_delay_seconds=60)
+
+        record_event("hook", "PreToolUse", db_path=first)
+        record_event("hook", "PreToolUse", db_path=second)
+        record_event("hook", "PostToolUse", db_path=second)
+        flush_writes()
+
+        assert _count(first, "hook_events") == 1
+        assert _count(second, "hook_events") == 2
+
+    def test_flush_fails_silently_on_bad_db(self, tmp_path: Path) -> None:
+        bad_path = tmp_path / "missing-schema.db"
+        enable_write_buffer(max_rows=1000, max_delay_seconds=60)
+        record_event("hook", "PreToolUse", db_path=bad_path)
+
+        # No schema -- insert fails, but must not raise
+        assert flush_writes() == 0
+
+    def test_locked_database_keeps_rows_for_retry(
+        self, db_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        buffer = WriteBuffer(max_rows=1000, max_delay_seconds=60)
+        for _ in range(5):
+            buffer.add(
+                sqlite_store._INSERT_COST_SQL,
+                (time.time(), "s", "pm", "m", 1, 1, 0.1, None, None, None),
+                db_path,
+            )
+        real_get_connection = sqlite_store._get_connection
+
+        def locked(path: Path) -> sqlite3.Connection:
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(sqlite_store, "_get_connection", locked)
+        assert buffer.flush() == 0
+        assert buffer.pending == 5
+
+        monkeypatch.setattr(sqlite_store, "_get_connection", real_get_connection)
+        assert buffer.flush() == 5
+        assert buffer.pending == 0
+        assert _count(db_path, "cost_records") == 5
+
+    def test_requeued_rows_bounded_by_max_pending(
+        self, db_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        buffer = WriteBuffer(max_rows=1000, max_delay_seconds=60, max_pending=3)
+        for i in range(5):
+            buffer.add(
+                sqlite_store._INSERT_COST_SQL,
+                (float(i), "s", "pm", "m", 1, 1, 0.1, None, None, None),
+                db_path,
+            )
+
+        def locked(path: Path) -> sqlite3.Connection:
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(sqlite_store, "_get_connection", locked)
+        buffer.flush()
+
+        assert buffer.pending == 3
+
+
+class TestBackgroundWriter:
+    """Tests for the background writer thread."""
+
+    def test_background_thread_flushes(self, db_path: Path) -> None:
+        buffer = WriteBuffer(max_rows=1000, max_delay_seconds=0.05, background=True)
+        try:
+            buffer.add(
+                sqlite_store._INSERT_COST_SQL,
+                (time.time(), "s", "pm", "m", 1, 1, 0.1, None, None, None),
+                db_path,
+            )
+            deadline = time.time() + 2.0
+            while _count(db_path, "cost_records") == 0 and time.time() < deadline:
+                time.sleep(0.02)
+            assert _count(db_path, "cost_records") == 1
+            assert buffer.pending == 0
+        finally:
+            buffer.close()
+
+    def test_close_flushes_remaining_rows(self, db_path: Path) -> None:
+        enable_write_buffer(max_rows=1000, max_delay_seconds=60, background=True)
+        for _ in range(10):
+            record_event("hook", "PreToolUse", db_path=db_path)
+
+        disable_write_buffer()
+
+        assert _count(db_path, "hook_events") == 10
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 from src.core.events import (
+    EventPriority,
     EventType,
     ASDLCEvent,
     HandlerResult,
@@ -160,6 +161,35 @@ class TestASDLCEvent:
         assert event.artifact_paths == ["/path/a", "/path/b"]
 
 
+    def test_priority_round_trip(self):
+        """Urgent priority is serialized and restored; bulk is the default."""
+        event = ASDLCEvent(
+            event_type=EventType.AGENT_STARTED,
+            session_id="session-123",
+            priority="urgent",
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        data = event.to_stream_dict()
+        restored = ASDLCEvent.from_stream_dict("evt-001", data)
+
+        assert event.priority == EventPriority.URGENT
+        assert data["priority"] == "urgent"
+        assert restored.priority == EventPriority.URGENT
+
+    def test_bulk_priority_not_serialized(self):
+        """Bulk events keep the existing stream format."""
+        event = ASDLCEvent(
+            event_type=EventType.AGENT_STARTED,
+            session_id="session-123",
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        assert "priority" not in event.to_stream_dict()
+        assert ASDLCEvent.from_stream_dict("evt-001", event.to_stream_dict()).priority == (
+            EventPriority.BULK
+        )
+
 class TestHandlerResult:
     """Tests for HandlerResult dataclass."""
 
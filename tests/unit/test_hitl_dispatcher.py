@@ -115,17 +115,58 @@ class TestGateDecision:
         assert len(decision.conditions) == 2
 
 
+def _mock_pipeline(mock_client: AsyncMock, results: list) -> AsyncMock:
+    """Attach a mock pipeline to a mock Redis client."""
+    pipe = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.hgetall = MagicMock()
+    pipe.hget = MagicMock()
+    pipe.hset = MagicMock()
+    pipe.zadd = MagicMock()
+    pipe.zrem = MagicMock()
+    pipe.execute = AsyncMock(return_value=results)
+    mock_client.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
+def _request_hash(request_id: str, gate_type: str = "hitl_4_code") -> dict:
+    return {
+        "request_id": request_id,
+        "task_id": f"task-{request_id}",
+        "session_id": "session-1",
+        "gate_type": gate_type,
+        "status": "expired",
+        "evidence_bundle_id": "bundle-1",
+        "requested_by": "agent",
+        "requested_at": "2026-01-22T10:00:00+00:00",
+    }
+
+
+def _flatten(data: dict) -> list:
+    return [item for pair in data.items() for item in pair]
+
+
 class TestHITLDispatcher:
     """Tests for HITLDispatcher class."""
 
+    @pytest.fixture(autouse=True)
+    def single_tenant(self):
+        """Run with multi-tenancy disabled so keys are unprefixed."""
+        from src.core.config import clear_config_cache
+
+        with patch.dict(os.environ, {"MULTI_TENANCY_ENABLED": "false"}, clear=False):
+            clear_config_cache()
+            yield
+        clear_config_cache()
+
     @pytest.mark.asyncio
     async def test_request_gate_creates_request(self):
         """request_gate creates and stores request."""
         from src.orchestrator.hitl_dispatcher import HITLDispatcher
 
         mock_client = AsyncMock()
-        mock_client.hset.return_value = True
-        mock_client.zadd.return_value = True
+        pipe = _mock_pipeline(mock_client, [1, 1, 1, 1])
         mock_publisher = AsyncMock()
         mock_logger = AsyncMock()
 
@@ -159,7 +200,9 @@ class TestHITLDispatcher:
         )
 
         assert request.status == GateStatus.PENDING
-        mock_client.hset.assert_called()
+        mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert pipe.hset.call_count == 2
+        pipe.execute.assert_awaited_once()
         mock_publisher.assert_called()
 
     @pytest.mark.asyncio
@@ -189,8 +232,7 @@ class TestHITLDispatcher:
 
         mock_client = AsyncMock()
         mock_client.hgetall.return_value = existing_request.to_dict()
-        mock_client.hset.return_value = True
-        mock_client.zrem.return_value = 1
+        pipe = _mock_pipeline(mock_client, [0, 1, 1])
         mock_publisher = AsyncMock()
         mock_logger = AsyncMock()
 
@@ -208,6 +250,15 @@ class TestHITLDispatcher:
         )
 
         assert decision.approved is True
+        mock_client.pipeline.assert_called_once_with(transaction=True)
+        pipe.hset.assert_called_once_with(
+            "asdlc:gate_request:req-001", "status", "approved"
+        )
+        assert [c.args for c in pipe.zrem.call_args_list] == [
+            ("asdlc:pending_gates", "req-001"),
+            ("asdlc:pending_gates:hitl_4_code", "req-001"),
+        ]
+        pipe.execute.assert_awaited_once()
         mock_publisher.assert_called()
         mock_logger.log_decision.assert_called()
 
@@ -218,7 +269,7 @@ class TestHITLDispatcher:
 
         mock_client = AsyncMock()
         mock_client.zrange.return_value = ["req-001", "req-002"]
-        mock_client.hgetall.side_effect = [
+        pipe = _mock_pipeline(mock_client, [
             {
                 "request_id": "req-001",
                 "task_id": "task-1",
@@ -239,7 +290,7 @@ class TestHITLDispatcher:
                 "requested_by": "agent",
                 "requested_at": "2026-01-22T10:01:00+00:00",
             },
-        ]
+        ])
 
         dispatcher = HITLDispatcher(
             redis_client=mock_client,
@@ -250,6 +301,154 @@ class TestHITLDispatcher:
         requests = await dispatcher.get_pending_requests()
 
         assert len(requests) == 2
+        mock_client.zrange.assert_awaited_once_with("asdlc:pending_gates", 0, -1)
+        assert pipe.hgetall.call_count == 2
+        mock_client.hgetall.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_pending_requests_by_gate_type_paginated(self):
+        """Gate type filter reads a page from the per-type index."""
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = ["req-011"]
+        _mock_pipeline(mock_client, [_request_hash("req-011", "hitl_1_backlog")])
+
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+        )
+
+        requests = await dispatcher.get_pending_requests(
+            GateType.HITL_1_BACKLOG, offset=10, limit=5
+        )
+
+        assert [r.request_id for r in requests] == ["req-011"]
+        mock_client.zrange.assert_awaited_once_with(
+            "asdlc:pending_gates:hitl_1_backlog", 10, 14
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_pending_requests_skips_missing_hashes(self):
+        """IDs whose request hash is gone are skipped."""
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = ["req-001", "req-002"]
+        _mock_pipeline(mock_client, [{}, _request_hash("req-002")])
+
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+        )
+
+        requests = await dispatcher.get_pending_requests()
+
+        assert [r.request_id for r in requests] == ["req-002"]
+
+    @pytest.mark.asyncio
+    async def test_count_pending(self):
+        """count_pending uses ZCARD on the relevant index."""
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zcard.return_value = 3
+
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+        )
+
+        assert await dispatcher.count_pending(GateType.HITL_4_CODE) == 3
+        mock_client.zcard.assert_awaited_once_with("asdlc:pending_gates:hitl_4_code")
+
+    @pytest.mark.asyncio
+    async def test_request_gate_indexes_gate_type(self):
+        """request_gate adds the request to the per-type pending index."""
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        pipe = _mock_pipeline(mock_client, [1, 1, 1, 1])
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+        )
+        bundle = EvidenceBundle.create(
+            task_id="task-123",
+            gate_type=GateType.HITL_4_CODE,
+            git_sha="sha456",
+            items=[
+                EvidenceItem(
+                    item_type="artifact",
+                    path="/test.patch",
+                    description="Test",
+                    content_hash="hash",
+                ),
+            ],
+            summary="Test bundle",
+        )
+
+        request = await dispatcher.request_gate(
+            task_id="task-123",
+            session_id="session-456",
+            gate_type=GateType.HITL_4_CODE,
+            evidence_bundle=bundle,
+            requested_by="coding-agent",
+        )
+
+        keys = [c.args[0] for c in pipe.zadd.call_args_list]
+        assert keys == ["asdlc:pending_gates", "asdlc:pending_gates:hitl_4_code"]
+        assert request.request_id in pipe.zadd.call_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_gate_type_index(self):
+        """rebuild_gate_type_index re-adds pending IDs with their scores."""
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = [("req-001", 10.0), ("req-002", 20.0)]
+        pipe = _mock_pipeline(mock_client, ["hitl_4_code", None])
+
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+        )
+
+        assert await dispatcher.rebuild_gate_type_index() == 2
+        pipe.zadd.assert_called_once_with(
+            "asdlc:pending_gates:hitl_4_code", {"req-001": 10.0}
+        )
+
+    @pytest.mark.asyncio
+    async def test_rebuild_gate_type_indexes_covers_every_tenant(self):
+        """rebuild_gate_type_indexes rebuilds the global and tenant sets."""
+        from src.orchestrator.hitl_dispatcher import rebuild_gate_type_indexes
+
+        async def scan_iter(match: str):
+            assert match == "tenant:*:asdlc:pending_gates"
+            yield "tenant:acme:asdlc:pending_gates"
+
+        mock_client = AsyncMock()
+        mock_client.scan_iter = scan_iter
+        mock_client.zrange.side_effect = [[], [("req-001", 10.0)]]
+        pipe = _mock_pipeline(mock_client, ["hitl_4_code"])
+
+        assert await rebuild_gate_type_indexes(mock_client) == 1
+        assert [c.args[0] for c in mock_client.zrange.call_args_list] == [
+            "asdlc:pending_gates",
+            "tenant:acme:asdlc:pending_gates",
+        ]
+        pipe.hget.assert_called_once_with(
+            "tenant:acme:asdlc:gate_request:req-001", "gate_type"
+        )
+        pipe.zadd.assert_called_once_with(
+            "tenant:acme:asdlc:pending_gates:hitl_4_code", {"req-001": 10.0}
+        )
 
     @pytest.mark.asyncio
     async def test_check_expired_marks_expired(self):
@@ -259,21 +458,13 @@ class TestHITLDispatcher:
         # Request that expired an hour ago
         expired_time = datetime.now(timezone.utc) - timedelta(hours=1)
 
+        expired_hash = _request_hash("req-001")
+        expired_hash["expires_at"] = expired_time.isoformat()
+
         mock_client = AsyncMock()
         mock_client.zrangebyscore.return_value = ["req-001"]
-        mock_client.hgetall.return_value = {
-            "request_id": "req-001",
-            "task_id": "task-1",
-            "session_id": "session-1",
-            "gate_type": "hitl_4_code",
-            "status": "pending",
-            "evidence_bundle_id": "bundle-1",
-            "requested_by": "agent",
-            "requested_at": "2026-01-22T10:00:00+00:00",
-            "expires_at": expired_time.isoformat(),
-        }
-        mock_client.hset.return_value = True
-        mock_client.zrem.return_value = 1
+        script = AsyncMock(return_value=[_flatten(expired_hash)])
+        mock_client.register_script = MagicMock(return_value=script)
 
         mock_publisher = AsyncMock()
 
@@ -286,7 +477,107 @@ class TestHITLDispatcher:
         expired = await dispatcher.check_expired()
 
         assert len(expired) == 1
-        mock_client.hset.assert_called()
+        assert expired[0].status == GateStatus.EXPIRED
+        assert expired[0].expires_at == expired_time
+        assert mock_client.zrangebyscore.call_args.kwargs == {"start": 0, "num": 100}
+        script.assert_awaited_once()
+        kwargs = script.call_args.kwargs
+        gate_types = [g.value for g in GateType]
+        # Every key the script touches is declared
+        assert kwargs["keys"] == [
+            "asdlc:pending_gates",
+            "asdlc:gate_request:req-001",
+            *(f"asdlc:pending_gates:{g}" for g in gate_types),
+        ]
+        assert kwargs["args"][1:] == ["pending", "expired", 1, "req-001", *gate_types]
+        mock_publisher.assert_awaited_once()
+        mock_client.hset.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_expired_sweeps_until_drained(self):
+        """Full batches trigger another sweep; events go out per batch."""
+        from src.core.events import EventType
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zrangebyscore.side_effect = [["req-001", "req-002"], ["req-003"]]
+        script = AsyncMock(
+            side_effect=[
+                [_flatten(_request_hash("req-001")), _flatten(_request_hash("req-002"))],
+                # Second batch: the examined ID was already decided
+                [],
+            ]
+        )
+        mock_client.register_script = MagicMock(return_value=script)
+        batch_publisher = AsyncMock()
+
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+            batch_event_publisher=batch_publisher,
+        )
+
+        expired = await dispatcher.check_expired(batch_size=2)
+
+        assert [r.request_id for r in expired] == ["req-001", "req-002"]
+        assert script.await_count == 2
+        batch_publisher.assert_awaited_once()
+        events = batch_publisher.call_args.args[0]
+        assert [e.event_type for e in events] == [EventType.GATE_EXPIRED] * 2
+        assert [e.metadata["request_id"] for e in events] == ["req-001", "req-002"]
+        mock_client.register_script.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_check_expired_nothing_due(self):
+        """No script call is made when no pending request has expired."""
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zrangebyscore.return_value = []
+        script = AsyncMock()
+        mock_client.register_script = MagicMock(return_value=script)
+
+        dispatcher = HITLDispatcher(
+            redis_client=mock_client,
+            event_publisher=AsyncMock(),
+            decision_logger=AsyncMock(),
+        )
+
+        assert await dispatcher.check_expired() == []
+        script.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_check_expired_uses_tenant_prefix(self):
+        """The sweep targets tenant-prefixed keys in multi-tenant mode."""
+        from src.core.config import clear_config_cache
+        from src.core.tenant import TenantContext
+        from src.orchestrator.hitl_dispatcher import HITLDispatcher
+
+        mock_client = AsyncMock()
+        mock_client.zrangebyscore.return_value = ["req-001"]
+        script = AsyncMock(return_value=[])
+        mock_client.register_script = MagicMock(return_value=script)
+
+        with patch.dict(os.environ, {"MULTI_TENANCY_ENABLED": "true"}, clear=False):
+            clear_config_cache()
+            dispatcher = HITLDispatcher(
+                redis_client=mock_client,
+                event_publisher=AsyncMock(),
+                decision_logger=AsyncMock(),
+            )
+            with TenantContext.tenant_scope("acme-corp"):
+                assert await dispatcher.check_expired() == []
+
+        assert mock_client.zrangebyscore.call_args.args[0] == (
+            "tenant:acme-corp:asdlc:pending_gates"
+        )
+        keys = script.call_args.kwargs["keys"]
+        assert keys[:2] == [
+            "tenant:acme-corp:asdlc:pending_gates",
+            "tenant:acme-corp:asdlc:gate_request:req-001",
+        ]
+        assert all(key.startswith("tenant:acme-corp:") for key in keys)
 
 
 class TestTenantIsolation:
@@ -300,8 +591,7 @@ class TestTenantIsolation:
         from src.core.config import clear_config_cache
 
         mock_client = AsyncMock()
-        mock_client.hset.return_value = True
-        mock_client.zadd.return_value = True
+        pipe = _mock_pipeline(mock_client, [1, 1, 1, 1])
 
         with patch.dict(os.environ, {"MULTI_TENANCY_ENABLED": "true"}, clear=False):
             clear_config_cache()
@@ -336,6 +626,5 @@ class TestTenantIsolation:
                     requested_by="agent",
                 )
 
-            call_args = mock_client.hset.call_args
-            key = call_args.args[0]
+            key = pipe.hset.call_args_list[0].args[0]
             assert "acme-corp" in key
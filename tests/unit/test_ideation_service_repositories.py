@@ -7,6 +7,7 @@ factory pattern for persistence operations.
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -21,6 +22,9 @@ from src.core.models.ideation import (
     ProjectStatus,
 )
 
+if TYPE_CHECKING:
+    from src.orchestrator.services.ideation_service import IdeationServiceImpl
+
 
 @asynccontextmanager
 async def mock_db_session():
@@ -255,38 +259,6 @@ class TestIdeationServiceImplConversationHistory:
         service._db_session = mock_db_session
         return service
 
-    @pytest.mark.asyncio
-    async def test_get_conversation_history_uses_repository(
-        self,
-        service: "IdeationServiceImpl",
-        mock_message_repo: AsyncMock,
-    ) -> None:
-        """Test that conversation history is fetched via repository."""
-        messages = [
-            ChatMessage(
-                id="msg-1",
-                session_id="session-123",
-                role=MessageRole.USER,
-                content="Hello",
-                timestamp=datetime(2024, 1, 15, 10, 0, 0),
-            ),
-            ChatMessage(
-                id="msg-2",
-                session_id="session-123",
-                role=MessageRole.ASSISTANT,
-                content="Hi there",
-                timestamp=datetime(2024, 1, 15, 10, 1, 0),
-            ),
-        ]
-        mock_message_repo.get_by_session = AsyncMock(return_value=messages)
-
-        result = await service._get_conversation_history("session-123")
-
-        mock_message_repo.get_by_session.assert_called_once_with("session-123")
-        assert len(result) == 2
-        assert result[0]["role"] == "user"
-        assert result[0]["content"] == "Hello"
-
     @pytest.mark.asyncio
     async def test_save_conversation_message_uses_repository(
         self,
@@ -310,6 +282,130 @@ class TestIdeationServiceImplConversationHistory:
         assert call_args.session_id == "session-123"
 
 
+class TestIdeationServiceImplMessagePaging:
+    """Test message paging methods use keyset repository queries."""
+
+    @pytest.fixture
+    def mock_message_repo(self) -> AsyncMock:
+        """Create mock message repository."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_message_repo: AsyncMock) -> "IdeationServiceImpl":
+        """Create service with mock factory and mocked database session."""
+        from src.orchestrator.services.ideation_service import IdeationServiceImpl
+
+        factory = MagicMock()
+        factory.get_message_repository = MagicMock(return_value=mock_message_repo)
+        service = IdeationServiceImpl(repository_factory=factory)
+        service._db_session = mock_db_session
+        return service
+
+    @pytest.mark.asyncio
+    async def test_get_messages_without_cursor_returns_latest(
+        self,
+        service: "IdeationServiceImpl",
+        mock_message_repo: AsyncMock,
+    ) -> None:
+        """Test that the first page is the newest messages."""
+        mock_message_repo.get_latest = AsyncMock(return_value=[])
+
+        await service.get_messages("session-123", limit=20)
+
+        mock_message_repo.get_latest.assert_called_once_with(
+            "session-123", limit=20, before=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_messages_after_cursor_uses_keyset_page(
+        self,
+        service: "IdeationServiceImpl",
+        mock_message_repo: AsyncMock,
+    ) -> None:
+        """Test that an after cursor reads forward from the cursor."""
+        from src.core.models.ideation import MessageCursor
+
+        cursor = MessageCursor(timestamp=datetime(2024, 1, 15, 10, 0, 0), id="msg-1")
+        mock_message_repo.get_page = AsyncMock(return_value=[])
+
+        await service.get_messages("session-123", limit=20, after=cursor)
+
+        mock_message_repo.get_page.assert_called_once_with(
+            "session-123", limit=20, after=cursor
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_session_caps_messages_by_default(
+        self,
+        service: "IdeationServiceImpl",
+        mock_message_repo: AsyncMock,
+    ) -> None:
+        """Test that session details return the newest messages, capped."""
+        from src.orchestrator.services.ideation_service import (
+            DEFAULT_SESSION_MESSAGE_LIMIT,
+        )
+
+        session_repo = AsyncMock()
+        session_repo.get_by_id = AsyncMock(
+            return_value=IdeationSession(
+                id="session-123", project_name="Test", user_id="user-1"
+            )
+        )
+        service._repository_factory.get_session_repository = MagicMock(
+            return_value=session_repo
+        )
+        service._repository_factory.get_maturity_repository = MagicMock(
+            return_value=AsyncMock()
+        )
+        service._repository_factory.get_requirement_repository = MagicMock(
+            return_value=AsyncMock()
+        )
+        mock_message_repo.get_latest = AsyncMock(return_value=[])
+
+        await service.get_session("session-123")
+        await service.get_session("session-123", message_limit=20)
+
+        assert [c.kwargs["limit"] for c in mock_message_repo.get_latest.call_args_list] == [
+            DEFAULT_SESSION_MESSAGE_LIMIT,
+            20,
+        ]
+        mock_message_repo.stream_by_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_counts_messages(
+        self,
+        service: "IdeationServiceImpl",
+        mock_message_repo: AsyncMock,
+    ) -> None:
+        """Test that session listing counts messages instead of loading them."""
+        session_repo = AsyncMock()
+        session_repo.list_by_user = AsyncMock(
+            return_value=[
+                IdeationSession(
+                    id="session-123",
+                    project_name="Test",
+                    user_id="user-1",
+                    created_at=datetime(2024, 1, 15, 10, 0, 0),
+                    updated_at=datetime(2024, 1, 15, 11, 0, 0),
+                )
+            ]
+        )
+        maturity_repo = AsyncMock()
+        maturity_repo.get_by_session = AsyncMock(return_value=None)
+        service._repository_factory.get_session_repository = MagicMock(
+            return_value=session_repo
+        )
+        service._repository_factory.get_maturity_repository = MagicMock(
+            return_value=maturity_repo
+        )
+        mock_message_repo.count_by_session = AsyncMock(return_value=7)
+
+        sessions, total = await service.list_sessions("user-1")
+
+        assert sessions[0]["message_count"] == 7
+        mock_message_repo.get_by_session.assert_not_called()
+
+
 class TestIdeationServiceBackwardCompatibility:
     """Test backward compatibility with existing behavior."""
 
@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.core.events import ASDLCEvent, EventType, HandlerResult
+from src.core.events import ASDLCEvent, EventPriority, EventType, HandlerResult
 from src.orchestrator.state_machine import TaskState
 
 
@@ -225,11 +225,12 @@ class TestHandleGateRejected:
         )
         mock_task_manager.increment_fail_count.return_value = 1
 
+        event_publisher = AsyncMock()
         agent = ManagerAgent(
             task_manager=mock_task_manager,
             session_manager=AsyncMock(),
             git_gateway=MagicMock(),
-            event_publisher=AsyncMock(),
+            event_publisher=event_publisher,
         )
 
         event = ASDLCEvent(
@@ -244,6 +245,10 @@ class TestHandleGateRejected:
 
         assert result.success is True
         mock_task_manager.increment_fail_count.assert_called_once()
+        # Rework after a rejection goes to the urgent lane
+        retry_event = event_publisher.call_args.args[0]
+        assert retry_event.event_type == EventType.AGENT_STARTED
+        assert retry_event.priority == EventPriority.URGENT
 
 
 class TestHandleTaskFailed:
@@ -9,6 +9,7 @@ Tests verify:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,6 +17,15 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def reset_vm_client() -> None:
+    """Drop the shared client and query cache between tests."""
+    from src.orchestrator.routes import metrics_api
+
+    metrics_api._vm_client = None
+    metrics_api._query_cache.clear()
+
+
 @pytest.fixture
 def mock_httpx_client() -> MagicMock:
     """Create a mock httpx.AsyncClient."""
@@ -347,3 +357,149 @@ class TestRouterConfiguration:
         from src.orchestrator.routes.metrics_api import router
 
         assert "metrics" in router.tags
+
+
+class TestQueryCache:
+    """Tests for the shared client and query response cache."""
+
+    @staticmethod
+    def _mock_client(payload: dict | None = None, delay: float = 0.0) -> AsyncMock:
+        mock_response = MagicMock()
+        mock_response.json.return_value = payload or {"status": "success", "data": {}}
+        mock_response.raise_for_status = MagicMock()
+
+        async def _get(*args, **kwargs):
+            if delay:
+                await asyncio.sleep(delay)
+            return mock_response
+
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=_get)
+        return client
+
+    def test_align_time_range_rounds_to_step(self) -> None:
+        """Start is aligned down and end up to multiples of the step."""
+        from src.orchestrator.routes.metrics_api import align_time_range
+
+        start, end = align_time_range(
+            "2024-01-01T00:00:07Z", "2024-01-01T01:00:59Z", "15s"
+        )
+
+        assert (start, end) == ("1704067200", "1704070860")
+        assert align_time_range("1704067207", "1704070859", "1m") == (
+            "1704067200",
+            "1704070860",
+        )
+        assert align_time_range("1704067200", "1704070800", "1m") == (
+            "1704067200",
+            "1704070800",
+        )
+
+    def test_align_time_range_passes_through_unparseable(self) -> None:
+        """Unrecognised formats are forwarded unchanged."""
+        from src.orchestrator.routes.metrics_api import align_time_range
+
+        assert align_time_range("now-1h", "now", "15s") == ("now-1h", "now")
+        assert align_time_range("1", "2", "bogus") == ("1", "2")
+
+    @pytest.mark.asyncio
+    async def test_same_window_within_step_hits_cache(self) -> None:
+        """Range queries inside one step share a cache entry."""
+        from src.orchestrator.routes import metrics_api
+
+        client = self._mock_client()
+        metrics_api._vm_client = client
+
+        await metrics_api.query_victoriametrics("up", "1704067201", "1704070801", "15s")
+        await metrics_api.query_victoriametrics("up", "1704067209", "1704070809", "15s")
+        await metrics_api.query_victoriametrics("up", "1704067216", "1704070816", "15s")
+
+        assert client.get.await_count == 2
+        params = client.get.call_args_list[0].kwargs["params"]
+        assert params["start"] == "1704067200"
+        assert params["end"] == "1704070815"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_coalesce(self) -> None:
+        """Identical in-flight requests make one upstream call."""
+        from src.orchestrator.routes import metrics_api
+
+        client = self._mock_client(delay=0.01)
+        metrics_api._vm_client = client
+
+        results = await asyncio.gather(
+            *(metrics_api.query_victoriametrics_instant("asdlc_active_tasks") for _ in range(10))
+        )
+
+        assert client.get.await_count == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        """A failed upstream call is retried on the next request."""
+        import httpx
+
+        from src.orchestrator.routes import metrics_api
+
+        client = self._mock_client()
+        ok = client.get.side_effect
+        client.get.side_effect = httpx.RequestError("down")
+        metrics_api._vm_client = client
+
+        assert await metrics_api.query_victoriametrics_instant("up") == {
+            "data": {"result": []}
+        }
+        client.get.side_effect = ok
+        assert await metrics_api.query_victoriametrics_instant("up") == {
+            "status": "success",
+            "data": {},
+        }
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self) -> None:
+        """Least recently used entries are evicted past the size limit."""
+        from src.orchestrator.routes import metrics_api
+
+        metrics_api._vm_client = self._mock_client()
+
+        with patch.object(metrics_api._query_cache, "max_entries", 2):
+            for query in ("a", "b", "c"):
+                await metrics_api.query_victoriametrics_instant(query)
+
+        assert [k[1] for k in metrics_api._query_cache] == ["query=b", "query=c"]
+
+    @pytest.mark.asyncio
+    async def test_cache_metrics_recorded(self) -> None:
+        """Hits and misses are counted per query type."""
+        from prometheus_client import REGISTRY
+
+        from src.orchestrator.routes import metrics_api
+
+        metrics_api._vm_client = self._mock_client()
+
+        def _count(result: str) -> float:
+            return REGISTRY.get_sample_value(
+                "asdlc_metrics_proxy_cache_requests_total",
+                {"query_type": "instant", "result": result},
+            ) or 0.0
+
+        hits, misses = _count("hit"), _count("miss")
+        await metrics_api.query_victoriametrics_instant("asdlc_active_workers")
+        await metrics_api.query_victoriametrics_instant("asdlc_active_workers")
+
+        assert _count("miss") == misses + 1
+        assert _count("hit") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_and_closed(self) -> None:
+        """One client serves all handlers until closed."""
+        from src.orchestrator.routes import metrics_api
+
+        client = metrics_api.get_vm_client()
+        assert metrics_api.get_vm_client() is client
+
+        await metrics_api.close_vm_client()
+
+        assert client.is_closed
+        assert metrics_api._vm_client is None
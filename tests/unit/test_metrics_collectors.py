@@ -232,6 +232,36 @@ class TestWorkerPoolCollector:
         assert sample_by_status["success"] == 150
         assert sample_by_status["failed"] == 5
 
+    def test_collect_includes_lane_depth_and_lag(self) -> None:
+        """Should yield per-lane queue depth and lag gauges."""
+        from src.infrastructure.metrics.collectors import WorkerPoolCollector
+
+        worker_pool = MagicMock()
+        worker_pool.get_stats.return_value = {
+            "active_workers": 1,
+            "events_succeeded": 0,
+            "events_failed": 0,
+            "lanes": {
+                "urgent": {"depth": 2, "pending": 1, "lag_seconds": 0.5},
+                "bulk": {"depth": 40, "pending": 4, "lag_seconds": 12.0},
+            },
+        }
+
+        collector = WorkerPoolCollector(
+            service_name="test-service",
+            worker_pool=worker_pool,
+        )
+
+        metrics = {m.name: m for m in collector.collect()}
+
+        depth = {s.labels["lane"]: s.value for s in metrics["asdlc_worker_queue_depth"].samples}
+        lag = {
+            s.labels["lane"]: s.value
+            for s in metrics["asdlc_worker_queue_lag_seconds"].samples
+        }
+        assert depth == {"bulk": 40, "urgent": 2}
+        assert lag == {"bulk": 12.0, "urgent": 0.5}
+
     def test_collect_handles_get_stats_exception(self) -> None:
         """Should handle gracefully when get_stats raises exception."""
         from src.infrastructure.metrics.collectors import WorkerPoolCollector
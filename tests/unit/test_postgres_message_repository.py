@@ -300,3 +300,130 @@ class TestPostgresMessageRepositoryDeleteBySession:
         await repo.delete_by_session("specific-session-id")
 
         mock_session.execute.assert_called_once()
+
+
+class TestPostgresMessageRepositoryKeyset:
+    """Test keyset pagination and streaming queries."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        """Create a mock AsyncSession returning the given ORM rows."""
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [
+            make_orm_message("msg-2", "session-123"),
+            make_orm_message("msg-1", "session-123"),
+        ]
+        session.execute = AsyncMock(return_value=mock_result)
+        return session
+
+    @staticmethod
+    def _sql(mock_session: AsyncMock) -> str:
+        from sqlalchemy.dialects import postgresql
+
+        stmt = mock_session.execute.call_args.args[0]
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_get_page_after_cursor(self, mock_session: AsyncMock) -> None:
+        """Test that get_page() filters on the (timestamp, id) tuple."""
+        from src.core.models.ideation import MessageCursor
+        from src.orchestrator.repositories.postgres.message_repository import (
+            PostgresMessageRepository,
+        )
+
+        repo = PostgresMessageRepository(mock_session)
+        cursor = MessageCursor(timestamp=datetime(2024, 1, 15, 10, 0, 0), id="msg-0")
+
+        result = await repo.get_page("session-123", limit=2, after=cursor)
+
+        sql = self._sql(mock_session)
+        assert "(ideation_messages.timestamp, ideation_messages.id) > (" in sql
+        assert "ORDER BY ideation_messages.timestamp ASC, ideation_messages.id ASC" in sql
+        assert "OFFSET" not in sql
+        assert [m.id for m in result] == ["msg-2", "msg-1"]
+
+    @pytest.mark.asyncio
+    async def test_get_latest_reads_backwards_and_reverses(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that get_latest() orders desc and returns oldest first."""
+        from src.core.models.ideation import MessageCursor
+        from src.orchestrator.repositories.postgres.message_repository import (
+            PostgresMessageRepository,
+        )
+
+        repo = PostgresMessageRepository(mock_session)
+        cursor = MessageCursor(timestamp=datetime(2024, 1, 15, 10, 0, 0), id="msg-9")
+
+        result = await repo.get_latest("session-123", limit=2, before=cursor)
+
+        sql = self._sql(mock_session)
+        assert "(ideation_messages.timestamp, ideation_messages.id) < (" in sql
+        assert "ORDER BY ideation_messages.timestamp DESC, ideation_messages.id DESC" in sql
+        assert [m.id for m in result] == ["msg-1", "msg-2"]
+
+    @pytest.mark.asyncio
+    async def test_stream_by_session_uses_stream_scalars(self) -> None:
+        """Test that stream_by_session() streams rows with yield_per."""
+        from src.orchestrator.repositories.postgres.message_repository import (
+            PostgresMessageRepository,
+        )
+
+        class FakeScalarStream:
+            def __init__(self, rows: List[MessageORM]) -> None:
+                self._rows = iter(rows)
+                self.closed = False
+
+            def __aiter__(self) -> "FakeScalarStream":
+                return self
+
+            async def __anext__(self) -> MessageORM:
+                try:
+                    return next(self._rows)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+            async def close(self) -> None:
+                self.closed = True
+
+        stream = FakeScalarStream(
+            [make_orm_message("msg-1", "session-123"), make_orm_message("msg-2", "session-123")]
+        )
+        session = AsyncMock()
+        session.stream_scalars = AsyncMock(return_value=stream)
+        repo = PostgresMessageRepository(session)
+
+        result = [m async for m in repo.stream_by_session("session-123", batch_size=50)]
+
+        stmt = session.stream_scalars.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 50
+        assert [m.id for m in result] == ["msg-1", "msg-2"]
+        assert stream.closed is True
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_by_session(self) -> None:
+        """Test that count_by_session() runs a count query."""
+        from src.orchestrator.repositories.postgres.message_repository import (
+            PostgresMessageRepository,
+        )
+
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one.return_value = 42
+        session.execute = AsyncMock(return_value=mock_result)
+        repo = PostgresMessageRepository(session)
+
+        assert await repo.count_by_session("session-123") == 42
+        assert "count(*)" in str(session.execute.call_args.args[0])
+
+    def test_orm_declares_composite_keyset_index(self) -> None:
+        """Test that the ORM model declares the (session_id, timestamp, id) index."""
+        index = next(
+            i
+            for i in MessageORM.__table__.indexes
+            if i.name == "idx_messages_session_timestamp_id"
+        )
+
+        assert [c.name for c in index.columns] == ["session_id", "timestamp", "id"]
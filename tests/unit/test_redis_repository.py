@@ -346,6 +346,119 @@ class TestRedisSessionRepository:
         assert all(isinstance(s, IdeationSession) for s in result)
 
 
+class FakeSortedSetRedis:
+    """In-memory Redis supporting the sorted set, hash and list calls
+    used by RedisMessageRepository. Replies are bytes, as with a client
+    created without decode_responses."""
+
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def hset(
+        self,
+        name: str,
+        key: str | None = None,
+        value: str | None = None,
+        mapping: dict[str, str] | None = None,
+    ) -> int:
+        values = self.hashes.setdefault(name, {})
+        if key is not None:
+            values[key] = value
+        values.update(mapping or {})
+        return 1
+
+    async def hmget(self, name: str, keys: list[str]) -> list[bytes | None]:
+        values = self.hashes.get(name, {})
+        return [values[k].encode() if k in values else None for k in keys]
+
+    async def zadd(self, name: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    def _sorted(self, name: str) -> list[tuple[str, float]]:
+        members = self.zsets.get(name, {})
+        return sorted(members.items(), key=lambda item: (item[1], item[0]))
+
+    async def zrange(
+        self, name: str, start: int, end: int, withscores: bool = False
+    ) -> list[Any]:
+        items = self._sorted(name)
+        n = len(items)
+        start = max(start + n if start < 0 else start, 0)
+        end = end + n if end < 0 else end
+        selected = items[start : end + 1]
+        if withscores:
+            return [(member.encode(), score) for member, score in selected]
+        return [member.encode() for member, _ in selected]
+
+    async def zcount(self, name: str, min: Any, max: Any) -> int:
+        def bound(value: Any) -> tuple[float, bool]:
+            text = str(value)
+            if text.startswith("("):
+                return float(text[1:]), True
+            return float(text), False
+
+        low, low_open = bound(min)
+        high, high_open = bound(max)
+        return sum(
+            1
+            for _, score in self._sorted(name)
+            if (score > low if low_open else score >= low)
+            and (score < high if high_open else score <= high)
+        )
+
+    async def zcard(self, name: str) -> int:
+        return len(self.zsets.get(name, {}))
+
+    async def exists(self, *names: str) -> int:
+        return sum(
+            1 for n in names if n in self.zsets or n in self.hashes or n in self.lists
+        )
+
+    async def lrange(self, name: str, start: int, end: int) -> list[bytes]:
+        values = self.lists.get(name, [])
+        end = len(values) if end == -1 else end + 1
+        return [v.encode() for v in values[start:end]]
+
+    async def delete(self, *names: str) -> int:
+        deleted = 0
+        for store in (self.zsets, self.hashes, self.lists):
+            for n in names:
+                deleted += store.pop(n, None) is not None
+        return deleted
+
+
+class FakePipeline:
+    """Queues FakeSortedSetRedis calls until execute()."""
+
+    def __init__(self, redis_client: FakeSortedSetRedis) -> None:
+        self._redis = redis_client
+        self._calls: list[Any] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> "FakePipeline":
+            self._calls.append(getattr(self._redis, name)(*args, **kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        results = [await call for call in self._calls]
+        self._calls = []
+        return results
+
+
 # =============================================================================
 # Message Repository Tests
 # =============================================================================
@@ -373,33 +486,29 @@ class TestRedisMessageRepository:
         assert issubclass(RedisMessageRepository, IMessageRepository)
 
     @pytest.mark.asyncio
-    async def test_create_stores_message(
-        self, repo: "RedisMessageRepository", mock_redis: AsyncMock
-    ) -> None:
-        """Test that create() stores message in Redis list."""
+    async def test_create_stores_message(self) -> None:
+        """Test that create() indexes the message in a sorted set."""
+        from src.orchestrator.repositories.redis import RedisMessageRepository
+
+        redis_client = FakeSortedSetRedis()
+        repo = RedisMessageRepository(redis_client)
         message = make_message()
-        mock_redis.rpush = AsyncMock()
 
         result = await repo.create(message)
 
         assert result.id == message.id
-        mock_redis.rpush.assert_called_once()
+        assert redis_client.zsets["ideation:message_index:session-123"] == {
+            "msg-123": message.timestamp.timestamp()
+        }
+        assert "msg-123" in redis_client.hashes["ideation:message_data:session-123"]
 
     @pytest.mark.asyncio
-    async def test_get_by_session_returns_messages(
-        self, repo: "RedisMessageRepository", mock_redis: AsyncMock
-    ) -> None:
+    async def test_get_by_session_returns_messages(self) -> None:
         """Test that get_by_session() returns messages."""
-        msg_json = json.dumps({
-            "id": "msg-123",
-            "session_id": "session-123",
-            "role": "user",
-            "content": "Hello",
-            "timestamp": "2024-01-15T10:30:00",
-            "maturity_delta": 5,
-            "metadata": {"key": "value"},
-        })
-        mock_redis.lrange = AsyncMock(return_value=[msg_json])
+        from src.orchestrator.repositories.redis import RedisMessageRepository
+
+        repo = RedisMessageRepository(FakeSortedSetRedis())
+        await repo.create(make_message())
 
         result = await repo.get_by_session("session-123")
 
@@ -418,6 +527,117 @@ class TestRedisMessageRepository:
         mock_redis.delete.assert_called_once()
 
 
+class TestRedisMessageRepositoryRanges:
+    """Test keyset ranges over the RedisMessageRepository sorted set."""
+
+    @pytest.fixture
+    def redis_client(self) -> FakeSortedSetRedis:
+        return FakeSortedSetRedis()
+
+    @pytest.fixture
+    async def repo(self, redis_client: FakeSortedSetRedis) -> Any:
+        """Repository holding 10 messages, with msg-04..msg-06 sharing a timestamp."""
+        from src.orchestrator.repositories.redis import RedisMessageRepository
+
+        repo = RedisMessageRepository(redis_client)
+        for i in range(10):
+            message = make_message(message_id=f"msg-{i:02d}", content=f"m{i}")
+            message.timestamp = datetime(2024, 1, 15, 10, 30, min(i, 4) if i < 7 else i)
+            await repo.create(message)
+        return repo
+
+    @staticmethod
+    def _ids(messages: list[ChatMessage]) -> list[str]:
+        return [m.id for m in messages]
+
+    @pytest.mark.asyncio
+    async def test_get_page_walks_all_messages(self, repo: Any) -> None:
+        from src.core.models.ideation import MessageCursor
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await repo.get_page("session-123", limit=3, after=cursor)
+            if not page:
+                break
+            seen.extend(self._ids(page))
+            cursor = MessageCursor.of(page[-1])
+
+        assert seen == [f"msg-{i:02d}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_get_page_after_cursor_with_equal_timestamps(self, repo: Any) -> None:
+        from src.core.models.ideation import MessageCursor
+
+        first = await repo.get_page("session-123", limit=5)
+        page = await repo.get_page(
+            "session-123", limit=2, after=MessageCursor.of(first[-1])
+        )
+
+        assert self._ids(page) == ["msg-05", "msg-06"]
+
+    @pytest.mark.asyncio
+    async def test_get_latest(self, repo: Any) -> None:
+        assert self._ids(await repo.get_latest("session-123", limit=3)) == [
+            "msg-07",
+            "msg-08",
+            "msg-09",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_latest_before_cursor(self, repo: Any) -> None:
+        from src.core.models.ideation import MessageCursor
+
+        latest = await repo.get_latest("session-123", limit=4)
+        older = await repo.get_latest(
+            "session-123", limit=4, before=MessageCursor.of(latest[0])
+        )
+
+        assert self._ids(latest) == ["msg-06", "msg-07", "msg-08", "msg-09"]
+        assert self._ids(older) == ["msg-02", "msg-03", "msg-04", "msg-05"]
+
+    @pytest.mark.asyncio
+    async def test_stream_by_session_in_batches(self, repo: Any) -> None:
+        streamed = [m async for m in repo.stream_by_session("session-123", batch_size=4)]
+
+        assert self._ids(streamed) == [f"msg-{i:02d}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_count_by_session(self, repo: Any) -> None:
+        assert await repo.count_by_session("session-123") == 10
+        assert await repo.count_by_session("other-session") == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_by_session_removes_index_and_data(
+        self, repo: Any, redis_client: FakeSortedSetRedis
+    ) -> None:
+        await repo.delete_by_session("session-123")
+
+        assert redis_client.zsets == {}
+        assert redis_client.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_legacy_list_is_migrated_on_read(
+        self, redis_client: FakeSortedSetRedis
+    ) -> None:
+        from src.orchestrator.repositories.redis import RedisMessageRepository
+        from src.orchestrator.repositories.redis.message_repository import (
+            _message_to_dict,
+        )
+
+        redis_client.lists["ideation:messages:session-123"] = [
+            json.dumps(_message_to_dict(make_message(message_id=f"msg-{i}")))
+            for i in range(3)
+        ]
+        repo = RedisMessageRepository(redis_client)
+
+        result = await repo.get_latest("session-123", limit=2)
+
+        assert self._ids(result) == ["msg-1", "msg-2"]
+        assert "ideation:messages:session-123" not in redis_client.lists
+        assert await repo.count_by_session("session-123") == 3
+
+
 # =============================================================================
 # Requirement Repository Tests
 # =============================================================================
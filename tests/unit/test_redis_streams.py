@@ -145,6 +145,85 @@ class TestPublishEventModel:
         assert event_data["idempotency_key"] == "my-custom-key"
 
 
+class TestPublishEventModels:
+    """Tests for publish_event_models batch function."""
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_single_pipeline(self):
+        """All events are appended in one pipelined round trip."""
+        from src.infrastructure.redis_streams import publish_event_models
+
+        pipe = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.xadd = MagicMock()
+        pipe.execute = AsyncMock(return_value=["1-0", "1-1"])
+        mock_client = AsyncMock()
+        mock_client.pipeline = MagicMock(return_value=pipe)
+
+        events = [
+            ASDLCEvent(
+                event_type=EventType.GATE_EXPIRED,
+                session_id="session-123",
+                task_id=f"task-{i}",
+                timestamp=datetime.now(timezone.utc),
+            )
+            for i in range(2)
+        ]
+
+        event_ids = await publish_event_models(
+            events, client=mock_client, stream_name="asdlc:events"
+        )
+
+        assert event_ids == ["1-0", "1-1"]
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.xadd.call_count == 2
+        for call in pipe.xadd.call_args_list:
+            assert call.args[0] == "asdlc:events"
+            assert call.args[1]["idempotency_key"]
+        mock_client.xadd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_routes_urgent_events(self):
+        """Urgent events go to the urgent lane stream."""
+        from src.core.events import EventPriority
+        from src.infrastructure.redis_streams import publish_event_models
+
+        pipe = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.xadd = MagicMock()
+        pipe.execute = AsyncMock(return_value=["1-0", "1-1"])
+        mock_client = AsyncMock()
+        mock_client.pipeline = MagicMock(return_value=pipe)
+
+        events = [
+            ASDLCEvent(
+                event_type=EventType.AGENT_STARTED,
+                session_id="session-123",
+                task_id=f"task-{i}",
+                priority=priority,
+                timestamp=datetime.now(timezone.utc),
+            )
+            for i, priority in enumerate([EventPriority.BULK, EventPriority.URGENT])
+        ]
+
+        await publish_event_models(events, client=mock_client, stream_name="asdlc:events")
+
+        streams = [call.args[0] for call in pipe.xadd.call_args_list]
+        assert streams == ["asdlc:events", "asdlc:events:urgent"]
+
+    @pytest.mark.asyncio
+    async def test_publish_empty_batch(self):
+        """Empty batches do not touch Redis."""
+        from src.infrastructure.redis_streams import publish_event_models
+
+        mock_client = AsyncMock()
+
+        assert await publish_event_models([], client=mock_client) == []
+        mock_client.pipeline.assert_not_called()
+
+
 class TestIdempotencyTracker:
     """Tests for IdempotencyTracker class."""
 
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -85,16 +85,54 @@ class TestTaskModel:
         assert task.fail_count == 3
 
 
+def _mock_pipeline(mock_client: AsyncMock, results: list | None = None) -> AsyncMock:
+    """Attach a mock pipeline to a mock Redis client."""
+    pipe = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.hset = MagicMock()
+    pipe.hgetall = MagicMock()
+    pipe.zadd = MagicMock()
+    pipe.zrem = MagicMock()
+    pipe.watch = AsyncMock()
+    pipe.multi = MagicMock()
+    pipe.execute = AsyncMock(return_value=results or [])
+    mock_client.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
+def _task_hash(task_id: str, state: str = "pending", session_id: str = "session-456") -> dict:
+    return {
+        "task_id": task_id,
+        "session_id": session_id,
+        "epic_id": "epic-789",
+        "state": state,
+        "fail_count": "0",
+        "created_at": "2026-01-22T10:00:00+00:00",
+        "updated_at": "2026-01-22T10:00:00+00:00",
+    }
+
+
 class TestTaskManager:
     """Tests for TaskManager class."""
 
+    @pytest.fixture(autouse=True)
+    def single_tenant(self):
+        """Run with multi-tenancy disabled so keys are unprefixed."""
+        from src.core.config import clear_config_cache
+
+        with patch.dict(os.environ, {"MULTI_TENANCY_ENABLED": "false"}, clear=False):
+            clear_config_cache()
+            yield
+        clear_config_cache()
+
     @pytest.mark.asyncio
     async def test_create_task(self):
         """Create stores task in Redis hash."""
         from src.orchestrator.task_manager import Task, TaskManager
 
         mock_client = AsyncMock()
-        mock_client.hset.return_value = True
+        pipe = _mock_pipeline(mock_client)
 
         manager = TaskManager(mock_client)
 
@@ -111,7 +149,15 @@ class TestTaskManager:
         result = await manager.create_task(task)
 
         assert result.task_id == "task-123"
-        mock_client.hset.assert_called_once()
+        pipe.hset.assert_called_once()
+        mock_client.pipeline.assert_called_once_with(transaction=True)
+        indexed = {c.args[0] for c in pipe.zadd.call_args_list}
+        assert indexed == {
+            "asdlc:task_index:state:pending",
+            "asdlc:task_index:session:session-456",
+            "asdlc:task_index:session:session-456:state:pending",
+        }
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_get_task(self):
@@ -156,21 +202,30 @@ class TestTaskManager:
         from src.core.exceptions import TaskStateError
 
         mock_client = AsyncMock()
-        mock_client.hgetall.return_value = {
-            "task_id": "task-123",
-            "session_id": "session-456",
-            "epic_id": "epic-789",
-            "state": "pending",  # Current state
-            "fail_count": "0",
-            "created_at": "2026-01-22T10:00:00+00:00",
-            "updated_at": "2026-01-22T10:00:00+00:00",
-        }
+        pipe = _mock_pipeline(mock_client)
+        pipe.hgetall = AsyncMock(return_value=_task_hash("task-123"))
 
         manager = TaskManager(mock_client)
 
         # Invalid: PENDING → COMPLETE
         with pytest.raises(TaskStateError):
             await manager.update_state("task-123", TaskState.COMPLETE)
+        pipe.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_update_state_not_found(self):
+        """Update state raises for a missing task."""
+        from src.core.exceptions import TaskNotFoundError
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        pipe = _mock_pipeline(mock_client)
+        pipe.hgetall = AsyncMock(return_value={})
+
+        manager = TaskManager(mock_client)
+
+        with pytest.raises(TaskNotFoundError):
+            await manager.update_state("task-123", TaskState.IN_PROGRESS)
 
     @pytest.mark.asyncio
     async def test_update_state_success(self):
@@ -178,16 +233,8 @@ class TestTaskManager:
         from src.orchestrator.task_manager import TaskManager
 
         mock_client = AsyncMock()
-        mock_client.hgetall.return_value = {
-            "task_id": "task-123",
-            "session_id": "session-456",
-            "epic_id": "epic-789",
-            "state": "pending",
-            "fail_count": "0",
-            "created_at": "2026-01-22T10:00:00+00:00",
-            "updated_at": "2026-01-22T10:00:00+00:00",
-        }
-        mock_client.hset.return_value = True
+        pipe = _mock_pipeline(mock_client)
+        pipe.hgetall = AsyncMock(return_value=_task_hash("task-123"))
 
         manager = TaskManager(mock_client)
 
@@ -195,7 +242,178 @@ class TestTaskManager:
         task = await manager.update_state("task-123", TaskState.IN_PROGRESS)
 
         assert task.state == TaskState.IN_PROGRESS
-        mock_client.hset.assert_called()
+        pipe.watch.assert_awaited_once_with("asdlc:task:task-123")
+        pipe.multi.assert_called_once()
+        pipe.hset.assert_called()
+        removed = {c.args[0] for c in pipe.zrem.call_args_list}
+        assert "asdlc:task_index:state:pending" in removed
+        assert "asdlc:task_index:session:session-456:state:pending" in removed
+        added = {c.args[0] for c in pipe.zadd.call_args_list}
+        assert "asdlc:task_index:state:in_progress" in added
+        assert "asdlc:task_index:session:session-456:state:in_progress" in added
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_state_retries_after_concurrent_change(self):
+        """A concurrent write aborts the transaction and the new state is re-validated."""
+        from redis.exceptions import WatchError
+
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        pipe = _mock_pipeline(mock_client)
+        pipe.hgetall = AsyncMock(
+            side_effect=[
+                _task_hash("task-123"),
+                _task_hash("task-123", state="in_progress"),
+            ]
+        )
+        pipe.execute = AsyncMock(side_effect=[WatchError(), []])
+
+        manager = TaskManager(mock_client)
+        task = await manager.update_state("task-123", TaskState.FAILED)
+
+        assert task.state == TaskState.FAILED
+        assert pipe.execute.await_count == 2
+        removed = {c.args[0] for c in pipe.zrem.call_args_list[-3:]}
+        assert "asdlc:task_index:state:in_progress" in removed
+
+    @pytest.mark.asyncio
+    async def test_update_state_gives_up_after_repeated_conflicts(self):
+        """Update state stops retrying after MAX_UPDATE_ATTEMPTS conflicts."""
+        from redis.exceptions import WatchError
+
+        from src.core.exceptions import RedisOperationError
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        pipe = _mock_pipeline(mock_client)
+        pipe.hgetall = AsyncMock(return_value=_task_hash("task-123"))
+        pipe.execute = AsyncMock(side_effect=WatchError())
+
+        manager = TaskManager(mock_client)
+
+        with pytest.raises(RedisOperationError):
+            await manager.update_state("task-123", TaskState.IN_PROGRESS)
+        assert pipe.execute.await_count == TaskManager.MAX_UPDATE_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_by_state_reads_index(self):
+        """Listing reads IDs from the index and pipelines the hash fetches."""
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = ["task-1", "task-2", "task-3"]
+        mock_client.eval.return_value = 2
+        pipe = _mock_pipeline(
+            mock_client,
+            results=[
+                _task_hash("task-1"),
+                {},  # Deleted task left in index
+                _task_hash("task-3", state="in_progress"),  # Stale index entry
+            ],
+        )
+
+        manager = TaskManager(mock_client)
+        tasks = await manager.list_tasks_by_state(TaskState.PENDING)
+
+        assert [t.task_id for t in tasks] == ["task-1"]
+        mock_client.zrange.assert_awaited_once_with(
+            "asdlc:task_index:state:pending", 0, -1
+        )
+        assert pipe.hgetall.call_count == 3
+        mock_client.scan_iter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_by_state_prunes_stale_entries(self):
+        """Stale index entries are removed and the page is refilled."""
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        mock_client.zrange.side_effect = [["task-1", "task-2"], ["task-3"]]
+        mock_client.eval.return_value = 1
+        _mock_pipeline(mock_client)
+        mock_client.pipeline.return_value.execute.side_effect = [
+            [_task_hash("task-1"), _task_hash("task-2", state="in_progress")],
+            [_task_hash("task-3")],
+        ]
+
+        manager = TaskManager(mock_client)
+        tasks = await manager.list_tasks_by_state(TaskState.PENDING, offset=0, limit=2)
+
+        assert [t.task_id for t in tasks] == ["task-1", "task-3"]
+        args = mock_client.eval.await_args.args
+        assert args[1:] == (
+            2,
+            "asdlc:task_index:state:pending",
+            "asdlc:task:task-2",
+            "pending",
+            "",
+            "task-2",
+        )
+        # task-2 was removed, so task-3 moved down to position 1
+        assert mock_client.zrange.await_args_list[1].args == (
+            "asdlc:task_index:state:pending", 1, 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_by_state_paginates_session_index(self):
+        """Session filter uses the combined index with offset/limit."""
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = ["task-5"]
+        _mock_pipeline(mock_client, results=[_task_hash("task-5")])
+
+        manager = TaskManager(mock_client)
+        tasks = await manager.list_tasks_by_state(
+            TaskState.PENDING, session_id="session-456", offset=4, limit=2
+        )
+
+        assert [t.task_id for t in tasks] == ["task-5"]
+        mock_client.zrange.assert_awaited_once_with(
+            "asdlc:task_index:session:session-456:state:pending", 4, 5
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_by_state_empty_index(self):
+        """An empty index returns no tasks without fetching hashes."""
+        from src.orchestrator.task_manager import TaskManager
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = []
+        mock_client.pipeline = MagicMock()
+
+        manager = TaskManager(mock_client)
+        assert await manager.list_tasks_by_state(TaskState.PENDING) == []
+        mock_client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reindex_rebuilds_indexes(self):
+        """Reindex drops old index keys and indexes every task hash."""
+        from src.orchestrator.task_manager import TaskManager
+
+        async def scan_iter(match: str, count: int):
+            keys = {
+                "asdlc:task_index:*": ["asdlc:task_index:state:pending"],
+                "asdlc:task:*": ["asdlc:task:task-1", "asdlc:task:task-2"],
+            }[match]
+            for key in keys:
+                yield key
+
+        mock_client = AsyncMock()
+        mock_client.scan_iter = scan_iter
+        pipe = _mock_pipeline(
+            mock_client,
+            results=[_task_hash("task-1"), _task_hash("task-2", state="in_progress")],
+        )
+
+        manager = TaskManager(mock_client)
+        count = await manager.reindex()
+
+        assert count == 2
+        mock_client.delete.assert_awaited_once_with("asdlc:task_index:state:pending")
+        assert pipe.zadd.call_count == 6
 
     @pytest.mark.asyncio
     async def test_increment_fail_count(self):
@@ -233,6 +451,27 @@ class TestTaskManager:
             key = call_args.args[0]
             assert "acme-corp" in key
 
+    @pytest.mark.asyncio
+    async def test_tenant_prefixed_indexes(self):
+        """Index keys are tenant-prefixed in multi-tenant mode."""
+        from src.orchestrator.task_manager import TaskManager
+        from src.core.tenant import TenantContext
+        from src.core.config import clear_config_cache
+
+        mock_client = AsyncMock()
+        mock_client.zrange.return_value = []
+
+        with patch.dict(os.environ, {"MULTI_TENANCY_ENABLED": "true"}, clear=False):
+            clear_config_cache()
+
+            manager = TaskManager(mock_client)
+
+            with TenantContext.tenant_scope("acme-corp"):
+                await manager.list_tasks_by_state(TaskState.PENDING)
+
+            key = mock_client.zrange.call_args.args[0]
+            assert key == "tenant:acme-corp:asdlc:task_index:state:pending"
+
 
 class TestSessionModel:
     """Tests for Session dataclass."""
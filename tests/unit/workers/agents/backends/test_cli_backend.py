@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+import sys
+import textwrap
 
 import pytest
 
-from src.workers.agents.backends.base import BackendConfig, BackendResult
+from src.workers.agents.backends.base import (
+    BackendConfig,
+    BackendEvent,
+    BackendResult,
+)
 from src.workers.agents.backends.cli_backend import CLIAgentBackend
 
 
@@ -91,6 +97,13 @@ class TestCLIAgentBackendBuildCommand:
         # Prompt should be at the end for codex
         assert cmd[-1] == "Do something"
 
+    def test_claude_streaming_command(self) -> None:
+        backend = CLIAgentBackend(cli="claude")
+        cmd = backend._build_command("prompt", BackendConfig(), streaming=True)
+        idx = cmd.index("--output-format")
+        assert cmd[idx + 1] == "stream-json"
+        assert "--verbose" in cmd
+
     def test_extra_flags(self) -> None:
         backend = CLIAgentBackend(cli="claude")
         config = BackendConfig(extra_flags=["--verbose", "--no-session-persistence"])
@@ -252,3 +265,195 @@ class TestCLIAgentBackendHealthCheck:
         # This will return False if claude is not installed
         result = await backend.health_check()
         assert isinstance(result, bool)
+
+
+def _script_backend(
+    script: str,
+    cli: str = "claude",
+    **kwargs,
+) -> CLIAgentBackend:
+    """Create a backend whose CLI is a Python script."""
+    backend = CLIAgentBackend(cli=cli, **kwargs)
+    backend._build_command = lambda prompt, config, streaming=False: [
+        sys.executable, "-c", textwrap.dedent(script),
+    ]
+    return backend
+
+
+_CLAUDE_STREAM = """
+    import json
+    def emit(msg):
+        print(json.dumps(msg), flush=True)
+    emit({"type": "system", "subtype": "init"})
+    for turn in range(2):
+        message = {"id": f"msg-{turn}", "usage": {"input_tokens": 100, "output_tokens": 50}}
+        emit({"type": "assistant", "message": {**message, "content": [{"type": "text", "text": "Reading"}]}})
+        emit({"type": "assistant", "message": {**message, "content": [{"type": "tool_use", "name": "Read", "id": f"t{turn}"}]}})
+        emit({"type": "user", "message": {"content": [{"type": "tool_result"}]}})
+    emit({"type": "result", "subtype": "success", "result": "Done", "session_id": "s1",
+          "is_error": False, "total_cost_usd": 0.01, "num_turns": 2})
+"""
+
+
+class TestCLIAgentBackendStreaming:
+    """Tests for incremental output handling."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_events_as_they_arrive(self) -> None:
+        events: list[BackendEvent] = []
+
+        async def on_event(event: BackendEvent) -> None:
+            events.append(event)
+
+        backend = _script_backend(_CLAUDE_STREAM)
+        result = await backend.execute("p", ".", BackendConfig(on_event=on_event))
+
+        assert result.success is True
+        assert result.output == "Done"
+        assert result.session_id == "s1"
+        assert [e.type for e in events] == [
+            "turn", "usage", "tool_use", "turn", "usage", "tool_use", "result",
+        ]
+        assert events[4].data == {"input_tokens": 200, "output_tokens": 100}
+        assert events[2].data["name"] == "Read"
+
+    @pytest.mark.asyncio
+    async def test_callback_errors_do_not_fail_run(self) -> None:
+        def on_event(event: BackendEvent) -> None:
+            raise RuntimeError("boom")
+
+        backend = _script_backend(_CLAUDE_STREAM)
+        result = await backend.execute("p", ".", BackendConfig(on_event=on_event))
+
+        assert result.success is True
+
+    @pytest.mark.asyncio
+    async def test_token_budget_terminates_cli(self) -> None:
+        script = _CLAUDE_STREAM.replace(
+            'emit({"type": "result"',
+            'import time; time.sleep(30)\n    emit({"type": "result"',
+        )
+        backend = _script_backend(script)
+
+        result = await backend.execute(
+            "p", ".", BackendConfig(max_total_tokens=200, timeout_seconds=10)
+        )
+
+        assert result.success is False
+        assert result.error == "CLI terminated: max_total_tokens exceeded"
+        assert result.metadata["terminated"] == "max_total_tokens"
+        assert result.turns == 2
+
+    @pytest.mark.asyncio
+    async def test_codex_jsonl_output(self) -> None:
+        script = """
+            import json
+            for msg in [
+                {"type": "thread.started", "thread_id": "t"},
+                {"type": "turn.started"},
+                {"type": "item.started", "item": {"id": "i0", "type": "command_execution"}},
+                {"type": "item.completed", "item": {"id": "i1", "type": "agent_message", "text": "All good"}},
+                {"type": "turn.completed", "usage": {"input_tokens": 10, "output_tokens": 5}},
+            ]:
+                print(json.dumps(msg))
+        """
+        events: list[BackendEvent] = []
+        backend = _script_backend(script, cli="codex")
+
+        result = await backend.execute("p", ".", BackendConfig(on_event=events.append))
+
+        assert result.success is True
+        assert result.output == "All good"
+        assert result.metadata["usage"] == {"input_tokens": 10, "output_tokens": 5}
+        assert [e.type for e in events] == ["turn", "tool_use", "usage"]
+
+        # Without a callback the same output is parsed once at exit
+        result = await backend.execute("p", ".")
+
+        assert result.output == "All good"
+        assert result.turns == 1
+
+    @pytest.mark.asyncio
+    async def test_large_output_spills_to_file(self) -> None:
+        script = """
+            for i in range(2000):
+                print("line", i)
+        """
+        backend = _script_backend(script, spill_threshold_bytes=1024)
+
+        result = await backend.execute("p", ".")
+
+        lines = result.output.splitlines()
+        assert len(lines) == 2000
+        assert lines[-1] == "line 1999"
+        assert result.metadata["output_bytes"] > 1024
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_multi_mib_single_line_output(self, streaming: bool) -> None:
+        script = """
+            import json, sys
+            sys.stdout.write(json.dumps({"type": "result", "subtype": "success",
+                "result": "x" * (6 * 1024 * 1024), "is_error": False, "num_turns": 1}))
+        """
+        events: list[BackendEvent] = []
+        backend = _script_backend(script, spill_threshold_bytes=256 * 1024)
+        handled: list[int] = []
+        parse_line = backend._parse_line
+
+        def record(line: bytes, state) -> list[BackendEvent]:
+            handled.append(len(line))
+            return parse_line(line, state)
+
+        backend._parse_line = record
+        config = BackendConfig(on_event=events.append if streaming else None)
+
+        result = await backend.execute("p", ".", config)
+
+        assert result.success is True
+        assert len(result.output) == 6 * 1024 * 1024
+        assert result.metadata["output_bytes"] > 6 * 1024 * 1024
+        # The line is parsed once, from the buffer, not accumulated per chunk
+        assert len(handled) == 1
+        assert [e.type for e in events] == (["result"] if streaming else [])
+
+    @pytest.mark.asyncio
+    async def test_oversized_line_between_stream_messages(self) -> None:
+        script = _CLAUDE_STREAM.replace(
+            'emit({"type": "result"',
+            'emit({"type": "user", "message": {"content": "y" * 300000}})\n'
+            '    emit({"type": "result"',
+        )
+        events: list[BackendEvent] = []
+        backend = _script_backend(script, spill_threshold_bytes=64 * 1024)
+
+        result = await backend.execute("p", ".", BackendConfig(on_event=events.append))
+
+        assert result.output == "Done"
+        assert [e.type for e in events][-1] == "result"
+        assert result.turns == 2
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_reports_stderr(self) -> None:
+        script = """
+            import sys
+            sys.stderr.write("auth failed")
+            sys.exit(2)
+        """
+        result = await _script_backend(script).execute("p", ".")
+
+        assert result.success is False
+        assert result.error == "CLI exited with code 2: auth failed"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_cli(self) -> None:
+        script = """
+            import time
+            time.sleep(30)
+        """
+        result = await _script_backend(script).execute(
+            "p", ".", BackendConfig(timeout_seconds=1)
+        )
+
+        assert result.success is False
+        assert result.error == "CLI timed out after 1s"
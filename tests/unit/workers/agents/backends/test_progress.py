@@ -0,0 +1,117 @@
+"""Unit tests for backend progress publishing and token budgets."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from src.workers.agents.backends.base import BackendEvent
+from src.workers.agents.backends.progress import (
+    DEFAULT_MAX_TOTAL_TOKENS,
+    BackendProgressPublisher,
+    backend_token_budget,
+)
+
+
+class FakePipeline:
+    """Pipeline recording LPUSH and LTRIM against a FakeRedis."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def lpush(self, key: str, value: str) -> None:
+        self._ops.append(("lpush", (key, value)))
+
+    def ltrim(self, key: str, start: int, end: int) -> None:
+        self._ops.append(("ltrim", (key, start, end)))
+
+    async def execute(self) -> None:
+        if self._redis.fail:
+            raise ConnectionError("redis down")
+        for op, args in self._ops:
+            if op == "lpush":
+                self._redis.lists.setdefault(args[0], []).insert(0, args[1])
+            else:
+                key, start, end = args
+                self._redis.lists[key] = self._redis.lists.get(key, [])[start : end + 1]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the publisher."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.fail = fail
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def entries(self, key: str) -> list[dict[str, Any]]:
+        return [json.loads(e) for e in self.lists.get(key, [])]
+
+
+class TestBackendProgressPublisher:
+    """Tests for writing backend events to the agent telemetry log."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_logged_newest_first(self) -> None:
+        redis = FakeRedis()
+        publisher = BackendProgressPublisher("coding", "task-1", redis_client=redis)
+
+        await publisher(BackendEvent("turn", {"turn": 1}))
+        await publisher(BackendEvent("tool_use", {"name": "Read", "id": "t1"}))
+        await publisher(BackendEvent("usage", {"input_tokens": 10, "output_tokens": 5}))
+
+        entries = redis.entries("agent:logs:coding:task-1")
+        assert [e["message"] for e in entries] == [
+            "Tokens: 10 in, 5 out",
+            "Tool use: Read",
+            "Turn 1",
+        ]
+        assert entries[0]["agent_id"] == "coding:task-1"
+        assert entries[0]["event_type"] == "usage"
+        assert entries[0]["level"] == "info"
+
+    @pytest.mark.asyncio
+    async def test_error_results_are_logged_as_errors(self) -> None:
+        redis = FakeRedis()
+        publisher = BackendProgressPublisher("coding", "task-1", redis_client=redis)
+
+        await publisher(BackendEvent("result", {"is_error": True, "num_turns": 3}))
+
+        entry = redis.entries("agent:logs:coding:task-1")[0]
+        assert entry["level"] == "error"
+        assert entry["message"] == "Run failed after 3 turns"
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_swallowed(self) -> None:
+        publisher = BackendProgressPublisher(
+            "coding", "task-1", redis_client=FakeRedis(fail=True)
+        )
+
+        await publisher(BackendEvent("turn", {"turn": 1}))
+
+
+class TestBackendTokenBudget:
+    """Tests for the environment-configured token budget."""
+
+    def test_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AGENT_BACKEND_MAX_TOTAL_TOKENS", raising=False)
+        assert backend_token_budget() == DEFAULT_MAX_TOTAL_TOKENS
+
+    def test_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENT_BACKEND_MAX_TOTAL_TOKENS", "5000")
+        assert backend_token_budget() == 5000
+
+    def test_zero_disables(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENT_BACKEND_MAX_TOTAL_TOKENS", "0")
+        assert backend_token_budget() is None
@@ -1,13 +1,14 @@
 """Tests for ValidationDeploymentCoordinator.
 
 Tests the workflow coordination for validation and deployment phases:
-- Validation -> Security -> HITL-5
+- Validation + Security (concurrent) -> HITL-5
 - Release -> Deployment -> HITL-6 -> Monitor
 - HITL gate submission and rejection handling
 """
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -619,6 +620,130 @@ class TestRunValidation:
         assert result.pending_hitl5 is True
 
 
+class TestConcurrentValidation:
+    """Tests for running the validation and security agents concurrently."""
+
+    @staticmethod
+    def _coordinator(mock_backend, mock_artifact_writer, mock_test_runner,
+                     validation_config, deployment_config, **kwargs):
+        coordinator = ValidationDeploymentCoordinator(
+            backend=mock_backend,
+            artifact_writer=mock_artifact_writer,
+            test_runner=mock_test_runner,
+            validation_config=validation_config,
+            deployment_config=deployment_config,
+            **kwargs,
+        )
+        coordinator._extract_validation_report = MagicMock(return_value=MagicMock(passed=True))
+        coordinator._extract_security_report = MagicMock(return_value=MagicMock(passed=True))
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_agents_run_concurrently_and_merge_in_order(
+        self,
+        mock_backend,
+        mock_artifact_writer,
+        mock_test_runner,
+        mock_hitl_dispatcher,
+        validation_config,
+        deployment_config,
+        agent_context,
+        implementation,
+        acceptance_criteria,
+    ):
+        """Test that both agents are in flight together and evidence keeps stage order."""
+        validation_started = asyncio.Event()
+        security_started = asyncio.Event()
+
+        async def run_validation(**kwargs):
+            validation_started.set()
+            # Deadlocks (and times out) if security only starts afterwards
+            await asyncio.wait_for(security_started.wait(), timeout=1)
+            await asyncio.sleep(0.01)
+            return AgentResult(
+                success=True, agent_type="validation", task_id="t",
+                artifact_paths=["validation_report.json"],
+            )
+
+        async def run_security(**kwargs):
+            security_started.set()
+            await asyncio.wait_for(validation_started.wait(), timeout=1)
+            return AgentResult(
+                success=True, agent_type="security", task_id="t",
+                artifact_paths=["security_report.json"],
+            )
+
+        coordinator = self._coordinator(
+            mock_backend, mock_artifact_writer, mock_test_runner,
+            validation_config, deployment_config, hitl_dispatcher=mock_hitl_dispatcher,
+        )
+        coordinator._run_validation_agent = run_validation
+        coordinator._run_security_agent = run_security
+        coordinator._submit_hitl5 = AsyncMock(return_value="hitl5-req")
+
+        result = await coordinator.run_validation(
+            context=agent_context,
+            implementation=implementation,
+            acceptance_criteria=acceptance_criteria,
+        )
+
+        assert result.pending_hitl5 is True
+        assert set(result.stage_timings) == {"validation", "security"}
+        # Security finished first, but validation evidence still comes first
+        assert coordinator._submit_hitl5.call_args.kwargs["artifact_paths"] == [
+            "validation_report.json",
+            "security_report.json",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_validation_failure_cancels_security(
+        self,
+        mock_backend,
+        mock_artifact_writer,
+        mock_test_runner,
+        validation_config,
+        deployment_config,
+        agent_context,
+        implementation,
+        acceptance_criteria,
+    ):
+        """Test that a validation failure stops the security scan still running."""
+        security_cancelled = False
+
+        async def run_validation(**kwargs):
+            await asyncio.sleep(0)
+            return AgentResult(
+                success=False, agent_type="validation", task_id="t",
+                error_message="E2E suite crashed",
+            )
+
+        async def run_security(**kwargs):
+            nonlocal security_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                security_cancelled = True
+                raise
+
+        coordinator = self._coordinator(
+            mock_backend, mock_artifact_writer, mock_test_runner,
+            validation_config, deployment_config,
+        )
+        coordinator._run_validation_agent = run_validation
+        coordinator._run_security_agent = run_security
+
+        result = await coordinator.run_validation(
+            context=agent_context,
+            implementation=implementation,
+            acceptance_criteria=acceptance_criteria,
+        )
+
+        assert result.success is False
+        assert result.failed_at == "validation"
+        assert result.error == "E2E suite crashed"
+        assert security_cancelled is True
+
+
 class TestRunDeployment:
     """Tests for ValidationDeploymentCoordinator.run_deployment method."""
 
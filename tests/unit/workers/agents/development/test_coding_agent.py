@@ -1138,3 +1138,74 @@ class TestCodingOutputSchema:
         assert "content" in file_schema["properties"]
         assert "path" in file_schema["required"]
         assert "content" in file_schema["required"]
+
+
+_STREAMING_CLI = """
+import json, time
+def emit(msg):
+    print(json.dumps(msg), flush=True)
+for turn in range(2):
+    emit({"type": "assistant", "message": {
+        "id": f"msg-{turn}",
+        "usage": {"input_tokens": 100, "output_tokens": 50},
+        "content": [{"type": "tool_use", "name": "Read", "id": f"t{turn}"}],
+    }})
+time.sleep(30)
+"""
+
+
+class TestCodingAgentBackendProgress:
+    """Tests for live progress and the token budget through CodingAgent."""
+
+    @pytest.mark.asyncio
+    async def test_cli_progress_is_published_and_budget_enforced(
+        self,
+        mock_artifact_writer,
+        config,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """CLI events reach the telemetry log and the budget stops the run."""
+        import sys
+
+        from src.workers.agents.backends.cli_backend import CLIAgentBackend
+        from src.workers.agents.development.coding_agent import CodingAgent
+        from tests.unit.workers.agents.backends.test_progress import FakeRedis
+
+        redis = FakeRedis()
+        monkeypatch.setattr(
+            "src.workers.agents.backends.progress.get_redis_client",
+            AsyncMock(return_value=redis),
+        )
+        monkeypatch.setenv("AGENT_BACKEND_MAX_TOTAL_TOKENS", "200")
+        backend = CLIAgentBackend(cli="claude")
+        commands: list[bool] = []
+
+        def build_command(prompt, backend_config, streaming=False):
+            commands.append(streaming)
+            return [sys.executable, "-c", _STREAMING_CLI]
+
+        backend._build_command = build_command
+        agent = CodingAgent(
+            backend=backend,
+            artifact_writer=mock_artifact_writer,
+            config=config,
+        )
+        context = AgentContext(
+            session_id="test-session",
+            task_id="test-task",
+            tenant_id="default",
+            workspace_path=str(tmp_path),
+        )
+
+        result = await agent.execute(
+            context,
+            {"task_description": "Implement login", "test_code": "def test_x(): pass"},
+        )
+
+        assert commands == [True]
+        assert result.success is False
+        assert "max_total_tokens" in (result.error_message or "")
+        messages = [e["message"] for e in redis.entries("agent:logs:coding:test-task")]
+        assert messages[-3:] == ["Tool use: Read", "Tokens: 100 in, 50 out", "Turn 1"]
+        assert "Tokens: 200 in, 100 out" in messages
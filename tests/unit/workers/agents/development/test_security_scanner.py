@@ -4,16 +4,27 @@ from __future__ import annotations
 
 import pytest
 
+from scripts.benchmarks.benchmark_security_scanner import (
+    VULNERABLE_LINES,
+    _reference_scan,
+    _scanner_findings,
+    generate_code,
+)
+from src.workers.agents.development import security_scanner
 from src.workers.agents.development.models import IssueSeverity
 from src.workers.agents.development.security_scanner import (
+    INJECTION_ANCHORS,
     INJECTION_PATTERNS,
+    OWASP_ANCHORS,
     OWASP_PATTERNS,
     SAFE_PATTERNS,
+    SECRET_ANCHORS,
     SECRET_PATTERNS,
     run_security_scan,
     scan_for_injection_vulnerabilities,
     scan_for_owasp_vulnerabilities,
     scan_for_secrets,
+    scan_files,
 )
 
 
@@ -265,6 +276,58 @@ api_key = "sk-12345678901234567890"
         assert len(ids) == len(set(ids)), f"Duplicate IDs found: {ids}"
 
 
+class TestAnchoredScan:
+    """Tests that the single-pass scan matches the per-line reference."""
+
+    def test_matches_reference_on_generated_code(self) -> None:
+        code = generate_code(3000, vulnerable_ratio=0.3)
+
+        assert _scanner_findings(code) == _reference_scan(code)
+
+    def test_matches_reference_for_each_line(self) -> None:
+        for line in VULNERABLE_LINES:
+            assert _scanner_findings(line) == _reference_scan(line), line
+
+    def test_matches_reference_on_non_ascii_code(self) -> None:
+        code = "# café\nPASSWORD = \"naïve\"\nx = EVAL(y)  # ünïcode"
+
+        assert _scanner_findings(code) == _reference_scan(code)
+        assert len(_reference_scan(code)) == 2
+
+    def test_anchor_lists_align_with_patterns(self) -> None:
+        assert len(SECRET_ANCHORS) == len(SECRET_PATTERNS)
+        assert len(INJECTION_ANCHORS) == len(INJECTION_PATTERNS)
+        assert len(OWASP_ANCHORS) == len(OWASP_PATTERNS)
+
+
+class TestScanFiles:
+    """Tests for scan_files()."""
+
+    FILES = {
+        "src/a.py": 'password = "x"\nobj = pickle.loads(b)',
+        "src/b.py": 'token = "y"',
+    }
+
+    def test_sets_file_paths_and_unique_ids(self) -> None:
+        findings = scan_files(self.FILES)
+
+        assert [(f.file_path, f.line_number, f.id) for f in findings] == [
+            ("src/a.py", 1, "SEC-001"),
+            ("src/a.py", 2, "OWASP-001"),
+            ("src/b.py", 1, "SEC-002"),
+        ]
+
+    def test_parallel_scan_matches_sequential(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sequential = scan_files(self.FILES)
+        monkeypatch.setattr(security_scanner, "PARALLEL_SCAN_MIN_BYTES", 0)
+
+        parallel = scan_files(self.FILES, max_workers=2)
+
+        assert [f.to_dict() for f in parallel] == [f.to_dict() for f in sequential]
+
+
 class TestPatternConstants:
     """Tests ensuring pattern lists are non-empty and well-formed."""
 
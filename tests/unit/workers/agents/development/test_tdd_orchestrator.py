@@ -63,7 +63,7 @@ def mock_reviewer_agent():
 def mock_test_runner():
     """Create a mock TestRunner."""
     runner = MagicMock()
-    runner.run_tests = MagicMock()
+    runner.run_tests_async = AsyncMock()
     return runner
 
 
@@ -280,7 +280,7 @@ class TestTDDOrchestratorBasicLoop:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -335,7 +335,7 @@ class TestTDDOrchestratorBasicLoop:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -390,7 +390,7 @@ class TestTDDOrchestratorBasicLoop:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -413,7 +413,7 @@ class TestTDDOrchestratorBasicLoop:
             acceptance_criteria=["Feature should work"],
         )
 
-        mock_test_runner.run_tests.assert_called()
+        mock_test_runner.run_tests_async.assert_called()
 
     @pytest.mark.asyncio
     async def test_run_tdd_loop_calls_reviewer_when_tests_pass(
@@ -445,7 +445,7 @@ class TestTDDOrchestratorBasicLoop:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -500,7 +500,7 @@ class TestTDDOrchestratorBasicLoop:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -561,7 +561,7 @@ class TestTDDOrchestratorRetryLogic:
             metadata={"implementation": sample_implementation.to_dict()},
         )
         # First call fails, second call passes
-        mock_test_runner.run_tests.side_effect = [
+        mock_test_runner.run_tests_async.side_effect = [
             failing_test_result,
             passing_test_result,
         ]
@@ -591,6 +591,79 @@ class TestTDDOrchestratorRetryLogic:
         assert mock_coding_agent.execute.call_count == 2
         assert result.success is True
 
+    @pytest.mark.asyncio
+    async def test_full_suite_confirms_affected_run(
+        self,
+        mock_utest_agent,
+        mock_coding_agent,
+        mock_debugger_agent,
+        mock_reviewer_agent,
+        mock_test_runner,
+        agent_context,
+        config,
+        sample_test_suite,
+        sample_implementation,
+        failing_test_result,
+        passing_test_result,
+        passing_review,
+    ) -> None:
+        """Test that a passing affected-only run is confirmed by a full run."""
+        from dataclasses import replace
+
+        from src.workers.agents.development.tdd_orchestrator import TDDOrchestrator
+
+        affected_pass = replace(passing_test_result, metadata={"affected_only": True})
+        mock_utest_agent.execute.return_value = AgentResult(
+            success=True,
+            agent_type="utest",
+            task_id="test-task",
+            metadata={"test_suite": sample_test_suite.to_dict()},
+        )
+        mock_coding_agent.execute.return_value = AgentResult(
+            success=True,
+            agent_type="coding",
+            task_id="test-task",
+            metadata={"implementation": sample_implementation.to_dict()},
+        )
+        # Affected tests pass but the full suite catches a failure; the
+        # retry then passes both
+        mock_test_runner.run_tests_async.side_effect = [
+            affected_pass,
+            failing_test_result,
+            affected_pass,
+            passing_test_result,
+        ]
+        mock_reviewer_agent.execute.return_value = AgentResult(
+            success=True,
+            agent_type="reviewer",
+            task_id="test-task",
+            metadata={"passed": True, "review": passing_review.to_dict()},
+        )
+
+        orchestrator = TDDOrchestrator(
+            utest_agent=mock_utest_agent,
+            coding_agent=mock_coding_agent,
+            debugger_agent=mock_debugger_agent,
+            reviewer_agent=mock_reviewer_agent,
+            test_runner=mock_test_runner,
+            config=config,
+        )
+
+        result = await orchestrator.run_tdd_loop(
+            context=agent_context,
+            task_description="Implement feature",
+            acceptance_criteria=["Feature should work"],
+        )
+
+        calls = mock_test_runner.run_tests_async.call_args_list
+        assert [c.kwargs["changed_files"] is None for c in calls] == [
+            False, True, False, True,
+        ]
+        assert mock_coding_agent.execute.call_count == 2
+        assert mock_reviewer_agent.execute.call_count == 1
+        assert result.success is True
+        assert result.test_result is passing_test_result
+
     @pytest.mark.asyncio
     async def test_increments_fail_count_on_each_retry(
         self,
@@ -623,7 +696,7 @@ class TestTDDOrchestratorRetryLogic:
             metadata={"implementation": sample_implementation.to_dict()},
         )
         # Fail twice then pass
-        mock_test_runner.run_tests.side_effect = [
+        mock_test_runner.run_tests_async.side_effect = [
             failing_test_result,
             failing_test_result,
             passing_test_result,
@@ -691,7 +764,7 @@ class TestTDDOrchestratorRetryLogic:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.side_effect = [
+        mock_test_runner.run_tests_async.side_effect = [
             failing_test_result,
             passing_test_result,
         ]
@@ -763,7 +836,7 @@ class TestTDDOrchestratorDebuggerEscalation:
             metadata={"implementation": sample_implementation.to_dict()},
         )
         # Fail 3 times to exceed max_coding_retries=2, then pass after debug
-        mock_test_runner.run_tests.side_effect = [
+        mock_test_runner.run_tests_async.side_effect = [
             failing_test_result,
             failing_test_result,
             failing_test_result,
@@ -848,7 +921,7 @@ class TestTDDOrchestratorDebuggerEscalation:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.side_effect = [
+        mock_test_runner.run_tests_async.side_effect = [
             failing_test_result,
             failing_test_result,
             passing_test_result,
@@ -940,7 +1013,7 @@ class TestTDDOrchestratorReviewRetry:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         # First review fails, second passes
         mock_reviewer_agent.execute.side_effect = [
             AgentResult(
@@ -1094,7 +1167,7 @@ class TestTDDOrchestratorErrorHandling:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.side_effect = TestTimeoutError("Test timed out")
+        mock_test_runner.run_tests_async.side_effect = TestTimeoutError("Test timed out")
 
         orchestrator = TDDOrchestrator(
             utest_agent=mock_utest_agent,
@@ -1148,7 +1221,7 @@ class TestTDDOrchestratorResult:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1204,7 +1277,7 @@ class TestTDDOrchestratorResult:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1260,7 +1333,7 @@ class TestTDDOrchestratorResult:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1316,7 +1389,7 @@ class TestTDDOrchestratorResult:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1373,7 +1446,7 @@ class TestTDDOrchestratorResult:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.side_effect = [
+        mock_test_runner.run_tests_async.side_effect = [
             failing_test_result,
             failing_test_result,
             passing_test_result,
@@ -1445,7 +1518,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1534,7 +1607,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1612,7 +1685,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1690,7 +1763,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1769,7 +1842,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1847,7 +1920,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1925,7 +1998,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -1993,7 +2066,7 @@ class TestHITL4EvidenceBundle:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -2067,7 +2140,7 @@ class TestHITL4RejectionHandling:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
@@ -2152,7 +2225,7 @@ class TestHITL4RejectionHandling:
             task_id="test-task",
             metadata={"implementation": sample_implementation.to_dict()},
         )
-        mock_test_runner.run_tests.return_value = passing_test_result
+        mock_test_runner.run_tests_async.return_value = passing_test_result
         mock_reviewer_agent.execute.return_value = AgentResult(
             success=True,
             agent_type="reviewer",
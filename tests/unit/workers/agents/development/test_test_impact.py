@@ -0,0 +1,132 @@
+"""Unit tests for test impact selection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.workers.agents.development.test_impact import (
+    TestImpactSelector,
+    find_test_files,
+    is_test_file,
+)
+
+
+def _workspace(root: Path) -> Path:
+    (root / "pkg").mkdir()
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "models.py").write_text("class Item:\n    pass\n")
+    (root / "pkg" / "service.py").write_text("from .models import Item\n")
+    (root / "pkg" / "util.py").write_text("def helper():\n    pass\n")
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "test_service.py").write_text("from pkg.service import Item\n")
+    (tests / "test_util.py").write_text("from pkg.util import helper\n")
+    return tests
+
+
+class TestTestImpactSelector:
+    """Tests for TestImpactSelector.select."""
+
+    def test_selects_direct_importers(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+
+        selected = TestImpactSelector().select(tmp_path, tests, ["pkg/util.py"])
+
+        assert selected == [tests / "test_util.py"]
+
+    def test_selects_transitive_importers(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+
+        selected = TestImpactSelector().select(tmp_path, tests, ["pkg/models.py"])
+
+        assert selected == [tests / "test_service.py"]
+
+    def test_package_and_submodule_imports(self, tmp_path: Path) -> None:
+        (tmp_path / "calc").mkdir()
+        (tmp_path / "calc" / "__init__.py").write_text("")
+        (tmp_path / "calc" / "ops.py").write_text("def add(a, b):\n    return a + b\n")
+        tests = tmp_path / "tests"
+        tests.mkdir()
+        (tests / "test_ops.py").write_text("from calc import ops\n")
+        (tests / "test_ops2.py").write_text("from calc.ops import add\n")
+        (tests / "test_pkg.py").write_text("import calc\n")
+
+        selector = TestImpactSelector()
+
+        assert selector.select(tmp_path, tests, ["calc/ops.py"]) == [
+            tests / "test_ops.py",
+            tests / "test_ops2.py",
+        ]
+        assert selector.select(tmp_path, tests, ["calc/__init__.py"]) == [
+            tests / "test_ops.py",
+            tests / "test_ops2.py",
+            tests / "test_pkg.py",
+        ]
+
+    def test_src_layout_imports(self, tmp_path: Path) -> None:
+        (tmp_path / "src" / "app").mkdir(parents=True)
+        (tmp_path / "src" / "app" / "__init__.py").write_text("")
+        (tmp_path / "src" / "app" / "core.py").write_text("")
+        (tmp_path / "app_core.py").write_text("")
+        tests = tmp_path / "tests"
+        tests.mkdir()
+        (tests / "test_core.py").write_text("from app.core import *\n")
+
+        selected = TestImpactSelector().select(tmp_path, tests, ["src/app/core.py"])
+
+        assert selected == [tests / "test_core.py"]
+
+    def test_changed_test_file_selected(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+
+        selected = TestImpactSelector().select(
+            tmp_path, tests, [tests / "test_util.py"]
+        )
+
+        assert selected == [tests / "test_util.py"]
+
+    def test_non_python_change_requires_full_run(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+        selector = TestImpactSelector()
+
+        assert selector.select(tmp_path, tests, ["setup.cfg"]) is None
+        assert selector.select(tmp_path, tests, ["tests/conftest.py"]) is None
+        assert selector.select(tmp_path, tests, []) is None
+
+    def test_unparseable_change_requires_full_run(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+        (tmp_path / "pkg" / "util.py").write_text("def broken(:\n")
+
+        assert TestImpactSelector().select(tmp_path, tests, ["pkg/util.py"]) is None
+
+    def test_parsed_files_cached(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+        selector = TestImpactSelector()
+        selector.select(tmp_path, tests, ["pkg/util.py"])
+        cached = dict(selector._cache)
+
+        selector.select(tmp_path, tests, ["pkg/util.py"])
+
+        assert all(selector._cache[k][1] is v[1] for k, v in cached.items())
+
+
+class TestFindTestFiles:
+    """Tests for test file discovery."""
+
+    def test_finds_test_modules(self, tmp_path: Path) -> None:
+        tests = _workspace(tmp_path)
+        (tests / "helpers.py").write_text("")
+        (tests / "api_test.py").write_text("")
+
+        assert find_test_files(tests) == [
+            tests / "api_test.py",
+            tests / "test_service.py",
+            tests / "test_util.py",
+        ]
+
+    def test_file_path_returned_as_is(self, tmp_path: Path) -> None:
+        path = tmp_path / "check.py"
+        path.write_text("")
+
+        assert find_test_files(path) == [path]
+        assert is_test_file(path) is False
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -441,3 +443,126 @@ def test_always_fails():
         assert result.failed == 1
         assert result.all_passed() is False
         assert any("This test should fail" in (r.error or "") for r in result.results)
+
+
+def _write_workspace(root: Path) -> None:
+    """Create a workspace with two modules and a test file for each."""
+    (root / "conftest.py").write_text("")
+    (root / "calc.py").write_text("def add(a, b):\n    return a + b\n")
+    (root / "greet.py").write_text("def hello():\n    return 'hi'\n")
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "test_calc.py").write_text(
+        "from calc import add\n\n"
+        "def test_add():\n    assert add(1, 2) == 3\n\n"
+        "def test_add_wrong():\n    assert add(1, 1) == 3, 'bad sum'\n"
+    )
+    (tests / "test_greet.py").write_text(
+        "import pytest\nfrom greet import hello\n\n"
+        "def test_hello():\n    assert hello() == 'hi'\n\n"
+        "@pytest.mark.skip\ndef test_skipped():\n    pass\n"
+    )
+
+
+class TestRunTestsAsync:
+    """Tests for affected, sharded runs with JUnit reports."""
+
+    @pytest.mark.asyncio
+    async def test_runs_only_affected_tests(self, tmp_path: Path) -> None:
+        _write_workspace(tmp_path)
+        runner = TestRunner(working_directory=tmp_path, max_workers=2)
+
+        result = await runner.run_tests_async(
+            tmp_path / "tests", changed_files=["calc.py"]
+        )
+
+        assert result.metadata["affected_only"] is True
+        assert result.metadata["selected_files"] == [str(tmp_path / "tests" / "test_calc.py")]
+        assert result.passed == 1
+        assert result.failed == 1
+        failed = next(r for r in result.results if not r.passed)
+        assert failed.test_id == "test_add_wrong"
+        assert "bad sum" in failed.error
+
+    @pytest.mark.asyncio
+    async def test_full_run_is_sharded(self, tmp_path: Path) -> None:
+        _write_workspace(tmp_path)
+        runner = TestRunner(working_directory=tmp_path, max_workers=4)
+
+        result = await runner.run_tests_async(tmp_path / "tests", suite_id="s1")
+
+        assert result.suite_id == "s1"
+        assert result.metadata["affected_only"] is False
+        assert result.metadata["shards"] == 2
+        assert result.metadata["skipped"] == 1
+        assert {r.test_id for r in result.results} == {
+            "test_add", "test_add_wrong", "test_hello",
+        }
+        assert runner._durations
+
+    @pytest.mark.asyncio
+    async def test_unanalysable_change_runs_everything(self, tmp_path: Path) -> None:
+        _write_workspace(tmp_path)
+        runner = TestRunner(working_directory=tmp_path)
+
+        result = await runner.run_tests_async(
+            tmp_path / "tests", changed_files=["pyproject.toml"]
+        )
+
+        assert result.metadata["affected_only"] is False
+        assert len(result.results) == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "test_slow.py"
+        test_file.write_text("import time\n\ndef test_slow():\n    time.sleep(30)\n")
+        runner = TestRunner(working_directory=tmp_path, timeout_seconds=1)
+
+        with pytest.raises(TestTimeoutError):
+            await runner.run_tests_async(test_file)
+
+    @pytest.mark.asyncio
+    async def test_shard_error_kills_other_shards(self, tmp_path: Path) -> None:
+        pid_file = tmp_path / "slow.pid"
+        (tmp_path / "test_slow.py").write_text(
+            "import os, time\n"
+            f"open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n\n"
+            "def test_slow():\n    time.sleep(30)\n"
+        )
+        (tmp_path / "test_broken.py").write_text(
+            "import os, time\n"
+            f"while not os.path.exists({str(pid_file)!r}):\n    time.sleep(0.05)\n"
+            "raise RuntimeError('collection failed')\n"
+        )
+        runner = TestRunner(working_directory=tmp_path, max_workers=2, timeout_seconds=20)
+        started = time.monotonic()
+
+        with pytest.raises(TestRunnerError, match="collection failed"):
+            await runner.run_tests_async(tmp_path)
+
+        assert time.monotonic() - started < 15
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+    def test_shards_balanced_by_duration(self) -> None:
+        runner = TestRunner(max_workers=2)
+        files = [Path(f"/w/test_{name}.py") for name in "abcd"]
+        runner._durations = {
+            "/w/test_a.py": 10.0,
+            "/w/test_b.py": 1.0,
+            "/w/test_c.py": 1.0,
+            "/w/test_d.py": 1.0,
+        }
+
+        shards = runner._shard(files)
+
+        assert shards[0] == [Path("/w/test_a.py")]
+        assert len(shards[1]) == 3
+
+    def test_merge_coverage_unions_lines(self) -> None:
+        runner = TestRunner()
+        shard_a = {"calc.py": {"executed_lines": [1, 2], "missing_lines": [3, 4]}}
+        shard_b = {"calc.py": {"executed_lines": [2, 3], "missing_lines": [1, 4]}}
+
+        assert runner._merge_coverage([shard_a, shard_b]) == 75.0
+        assert runner._merge_coverage([]) == 0.0
@@ -0,0 +1,166 @@
+"""Unit tests for the coordinator stage graph executor."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.workers.agents.stage_graph import (
+    Stage,
+    StageError,
+    StageGraph,
+    StageGraphError,
+    StageStatus,
+)
+
+
+def _returning(value, delay: float = 0.0, log: list[str] | None = None):
+    async def run(inputs: dict) -> object:
+        if log is not None:
+            log.append(f"start:{value}")
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(f"end:{value}")
+        return value
+
+    return run
+
+
+class TestStageGraphValidation:
+    """Tests for graph construction."""
+
+    def test_rejects_duplicate_names(self) -> None:
+        with pytest.raises(StageGraphError, match="unique"):
+            StageGraph([Stage("a", _returning(1)), Stage("a", _returning(2))])
+
+    def test_rejects_unknown_dependency(self) -> None:
+        with pytest.raises(StageGraphError, match="unknown"):
+            StageGraph([Stage("a", _returning(1), depends_on=("missing",))])
+
+    def test_rejects_cycle(self) -> None:
+        with pytest.raises(StageGraphError, match="cycle"):
+            StageGraph([
+                Stage("a", _returning(1), depends_on=("b",)),
+                Stage("b", _returning(2), depends_on=("a",)),
+            ])
+
+
+class TestStageGraphRun:
+    """Tests for running stages."""
+
+    async def test_independent_stages_overlap(self) -> None:
+        log: list[str] = []
+        graph = StageGraph([
+            Stage("a", _returning("a", 0.02, log)),
+            Stage("b", _returning("b", 0.01, log)),
+        ])
+
+        result = await graph.run()
+
+        assert result.succeeded
+        assert log[:2] == ["start:a", "start:b"]
+        # Outcomes keep declaration order even though b finished first
+        assert log.index("end:b") < log.index("end:a")
+        assert list(result.outcomes) == ["a", "b"]
+        assert result.results == {"a": "a", "b": "b"}
+        assert set(result.timings) == {"a", "b"}
+
+    async def test_dependent_stage_receives_results(self) -> None:
+        async def combine(inputs: dict) -> str:
+            return inputs["a"] + inputs["b"]
+
+        graph = StageGraph([
+            Stage("report", combine, depends_on=("a", "b")),
+            Stage("a", _returning("x")),
+            Stage("b", _returning("y")),
+        ])
+
+        result = await graph.run()
+
+        assert result.results["report"] == "xy"
+
+    async def test_failure_cancels_running_and_skips_dependants(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def fail(inputs: dict) -> None:
+            raise StageError("checks failed")
+
+        async def slow(inputs: dict) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        graph = StageGraph([
+            Stage("slow", slow),
+            Stage("fail", fail),
+            Stage("after", _returning(1), depends_on=("fail",)),
+        ])
+
+        result = await graph.run()
+
+        assert not result.succeeded
+        assert cancelled.is_set()
+        assert result.outcomes["slow"].status == StageStatus.CANCELLED
+        assert result.outcomes["after"].status == StageStatus.SKIPPED
+        assert result.first_failure.name == "fail"
+        assert result.first_failure.error == "checks failed"
+
+    async def test_first_failure_follows_declaration_order(self) -> None:
+        async def fail_late(inputs: dict) -> None:
+            await asyncio.sleep(0.01)
+            raise StageError("late")
+
+        async def fail_early(inputs: dict) -> None:
+            raise StageError("early")
+
+        graph = StageGraph([Stage("a", fail_late), Stage("b", fail_early)])
+
+        result = await graph.run(fail_fast=False)
+
+        assert result.first_failure.name == "a"
+        assert result.outcomes["b"].status == StageStatus.FAILED
+
+    async def test_without_fail_fast_independent_stages_finish(self) -> None:
+        async def fail(inputs: dict) -> None:
+            raise RuntimeError("boom")
+
+        graph = StageGraph([
+            Stage("fail", fail),
+            Stage("other", _returning("ok", 0.01)),
+            Stage("after", _returning(1), depends_on=("fail",)),
+        ])
+
+        result = await graph.run(fail_fast=False)
+
+        assert result.outcomes["other"].status == StageStatus.SUCCEEDED
+        assert result.outcomes["after"].status == StageStatus.SKIPPED
+        assert result.first_failure.error == "boom"
+
+    async def test_timeout_fails_stage(self) -> None:
+        graph = StageGraph([Stage("slow", _returning(1, 10), timeout_seconds=0.01)])
+
+        result = await graph.run()
+
+        assert result.outcomes["slow"].status == StageStatus.FAILED
+        assert "timed out" in result.outcomes["slow"].error
+
+    async def test_outer_cancellation_cancels_stages(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def slow(inputs: dict) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(StageGraph([Stage("slow", slow)]).run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled.is_set()
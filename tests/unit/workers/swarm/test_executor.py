@@ -6,10 +6,15 @@ Tests cover code extraction from local paths, LLM response parsing
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+import subprocess
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from src.infrastructure.llm.base_client import LLMResponse
@@ -212,6 +217,19 @@ class TestCodeExtractor:
         assert owner == ""
         assert repo == ""
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com/../repo",
+            "https://github.com/owner/..",
+            "https://github.com/-owner/repo",
+            "https://github.com/owner/re%2Fpo",
+        ],
+    )
+    def test_parse_github_url_rejects_invalid_names(self, url: str) -> None:
+        """Names that are not valid GitHub names are never used as paths."""
+        assert CodeExtractor._parse_github_url(url) == ("", "")
+
     @pytest.mark.asyncio
     async def test_extract_github_dispatches_correctly(self) -> None:
         """A github.com URL triggers the GitHub extraction path."""
@@ -226,6 +244,274 @@ class TestCodeExtractor:
             mock_gh.assert_awaited_once_with("https://github.com/owner/repo")
 
 
+# ---------------------------------------------------------------------------
+# TestCodeExtractorGitHub
+# ---------------------------------------------------------------------------
+
+
+def _blob_sha(content: str) -> str:
+    data = content.encode()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class FakeGitHub:
+    """Local stand-in for the GitHub tree API and raw file host."""
+
+    def __init__(self, files: dict[str, str], delay: float = 0.01) -> None:
+        self.files = files
+        self.delay = delay
+        self.raw_requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def tree(self) -> dict:
+        return {
+            "sha": "remote-tree",
+            "tree": [
+                {"path": p, "type": "blob", "sha": _blob_sha(c), "size": len(c)}
+                for p, c in self.files.items()
+            ],
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.github.com":
+            return httpx.Response(200, json=self.tree())
+        path = request.url.path.split("/HEAD/", 1)[1]
+        self.raw_requests.append(path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if path not in self.files:
+            return httpx.Response(404)
+        return httpx.Response(200, text=self.files[path])
+
+    def extractor(self, cache_dir: Path, **kwargs) -> CodeExtractor:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return CodeExtractor(
+            workspace_root="/tmp",
+            cache_dir=str(cache_dir),
+            http_client=client,
+            **kwargs,
+        )
+
+
+class TestCodeExtractorGitHub:
+    """Tests for pooled, cached GitHub extraction."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_in_tree_order(self, tmp_path: Path) -> None:
+        """Files download in parallel but are added in tree order."""
+        github = FakeGitHub({f"src/m{i}.py": f"x = {i}\n" for i in range(10)})
+        extractor = github.extractor(tmp_path, fetch_concurrency=4)
+
+        context = await extractor.extract("https://github.com/owner/repo")
+
+        assert [f.path for f in context.files] == list(github.files)
+        assert context.total_lines == 10
+        assert 1 < github.max_in_flight <= 4
+        await extractor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cached_blobs_are_not_fetched_again(self, tmp_path: Path) -> None:
+        """A second review of an unchanged repo downloads nothing."""
+        github = FakeGitHub({"a.py": "a = 1\n", "b.py": "b = 2\n"})
+        await github.extractor(tmp_path).extract("https://github.com/owner/repo")
+        github.raw_requests.clear()
+
+        github.files["b.py"] = "b = 3\n"
+        context = await github.extractor(tmp_path).extract(
+            "https://github.com/owner/repo"
+        )
+
+        assert github.raw_requests == ["b.py"]
+        assert [f.content for f in context.files] == ["a = 1\n", "b = 3\n"]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_blob_is_not_cached(self, tmp_path: Path) -> None:
+        """Content that does not match the tree SHA is used but not cached."""
+        github = FakeGitHub({"a.py": "a = 1\n"})
+        tree = github.tree()
+        github.tree = lambda: {**tree, "tree": [{**tree["tree"][0], "sha": "0" * 40}]}
+        extractor = github.extractor(tmp_path)
+
+        context = await extractor.extract("https://github.com/owner/repo")
+        await extractor.extract("https://github.com/owner/repo")
+
+        assert context.files[0].content == "a = 1\n"
+        assert github.raw_requests == ["a.py", "a.py"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extractions_share_downloads(self, tmp_path: Path) -> None:
+        """Reviewers extracting the same repo at once fetch each file once."""
+        github = FakeGitHub({"a.py": "a = 1\n", "b.py": "b = 2\n"})
+        extractor = github.extractor(tmp_path)
+
+        contexts = await asyncio.gather(
+            *(extractor.extract("https://github.com/owner/repo") for _ in range(3))
+        )
+
+        assert all(len(c.files) == 2 for c in contexts)
+        assert sorted(github.raw_requests) == ["a.py", "b.py"]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_recorded(self, tmp_path: Path) -> None:
+        """A failed download is reported and the remaining files still load."""
+        github = FakeGitHub({"a.py": "a = 1\n", "b.py": "b = 2\n"})
+        del github.files["a.py"]
+        github.tree = lambda: {
+            "tree": [
+                {"path": "a.py", "type": "blob", "sha": "1" * 40, "size": 6},
+                {"path": "b.py", "type": "blob", "sha": _blob_sha("b = 2\n"), "size": 6},
+            ]
+        }
+
+        context = await github.extractor(tmp_path).extract(
+            "https://github.com/owner/repo"
+        )
+
+        assert [f.path for f in context.files] == ["b.py"]
+        assert "Failed to fetch a.py" in context.extraction_errors[0]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_total_lines(self, tmp_path: Path) -> None:
+        """Extraction stops once the next file would exceed the line cap."""
+        chunk = "x = 1\n" * (MAX_TOTAL_LINES // 2)
+        github = FakeGitHub({"a.py": chunk, "b.py": chunk, "c.py": chunk})
+
+        context = await github.extractor(tmp_path).extract(
+            "https://github.com/owner/repo"
+        )
+
+        assert [f.path for f in context.files] == ["a.py", "b.py"]
+        assert context.total_lines == MAX_TOTAL_LINES
+
+    @pytest.mark.asyncio
+    async def test_large_repo_uses_shallow_clone(self, tmp_path: Path) -> None:
+        """Above the clone threshold, files come from a cached shallow clone."""
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        (origin / "app.py").write_text("v = 1\n")
+        (origin / "notes.md").write_text("skip\n")
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", "-C", str(origin), *args],
+                check=True, capture_output=True, text=True,
+            ).stdout.strip()
+
+        git("init", "-q")
+        git("add", ".")
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+
+        github = FakeGitHub({"app.py": "v = 1\n"})
+        extractor = github.extractor(tmp_path / "cache", clone_threshold=0)
+        extractor._clone_url = lambda owner, repo: origin.as_uri()
+
+        context = await extractor.extract("https://github.com/owner/repo")
+
+        assert [(f.path, f.content) for f in context.files] == [("app.py", "v = 1\n")]
+        assert github.raw_requests == []
+        assert (tmp_path / "cache" / "clones" / "owner" / "repo" / ".git").is_dir()
+
+        (origin / "app.py").write_text("v = 2\n")
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qam", "bump")
+        github.tree = lambda: {
+            "sha": git("rev-parse", "HEAD^{tree}"), "tree": [], "truncated": True,
+        }
+
+        context = await extractor.extract("https://github.com/owner/repo")
+
+        assert context.files[0].content == "v = 2\n"
+
+    @pytest.mark.asyncio
+    async def test_shallow_clone_skips_symlinks(self, tmp_path: Path) -> None:
+        """Symlinked files in a clone are never read, so host files cannot leak."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("TOKEN=hunter2\n")
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        (origin / "app.py").write_text("v = 1\n")
+        (origin / "leak.py").symlink_to(secret)
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", "-C", str(origin), *args],
+                check=True, capture_output=True, text=True,
+            ).stdout.strip()
+
+        git("init", "-q")
+        git("add", ".")
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+
+        github = FakeGitHub({"app.py": "v = 1\n"})
+        extractor = github.extractor(tmp_path / "cache", clone_threshold=0)
+        extractor._clone_url = lambda owner, repo: origin.as_uri()
+
+        context = await extractor.extract("https://github.com/owner/repo")
+
+        assert [f.path for f in context.files] == ["app.py"]
+        assert all("hunter2" not in f.content for f in context.files)
+
+    def test_candidate_entries_skip_symlinks(self) -> None:
+        """Tree API symlink entries (mode 120000) are not review candidates."""
+        entries = [
+            {"path": "a.py", "mode": "100644", "type": "blob", "size": 1},
+            {"path": "b.py", "mode": "120000", "type": "blob", "size": 1},
+        ]
+
+        assert [e["path"] for e in CodeExtractor._candidate_entries(entries)] == ["a.py"]
+
+    @pytest.mark.asyncio
+    async def test_prune_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Pruning removes the oldest blobs and clones until the cache fits."""
+        extractor = CodeExtractor(cache_dir=str(tmp_path), cache_max_bytes=250)
+        for i, sha in enumerate(["aa" + "1" * 38, "bb" + "2" * 38, "cc" + "3" * 38]):
+            extractor._cache_put(sha, b"x" * 100)
+            os.utime(extractor._blob_cache_path(sha), (1000 + i, 1000 + i))
+        clone = tmp_path / "clones" / "owner" / "repo"
+        clone.mkdir(parents=True)
+        (clone / "app.py").write_bytes(b"y" * 100)
+        os.utime(clone, (500, 500))
+
+        freed = await extractor.prune_cache()
+
+        assert freed == 200
+        assert not clone.exists()
+        assert extractor._cache_get("aa" + "1" * 38) is None
+        assert extractor._cache_get("bb" + "2" * 38) is not None
+        assert extractor._cache_get("cc" + "3" * 38) is not None
+
+    @pytest.mark.asyncio
+    async def test_prune_skips_clones_in_use(self, tmp_path: Path) -> None:
+        """A clone locked by an extraction is not evicted."""
+        extractor = CodeExtractor(cache_dir=str(tmp_path), cache_max_bytes=0)
+        clone = tmp_path / "clones" / "owner" / "repo"
+        clone.mkdir(parents=True)
+        (clone / "app.py").write_bytes(b"y" * 100)
+        lock = extractor._clone_locks.setdefault("owner/repo", asyncio.Lock())
+
+        async with lock:
+            freed = await extractor.prune_cache()
+
+        assert freed == 0
+        assert clone.exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_refreshes_last_use(self, tmp_path: Path) -> None:
+        """Reading a cached blob marks it as recently used."""
+        extractor = CodeExtractor(cache_dir=str(tmp_path))
+        sha = "aa" + "1" * 38
+        extractor._cache_put(sha, b"data")
+        path = extractor._blob_cache_path(sha)
+        os.utime(path, (1000, 1000))
+
+        assert extractor._cache_get(sha) == b"data"
+        assert path.stat().st_mtime > 1000
+
+
 # ---------------------------------------------------------------------------
 # TestResponseParser
 # ---------------------------------------------------------------------------
@@ -433,6 +719,16 @@ class TestReviewExecutor:
             checklist=["Check SQL injection", "Check auth bypass"],
         )
 
+    @pytest.mark.asyncio
+    async def test_aclose_closes_extractor(self, mock_factory: AsyncMock) -> None:
+        """Closing the executor closes the extractor's HTTP client."""
+        executor = ReviewExecutor(factory=mock_factory)
+        executor._extractor = MagicMock(aclose=AsyncMock())
+
+        await executor.aclose()
+
+        executor._extractor.aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_execute_review_success(
         self,
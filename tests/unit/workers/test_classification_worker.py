@@ -144,6 +144,20 @@ class TestEnqueueBatch:
         assert job_data["completed"] == 0
         assert job_data["status"] == ClassificationJobStatus.PENDING.value
 
+    @pytest.mark.asyncio
+    async def test_enqueue_batch_single_lpush(
+        self, worker: ClassificationWorker
+    ) -> None:
+        """Test batch enqueue pushes all queue items in one call."""
+        await worker.enqueue_batch(["idea-1", "idea-2", "idea-3"])
+
+        worker._redis_client.lpush.assert_called_once()
+        args = worker._redis_client.lpush.call_args.args
+        assert args[0] == REDIS_QUEUE_KEY
+        assert [json.loads(item)["idea_id"] for item in args[1:]] == [
+            "idea-1", "idea-2", "idea-3",
+        ]
+
 
 class TestGetJobStatus:
     """Tests for get_job_status method."""
@@ -218,6 +232,9 @@ class TestProcessQueue:
         }
 
         # brpop returns (key, value) tuple
+        worker._running = True
+        worker._redis_client.rpop.return_value = None
+        worker._redis_client.get.return_value = None
         worker._redis_client.brpop.side_effect = [
             (REDIS_QUEUE_KEY, json.dumps(job_data)),
             asyncio.CancelledError(),  # Stop the loop
@@ -253,10 +270,15 @@ class TestProcessQueue:
             "queued_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        worker._running = True
+        worker._redis_client.rpop.return_value = None
         worker._redis_client.brpop.side_effect = [
             (REDIS_QUEUE_KEY, json.dumps(job_data)),
             asyncio.CancelledError(),
         ]
+        worker._redis_client.get.return_value = json.dumps({
+            "job_id": "job-123", "total": 1, "completed": 0, "failed": 0,
+        })
 
         # Make classification fail
         worker._classification_service.classify_idea.side_effect = ValueError(
@@ -384,3 +406,161 @@ class TestBatchProcessing:
         # Get the stored job data
         set_calls = worker._redis_client.set.call_args_list
         assert len(set_calls) > 0
+
+
+class FakeQueueRedis:
+    """Minimal in-memory Redis for the queue and job metadata."""
+
+    def __init__(self) -> None:
+        self.queue: list[str] = []
+        self.store: dict[str, str] = {}
+        self.rpop_counts: list[int] = []
+
+    async def lpush(self, key: str, *values: str) -> int:
+        for value in values:
+            self.queue.insert(0, value)
+        return len(self.queue)
+
+    async def brpop(self, key: str, timeout: int = 0) -> tuple[str, str] | None:
+        if not self.queue:
+            raise asyncio.CancelledError()
+        return key, self.queue.pop()
+
+    async def rpop(self, key: str, count: int) -> list[str] | None:
+        self.rpop_counts.append(count)
+        items = []
+        while self.queue and len(items) < count:
+            items.append(self.queue.pop())
+        return items or None
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str) -> bool:
+        # Yield between read and write to expose lost updates
+        await asyncio.sleep(0)
+        self.store[key] = value
+        return True
+
+
+def _result(idea_id: str) -> ClassificationResult:
+    return ClassificationResult(
+        idea_id=idea_id,
+        classification=ClassificationType.FUNCTIONAL,
+        confidence=0.9,
+        labels=[],
+    )
+
+
+async def _drain(worker: ClassificationWorker) -> None:
+    worker._running = True
+    with pytest.raises(asyncio.CancelledError):
+        await worker.process_queue()
+
+
+class TestConcurrentProcessing:
+    """Tests for concurrent, multi-item queue draining."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_concurrently_up_to_limit(self) -> None:
+        """Jobs overlap but never exceed the concurrency limit."""
+        fake = FakeQueueRedis()
+        service = AsyncMock()
+        active = 0
+        peak = 0
+
+        async def classify(idea_id: str, force: bool = False) -> ClassificationResult:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _result(idea_id)
+
+        service.classify_idea.side_effect = classify
+        worker = ClassificationWorker(fake, service, concurrency=3)
+        job_id = await worker.enqueue_batch([f"idea-{i}" for i in range(10)])
+
+        await _drain(worker)
+
+        assert peak == 3
+        assert service.classify_idea.await_count == 10
+        status = await worker.get_job_status(job_id)
+        assert status["completed"] == 10
+        assert status["status"] == ClassificationJobStatus.COMPLETED.value
+
+    @pytest.mark.asyncio
+    async def test_wakeup_drains_free_slots_with_rpop_count(self) -> None:
+        """One BRPOP wake-up takes up to the number of free slots."""
+        fake = FakeQueueRedis()
+        service = AsyncMock()
+        service.classify_idea.side_effect = lambda idea_id, force=False: _result(idea_id)
+        worker = ClassificationWorker(fake, service, concurrency=4)
+        await worker.enqueue_batch([f"idea-{i}" for i in range(6)])
+
+        await _drain(worker)
+
+        assert fake.rpop_counts[0] == 3
+        assert service.classify_idea.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_packs_short_ideas_into_one_call(self) -> None:
+        """With pack_size > 1, drained jobs share one classify_ideas call."""
+        fake = FakeQueueRedis()
+        service = AsyncMock()
+        service.classify_ideas.side_effect = lambda ids, force=False: {
+            idea_id: (_result(idea_id) if idea_id != "idea-2" else ValueError("gone"))
+            for idea_id in ids
+        }
+        worker = ClassificationWorker(fake, service, concurrency=1, pack_size=3)
+        job_id = await worker.enqueue_batch(["idea-0", "idea-1", "idea-2"])
+
+        await _drain(worker)
+
+        service.classify_ideas.assert_awaited_once_with(
+            ["idea-0", "idea-1", "idea-2"], force=False
+        )
+        service.classify_idea.assert_not_called()
+        status = await worker.get_job_status(job_id)
+        assert status["completed"] == 2
+        assert status["failed"] == 1
+        assert status["errors"] == [{"idea_id": "idea-2", "error": "gone"}]
+        assert status["status"] == ClassificationJobStatus.COMPLETED.value
+
+    def test_pack_jobs_groups_by_force_flag(self) -> None:
+        """Jobs with different force flags are never packed together."""
+        worker = ClassificationWorker(AsyncMock(), AsyncMock(), pack_size=2)
+        jobs = [
+            {"idea_id": "a", "force": False},
+            {"idea_id": "b", "force": True},
+            {"idea_id": "c", "force": False},
+            {"idea_id": "d", "force": False},
+        ]
+
+        units = worker._pack_jobs(jobs)
+
+        assert [[j["idea_id"] for j in unit] for unit in units] == [
+            ["a", "c"], ["d"], ["b"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_exports_idea_metrics(self) -> None:
+        """Per-idea counters and batch throughput are exported."""
+        from src.infrastructure.metrics.definitions import (
+            CLASSIFICATION_BATCH_THROUGHPUT,
+            CLASSIFICATION_IDEAS_PROCESSED,
+        )
+
+        success = CLASSIFICATION_IDEAS_PROCESSED.labels(status="success")
+        before = success._value.get()
+        fake = FakeQueueRedis()
+        service = AsyncMock()
+        service.classify_idea.side_effect = lambda idea_id, force=False: _result(idea_id)
+        worker = ClassificationWorker(fake, service, concurrency=2)
+        await worker.enqueue_batch(["idea-0", "idea-1"])
+        CLASSIFICATION_BATCH_THROUGHPUT.set(0)
+
+        await _drain(worker)
+
+        assert success._value.get() == before + 2
+        assert CLASSIFICATION_BATCH_THROUGHPUT._value.get() > 0
@@ -9,11 +9,30 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.core.events import ASDLCEvent, EventType
+from src.core.events import ASDLCEvent, EventPriority, EventType
 from src.workers.pool.event_consumer import EventConsumer
 from src.workers.config import WorkerConfig
 
 
+def _reply(*stream_messages):
+    """Build an xreadgroup side effect serving entries per stream.
+
+    Args:
+        stream_messages: (stream_name, messages) pairs.
+    """
+    replies = dict(stream_messages)
+
+    async def _xreadgroup(**kwargs):
+        count = kwargs["count"]
+        return [
+            (stream, replies[stream][:count])
+            for stream in kwargs["streams"]
+            if replies.get(stream)
+        ]
+
+    return _xreadgroup
+
+
 class TestEventConsumer:
     """Tests for EventConsumer class."""
 
@@ -56,9 +75,9 @@ class TestEventConsumer:
             "timestamp": "2026-01-22T10:00:00+00:00",
             "metadata": '{"agent_type": "coding"}',
         }
-        mock_redis.xreadgroup.return_value = [
+        mock_redis.xreadgroup.side_effect = _reply(
             ("asdlc:events", [("evt-001", event_data)])
-        ]
+        )
 
         events = await consumer.read_events()
 
@@ -104,7 +123,7 @@ class TestEventConsumer:
                 },
             ),
         ]
-        mock_redis.xreadgroup.return_value = [("asdlc:events", events_data)]
+        mock_redis.xreadgroup.side_effect = _reply(("asdlc:events", events_data))
 
         events = await consumer.read_events()
 
@@ -148,29 +167,39 @@ class TestEventConsumer:
         assert result is False
 
     async def test_get_pending_count(self, consumer, mock_redis):
-        """EventConsumer returns pending event count."""
-        mock_redis.xpending.return_value = {
-            "pending": 5,
-            "min": "evt-001",
-            "max": "evt-005",
-            "consumers": [{"name": "test-consumer", "pending": 5}],
-        }
+        """EventConsumer returns pending event count summed over lanes."""
+        pending = {"asdlc:events:urgent": 2, "asdlc:events": 5}
+
+        async def _xpending(stream, group):
+            return {
+                "pending": pending[stream],
+                "min": "evt-001",
+                "max": "evt-005",
+                "consumers": [{"name": "test-consumer", "pending": pending[stream]}],
+            }
+
+        mock_redis.xpending.side_effect = _xpending
 
         count = await consumer.get_pending_count()
 
-        assert count == 5
+        assert count == 7
 
     async def test_claim_stale_events(self, consumer, mock_redis):
         """EventConsumer claims stale events from dead consumers."""
-        # Mock pending entries
-        mock_redis.xpending_range.return_value = [
-            {
-                "message_id": "evt-001",
-                "consumer": "dead-consumer",
-                "time_since_delivered": 120000,  # 2 minutes
-                "times_delivered": 1,
-            }
-        ]
+        # Mock pending entries, on the bulk lane only
+        async def _xpending_range(name, **kwargs):
+            if name != "asdlc:events":
+                return []
+            return [
+                {
+                    "message_id": "evt-001",
+                    "consumer": "dead-consumer",
+                    "time_since_delivered": 120000,  # 2 minutes
+                    "times_delivered": 1,
+                }
+            ]
+
+        mock_redis.xpending_range.side_effect = _xpending_range
         # Mock claim result
         mock_redis.xclaim.return_value = [
             (
@@ -188,6 +217,8 @@ class TestEventConsumer:
 
         assert len(events) == 1
         assert events[0].event_id == "evt-001"
+        assert events[0].priority == EventPriority.BULK
+        assert mock_redis.xclaim.call_args.args[0] == "asdlc:events"
 
 
 class TestEventConsumerTenantAware:
@@ -217,8 +248,143 @@ class TestEventConsumerTenantAware:
 
         await consumer.read_events()
 
-        # Should read from tenant-prefixed stream
-        call_kwargs = mock_redis.xreadgroup.call_args.kwargs
-        streams = call_kwargs.get("streams", {})
-        stream_name = list(streams.keys())[0] if streams else None
-        assert stream_name == "tenant:acme-corp:asdlc:events"
+        # Should read from tenant-prefixed streams
+        streams = {
+            name
+            for call in mock_redis.xreadgroup.call_args_list
+            for name in call.kwargs.get("streams", {})
+        }
+        assert "tenant:acme-corp:asdlc:events" in streams
+        assert "tenant:acme-corp:asdlc:events:urgent" in streams
+
+
+class TestEventConsumerLanes:
+    """Tests for priority lanes, capacity-sized reads and backlog stats."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Create a mock Redis client."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def config(self):
+        """Create a test worker config."""
+        return WorkerConfig(
+            batch_size=4,
+            consumer_group="test-group",
+            consumer_name="test-consumer",
+        )
+
+    @pytest.fixture
+    def consumer(self, mock_redis, config):
+        """Create an EventConsumer with mocked Redis."""
+        return EventConsumer(client=mock_redis, config=config)
+
+    @staticmethod
+    def _entry(event_id: str) -> tuple[str, dict]:
+        return (
+            event_id,
+            {
+                "event_type": "agent_started",
+                "session_id": "session-1",
+                "timestamp": "2026-01-22T10:00:00+00:00",
+            },
+        )
+
+    async def test_urgent_lane_read_first(self, consumer, mock_redis):
+        """Urgent events are returned ahead of bulk and tagged by lane."""
+        mock_redis.xreadgroup.side_effect = _reply(
+            ("asdlc:events:urgent", [self._entry("u-1")]),
+            ("asdlc:events", [self._entry("b-1"), self._entry("b-2")]),
+        )
+
+        events = await consumer.read_events(count=2)
+
+        assert [e.event_id for e in events] == ["u-1", "b-1"]
+        assert [e.priority for e in events] == [EventPriority.URGENT, EventPriority.BULK]
+        # Bulk read asks only for the capacity left after urgent events
+        assert mock_redis.xreadgroup.call_args_list[1].kwargs["count"] == 1
+
+    async def test_count_capped_at_batch_size(self, consumer, mock_redis):
+        """Requested count never exceeds the configured batch size."""
+        mock_redis.xreadgroup.return_value = []
+
+        await consumer.read_events(count=50)
+
+        assert mock_redis.xreadgroup.call_args.kwargs["count"] == 4
+
+    async def test_blocks_on_both_lanes_when_idle(self, consumer, mock_redis):
+        """With both lanes empty, one blocking read waits on both streams."""
+        mock_redis.xreadgroup.return_value = []
+
+        await consumer.read_events(block_ms=1000, count=4)
+
+        assert mock_redis.xreadgroup.call_count == 3
+        last = mock_redis.xreadgroup.call_args.kwargs
+        assert last["block"] == 1000
+        assert set(last["streams"]) == {"asdlc:events", "asdlc:events:urgent"}
+        # Count is per stream, so it is split across lanes
+        assert last["count"] == 2
+        for call in mock_redis.xreadgroup.call_args_list[:2]:
+            assert "block" not in call.kwargs
+
+    async def test_lanes_disabled_reads_base_stream_only(self, mock_redis):
+        """Without priority lanes, only the base stream is read."""
+        config = WorkerConfig(
+            consumer_group="test-group",
+            consumer_name="test-consumer",
+            priority_lanes=False,
+        )
+        consumer = EventConsumer(client=mock_redis, config=config)
+        mock_redis.xreadgroup.return_value = []
+
+        await consumer.read_events(block_ms=1000)
+
+        mock_redis.xreadgroup.assert_called_once()
+        assert list(mock_redis.xreadgroup.call_args.kwargs["streams"]) == ["asdlc:events"]
+
+    async def test_acknowledge_uses_lane_stream(self, consumer, mock_redis):
+        """Urgent events are acknowledged on the urgent stream."""
+        mock_redis.xack.return_value = 1
+
+        await consumer.acknowledge("1-0", EventPriority.URGENT)
+
+        mock_redis.xack.assert_called_once_with("asdlc:events:urgent", "test-group", "1-0")
+
+    async def test_claim_stale_events_from_urgent_lane(self, consumer, mock_redis):
+        """Stale urgent events are claimed first and acked on the urgent stream."""
+        stale = {"message_id": "1-0", "time_since_delivered": 120000}
+        mock_redis.xpending_range.return_value = [stale]
+        mock_redis.xclaim.return_value = [self._entry("1-0")]
+        mock_redis.xack.return_value = 1
+
+        events = await consumer.claim_stale_events(min_idle_ms=60000, count=1)
+        await consumer.acknowledge(events[0].event_id, events[0].priority)
+
+        assert [e.priority for e in events] == [EventPriority.URGENT]
+        # The count budget was spent on the urgent lane
+        assert mock_redis.xpending_range.call_count == 1
+        assert mock_redis.xpending_range.call_args.kwargs["name"] == "asdlc:events:urgent"
+        mock_redis.xack.assert_called_once_with("asdlc:events:urgent", "test-group", "1-0")
+
+    async def test_ensure_lanes_creates_groups(self, consumer, mock_redis):
+        """The consumer group is created on every lane stream."""
+        await consumer.ensure_lanes()
+
+        streams = [call.args[0] for call in mock_redis.xgroup_create.call_args_list]
+        assert streams == ["asdlc:events:urgent", "asdlc:events"]
+
+    async def test_get_backlog(self, consumer, mock_redis):
+        """Backlog reports depth and the age of the oldest undelivered entry."""
+        mock_redis.xinfo_groups.return_value = [
+            {"name": "other-group", "pending": 100, "lag": 100},
+            {"name": "test-group", "pending": 2, "lag": 5, "last-delivered-id": "1-0"},
+        ]
+        mock_redis.xrange.return_value = [("1700000000000-0", {})]
+
+        with patch("src.workers.pool.event_consumer.time.time", return_value=1700000010.0):
+            backlog = await consumer.get_backlog()
+
+        assert backlog["bulk"] == {"depth": 7, "pending": 2, "lag_seconds": 10.0}
+        assert set(backlog) == {"urgent", "bulk"}
+        assert mock_redis.xrange.call_args.kwargs["min"] == "(1-0"
@@ -81,6 +81,16 @@ class TestWorkerConfig:
         assert config.consumer_group == "env-group"
         assert config.consumer_name == "env-consumer"
 
+    def test_from_env_lane_settings(self, monkeypatch):
+        """WorkerConfig.from_env reads priority lane settings."""
+        monkeypatch.setenv("WORKER_PRIORITY_LANES", "false")
+        monkeypatch.setenv("WORKER_BACKLOG_REFRESH_SECONDS", "30")
+
+        config = WorkerConfig.from_env()
+
+        assert config.priority_lanes is False
+        assert config.backlog_refresh_seconds == 30
+
     def test_pool_size_validates_positive(self):
         """WorkerConfig validates pool_size is positive."""
         with pytest.raises(ValueError, match="pool_size"):
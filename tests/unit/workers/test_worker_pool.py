@@ -398,3 +398,114 @@ class TestWorkerPoolMetrics:
 
         stats = pool.get_stats()
         assert stats["events_processed"] >= 1
+
+
+class TestWorkerPoolBackpressure:
+    """Tests for capacity-sized prefetch and queue statistics."""
+
+    @pytest.fixture
+    def config(self):
+        """Create a test worker config."""
+        return WorkerConfig(
+            pool_size=3,
+            batch_size=10,
+            consumer_group="test-group",
+            consumer_name="test-consumer",
+        )
+
+    @pytest.fixture
+    def pool(self, config):
+        """Create a WorkerPool with a mocked consumer."""
+        pool = WorkerPool(
+            redis_client=AsyncMock(),
+            config=config,
+            dispatcher=AgentDispatcher(),
+            workspace_path="/app/workspace",
+        )
+        pool._consumer = AsyncMock()
+        pool._consumer.read_events.return_value = []
+        pool._consumer.get_backlog.return_value = {}
+        return pool
+
+    def _event(self, event_id: str) -> ASDLCEvent:
+        return ASDLCEvent(
+            event_id=event_id,
+            event_type=EventType.AGENT_STARTED,
+            session_id="session-123",
+            task_id=f"task-{event_id}",
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    async def _run_briefly(self, pool: WorkerPool, seconds: float = 0.05) -> None:
+        task = asyncio.create_task(pool.start())
+        await asyncio.sleep(seconds)
+        await pool.stop()
+        await task
+
+    async def test_prefetch_sized_to_free_slots(self, pool):
+        """Reads request only as many events as there are idle slots."""
+        busy = asyncio.create_task(asyncio.Event().wait())
+        pool._active_tasks.add(busy)
+
+        task = asyncio.create_task(pool.start())
+        await asyncio.sleep(0.05)
+        busy.cancel()
+        await pool.stop()
+        await task
+
+        counts = {call.kwargs["count"] for call in pool._consumer.read_events.call_args_list}
+        assert counts == {2}
+
+    async def test_no_read_while_saturated(self, pool):
+        """A full pool leaves events in the stream for other workers."""
+        busy = [asyncio.create_task(asyncio.Event().wait()) for _ in range(3)]
+        pool._active_tasks.update(busy)
+
+        task = asyncio.create_task(pool.start())
+        await asyncio.sleep(0.05)
+        pool._consumer.read_events.assert_not_called()
+        for t in busy:
+            t.cancel()
+        await pool.stop()
+        await task
+
+    async def test_surplus_events_held_until_slot_frees(self, pool):
+        """Events read beyond capacity start once a slot frees, in order."""
+        pool._config = WorkerConfig(
+            pool_size=1,
+            consumer_group="test-group",
+            consumer_name="test-consumer",
+        )
+        batches = [[self._event("urgent-1"), self._event("bulk-1")]]
+
+        async def _read(**kwargs):
+            await asyncio.sleep(0.005)
+            return batches.pop(0) if batches else []
+
+        pool._consumer.read_events.side_effect = _read
+        started: list[str] = []
+
+        async def _process(event):
+            started.append(event.event_id)
+            await asyncio.sleep(0.01)
+
+        pool._process_event = _process
+
+        await self._run_briefly(pool, 0.1)
+
+        assert started == ["urgent-1", "bulk-1"]
+        assert pool._consumer.read_events.call_args_list[0].kwargs["count"] == 1
+
+    async def test_stats_include_lane_backlog(self, pool):
+        """Queue depth and lag are refreshed into get_stats()."""
+        pool._consumer.get_backlog.return_value = {
+            "urgent": {"depth": 1, "pending": 0, "lag_seconds": 0.2},
+            "bulk": {"depth": 9, "pending": 3, "lag_seconds": 4.0},
+        }
+
+        await self._run_briefly(pool)
+
+        lanes = pool.get_stats()["lanes"]
+        assert lanes["bulk"]["depth"] == 9
+        assert lanes["urgent"]["lag_seconds"] == 0.2
+        pool._consumer.ensure_lanes.assert_awaited_once()